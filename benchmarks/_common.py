@@ -0,0 +1,110 @@
+"""Shared timing helpers for the benchmark scripts.
+
+Benchmarks are plain scripts, run from the repository root with the
+package importable, e.g. ``uv run python benchmarks/bench_capture.py``.
+"""
+
+import json
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+
+def time_calls(fn: Callable[[], object], repeat: int, warmup: int = 3) -> list[float]:
+    """Call ``fn`` ``warmup + repeat`` times and return per-call seconds.
+
+    Warmup calls are discarded so lazy initialization (imports, session
+    setup, first-touch page faults) doesn't skew the distribution.
+    """
+    for _ in range(warmup):
+        fn()
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Summarize per-call seconds as millisecond percentiles."""
+    ms = np.asarray(samples, dtype=np.float64) * 1000.0
+    return {
+        "n": float(len(samples)),
+        "mean_ms": float(ms.mean()),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+    }
+
+
+def print_table(rows: list[tuple[str, dict[str, float]]]) -> None:
+    """Print labelled summaries as an aligned text table."""
+    width = max((len(label) for label, _ in rows), default=0)
+    print(f"{'case':<{width}}  {'mean':>9}  {'p50':>9}  {'p95':>9}  {'p99':>9}")
+    for label, stats in rows:
+        print(
+            f"{label:<{width}}  "
+            f"{stats['mean_ms']:>7.2f}ms  {stats['p50_ms']:>7.2f}ms  "
+            f"{stats['p95_ms']:>7.2f}ms  {stats['p99_ms']:>7.2f}ms"
+        )
+
+
+def environment() -> dict[str, str]:
+    """Versions and host details recorded alongside saved results."""
+    import platform
+
+    import cv2
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": str(os.cpu_count()),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+    }
+
+
+def save_results(
+    path: str | Path, rows: list[tuple[str, dict[str, float]]], meta: dict
+) -> None:
+    """Write labelled summaries plus run metadata as JSON."""
+    payload = {
+        "meta": {"created": time.strftime("%Y-%m-%dT%H:%M:%S%z"), **meta},
+        "results": {label: stats for label, stats in rows},
+    }
+    Path(path).write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def compare_results(
+    baseline_path: str | Path,
+    rows: list[tuple[str, dict[str, float]]],
+    threshold: float,
+    metric: str = "p50_ms",
+) -> list[str]:
+    """Print ``metric`` against a saved baseline; return regressed labels.
+
+    A case regresses when it is more than ``threshold`` (a fraction, e.g.
+    0.1 for 10%) slower than the baseline. Only cases in the current run
+    are compared, so a partial run can be checked against a full baseline.
+    """
+    baseline = json.loads(Path(baseline_path).read_text())["results"]
+    width = max((len(label) for label, _ in rows), default=0)
+    print(f"{'case':<{width}}  {'baseline':>9}  {'current':>9}  {'change':>7}")
+    regressed: list[str] = []
+    for label, stats in rows:
+        if label not in baseline:
+            print(f"{label:<{width}}  {'-':>9}  {stats[metric]:>7.2f}ms  (new)")
+            continue
+        old, new = baseline[label][metric], stats[metric]
+        change = (new - old) / old if old > 0 else 0.0
+        flag = ""
+        if change > threshold:
+            regressed.append(label)
+            flag = "  REGRESSION"
+        print(f"{label:<{width}}  {old:>7.2f}ms  {new:>7.2f}ms  {change:>+6.1%}{flag}")
+    return regressed
@@ -0,0 +1,43 @@
+"""Batch throughput scaling across worker counts.
+
+Runs ``zora.batch.run_batch`` over a directory (or glob) of screenshots
+once per worker count and reports images/s and speedup over one worker::
+
+    uv run python benchmarks/bench_batch.py screenshots/ --workers 1 2 4 8 16 32
+"""
+
+import argparse
+import os
+
+from zora.batch import BatchStats, collect_image_paths, run_batch
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("target", help="Directory, glob pattern, or image file")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, os.cpu_count() or 1],
+    )
+    args = parser.parse_args()
+
+    paths = collect_image_paths(args.target)
+    if not paths:
+        parser.error(f"no images found for {args.target!r}")
+
+    baseline = None
+    print(f"{len(paths)} images")
+    print(f"{'workers':>7}  {'images/s':>9}  {'speedup':>7}")
+    for workers in args.workers:
+        stats = BatchStats()
+        for _ in run_batch(paths, workers=workers, stats=stats):
+            pass
+        rate = stats.images_per_second
+        baseline = baseline or rate
+        print(f"{workers:>7}  {rate:>9.1f}  {rate / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Per-frame latency of live screen capture: full screen vs region grabs.
+
+Compares three strategies on the current display:
+
+- ``legacy``: a fresh ``mss.mss()`` per frame, ``np.array`` copy of the
+  whole virtual desktop, then a ``[:, :, :3]`` slice (the old behavior).
+- ``session-full``: a persistent ``ScreenshotCapture`` grabbing the whole
+  monitor.
+- ``session-region``: a persistent ``ScreenshotCapture`` limited to a
+  board-sized rectangle.
+
+Needs a display (and the ``capture`` extra)::
+
+    uv run python benchmarks/bench_capture.py --monitor 0 --region 1280x900
+"""
+
+import argparse
+
+import numpy as np
+
+from _common import print_table, summarize, time_calls
+from zora.capture.screenshot import ScreenshotCapture
+from zora.vision import BoundingBox
+
+
+def legacy_grab(monitor: int) -> np.ndarray:
+    """The pre-session capture path, kept here as the baseline."""
+    import mss
+
+    with mss.mss() as sct:
+        shot = sct.grab(sct.monitors[monitor])
+        return np.array(shot, dtype=np.uint8)[:, :, :3]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--monitor", type=int, default=0)
+    parser.add_argument(
+        "--region",
+        default="1280x900",
+        help="WxH of the region grab, centred on the monitor",
+    )
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    region_w, region_h = (int(v) for v in args.region.lower().split("x"))
+
+    with ScreenshotCapture(monitor=args.monitor) as full:
+        frame_h, frame_w = full().shape[:2]
+        region = BoundingBox(
+            x=max(0, (frame_w - region_w) // 2),
+            y=max(0, (frame_h - region_h) // 2),
+            width=min(region_w, frame_w),
+            height=min(region_h, frame_h),
+        )
+        rows = [
+            (
+                f"legacy {frame_w}x{frame_h}",
+                summarize(time_calls(lambda: legacy_grab(args.monitor), args.repeat)),
+            ),
+            (
+                f"session-full {frame_w}x{frame_h}",
+                summarize(time_calls(full, args.repeat)),
+            ),
+            (
+                f"session-full bgra {frame_w}x{frame_h}",
+                summarize(time_calls(full.grab_bgra, args.repeat)),
+            ),
+        ]
+
+    with ScreenshotCapture(monitor=args.monitor, region=region) as partial:
+        rows.append(
+            (
+                f"session-region {region.width}x{region.height}",
+                summarize(time_calls(partial, args.repeat)),
+            )
+        )
+
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
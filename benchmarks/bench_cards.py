@@ -0,0 +1,54 @@
+"""Card detection latency: grid inference vs card contours.
+
+Renders a synthetic screenshot (``zora.synthetic.render_board``) at
+1080p, 1440p, 4K and 5120x1440 with several card counts, crops its board
+and times ``find_cards_by_grid`` against ``find_cards_by_contours``,
+reporting whether both found the same boxes::
+
+    uv run python benchmarks/bench_cards.py --repeat 30
+"""
+
+import argparse
+
+from _common import print_table, summarize, time_calls
+from zora.synthetic import render_board
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.regions import find_cards_by_contours, find_cards_by_grid
+
+RESOLUTIONS = [(1920, 1080), (2560, 1440), (3840, 2160), (5120, 1440)]
+CARD_COUNTS = [4, 9]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    rows = []
+    for width, height in RESOLUTIONS:
+        for num_cards in CARD_COUNTS:
+            image = render_board(width, height, num_cards)
+            board = crop_board(image, detect_board(image))
+            same = find_cards_by_grid(board) == find_cards_by_contours(board)
+            label = f"{width}x{height} ({num_cards} cards)"
+            rows.append(
+                (
+                    f"{label} contours",
+                    summarize(
+                        time_calls(lambda: find_cards_by_contours(board), args.repeat)
+                    ),
+                )
+            )
+            rows.append(
+                (
+                    f"{label} grid ({'same' if same else 'DIFFERENT'} boxes)",
+                    summarize(
+                        time_calls(lambda: find_cards_by_grid(board), args.repeat)
+                    ),
+                )
+            )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Board detection latency: full resolution vs coarse-to-fine multiscale.
+
+Renders a synthetic screenshot (``zora.synthetic.render_board``) at
+1080p, 1440p, 4K and 5120x1440, times ``detect_board`` against
+``detect_board_multiscale`` and reports the largest edge difference
+between their bounding boxes::
+
+    uv run python benchmarks/bench_detect.py --repeat 30
+"""
+
+import argparse
+
+from _common import print_table, summarize, time_calls
+from zora.synthetic import render_board
+from zora.vision import BoundingBox
+from zora.vision.detect import detect_board, detect_board_multiscale
+
+RESOLUTIONS = [(1920, 1080), (2560, 1440), (3840, 2160), (5120, 1440)]
+
+
+def edge_error(a: BoundingBox | None, b: BoundingBox | None) -> float:
+    if a is None or b is None:
+        return float("nan") if a != b else 0.0
+    return max(abs(a.x - b.x), abs(a.y - b.y), abs(a.x2 - b.x2), abs(a.y2 - b.y2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    rows = []
+    for width, height in RESOLUTIONS:
+        image = render_board(width, height, num_cards=9)
+        error = edge_error(detect_board(image), detect_board_multiscale(image))
+        label = f"{width}x{height}"
+        rows.append(
+            (
+                f"{label} full",
+                summarize(time_calls(lambda: detect_board(image), args.repeat)),
+            )
+        )
+        rows.append(
+            (
+                f"{label} multiscale (max edge error {error:.0f}px)",
+                summarize(
+                    time_calls(lambda: detect_board_multiscale(image), args.repeat)
+                ),
+            )
+        )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
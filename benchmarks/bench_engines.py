@@ -0,0 +1,120 @@
+"""Accuracy vs latency of every installed OCR engine on a fixture corpus.
+
+Runs each engine registered in ``zora.vision.ocr`` over two synthetic
+corpora with known contents: the cards of a rendered board, read field by
+field with ``extract_assignment_fields`` (accuracy = fields matching the
+rendered values), and stat values rendered at several scales, read with
+``ocr_number`` (accuracy = exact values). Engines that can't be created
+or fail on a probe image are reported and skipped. The ``fake`` engine
+never reads anything; its row is the harness overhead::
+
+    uv run python benchmarks/bench_engines.py --repeat 5
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from _common import print_table, summarize, time_calls
+from zora.synthetic import SAMPLE_ASSIGNMENTS, render_board, render_field
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.extract import extract_assignment_fields, ocr_number
+from zora.vision.ocr import AUTO_ENGINE, OcrEngine, engine_names, get_engine
+from zora.vision.regions import crop_region, find_assignment_cards
+
+NUMBER_VALUES = ["5", "15", "30", "42", "105"]
+NUMBER_SCALES = [1.0, 1.5, 2.0]
+# Assignment attribute for each SAMPLE_ASSIGNMENTS key
+CARD_FIELDS = {
+    "name": "name",
+    "eng": "engineering",
+    "sci": "science",
+    "tac": "tactical",
+    "slots": "ship_slots",
+    "duration": "duration",
+    "rarity": "rarity",
+}
+
+
+def card_corpus() -> list[tuple[np.ndarray, dict]]:
+    """Card crops of a rendered 1080p board with the values drawn on them."""
+    image = render_board(1920, 1080, len(SAMPLE_ASSIGNMENTS))
+    board = crop_board(image, detect_board(image))
+    crops = [crop_region(board, box) for box in find_assignment_cards(board)]
+    return list(zip(crops, SAMPLE_ASSIGNMENTS))
+
+
+def number_corpus() -> list[tuple[np.ndarray, int]]:
+    return [
+        (render_field(value, scale), int(value))
+        for scale in NUMBER_SCALES
+        for value in NUMBER_VALUES
+    ]
+
+
+def usable_engines(names: list[str]) -> list[OcrEngine]:
+    """The engines among ``names`` that load and can read a probe image."""
+    engines: list[OcrEngine] = []
+    probe = render_field("1")
+    for name in names:
+        try:
+            engine = get_engine(name)
+            ocr_number(probe, engine=engine)
+        except Exception as exc:
+            print(f"{name}: skipped ({type(exc).__name__}: {exc})", file=sys.stderr)
+            continue
+        engines.append(engine)
+    return engines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=[n for n in engine_names() if n != AUTO_ENGINE],
+        default=[n for n in engine_names() if n != AUTO_ENGINE],
+    )
+    args = parser.parse_args()
+
+    cards = card_corpus()
+    numbers = number_corpus()
+    rows = []
+    for engine in usable_engines(args.engines):
+        correct = total = 0
+        for crop, expected in cards:
+            assignment = extract_assignment_fields(crop, engine=engine)
+            for key, attribute in CARD_FIELDS.items():
+                correct += getattr(assignment, attribute) == expected[key]
+                total += 1
+        samples = time_calls(
+            lambda: [extract_assignment_fields(c, engine=engine) for c, _ in cards],
+            args.repeat,
+            warmup=1,
+        )
+        rows.append(
+            (
+                f"{engine.name} card ({correct}/{total} fields)",
+                summarize([s / len(cards) for s in samples]),
+            )
+        )
+
+        correct = sum(ocr_number(c, engine=engine) == v for c, v in numbers)
+        samples = time_calls(
+            lambda: [ocr_number(c, engine=engine) for c, _ in numbers],
+            args.repeat,
+            warmup=1,
+        )
+        rows.append(
+            (
+                f"{engine.name} number ({correct}/{len(numbers)} values)",
+                summarize([s / len(numbers) for s in samples]),
+            )
+        )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
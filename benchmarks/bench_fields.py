@@ -0,0 +1,107 @@
+"""Whole-card OCR vs field-targeted OCR: latency, accuracy, field breakdown.
+
+Renders synthetic boards (``zora.synthetic.render_board``), crops their
+cards and reads each one with ``extract_assignment`` (whole card, PSM 6,
+regex parse) and ``extract_assignment_fields`` (per-field crops, digits
+path for stats), both with its confidence-driven passes (``fields``) and
+with a single pass at the default preprocessing (``fields-fixed``).
+Reports per-card latency, how many fields each got wrong against the
+text the cards were drawn from, and the mean time per field of the
+targeted extractor::
+
+    uv run python benchmarks/bench_fields.py --repeat 5
+"""
+
+import argparse
+import functools
+import sys
+
+from _common import print_table, summarize, time_calls
+from zora.synthetic import SAMPLE_ASSIGNMENTS, render_board
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.extract import (
+    FieldTimings,
+    OcrEffort,
+    extract_assignment,
+    extract_assignment_fields,
+)
+from zora.vision.regions import crop_region, find_assignment_cards
+
+RESOLUTIONS = [(1280, 720), (1920, 1080), (2560, 1440), (3840, 2160)]
+NUM_CARDS = 4
+
+
+def expected(index: int) -> dict:
+    sample = SAMPLE_ASSIGNMENTS[index % len(SAMPLE_ASSIGNMENTS)]
+    return {
+        "name": sample["name"],
+        "engineering": sample["eng"],
+        "science": sample["sci"],
+        "tactical": sample["tac"],
+        "ship_slots": sample["slots"],
+        "duration": sample["duration"],
+        "rarity": sample["rarity"],
+    }
+
+
+def wrong_fields(cards: list, extractor) -> int:
+    wrong = 0
+    for i, card in enumerate(cards):
+        result = extractor(card).to_dict()
+        wrong += sum(result[k] != v for k, v in expected(i).items())
+    return wrong
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    breakdowns = []
+    for width, height in RESOLUTIONS:
+        image = render_board(width, height, NUM_CARDS)
+        box = detect_board(image)
+        if box is None:
+            sys.exit(f"board not detected at {width}x{height}")
+        board = crop_board(image, box)
+        cards = [crop_region(board, b) for b in find_assignment_cards(board)]
+        fields = len(cards) * len(expected(0))
+
+        for label, extractor in [
+            ("whole", extract_assignment),
+            ("fields", extract_assignment_fields),
+            (
+                "fields-fixed",
+                functools.partial(extract_assignment_fields, efforts=[OcrEffort()]),
+            ),
+        ]:
+            wrong = wrong_fields(cards, extractor)
+            samples = time_calls(
+                lambda: [extractor(c) for c in cards], args.repeat, warmup=1
+            )
+            per_card = [s / len(cards) for s in samples]
+            rows.append(
+                (
+                    f"{label} {width}x{height} ({wrong}/{fields} fields wrong)",
+                    summarize(per_card),
+                )
+            )
+
+        timings = FieldTimings()
+        for card in cards:
+            extract_assignment_fields(card, timings=timings)
+        breakdowns.append((f"{width}x{height}", timings.to_dict()))
+
+    print("Per-card latency")
+    print_table(rows)
+    print("\nField breakdown (mean ms per card)")
+    names = list(breakdowns[0][1])
+    print(f"{'resolution':<10}  " + "  ".join(f"{n:>11}" for n in names))
+    for label, breakdown in breakdowns:
+        cells = (f"{breakdown.get(n, {}).get('mean_ms', 0.0):>11.2f}" for n in names)
+        print(f"{label:<10}  " + "  ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Colour conversions and time per frame, with and without shared planes.
+
+Runs ``read_board_from_image`` on synthetic screenshots
+(``zora.synthetic.render_board``) at 1080p, 1440p and 4K with
+``share_planes`` on (one ``FrameContext`` threaded through detection,
+card finding and extraction) and off (detection and card finding each
+convert their own crop; extraction still converts each card once). OCR
+is a ``FakeEngine`` that answers every field confidently, so each field
+takes one pass and the timings are the vision work around OCR. Each row
+counts the ``cv2.cvtColor`` and ``cv2.inRange`` calls of one frame and
+the megapixels they processed::
+
+    uv run python benchmarks/bench_frame.py --repeat 10
+"""
+
+import argparse
+
+import cv2
+
+from _common import print_table, summarize, time_calls
+from zora.pipeline import read_board_from_image
+from zora.synthetic import render_board
+from zora.vision.ocr.fake import FakeEngine
+
+CASES = [(1920, 1080, 6), (2560, 1440, 9), (3840, 2160, 9)]
+COUNTED = ("cvtColor", "inRange")
+
+
+class ConversionCounter:
+    """Wrap the counted cv2 functions, tallying calls and pixels."""
+
+    def __init__(self) -> None:
+        self.calls = {name: 0 for name in COUNTED}
+        self.pixels = 0
+        self._originals = {name: getattr(cv2, name) for name in COUNTED}
+
+    def __enter__(self) -> "ConversionCounter":
+        for name, original in self._originals.items():
+            setattr(cv2, name, self._wrap(name, original))
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        for name, original in self._originals.items():
+            setattr(cv2, name, original)
+
+    def _wrap(self, name, original):
+        def counted(src, *args, **kwargs):
+            self.calls[name] += 1
+            self.pixels += src.shape[0] * src.shape[1]
+            return original(src, *args, **kwargs)
+
+        return counted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = FakeEngine("7")
+    rows = []
+    for width, height, num_cards in CASES:
+        image = render_board(width, height, num_cards)
+        for share_planes in (False, True):
+
+            def read():
+                return read_board_from_image(
+                    image, engine=engine, share_planes=share_planes
+                )
+
+            with ConversionCounter() as counter:
+                read()
+            counts = ", ".join(f"{n} {name}" for name, n in counter.calls.items())
+            label = (
+                f"{width}x{height} {num_cards}cards "
+                f"{'shared' if share_planes else 'per-stage'} "
+                f"({counts}, {counter.pixels / 1e6:.1f}MP)"
+            )
+            rows.append((label, summarize(time_calls(read, args.repeat))))
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
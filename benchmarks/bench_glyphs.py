@@ -0,0 +1,67 @@
+"""Glyph-bank reads vs Tesseract digit reads for numeric field crops.
+
+Renders stat and duration values in the card font at several scales,
+builds a ``GlyphBank`` from a disjoint training set, then reports per-field
+latency, misreads and unsure reads (``None``, which the pipeline hands to
+Tesseract) for ``GlyphBank.read_number`` and for Tesseract's digits-only
+``ocr_number`` (skipped when no engine works)::
+
+    uv run python benchmarks/bench_glyphs.py --repeat 50
+"""
+
+import argparse
+import sys
+
+from _common import print_table, summarize, time_calls
+from zora.synthetic import render_field
+from zora.vision.extract import ocr_number
+from zora.vision.glyphs import GlyphBank
+
+SCALES = [1.0, 1.5, 2.0, 3.0]
+TRAINING_TEXTS = ["1234", "5678", "90", "12h", "30m"]
+TEST_VALUES = ["7", "15", "30", "42", "86", "105", "249", "2048"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--ocr-repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    bank = GlyphBank.from_samples(
+        (render_field(text, scale), text)
+        for scale in (1.0, 1.5)
+        for text in TRAINING_TEXTS
+    )
+    print(f"bank: {len(bank)} templates for {bank.alphabet!r}", file=sys.stderr)
+    try:
+        ocr_number(render_field("1", 1.0))
+        tesseract = True
+    except Exception as exc:
+        print(f"tesseract: skipped ({type(exc).__name__}: {exc})", file=sys.stderr)
+        tesseract = False
+
+    rows = []
+    for scale in SCALES:
+        crops = [render_field(v, scale) for v in TEST_VALUES]
+        readers = [("glyphs", bank.read_number, args.repeat)]
+        if tesseract:
+            readers.append(("tesseract", ocr_number, args.ocr_repeat))
+        for label, reader, repeat in readers:
+            values = [reader(c) for c in crops]
+            unsure = values.count(None)
+            wrong = sum(r not in (None, int(v)) for r, v in zip(values, TEST_VALUES))
+            samples = time_calls(lambda: [reader(c) for c in crops], repeat, warmup=1)
+            per_field = [s / len(crops) for s in samples]
+            rows.append(
+                (
+                    f"{label} x{scale} ({wrong} wrong, {unsure} unsure"
+                    f" of {len(crops)})",
+                    summarize(per_field),
+                )
+            )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Board and card colour masks: HSV conversion + inRange vs the lut engine.
+
+Renders synthetic screenshots (``zora.synthetic.render_board``) at 1080p,
+1440p and 4K and times, per mask engine (see ``zora.vision.masks``):
+
+- ``masks``: the board and card masks of the whole frame, in one
+  ``color_masks`` call
+- ``detect``: ``detect_board`` on a fresh ``FrameContext`` using that
+  engine, the stage whose mask covers the whole frame
+- ``read``: ``read_board_from_image`` with a ``FakeEngine`` (so the time
+  is the vision work around OCR)
+
+Each resolution first checks that the engines' masks are identical::
+
+    uv run python benchmarks/bench_masks.py --repeat 30
+"""
+
+import argparse
+
+import numpy as np
+
+from _common import print_table, summarize, time_calls
+from zora.defaults import MASK_ENGINES
+from zora.pipeline import read_board_from_image
+from zora.synthetic import render_board
+from zora.vision.detect import BOARD_BG_LOWER, BOARD_BG_UPPER, detect_board
+from zora.vision.frame import FrameContext
+from zora.vision.masks import color_masks
+from zora.vision.ocr.fake import FakeEngine
+from zora.vision.regions import CARD_BG_LOWER, CARD_BG_UPPER
+
+RESOLUTIONS = [(1920, 1080), (2560, 1440), (3840, 2160)]
+RANGES = [(BOARD_BG_LOWER, BOARD_BG_UPPER), (CARD_BG_LOWER, CARD_BG_UPPER)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument(
+        "--resolutions",
+        nargs="+",
+        default=[f"{w}x{h}" for w, h in RESOLUTIONS],
+        help="WIDTHxHEIGHT frames to render",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.resolutions:
+        width, height = (int(n) for n in size.split("x"))
+        image = render_board(width, height, num_cards=9)
+        hsv, lut = (color_masks(image, RANGES, engine) for engine in MASK_ENGINES)
+        identical = all(np.array_equal(a, b) for a, b in zip(hsv, lut))
+        print(f"{size}: masks identical across engines: {identical}")
+
+        for engine in MASK_ENGINES:
+
+            def masks(engine: str = engine) -> object:
+                return color_masks(image, RANGES, engine)
+
+            def detect(engine: str = engine) -> object:
+                return detect_board(FrameContext(image, mask_engine=engine))
+
+            def read(engine: str = engine) -> object:
+                return read_board_from_image(
+                    image, engine=FakeEngine("7"), mask_engine=engine
+                )
+
+            for stage, fn in (("masks", masks), ("detect", detect), ("read", read)):
+                rows.append(
+                    (f"{size} {stage} {engine}", summarize(time_calls(fn, args.repeat)))
+                )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
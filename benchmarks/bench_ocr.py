@@ -0,0 +1,89 @@
+"""Per-card OCR latency: subprocess pytesseract vs in-process tesserocr.
+
+Renders synthetic assignment-card text, then times ``ocr_text`` (block
+text, PSM 6) and ``ocr_number`` (digits, PSM 7) through each installed
+Tesseract engine. Engines that aren't installed are reported and skipped::
+
+    uv run python benchmarks/bench_ocr.py --repeat 50
+"""
+
+import argparse
+import shutil
+
+import cv2
+import numpy as np
+
+from _common import print_table, summarize, time_calls
+from zora.vision.extract import ocr_number, ocr_text
+from zora.vision.ocr import OcrEngine
+from zora.vision.ocr.tesseract import PytesseractEngine, TesserocrEngine
+
+
+def render_card() -> np.ndarray:
+    """A 300x200 card with a title and stat lines in white on gray."""
+    card = np.full((200, 300, 3), (120, 110, 100), dtype=np.uint8)
+    lines = ["Patrol Sector 42", "Eng: 30", "Sci: 20", "Tac: 15", "Slots: 2"]
+    for i, line in enumerate(lines):
+        cv2.putText(
+            card,
+            line,
+            (10, 25 + 30 * i),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.6,
+            (255, 255, 255),
+            1,
+        )
+    return card
+
+
+def render_number() -> np.ndarray:
+    image = np.zeros((40, 80, 3), dtype=np.uint8)
+    cv2.putText(
+        image, "42", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2
+    )
+    return image
+
+
+def installed_engines() -> list[OcrEngine]:
+    engines: list[OcrEngine] = []
+    if shutil.which("tesseract") is not None:
+        engines.append(PytesseractEngine())
+    else:
+        print("pytesseract: skipped (tesseract binary not on PATH)")
+    try:
+        engines.append(TesserocrEngine())
+    except (ImportError, RuntimeError) as exc:
+        print(f"tesserocr: skipped ({exc})")
+    return engines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    card = render_card()
+    number = render_number()
+    rows = []
+    for engine in installed_engines():
+        rows.append(
+            (
+                f"{engine.name} ocr_text card",
+                summarize(
+                    time_calls(lambda: ocr_text(card, engine=engine), args.repeat)
+                ),
+            )
+        )
+        rows.append(
+            (
+                f"{engine.name} ocr_number field",
+                summarize(
+                    time_calls(lambda: ocr_number(number, engine=engine), args.repeat)
+                ),
+            )
+        )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Bulk re-parse throughput: compiled parser vs the original regex parser.
+
+Generates a corpus of synthetic raw OCR texts (card titles, stats with
+label variants and OCR noise, durations, rarities, reward lines and
+items, junk lines) totalling ``--lines`` lines, checks that
+``parse_many`` gives exactly the original parser's output for every
+text, then times both over the whole corpus. Two corpora are run: one of
+freshly generated (unique) texts, and one drawn from ``--distinct`` texts,
+like a store of frame-by-frame reads of the same cards.
+
+"parser" is ``parse_many(cache_size=0)``, so its speedup is the compiled
+parser's own; "parse_many" adds result reuse, which only pays off on the
+repeated corpus and is reported separately as "with reuse"::
+
+    uv run python benchmarks/bench_parse.py --lines 1000000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+
+from zora.vision.parse import parse_many
+
+NAMES = [
+    "Patrol Sector 42",
+    "Rescue Mission",
+    "Supply Run",
+    "Survey Nebula",
+    "Escort the Convoy",
+    "Diplomatic Envoy",
+]
+STAT_LABELS = {
+    "eng": ["Eng", "Engineering", "ENG", "Eng.", "Engineerng"],
+    "sci": ["Sci", "Science", "SCI", "Sck"],
+    "tac": ["Tac", "Tactical", "TAC", "Tae"],
+    "slots": ["Slots", "Slot", "Ships", "Ship Slots"],
+}
+DURATIONS = ["4h", "8h", "2h", "1h 30m", "45m", "6 hours", "12h", ""]
+RARITIES = ["Common", "Uncommon", "Rare", "Very Rare", "Epic", "Comrnon", ""]
+REWARDS = [
+    "Event Reward: 500 Dilithium",
+    "Rewards: 50 Marks, 1000 XP; Tour of Duty",
+    "250 Fleet Credits",
+    "2x Reputation Marks and 100 EC",
+    "Reward - Campaign XP",
+]
+JUNK = ["[", "|", "~ ~", "ae 7", "0", "@ -"]
+# Bulk re-parse speedup the compiled parser was asked for; the parser's own
+# speedup is reported against it
+TARGET_SPEEDUP = 5.0
+
+# The parser as it was before it was compiled into zora.vision.parse, kept
+# verbatim as the parity and speed baseline
+LEGACY_RARITIES = ("epic", "very rare", "rare", "uncommon", "common")
+LEGACY_DURATION = re.compile(
+    r"(\d+\s*h(?:ours?)?(?:\s*\d+\s*m(?:in)?)?|\d+\s*m(?:in)?)"
+)
+
+
+def legacy_parse(raw_text: str) -> dict:
+    lines = [line.strip() for line in raw_text.splitlines() if line.strip()]
+    result: dict = {
+        "name": "",
+        "engineering": 0,
+        "science": 0,
+        "tactical": 0,
+        "ship_slots": 0,
+        "duration": "",
+        "rarity": "",
+        "event_rewards": [],
+    }
+    if not lines:
+        return result
+    result["name"] = lines[0]
+    full_text = raw_text.lower()
+    eng_match = re.search(r"(?:eng(?:ineering)?)\s*[:\-]?\s*(\d+)", full_text)
+    if eng_match:
+        result["engineering"] = int(eng_match.group(1))
+    sci_match = re.search(r"(?:sci(?:ence)?)\s*[:\-]?\s*(\d+)", full_text)
+    if sci_match:
+        result["science"] = int(sci_match.group(1))
+    tac_match = re.search(r"(?:tac(?:tical)?)\s*[:\-]?\s*(\d+)", full_text)
+    if tac_match:
+        result["tactical"] = int(tac_match.group(1))
+    slots_match = re.search(r"(?:slots?|ships?)\s*[:\-]?\s*(\d+)", full_text)
+    if slots_match:
+        result["ship_slots"] = int(slots_match.group(1))
+    dur_match = LEGACY_DURATION.search(full_text)
+    if dur_match:
+        result["duration"] = dur_match.group(1).strip()
+    result["rarity"] = ""
+    for rarity in LEGACY_RARITIES:
+        if rarity in full_text:
+            result["rarity"] = rarity.title()
+            break
+    rewards: list[str] = []
+    reward_line_pat = re.compile(
+        r"(?:event\s*rewards?|rewards?)\s*[:\-]\s*(.+)", re.IGNORECASE
+    )
+    reward_item_pat = re.compile(
+        r"(\d+[x×]?\s*(?:dilithium|dil|marks?|xp|experience|ec|energy credits"
+        r"|fleet credits|admiralty xp|campaign xp|tour of duty|"
+        r"r&d materials?|reputation marks?))",
+        re.IGNORECASE,
+    )
+    for line in lines:
+        line_match = reward_line_pat.search(line)
+        if line_match:
+            reward_text = line_match.group(1).strip()
+            for part in re.split(r"[,;]", reward_text):
+                part = part.strip()
+                if part:
+                    rewards.append(part)
+        else:
+            for item_match in reward_item_pat.finditer(line):
+                rewards.append(item_match.group(1).strip())
+    result["event_rewards"] = rewards
+    return result
+
+
+def make_text(rng: random.Random) -> str:
+    """One card's raw OCR text, with the kinds of noise Tesseract produces."""
+    lines = [rng.choice(NAMES)]
+    for key, labels in STAT_LABELS.items():
+        if rng.random() < 0.9:
+            sep = rng.choice([": ", ":", " ", " - ", ""])
+            lines.append(f"{rng.choice(labels)}{sep}{rng.randint(0, 99)}")
+    lines.append(f"Duration: {rng.choice(DURATIONS)}")
+    lines.append(rng.choice(RARITIES))
+    if rng.random() < 0.2:
+        lines.append(rng.choice(REWARDS))
+    if rng.random() < 0.3:
+        lines.insert(rng.randrange(len(lines) + 1), rng.choice(JUNK))
+    if rng.random() < 0.1:
+        lines.insert(rng.randrange(len(lines) + 1), "")
+    return "\n".join(lines) + "\n"
+
+
+def make_corpus(
+    total_lines: int, seed: int = 0, distinct: int | None = None
+) -> list[str]:
+    """Texts totalling ``total_lines`` lines, drawn from ``distinct`` texts.
+
+    With ``distinct=None`` every text is generated afresh (nearly all
+    unique); otherwise texts repeat as in a store of frame-by-frame reads.
+    """
+    rng = random.Random(seed)
+    pool = [make_text(rng) for _ in range(distinct)] if distinct else None
+    corpus: list[str] = []
+    lines = 0
+    while lines < total_lines:
+        text = rng.choice(pool) if pool else make_text(rng)
+        corpus.append(text)
+        lines += text.count("\n")
+    return corpus
+
+
+def compare(corpus: list[str], repeat: int) -> dict[str, float]:
+    """Check parity, then return the best seconds for each parser."""
+    mismatches = sum(
+        new != old for new, old in zip(parse_many(corpus), map(legacy_parse, corpus))
+    )
+    if mismatches:
+        sys.exit(f"{mismatches} text(s) parsed differently from the original")
+
+    # Interleave the runs and keep each one's best, so a noisy neighbour
+    # slows both rather than skewing the ratio
+    runs = {
+        "original": lambda: list(map(legacy_parse, corpus)),
+        "parser": lambda: list(parse_many(corpus, cache_size=0)),
+        "parse_many": lambda: list(parse_many(corpus)),
+    }
+    timings = dict.fromkeys(runs, float("inf"))
+    for _ in range(repeat):
+        for label, run in runs.items():
+            start = time.perf_counter()
+            run()
+            timings[label] = min(timings[label], time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--distinct",
+        type=int,
+        default=2000,
+        help="Distinct texts in the repeated corpus (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    for label, distinct in [("unique", None), ("repeated", args.distinct)]:
+        corpus = make_corpus(args.lines, args.seed, distinct)
+        timings = compare(corpus, args.repeat)
+        print(f"{label} corpus: {len(corpus)} texts, >= {args.lines} lines")
+        for name, seconds in timings.items():
+            rate = args.lines / seconds
+            print(f"  {name:<12} {seconds:8.2f}s  {rate / 1000:8.0f}k lines/s")
+        parser_speedup = timings["original"] / timings["parser"]
+        reuse_speedup = timings["original"] / timings["parse_many"]
+        print(
+            f"  speedup: parser {parser_speedup:.1f}x "
+            f"({TARGET_SPEEDUP / parser_speedup:.1f}x short of the "
+            f"{TARGET_SPEEDUP:.0f}x target), with reuse {reuse_speedup:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""OCR preprocessing with fresh arrays vs a reusable ``PreprocessWorkspace``.
+
+Preprocesses every card crop, and every field crop within it, for a
+10k-card run over synthetic boards at 720p-4K (so crop shapes vary as
+they do between boards). Each mode runs in its own subprocess so peak
+RSS isn't shared, and reports:
+
+- ``allocs``: arrays OpenCV allocated for its outputs (plus workspace
+  arena growth), counted by wrapping the cv2 calls preprocessing makes
+- ``traced peak``: peak of numpy memory traced by tracemalloc
+- ``minor faults``: page faults taken while running (fresh pages)
+- ``peak RSS`` growth while running over the RSS after setup (Linux:
+  the peak is reset via ``/proc/self/clear_refs``; elsewhere it is the
+  process peak)
+- per-card time, from a second pass without tracemalloc::
+
+    uv run python benchmarks/bench_preprocess.py --cards 10000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import cv2
+
+import zora.vision.extract as extract
+from zora.synthetic import render_board
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.regions import crop_region, find_assignment_cards, locate_card_fields
+
+RESOLUTIONS = [(1280, 720), (1920, 1080), (2560, 1440), (3840, 2160)]
+MODES = ("allocate", "workspace")
+
+
+class CountingCv2:
+    """cv2 stand-in counting outputs that weren't written to a given dst."""
+
+    def __init__(self) -> None:
+        self.allocations = 0
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(cv2, name)
+
+    def _count(self, result: object, dst: object) -> None:
+        self.allocations += result is not dst
+
+    def cvtColor(self, src, code, dst=None):
+        result = cv2.cvtColor(src, code, dst=dst)
+        self._count(result, dst)
+        return result
+
+    def resize(self, src, dsize, dst=None, **kwargs):
+        result = cv2.resize(src, dsize, dst=dst, **kwargs)
+        self._count(result, dst)
+        return result
+
+    def GaussianBlur(self, src, ksize, sigma, dst=None):
+        result = cv2.GaussianBlur(src, ksize, sigma, dst=dst)
+        self._count(result, dst)
+        return result
+
+    def threshold(self, src, thresh, maxval, kind, dst=None):
+        retval, result = cv2.threshold(src, thresh, maxval, kind, dst=dst)
+        self._count(result, dst)
+        return retval, result
+
+
+def card_crops() -> list[list]:
+    """Per card: the card crop followed by its field crops."""
+    cards = []
+    for width, height in RESOLUTIONS:
+        image = render_board(width, height, 4)
+        board = crop_board(image, detect_board(image))
+        for box in find_assignment_cards(board):
+            card = crop_region(board, box)
+            regions = locate_card_fields(card)
+            fields = [] if regions is None else list(regions.fields.values())
+            cards.append([card] + [crop_region(card, f) for f in fields])
+    return cards
+
+
+def reset_peak_rss() -> None:
+    """Restart the kernel's peak RSS count from the current RSS, if possible."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def rss_mib(field: str) -> float:
+    """A memory field of /proc/self/status ("VmRSS", "VmHWM") in MiB."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def preprocess_cards(cards: list[list], num_cards: int, workspace) -> None:
+    for i in range(num_cards):
+        for crop in cards[i % len(cards)]:
+            extract.preprocess_for_ocr(crop, workspace)
+
+
+def run(mode: str, num_cards: int) -> dict:
+    cards = card_crops()
+    workspace = extract.PreprocessWorkspace() if mode == "workspace" else None
+    counter = CountingCv2()
+    extract.cv2 = counter  # type: ignore[assignment]
+
+    reset_peak_rss()
+    rss_before = rss_mib("VmRSS")
+    tracemalloc.start()
+    faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+    preprocess_cards(cards, num_cards, workspace)
+    faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt - faults
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    peak_rss_growth = rss_mib("VmHWM") - rss_before
+    allocations = counter.allocations + (workspace.allocations if workspace else 0)
+    extract.cv2 = cv2
+
+    start = time.perf_counter()
+    preprocess_cards(cards, num_cards, workspace)
+    seconds = time.perf_counter() - start
+    return {
+        "mode": mode,
+        "allocs": allocations,
+        "traced_peak_kib": traced_peak / 1024,
+        "minor_faults": faults,
+        "peak_rss_growth_mib": peak_rss_growth,
+        "us_per_card": 1e6 * seconds / num_cards,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=10_000)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        print(json.dumps(run(args.mode, args.cards)))
+        return
+
+    print(
+        f"{'mode':<10}  {'allocs':>8}  {'traced peak':>12}  {'minor faults':>12}"
+        f"  {'RSS growth':>10}  {'per card':>10}"
+    )
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--cards", str(args.cards)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        r = json.loads(output)
+        print(
+            f"{r['mode']:<10}  {r['allocs']:>8}  {r['traced_peak_kib']:>9.0f}KiB"
+            f"  {r['minor_faults']:>12}  {r['peak_rss_growth_mib']:>7.1f}MiB"
+            f"  {r['us_per_card']:>8.0f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Layout cost per frame: full detection vs a calibrated layout profile.
+
+Renders a synthetic screenshot (``zora.synthetic.render_board``) at
+1080p, 1440p, 4K and 5120x1440, calibrates a ``LayoutProfile`` on it, and
+times what each frame costs before OCR can start: locating the board,
+its cards and every card's fields with ``detect_board`` +
+``find_assignment_cards`` + ``locate_card_fields``, against the profile's
+sanity check (``LayoutProfile.matches``) + ``field_regions``::
+
+    uv run python benchmarks/bench_profile.py --repeat 30
+"""
+
+import argparse
+
+from _common import print_table, summarize, time_calls
+from zora.synthetic import render_board
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.profile import calibrate
+from zora.vision.regions import crop_region, find_assignment_cards, locate_card_fields
+
+RESOLUTIONS = [(1920, 1080), (2560, 1440), (3840, 2160), (5120, 1440)]
+
+
+def detect_layout(image) -> int:
+    board = crop_board(image, detect_board(image))
+    cards = [crop_region(board, box) for box in find_assignment_cards(board)]
+    return sum(locate_card_fields(card) is not None for card in cards)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    rows = []
+    for width, height in RESOLUTIONS:
+        image = render_board(width, height, num_cards=9)
+        profile = calibrate(image)
+
+        def profile_layout() -> int:
+            assert profile.matches(image)
+            board = crop_board(image, profile.board)
+            cards = [crop_region(board, box) for box in profile.card_boxes]
+            return sum(
+                profile.field_regions(i, card) is not None
+                for i, card in enumerate(cards)
+            )
+
+        label = f"{width}x{height} ({len(profile.cards)} cards)"
+        rows.append(
+            (
+                f"{label} detect",
+                summarize(time_calls(lambda: detect_layout(image), args.repeat)),
+            )
+        )
+        rows.append(
+            (f"{label} profile", summarize(time_calls(profile_layout, args.repeat)))
+        )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Scrolled board lists: one read per screenshot vs stitched frames.
+
+Renders the screenshots taken while scrolling a 30-card list
+(``zora.synthetic.render_scrolling_board``, half a board per scroll) at
+1080p, 1440p and 4K, and compares reading them the screenshot-per-page
+way (``read_board_from_image`` on each, overlapping cards read again
+and cut-off cards read partially) with ``read_scrolling_board``, which
+reads each card once. OCR is a ``FakeEngine`` that answers every field
+confidently, so the timings are the vision work and the OCR call counts
+show what a real engine would be asked to read. Also times
+``register_scroll`` between consecutive board crops::
+
+    uv run python benchmarks/bench_scroll.py --repeat 10
+"""
+
+import argparse
+
+from _common import print_table, summarize, time_calls
+from zora.pipeline import read_board_from_image, read_scrolling_board
+from zora.synthetic import render_scrolling_board
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.ocr.fake import FakeEngine
+from zora.vision.scroll import register_scroll
+
+RESOLUTIONS = [(1920, 1080), (2560, 1440), (3840, 2160)]
+NUM_CARDS = 30
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = []
+    for width, height in RESOLUTIONS:
+        frames = render_scrolling_board(width, height, NUM_CARDS)
+        box = detect_board(frames[0])
+        boards = [crop_board(frame, box) for frame in frames]
+
+        per_page = FakeEngine("7")
+        paged = sum(
+            len(read_board_from_image(frame, engine=per_page).assignments)
+            for frame in frames
+        )
+        stitching = FakeEngine("7")
+        stitched = len(read_scrolling_board(frames, engine=stitching).assignments)
+        label = f"{width}x{height} ({len(frames)} frames)"
+        print(
+            f"{label}: per page {paged} cards / {len(per_page.calls)} OCR calls, "
+            f"stitched {stitched} cards / {len(stitching.calls)} OCR calls"
+        )
+
+        def read_pages() -> None:
+            for frame in frames:
+                read_board_from_image(frame, engine=FakeEngine("7"))
+
+        def read_stitched() -> None:
+            read_scrolling_board(frames, engine=FakeEngine("7"))
+
+        def register() -> None:
+            for previous, current in zip(boards, boards[1:]):
+                register_scroll(previous, current)
+
+        rows.append(
+            (f"{label} per page", summarize(time_calls(read_pages, args.repeat)))
+        )
+        rows.append(
+            (f"{label} stitched", summarize(time_calls(read_stitched, args.repeat)))
+        )
+        rows.append((f"{label} register", summarize(time_calls(register, args.repeat))))
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
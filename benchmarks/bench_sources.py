@@ -0,0 +1,84 @@
+"""Per-frame cost of reading an archived frame through each file source.
+
+Writes one synthetic frame as PNG, ``.npy`` and a headerless BGR dump, then
+times ``FileCapture`` (``cv2.imread``), ``MmapFileCapture`` (decode from a
+mapping), ``NpyCapture`` and ``RawFrameCapture``. The mapped raw sources
+are lazy, so every timed call also reduces over the frame to force the
+pixels in from the page cache::
+
+    uv run python benchmarks/bench_sources.py --size 3840x2160
+"""
+
+import argparse
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from _common import print_table, summarize, time_calls
+from zora.capture import (
+    CaptureSource,
+    FileCapture,
+    MmapFileCapture,
+    NpyCapture,
+    RawFrameCapture,
+)
+
+
+def render_frame(width: int, height: int) -> np.ndarray:
+    """A compressible screenshot-like frame: flat panels plus some text."""
+    image = np.full((height, width, 3), (200, 190, 180), dtype=np.uint8)
+    image[height // 10 : height * 9 // 10, width // 5 : width * 3 // 4] = (30, 25, 20)
+    for row in range(0, height, 60):
+        cv2.putText(
+            image,
+            "Patrol Sector 42  Eng 12  Sci 7",
+            (width // 5 + 20, row),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            1.0,
+            (255, 255, 255),
+            2,
+        )
+    return image
+
+
+def touched(source: CaptureSource) -> Callable[[], object]:
+    return lambda: source().max()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", default="1920x1080", help="WxH of the frame")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    frame = render_frame(width, height)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        png, npy, raw = Path(tmp, "f.png"), Path(tmp, "f.npy"), Path(tmp, "f.bgr")
+        cv2.imwrite(str(png), frame)
+        np.save(npy, frame)
+        raw.write_bytes(frame.tobytes())
+
+        with MmapFileCapture(png) as mapped, NpyCapture(npy) as npy_source:
+            sources = [
+                ("FileCapture png", FileCapture(png)),
+                ("MmapFileCapture png", mapped),
+                ("NpyCapture", npy_source),
+                ("RawFrameCapture", RawFrameCapture(raw, shape=frame.shape)),
+            ]
+            rows = [
+                (
+                    f"{name} {width}x{height}",
+                    summarize(time_calls(touched(s), args.repeat)),
+                )
+                for name, s in sources
+            ]
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
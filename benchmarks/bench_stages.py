@@ -0,0 +1,205 @@
+"""Per-stage latency of the board-reading pipeline on synthetic boards.
+
+Renders boards with ``zora.synthetic.render_board`` at several resolutions
+and card counts, then times each stage on its own:
+
+- ``capture``: decoding the screenshot from PNG (``FileCapture``)
+- ``detect``: ``detect_board`` on the full screenshot
+- ``cards``: ``find_assignment_cards`` on the cropped board
+- ``preprocess``: ``preprocess_for_ocr`` for every card
+- ``ocr``: the default OCR engine on every preprocessed card
+- ``parse``: ``parse_assignment_text`` for every card's text
+- ``serialize``: ``BoardState.to_dict`` plus ``json.dumps``
+
+Per-card stages report the time for the whole board. OCR is skipped when
+no engine works; ``parse`` then uses the text the cards were drawn from.
+
+Results can be saved as JSON and compared with an earlier run; the script
+exits with status 1 if any case's p50 regressed past ``--threshold``::
+
+    uv run python benchmarks/bench_stages.py --output baseline.json
+    uv run python benchmarks/bench_stages.py --compare baseline.json
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from _common import (
+    compare_results,
+    environment,
+    print_table,
+    save_results,
+    summarize,
+    time_calls,
+)
+from zora.capture import FileCapture
+from zora.models.assignment import Assignment
+from zora.models.board import BoardState
+from zora.synthetic import SAMPLE_ASSIGNMENTS, render_board
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.extract import (
+    TESSERACT_CONFIG,
+    parse_assignment_text,
+    preprocess_for_ocr,
+)
+from zora.vision.ocr import OcrEngine, get_default_engine
+from zora.vision.regions import crop_region, find_assignment_cards
+
+STAGES = ("capture", "detect", "cards", "preprocess", "ocr", "parse", "serialize")
+DEFAULT_SIZES = ["1920x1080", "2560x1440", "3840x2160"]
+DEFAULT_CARDS = [3, 6, 12]
+
+
+def working_engine() -> OcrEngine | None:
+    """The default OCR engine, or None if it can't recognize anything here."""
+    try:
+        engine = get_default_engine()
+        engine.image_to_string(np.full((20, 20), 255, np.uint8), TESSERACT_CONFIG)
+    except Exception as exc:
+        print(f"ocr: skipped ({type(exc).__name__}: {exc})", file=sys.stderr)
+        return None
+    return engine
+
+
+def card_text(index: int) -> str:
+    """The text drawn on card ``index`` by render_board."""
+    a = SAMPLE_ASSIGNMENTS[index % len(SAMPLE_ASSIGNMENTS)]
+    return "\n".join(
+        [
+            a["name"],
+            f"Eng: {a['eng']}",
+            f"Sci: {a['sci']}",
+            f"Tac: {a['tac']}",
+            f"Slots: {a['slots']}",
+            f"Duration: {a['duration']}",
+            a["rarity"],
+        ]
+    )
+
+
+def to_assignment(fields: dict) -> Assignment:
+    return Assignment(
+        name=fields["name"],
+        engineering=fields["engineering"],
+        science=fields["science"],
+        tactical=fields["tactical"],
+        ship_slots=fields["ship_slots"],
+        duration=fields["duration"],
+        rarity=fields["rarity"],
+        event_rewards=fields["event_rewards"],
+    )
+
+
+def stage_calls(
+    image: np.ndarray,
+    png_path: Path,
+    num_cards: int,
+    engine: OcrEngine | None,
+) -> dict[str, Callable[[], object]]:
+    """Build one zero-argument call per stage, each fed the previous output."""
+    box = detect_board(image)
+    if box is None:
+        raise RuntimeError("board not detected in synthetic image")
+    board = crop_board(image, box)
+    boxes = find_assignment_cards(board)
+    if len(boxes) != num_cards:
+        raise RuntimeError(f"found {len(boxes)} of {num_cards} cards")
+    crops = [crop_region(board, b) for b in boxes]
+    processed = [preprocess_for_ocr(c) for c in crops]
+    if engine is not None:
+        texts = [engine.image_to_string(p, TESSERACT_CONFIG) for p in processed]
+    else:
+        texts = [card_text(i) for i in range(num_cards)]
+    state = BoardState(
+        assignments=[to_assignment(parse_assignment_text(t)) for t in texts]
+    )
+    capture = FileCapture(png_path)
+
+    calls: dict[str, Callable[[], object]] = {
+        "capture": capture,
+        "detect": lambda: detect_board(image),
+        "cards": lambda: find_assignment_cards(board),
+        "preprocess": lambda: [preprocess_for_ocr(c) for c in crops],
+        "parse": lambda: [parse_assignment_text(t) for t in texts],
+        "serialize": lambda: json.dumps(state.to_dict()),
+    }
+    if engine is not None:
+        calls["ocr"] = lambda: [
+            engine.image_to_string(p, TESSERACT_CONFIG) for p in processed
+        ]
+    return calls
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    width, height = (int(v) for v in value.lower().split("x"))
+    return width, height
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="WxH")
+    parser.add_argument("--cards", type=int, nargs="+", default=DEFAULT_CARDS)
+    parser.add_argument(
+        "--stages", nargs="+", choices=STAGES, default=list(STAGES), metavar="STAGE"
+    )
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument(
+        "--ocr-repeat", type=int, default=5, help="Repeats for the (slow) OCR stage"
+    )
+    parser.add_argument("--output", type=Path, help="Save results as JSON")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="p50 slowdown counted as a regression (fraction, default 0.1)",
+    )
+    args = parser.parse_args()
+
+    engine = working_engine() if "ocr" in args.stages else None
+    rows: list[tuple[str, dict[str, float]]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            width, height = parse_size(size)
+            for num_cards in args.cards:
+                image = render_board(width, height, num_cards)
+                png_path = Path(tmp, f"{width}x{height}_{num_cards}.png")
+                cv2.imwrite(str(png_path), image)
+                calls = stage_calls(image, png_path, num_cards, engine)
+                for stage in args.stages:
+                    if stage not in calls:
+                        continue
+                    repeat = args.ocr_repeat if stage == "ocr" else args.repeat
+                    samples = time_calls(
+                        calls[stage], repeat, warmup=1 if stage == "ocr" else 3
+                    )
+                    label = f"{stage} {width}x{height} {num_cards}cards"
+                    rows.append((label, summarize(samples)))
+
+    print_table(rows)
+    if args.output is not None:
+        meta = {
+            **environment(),
+            "ocr_engine": engine.name if engine is not None else "none",
+            "repeat": args.repeat,
+            "ocr_repeat": args.ocr_repeat,
+        }
+        save_results(args.output, rows, meta)
+        print(f"Saved {len(rows)} results to {args.output}", file=sys.stderr)
+    if args.compare is not None:
+        print()
+        regressed = compare_results(args.compare, rows, args.threshold)
+        if regressed:
+            print(f"{len(regressed)} case(s) regressed", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
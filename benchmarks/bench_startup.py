@@ -0,0 +1,122 @@
+"""CLI cold-start time and import cost, checked against budgets.
+
+Runs ``python -X importtime -m zora`` in a fresh interpreter for
+``--version``, ``--help`` and a real ``--image`` read of a fixture
+screenshot, and reports per case:
+
+- ``wall``: median wall time of the whole process
+- ``imports``: median total import time, summed over the top-level
+  imports ``-X importtime`` reports (interpreter startup included)
+- ``heavy``: which of OpenCV, numpy and the OCR libraries got imported
+- the slowest top-level imports of the last run
+
+``--version`` and ``--help`` must not import any heavy module, and each
+case's import time must stay within its budget; the script exits
+non-zero otherwise, so it can run as a check::
+
+    uv run python benchmarks/bench_startup.py --repeat 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+FIXTURE = REPO / "tests" / "fixtures" / "synthetic_board.png"
+# Modules whose import dominates cold start when loaded eagerly
+HEAVY_MODULES = ("cv2", "numpy", "pytesseract", "tesserocr", "easyocr")
+# Import-time budgets per case (ms), and whether heavy modules may load
+CASES = {
+    "--version": (["--version"], 150.0, False),
+    "--help": (["--help"], 120.0, False),
+    "--image": (["--image", str(FIXTURE)], 600.0, True),
+}
+
+
+def parse_importtime(stderr: str) -> dict[str, float]:
+    """Cumulative ms of each top-level import in ``-X importtime`` output."""
+    imports: dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the header row
+        # Nested imports are indented by two spaces per level
+        if name.startswith("  "):
+            continue
+        imports[name.strip()] = int(cumulative) / 1000
+    return imports
+
+
+def imported_modules(stderr: str) -> set[str]:
+    """Every module named in ``-X importtime`` output, nested ones included."""
+    return {
+        line.rpartition("|")[2].strip()
+        for line in stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def run_case(argv: list[str]) -> tuple[float, dict[str, float], set[str]]:
+    """Run the CLI once; return wall ms, top-level imports and all modules."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(REPO / "src"), env.get("PYTHONPATH")])
+    )
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "zora", *argv],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall = (time.perf_counter() - start) * 1000
+    return wall, parse_importtime(result.stderr), imported_modules(result.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=3, help="Slowest imports shown")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    args = parser.parse_args()
+
+    failures: list[str] = []
+    print(
+        f"{'case':<10}  {'wall':>9}  {'imports':>9}  {'budget':>9}  heavy"
+        f"  (slowest imports)"
+    )
+    for case in args.cases:
+        argv, budget, heavy_allowed = CASES[case]
+        walls: list[float] = []
+        totals: list[float] = []
+        for _ in range(args.repeat):
+            wall, imports, modules = run_case(argv)
+            walls.append(wall)
+            totals.append(sum(imports.values()))
+        heavy = sorted(m for m in HEAVY_MODULES if m in modules)
+        total = statistics.median(totals)
+        slowest = sorted(imports.items(), key=lambda item: -item[1])[: args.top]
+        print(
+            f"{case:<10}  {statistics.median(walls):>7.1f}ms  {total:>7.1f}ms"
+            f"  {budget:>7.0f}ms  {','.join(heavy) or '-'}  ("
+            + ", ".join(f"{name} {ms:.1f}ms" for name, ms in slowest)
+            + ")"
+        )
+        if total > budget:
+            failures.append(f"{case}: imports took {total:.1f}ms > {budget:.0f}ms")
+        if heavy and not heavy_allowed:
+            failures.append(f"{case}: imported {', '.join(heavy)}")
+
+    for failure in failures:
+        print(f"OVER BUDGET {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Per-card OCR loop vs one tiled OCR call per board, end to end.
+
+Times ``read_board_from_image`` on synthetic boards (``render_board``) in
+three modes: the default field-by-field extraction, whole-card OCR one
+card at a time (``extract_assignment`` per card, what tiling replaces),
+and ``tiled=True`` (all cards stacked into one canvas, one
+``image_to_data`` call). Also counts fields that differ from the text the
+cards were drawn from::
+
+    uv run python benchmarks/bench_tiled.py --repeat 3
+"""
+
+import argparse
+import sys
+from unittest.mock import patch
+
+from _common import print_table, summarize, time_calls
+from zora.pipeline import read_board_from_image
+from zora.synthetic import SAMPLE_ASSIGNMENTS, render_board
+from zora.vision.extract import extract_assignment
+
+CASES = [(1280, 720, 4), (1920, 1080, 6), (2560, 1440, 6), (3840, 2160, 12)]
+FIELDS = {
+    "name": "name",
+    "engineering": "eng",
+    "science": "sci",
+    "tactical": "tac",
+    "ship_slots": "slots",
+    "duration": "duration",
+    "rarity": "rarity",
+}
+
+
+def wrong_fields(board: dict) -> int:
+    wrong = 0
+    for i, assignment in enumerate(board["assignments"]):
+        sample = SAMPLE_ASSIGNMENTS[i % len(SAMPLE_ASSIGNMENTS)]
+        wrong += sum(assignment[k] != sample[v] for k, v in FIELDS.items())
+    return wrong
+
+
+def whole_card(image):
+    """The pipeline with each card read by one whole-card OCR call."""
+    with patch(
+        "zora.pipeline.extract_assignment_fields",
+        side_effect=lambda card, **kwargs: extract_assignment(card),
+    ):
+        return read_board_from_image(image)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    modes = {
+        "fields": read_board_from_image,
+        "whole-card": whole_card,
+        "tiled": lambda image: read_board_from_image(image, tiled=True),
+    }
+    rows = []
+    for width, height, num_cards in CASES:
+        image = render_board(width, height, num_cards)
+        total = num_cards * len(FIELDS)
+        for label, read in modes.items():
+            board = read(image).to_dict()
+            if len(board["assignments"]) != num_cards:
+                sys.exit(f"{label}: read {len(board['assignments'])} cards")
+            samples = time_calls(lambda: read(image), args.repeat, warmup=1)
+            rows.append(
+                (
+                    f"{label} {width}x{height} {num_cards}cards "
+                    f"({wrong_fields(board)}/{total} wrong)",
+                    summarize(samples),
+                )
+            )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""Offline batch processing of archived screenshots.
+
+Spreads ``read_board`` over a process pool so a directory (or glob) of
+screenshots is read in parallel, with one JSON-serializable result per
+image. Each worker process pays the interpreter and import startup cost
+once, instead of once per file as with repeated ``zora --image`` runs.
+"""
+
+import glob
+import logging
+import os
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+
+from zora.capture.raw import open_frame_source
+from zora.pipeline import read_board
+from zora.vision.cache import OcrCache
+from zora.vision.glyphs import GlyphBank
+from zora.vision.profile import LayoutProfile
+
+logger = logging.getLogger(__name__)
+
+# File extensions picked up when a directory is given as the batch target
+IMAGE_SUFFIXES = frozenset(
+    {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp", ".npy"}
+)
+# Images handed to a worker per round-trip in input-order mode
+ORDERED_CHUNKSIZE = 4
+
+
+@dataclass
+class BatchStats:
+    """Counters and timing for a batch run."""
+
+    images: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def images_per_second(self) -> float:
+        return self.images / self.seconds if self.seconds > 0 else 0.0
+
+
+def collect_image_paths(target: str | Path) -> list[Path]:
+    """Resolve a directory, glob pattern, or single file into image paths.
+
+    Directories are scanned (non-recursively) for known image extensions.
+    Anything else is treated as a glob pattern, where ``**`` recurses.
+    Results are sorted so input order is deterministic.
+    """
+    path = Path(target)
+    if path.is_dir():
+        return sorted(
+            p
+            for p in path.iterdir()
+            if p.is_file() and p.suffix.lower() in IMAGE_SUFFIXES
+        )
+    if path.is_file():
+        return [path]
+    return sorted(
+        Path(p) for p in glob.glob(str(target), recursive=True) if Path(p).is_file()
+    )
+
+
+# OCR cache of the current process, opened by _open_worker_cache
+_worker_cache: OcrCache | None = None
+
+
+def _open_worker_cache(cache_path: str | None) -> None:
+    """Give this process its own OCR cache (in-memory, plus disk if a path)."""
+    global _worker_cache
+    if _worker_cache is not None:
+        _worker_cache.close()
+    _worker_cache = OcrCache(path=cache_path)
+
+
+# Glyph bank of the current process, loaded by _load_worker_glyphs
+_worker_glyphs: GlyphBank | None = None
+
+
+def _load_worker_glyphs(glyphs_path: str | None) -> None:
+    """Load this process's glyph bank, or clear it if no path is given."""
+    global _worker_glyphs
+    _worker_glyphs = GlyphBank.load(glyphs_path) if glyphs_path is not None else None
+
+
+# Layout profile of the current process, loaded by _load_worker_profile
+_worker_profile: LayoutProfile | None = None
+
+
+def _load_worker_profile(profile_path: str | None) -> None:
+    """Load this process's layout profile, or clear it if no path is given."""
+    global _worker_profile
+    _worker_profile = (
+        LayoutProfile.load(profile_path) if profile_path is not None else None
+    )
+
+
+# Name of the OCR engine the current process reads with (None: default)
+_worker_engine: str | None = None
+
+
+def _select_worker_engine(engine_name: str | None) -> None:
+    """Choose this process's OCR engine; it's created on first use."""
+    global _worker_engine
+    _worker_engine = engine_name
+
+
+def _init_worker(
+    cache_path: str | None = None,
+    glyphs_path: str | None = None,
+    engine_name: str | None = None,
+    profile_path: str | None = None,
+) -> None:
+    """Per-process setup: a private OCR cache and single-threaded OpenCV.
+
+    The pool already uses every core; letting each worker also spawn an
+    OpenCV thread pool oversubscribes the CPU and hurts scaling.
+    """
+    cv2.setNumThreads(1)
+    _open_worker_cache(cache_path)
+    _load_worker_glyphs(glyphs_path)
+    _select_worker_engine(engine_name)
+    _load_worker_profile(profile_path)
+
+
+def read_image_file(path: str | Path) -> dict:
+    """Read one screenshot and return its board as a JSON-ready dict.
+
+    Failures are reported in an ``error`` field rather than raised, so one
+    corrupt file doesn't abort a batch of thousands. Encoded images are
+    decoded from a memory map and ``.npy`` frames are used without decoding
+    (see ``zora.capture.raw``).
+    """
+    try:
+        with open_frame_source(path) as source:
+            board = read_board(
+                source,
+                cache=_worker_cache,
+                glyphs=_worker_glyphs,
+                engine=_worker_engine,
+                profile=_worker_profile,
+            )
+    except Exception as exc:
+        logger.debug("Failed to read %s", path, exc_info=True)
+        return {"image": str(path), "error": f"{type(exc).__name__}: {exc}"}
+    return {"image": str(path), **board.to_dict()}
+
+
+def run_batch(
+    paths: Sequence[str | Path],
+    workers: int | None = None,
+    ordered: bool = False,
+    stats: BatchStats | None = None,
+    cache_path: str | Path | None = None,
+    glyphs_path: str | Path | None = None,
+    engine_name: str | None = None,
+    profile_path: str | Path | None = None,
+) -> Iterator[dict]:
+    """Read every image in ``paths``, yielding one result dict per image.
+
+    Results stream in completion order by default, or in input order when
+    ``ordered`` is set. ``workers`` defaults to the CPU count; with a single
+    worker images are read in-process without a pool. If ``stats`` is
+    given it is updated as results are produced.
+
+    Every worker keeps an in-memory OCR cache so cards repeated across
+    screenshots are only read once per worker; ``cache_path`` adds a
+    shared on-disk store that also survives between runs. ``glyphs_path``
+    names a saved ``GlyphBank`` each worker loads for numeric fields.
+    ``engine_name`` selects a registered OCR engine (see
+    ``zora.vision.ocr.get_engine``), created once per worker.
+    ``profile_path`` names a saved ``LayoutProfile`` (``zora calibrate``)
+    each worker crops boards with, skipping detection.
+    """
+    stats = stats if stats is not None else BatchStats()
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    def _record(result: dict) -> dict:
+        stats.images += 1
+        if "error" in result:
+            stats.failed += 1
+        stats.seconds = time.perf_counter() - start
+        return result
+
+    cache_arg = str(cache_path) if cache_path is not None else None
+    glyphs_arg = str(glyphs_path) if glyphs_path is not None else None
+    profile_arg = str(profile_path) if profile_path is not None else None
+    if workers == 1 or len(paths) <= 1:
+        _open_worker_cache(cache_arg)
+        _load_worker_glyphs(glyphs_arg)
+        _select_worker_engine(engine_name)
+        _load_worker_profile(profile_arg)
+        for path in paths:
+            yield _record(read_image_file(path))
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(cache_arg, glyphs_arg, engine_name, profile_arg),
+    ) as pool:
+        if ordered:
+            results = pool.map(read_image_file, paths, chunksize=ORDERED_CHUNKSIZE)
+            for result in results:
+                yield _record(result)
+        else:
+            futures = [pool.submit(read_image_file, path) for path in paths]
+            for future in as_completed(futures):
+                yield _record(future.result())
@@ -25,5 +25,19 @@ class CaptureSource(Protocol):
 
 
 from zora.capture.file import FileCapture  # noqa: E402
-
-__all__ = ["BGRImage", "CaptureSource", "FileCapture"]
+from zora.capture.raw import (  # noqa: E402
+    MmapFileCapture,
+    NpyCapture,
+    RawFrameCapture,
+    open_frame_source,
+)
+
+__all__ = [
+    "BGRImage",
+    "CaptureSource",
+    "FileCapture",
+    "MmapFileCapture",
+    "NpyCapture",
+    "RawFrameCapture",
+    "open_frame_source",
+]
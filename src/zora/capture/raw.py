@@ -0,0 +1,206 @@
+"""Memory-mapped capture sources for archived frames.
+
+``FileCapture`` re-opens its path and fully decodes a PNG on every call,
+which makes reprocessing a frame archive decode-bound. These sources keep
+the file mapped instead:
+
+- ``NpyCapture`` maps a ``.npy`` array (one frame, or a stack of frames)
+  and returns views into it — no decode and no copy.
+- ``RawFrameCapture`` does the same for headerless BGR/BGRA dumps of a
+  known shape, such as frames written straight from a capture buffer.
+- ``MmapFileCapture`` maps an encoded image once and decodes from the
+  mapped bytes with ``cv2.imdecode``, skipping the per-call open/read.
+
+Frames returned by the mapped sources are read-only; the pipeline only
+reads its input, so that is enough to satisfy ``CaptureSource``.
+"""
+
+import mmap
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from zora.capture import BGRImage
+
+# Channel counts accepted for raw frames: BGR, or BGRA as grabbed by mss
+RAW_CHANNELS = (3, 4)
+# Suffix routed to NpyCapture by open_frame_source
+NPY_SUFFIX = ".npy"
+
+
+def _as_bgr(frame: np.ndarray, source: Path) -> BGRImage:
+    """Validate a mapped frame and return it as a BGR array.
+
+    BGR frames are returned as views; BGRA frames are converted (a copy).
+    """
+    if frame.dtype != np.uint8 or frame.ndim != 3 or frame.shape[2] not in RAW_CHANNELS:
+        raise ValueError(
+            f"Expected a uint8 HxWx3 or HxWx4 frame in {source}, "
+            f"got {frame.dtype} {frame.shape}"
+        )
+    if frame.shape[2] == 4:
+        return cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+    return np.ascontiguousarray(frame)
+
+
+class NpyCapture:
+    """Return frames from a memory-mapped ``.npy`` file.
+
+    The array may hold one frame (H x W x C) or a stack (N x H x W x C);
+    for a stack, ``index`` selects the frame. Nothing is read from disk
+    until the pipeline touches the pixels.
+
+    Usage::
+
+        capture = NpyCapture("frames.npy", index=42)
+        image = capture()
+    """
+
+    def __init__(self, path: str | Path, index: int | None = None) -> None:
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Capture file not found: {self.path}")
+        array = np.load(self.path, mmap_mode="r", allow_pickle=False)
+        if array.ndim == 4:
+            if index is None:
+                raise ValueError(f"{self.path} holds {len(array)} frames; pass index=")
+            if not -len(array) <= index < len(array):
+                raise IndexError(f"Frame {index} out of range for {len(array)} frames")
+        elif index is not None:
+            raise ValueError(f"{self.path} holds a single frame; index must be None")
+        self.index = index
+        self._array: np.ndarray | None = array
+
+    def __len__(self) -> int:
+        """Number of frames in the file."""
+        array = self._mapped()
+        return len(array) if array.ndim == 4 else 1
+
+    def __call__(self) -> BGRImage:
+        """Return the selected frame as a BGR numpy array."""
+        array = self._mapped()
+        frame = array if self.index is None else array[self.index]
+        return _as_bgr(np.asarray(frame), self.path)
+
+    def _mapped(self) -> np.ndarray:
+        if self._array is None:
+            raise RuntimeError(f"NpyCapture for {self.path} is closed")
+        return self._array
+
+    def close(self) -> None:
+        """Drop this source's reference to the mapping.
+
+        The file is unmapped once frames returned earlier are released too.
+        """
+        self._array = None
+
+    def __enter__(self) -> "NpyCapture":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class RawFrameCapture:
+    """Return frames from a memory-mapped headerless pixel dump.
+
+    The file holds one or more back-to-back frames of ``height x width x
+    channels`` uint8 pixels, starting ``offset`` bytes in; ``index``
+    selects the frame.
+
+    Usage::
+
+        capture = RawFrameCapture("frame.bgra", shape=(1080, 1920, 4))
+        image = capture()
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        shape: tuple[int, int, int],
+        index: int = 0,
+        offset: int = 0,
+    ) -> None:
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Capture file not found: {self.path}")
+        if len(shape) != 3 or shape[2] not in RAW_CHANNELS:
+            raise ValueError(f"Raw frame shape must be (H, W, 3|4), got {shape}")
+        frame_bytes = shape[0] * shape[1] * shape[2]
+        start = offset + index * frame_bytes
+        size = self.path.stat().st_size
+        if index < 0 or start + frame_bytes > size:
+            raise ValueError(
+                f"Frame {index} of shape {shape} at offset {offset} "
+                f"does not fit in {self.path} ({size} bytes)"
+            )
+        self.shape = shape
+        self.index = index
+        self._frame = np.memmap(
+            self.path, dtype=np.uint8, mode="r", offset=start, shape=shape
+        )
+
+    def __call__(self) -> BGRImage:
+        """Return the frame as a BGR numpy array."""
+        return _as_bgr(np.asarray(self._frame), self.path)
+
+
+class MmapFileCapture:
+    """Decode an encoded image (PNG, JPEG, ...) from a memory-mapped file.
+
+    The file is opened and mapped once; each call decodes straight from
+    the mapping. Call ``close()`` (or use as a context manager) to release
+    the mapping.
+
+    Usage::
+
+        with MmapFileCapture("board.png") as capture:
+            image = capture()
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Capture file not found: {self.path}")
+        if self.path.stat().st_size == 0:
+            raise ValueError(f"Failed to read image: {self.path} is empty")
+        with open(self.path, "rb") as f:
+            self._map: mmap.mmap | None = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+    def __call__(self) -> BGRImage:
+        """Decode and return the image as a BGR numpy array."""
+        if self._map is None:
+            raise RuntimeError(f"MmapFileCapture for {self.path} is closed")
+        buffer = np.frombuffer(self._map, dtype=np.uint8)
+        image = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+        # Drop the exported buffer before the mapping may be closed
+        del buffer
+        if image is None:
+            raise ValueError(f"Failed to read image: {self.path}")
+        return image
+
+    def close(self) -> None:
+        """Unmap the file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self) -> "MmapFileCapture":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def open_frame_source(path: str | Path) -> NpyCapture | MmapFileCapture:
+    """Pick a mapped capture source for an archived frame by file suffix.
+
+    ``.npy`` files are mapped as raw arrays; anything else is treated as an
+    encoded image.
+    """
+    if Path(path).suffix.lower() == NPY_SUFFIX:
+        return NpyCapture(path)
+    return MmapFileCapture(path)
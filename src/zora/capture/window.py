@@ -0,0 +1,211 @@
+"""Window capture source — grab only the game client's window (Linux/X11).
+
+``ScreenshotCapture(monitor=0)`` grabs the whole virtual desktop, and
+``detect_board`` then searches all of it for a board that lives inside
+one window. ``WindowCapture`` finds the game window by title or
+``WM_CLASS`` and grabs just its client rectangle, so both the bytes
+captured and the area detection searches shrink by the ratio of desktop
+area to window area.
+
+Finding a window walks the X window tree and querying its position costs
+server round trips, so neither happens per frame. The window's geometry
+is kept, and the capture listens for the window's structure events
+(``ConfigureNotify`` when it moves or resizes, on the client window and
+its window manager frame) and re-resolves the geometry only after one
+arrives; a destroyed window is looked up again by title or class.
+
+Needs python-xlib (for the window) and mss (for the pixels), and a
+display: the ``DISPLAY`` environment variable picks the X server, as
+for ``ScreenshotCapture``.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from zora.capture import BGRImage
+from zora.capture.screenshot import ScreenshotCapture
+from zora.vision import BoundingBox
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WindowCaptureStats:
+    """Frames grabbed, and how often the window had to be looked up."""
+
+    frames: int = 0
+    lookups: int = 0
+    geometry_updates: int = 0
+
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict for JSON output."""
+        return {
+            "frames": self.frames,
+            "lookups": self.lookups,
+            "geometry_updates": self.geometry_updates,
+        }
+
+
+class WindowCapture:
+    """Capture the client area of the window matching a title or class.
+
+    ``title`` matches any window whose title contains it, and ``wm_class``
+    any window whose ``WM_CLASS`` instance or class name equals it (both
+    case-insensitively); with both, a window must match both. Only
+    viewable (mapped) windows are considered. Like any screen grab, the
+    capture holds whatever is on screen over the client area, so keep the
+    window unobscured.
+
+    Usage::
+
+        with WindowCapture(title="Star Trek Online") as capture:
+            image = capture()  # just the game's client area
+
+    Raises ValueError without a title or class. Captures raise
+    RuntimeError while no matching window is on screen.
+    """
+
+    def __init__(self, title: str | None = None, wm_class: str | None = None) -> None:
+        if not title and not wm_class:
+            raise ValueError("WindowCapture needs a window title or class")
+        self.title = title
+        self.wm_class = wm_class
+        self.stats = WindowCaptureStats()
+        self.box: BoundingBox | None = None
+        self._screen = ScreenshotCapture(monitor=0)
+        self._display: Any = None
+        self._window: Any = None
+        self._watched: set[int] = set()
+
+    def open(self) -> None:
+        """Connect to the X server and the grabber if not connected yet."""
+        if self._display is None:
+            from Xlib import display
+
+            self._display = display.Display()
+        self._screen.open()
+
+    def close(self) -> None:
+        """Disconnect from the X server and release the grabber."""
+        if self._display is not None:
+            self._display.close()
+        self._display = None
+        self._window = None
+        self._watched = set()
+        self.box = None
+        self._screen.close()
+
+    def __enter__(self) -> "WindowCapture":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __call__(self) -> BGRImage:
+        """Capture and return the window's client area as BGR."""
+        self.open()
+        self._process_events()
+        if self._window is None:
+            self._window = self._find_window()
+            self._watch(self._window)
+        if self.box is None:
+            self.box = self._client_box(self._window)
+        self._screen.region = self.box
+        self.stats.frames += 1
+        return self._screen()
+
+    def _process_events(self) -> None:
+        """Drop the geometry (or the window) if it changed since last frame."""
+        from Xlib import X
+
+        display = self._display
+        while display.pending_events():
+            event = display.next_event()
+            window = getattr(event, "window", None)
+            if window is None or window.id not in self._watched:
+                continue
+            if event.type in (X.DestroyNotify, X.UnmapNotify):
+                logger.debug("Window %#x went away", event.window.id)
+                self._window = None
+                self._watched = set()
+                self.box = None
+            elif event.type == X.ConfigureNotify:
+                self.box = None
+            elif event.type == X.ReparentNotify and self._window is not None:
+                # A window manager framed (or unframed) the window
+                self.box = None
+                self._watch(self._window)
+
+    def _matches(self, window: Any) -> bool:
+        from Xlib import X
+
+        display = self._display
+        if self.title:
+            name = window.get_full_text_property(display.get_atom("_NET_WM_NAME"))
+            name = name or window.get_wm_name()
+            if not isinstance(name, str) or self.title.lower() not in name.lower():
+                return False
+        if self.wm_class:
+            names = window.get_wm_class() or ()
+            if self.wm_class.lower() not in (n.lower() for n in names):
+                return False
+        return window.get_attributes().map_state == X.IsViewable
+
+    def _find_window(self) -> Any:
+        """Breadth-first search of the window tree for a matching window."""
+        from Xlib import error
+
+        self.stats.lookups += 1
+        pending = [self._display.screen().root]
+        while pending:
+            window = pending.pop(0)
+            try:
+                if self._matches(window):
+                    logger.debug("Capturing window %#x", window.id)
+                    return window
+                pending.extend(window.query_tree().children)
+            except error.XError:
+                continue  # destroyed while we looked
+        wanted = " and ".join(
+            f"{label} {value!r}"
+            for label, value in (("title", self.title), ("class", self.wm_class))
+            if value
+        )
+        raise RuntimeError(f"No window on screen with {wanted}")
+
+    def _watch(self, window: Any) -> None:
+        """Ask for structure events of the window and its top-level frame."""
+        from Xlib import X
+
+        root = self._display.screen().root
+        watched = {window.id}
+        window.change_attributes(event_mask=X.StructureNotifyMask)
+        frame = window
+        while True:
+            parent = frame.query_tree().parent
+            if parent is None or parent.id == root.id:
+                break
+            frame = parent
+        if frame.id != window.id:
+            # Window managers move the frame, not the client inside it
+            frame.change_attributes(event_mask=X.StructureNotifyMask)
+            watched.add(frame.id)
+        self._watched = watched
+
+    def _client_box(self, window: Any) -> BoundingBox:
+        """The window's client area on the screen, clipped to the screen."""
+        self.stats.geometry_updates += 1
+        root = self._display.screen().root
+        origin = root.translate_coords(window, 0, 0)
+        geometry = window.get_geometry()
+        screen = root.get_geometry()
+        left, top = max(0, origin.x), max(0, origin.y)
+        right = min(screen.width, origin.x + geometry.width)
+        bottom = min(screen.height, origin.y + geometry.height)
+        if right <= left or bottom <= top:
+            raise RuntimeError(f"Window {window.id:#x} is off screen")
+        box = BoundingBox(x=left, y=top, width=right - left, height=bottom - top)
+        logger.debug("Window %#x client area at %s", window.id, box)
+        return box
@@ -1,66 +1,467 @@
-"""Command-line entry point for Zora."""
+"""Command-line entry point for Zora.
+
+Wrapper scripts call the CLI often, so startup matters: OpenCV, numpy and
+the OCR engines take far longer to import than ``--version`` or ``--help``
+take to run. Only light modules are imported here; the pipeline and
+everything behind it are imported inside the functions that run it, and
+modules needed only for annotations are imported under TYPE_CHECKING.
+``benchmarks/bench_startup.py`` keeps this honest.
+"""
 
 import argparse
-import importlib.metadata
+import contextlib
 import json
 import logging
 import sys
+from typing import TYPE_CHECKING
+
+from zora.defaults import DEFAULT_WATCH_INTERVAL, EXECUTOR_KINDS, MASK_ENGINES
+from zora.vision.ocr import engine_names
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
-from zora.capture.file import FileCapture
-from zora.pipeline import read_board
+    from zora.capture import CaptureSource
+    from zora.vision.cache import OcrCache
+    from zora.vision.glyphs import GlyphBank
+    from zora.vision.ocr import OcrEngine
+    from zora.vision.profile import LayoutProfile
+
+logger = logging.getLogger(__name__)
 
 
 def _get_version() -> str:
     """Read the package version from installed metadata."""
+    import importlib.metadata
+
     try:
         return importlib.metadata.version("zora")
     except importlib.metadata.PackageNotFoundError:
         return "0.1.0"
 
 
-def main() -> None:
-    """Run the Zora admiralty board reader."""
+class _VersionAction(argparse.Action):
+    """``--version``, looking the version up only when the flag is given.
+
+    Reading package metadata imports ``importlib.metadata`` and scans the
+    import path, which ``--help`` and ordinary runs shouldn't pay for.
+    """
+
+    def __init__(self, option_strings: list[str], dest: str, help: str) -> None:
+        super().__init__(
+            option_strings, dest, nargs=0, default=argparse.SUPPRESS, help=help
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        print(f"{parser.prog} {_get_version()}")
+        parser.exit()
+
+
+def _add_common_arguments(
+    parser: argparse.ArgumentParser,
+    suppress_defaults: bool = False,
+    image: bool = True,
+) -> None:
+    """Add the options shared by the top-level command and subcommands.
+
+    Subcommands suppress their defaults so that an option given before the
+    subcommand name (``zora -v watch``) isn't reset by the subparser.
+    """
+    if image:
+        parser.add_argument(
+            "--image",
+            type=str,
+            default=argparse.SUPPRESS if suppress_defaults else None,
+            help="Path to a screenshot image file (instead of live capture)",
+        )
+        parser.add_argument(
+            "--window",
+            metavar="TITLE",
+            default=argparse.SUPPRESS if suppress_defaults else None,
+            help="Capture only the window whose title contains TITLE (X11)",
+        )
+        parser.add_argument(
+            "--window-class",
+            metavar="CLASS",
+            default=argparse.SUPPRESS if suppress_defaults else None,
+            help="Capture only the window of this WM_CLASS (X11)",
+        )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        default=argparse.SUPPRESS if suppress_defaults else False,
+        help="Enable verbose logging",
+    )
+
+
+def _add_executor_arguments(
+    parser: argparse.ArgumentParser, suppress_defaults: bool = False
+) -> None:
+    """Add the options controlling concurrent per-card extraction."""
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=argparse.SUPPRESS if suppress_defaults else 1,
+        help="Cards extracted concurrently (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=EXECUTOR_KINDS,
+        default=argparse.SUPPRESS if suppress_defaults else "thread",
+        help="Executor used when --workers > 1 (default: thread)",
+    )
+
+
+def _add_cache_argument(
+    parser: argparse.ArgumentParser, suppress_defaults: bool = False
+) -> None:
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        default=argparse.SUPPRESS if suppress_defaults else None,
+        help="Persist OCR results in this SQLite file and reuse them across runs",
+    )
+
+
+def _add_multiscale_argument(
+    parser: argparse.ArgumentParser, suppress_defaults: bool = False
+) -> None:
+    parser.add_argument(
+        "--multiscale",
+        action="store_true",
+        default=argparse.SUPPRESS if suppress_defaults else False,
+        help="Detect the board on a downscaled frame (faster on 4K/ultrawide)",
+    )
+
+
+def _add_mask_engine_argument(
+    parser: argparse.ArgumentParser, suppress_defaults: bool = False
+) -> None:
+    parser.add_argument(
+        "--mask-engine",
+        choices=MASK_ENGINES,
+        default=argparse.SUPPRESS if suppress_defaults else "hsv",
+        help="How board and card colour masks are made (default: hsv; "
+        "lut skips the HSV conversion)",
+    )
+
+
+def _add_glyphs_argument(
+    parser: argparse.ArgumentParser, suppress_defaults: bool = False
+) -> None:
+    parser.add_argument(
+        "--glyphs",
+        metavar="PATH",
+        default=argparse.SUPPRESS if suppress_defaults else None,
+        help="Read numeric fields with this glyph bank (see 'zora glyphs')",
+    )
+
+
+def _add_profile_argument(
+    parser: argparse.ArgumentParser, suppress_defaults: bool = False
+) -> None:
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        default=argparse.SUPPRESS if suppress_defaults else None,
+        help="Crop the board with this layout profile (see 'zora calibrate')",
+    )
+
+
+def _add_tiled_argument(
+    parser: argparse.ArgumentParser, suppress_defaults: bool = False
+) -> None:
+    parser.add_argument(
+        "--tiled-ocr",
+        action="store_true",
+        default=argparse.SUPPRESS if suppress_defaults else False,
+        help="Read all cards in one OCR call on a stacked canvas",
+    )
+
+
+def _add_engine_argument(
+    parser: argparse.ArgumentParser, suppress_defaults: bool = False
+) -> None:
+    parser.add_argument(
+        "--ocr-engine",
+        choices=engine_names(),
+        default=argparse.SUPPRESS if suppress_defaults else None,
+        help="OCR engine to read cards with (default: auto, Tesseract)",
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="zora",
         description="Read the Star Trek Online Admiralty assignment board",
     )
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"%(prog)s {_get_version()}",
+        action=_VersionAction,
+        help="show program's version number and exit",
     )
-    parser.add_argument(
-        "--image",
-        type=str,
-        help="Path to a screenshot image file (instead of live capture)",
+    _add_common_arguments(parser)
+    _add_executor_arguments(parser)
+    _add_cache_argument(parser)
+    _add_multiscale_argument(parser)
+    _add_mask_engine_argument(parser)
+    _add_glyphs_argument(parser)
+    _add_tiled_argument(parser)
+    _add_engine_argument(parser)
+    _add_profile_argument(parser)
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    watch = subparsers.add_parser(
+        "watch",
+        help="Continuously read the board, printing JSON lines on change",
+        description=(
+            "Capture the board every --interval seconds and print a JSON "
+            "line each time it changes. Unchanged frames skip OCR entirely."
+        ),
     )
-    parser.add_argument(
-        "--verbose",
-        "-v",
+    _add_common_arguments(watch, suppress_defaults=True)
+    _add_executor_arguments(watch, suppress_defaults=True)
+    _add_cache_argument(watch, suppress_defaults=True)
+    _add_multiscale_argument(watch, suppress_defaults=True)
+    _add_mask_engine_argument(watch, suppress_defaults=True)
+    _add_glyphs_argument(watch, suppress_defaults=True)
+    _add_tiled_argument(watch, suppress_defaults=True)
+    _add_engine_argument(watch, suppress_defaults=True)
+    _add_profile_argument(watch, suppress_defaults=True)
+    watch.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_WATCH_INTERVAL,
+        help="Seconds between captures (default: %(default)s)",
+    )
+    watch.add_argument(
+        "--max-frames",
+        type=int,
+        default=None,
+        help="Stop after this many captures (default: run until interrupted)",
+    )
+
+    batch = subparsers.add_parser(
+        "batch",
+        help="Read a directory or glob of screenshots in parallel (JSON lines)",
+        description=(
+            "Read every screenshot in a directory or matching a glob pattern "
+            "across a process pool, printing one JSON line per image."
+        ),
+    )
+    _add_common_arguments(batch, suppress_defaults=True, image=False)
+    _add_cache_argument(batch, suppress_defaults=True)
+    _add_glyphs_argument(batch, suppress_defaults=True)
+    _add_engine_argument(batch, suppress_defaults=True)
+    _add_profile_argument(batch, suppress_defaults=True)
+    batch.add_argument("target", help="Directory, glob pattern, or image file")
+    batch.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker processes (default: number of CPUs)",
+    )
+    batch.add_argument(
+        "--ordered",
         action="store_true",
-        help="Enable verbose logging",
+        help="Emit results in input order instead of completion order",
     )
-    args = parser.parse_args()
 
-    if args.verbose:
-        logging.basicConfig(level=logging.DEBUG, format="%(name)s: %(message)s")
+    stitch = subparsers.add_parser(
+        "stitch",
+        help="Read a scrolling board from screenshots taken while scrolling",
+        description=(
+            "Read screenshots taken while scrolling through the board, in "
+            "order, and print the whole list as one board. Consecutive "
+            "screenshots must overlap; cards seen in several are read once."
+        ),
+    )
+    _add_common_arguments(stitch, suppress_defaults=True, image=False)
+    _add_executor_arguments(stitch, suppress_defaults=True)
+    _add_cache_argument(stitch, suppress_defaults=True)
+    _add_mask_engine_argument(stitch, suppress_defaults=True)
+    _add_glyphs_argument(stitch, suppress_defaults=True)
+    _add_engine_argument(stitch, suppress_defaults=True)
+    stitch.add_argument("frames", nargs="+", help="Screenshots, in scroll order")
+
+    glyphs = subparsers.add_parser(
+        "glyphs",
+        help="Build a glyph bank for numeric fields from labeled crops",
+        description=(
+            "Build a glyph bank from a directory of field crops named after "
+            "their text (e.g. 30.png, 4h_2.png) and save it for --glyphs."
+        ),
+    )
+    _add_common_arguments(glyphs, suppress_defaults=True, image=False)
+    glyphs.add_argument("samples", help="Directory of labeled field crops")
+    glyphs.add_argument(
+        "--output", "-o", required=True, help="Where to write the bank (.npz)"
+    )
+
+    calibrate = subparsers.add_parser(
+        "calibrate",
+        help="Record the board layout to a profile that skips detection",
+        description=(
+            "Detect the board, its cards and their fields once, on a "
+            "screenshot showing a full board, and save them as a layout "
+            "profile for --profile. Recalibrate after changing the game "
+            "resolution or UI scale."
+        ),
+    )
+    _add_common_arguments(calibrate, suppress_defaults=True)
+    _add_multiscale_argument(calibrate, suppress_defaults=True)
+    calibrate.add_argument(
+        "--output", "-o", required=True, help="Where to write the profile (.json)"
+    )
+    return parser
+
 
+def _make_source(args: argparse.Namespace) -> "CaptureSource":
+    """Build the capture source selected by the command-line options."""
     if args.image:
-        source = FileCapture(args.image)
-    else:
-        try:
-            from zora.capture.screenshot import ScreenshotCapture
+        from zora.capture.file import FileCapture
+
+        return FileCapture(args.image)
+    if args.window or args.window_class:
+        from importlib.util import find_spec
 
-            source = ScreenshotCapture()
-        except ImportError:
+        if find_spec("mss") is None or find_spec("Xlib") is None:
             print(
-                "Error: Live capture requires the 'mss' package. "
-                "Install it with: pip install zora[capture]",
+                "Error: Window capture requires the 'mss' and 'python-xlib' "
+                "packages. Install them with: pip install zora[capture]",
                 file=sys.stderr,
             )
             sys.exit(1)
+        from zora.capture.window import WindowCapture
+
+        return WindowCapture(title=args.window, wm_class=args.window_class)
+    try:
+        from zora.capture.screenshot import ScreenshotCapture
+
+        return ScreenshotCapture()
+    except ImportError:
+        print(
+            "Error: Live capture requires the 'mss' package. "
+            "Install it with: pip install zora[capture]",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+def _make_executor(args: argparse.Namespace) -> contextlib.AbstractContextManager:
+    """Context manager yielding the per-card executor, or None if sequential."""
+    if args.workers <= 1:
+        return contextlib.nullcontext()
+    from zora.pipeline import make_executor
+
+    return make_executor(args.executor, args.workers)
+
+
+def _make_cache(args: argparse.Namespace, in_memory: bool = False) -> "OcrCache | None":
+    """Open the OCR cache requested by --cache.
+
+    With ``in_memory`` an unpersisted cache is used even without --cache,
+    unless cards go to a process executor that couldn't share it.
+    """
+    from zora.vision.cache import OcrCache
+
+    uses_processes = args.workers > 1 and args.executor == "process"
+    if args.cache is not None:
+        if uses_processes:
+            print(
+                "Error: --cache can't be combined with --executor process",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        return OcrCache(path=args.cache)
+    if in_memory and not uses_processes:
+        return OcrCache()
+    return None
+
+
+def _load_glyphs(args: argparse.Namespace) -> "GlyphBank | None":
+    """Load the glyph bank requested by --glyphs."""
+    if args.glyphs is None:
+        return None
+    from zora.vision.glyphs import GlyphBank
+
+    try:
+        return GlyphBank.load(args.glyphs)
+    except (OSError, KeyError, ValueError) as exc:
+        print(f"Error: can't load glyph bank {args.glyphs}: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _load_profile(args: argparse.Namespace) -> "LayoutProfile | None":
+    """Load the layout profile requested by --profile."""
+    if args.profile is None:
+        return None
+    from zora.vision.profile import LayoutProfile
+
+    try:
+        return LayoutProfile.load(args.profile)
+    except (OSError, KeyError, TypeError, ValueError) as exc:
+        print(
+            f"Error: can't load layout profile {args.profile}: {exc}", file=sys.stderr
+        )
+        sys.exit(1)
+
+
+def _make_engine(
+    args: argparse.Namespace, in_process: bool = True
+) -> "OcrEngine | str | None":
+    """Create the OCR engine selected by --ocr-engine (None for the default).
+
+    The engine is created up front so a missing library is reported once.
+    Unless ``in_process``, it is only checked (``check_engine``) and its
+    name is returned instead, for process workers to create their own.
+    """
+    if args.ocr_engine is None:
+        return None
+    from zora.vision.ocr import check_engine, get_engine
+
+    try:
+        if not in_process:
+            check_engine(args.ocr_engine)
+            return args.ocr_engine
+        return get_engine(args.ocr_engine)
+    except (ImportError, RuntimeError) as exc:
+        print(
+            f"Error: OCR engine {args.ocr_engine!r} is unavailable: {exc}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+def _log_cache_stats(cache: "OcrCache | None") -> None:
+    if cache is not None:
+        logger.info("OCR cache: %s", cache.stats.to_dict())
+        cache.close()
+
 
-    board = read_board(source)
+def _run_read(args: argparse.Namespace) -> None:
+    """Read the board once and print it as JSON."""
+    from zora.pipeline import read_board
+    from zora.vision.track import BoardTracker
+
+    source = _make_source(args)
+    cache = _make_cache(args)
+    executor: "Executor | None"
+    with _make_executor(args) as executor:
+        board = read_board(
+            source,
+            executor=executor,
+            cache=cache,
+            tracker=BoardTracker(multiscale=args.multiscale),
+            glyphs=_load_glyphs(args),
+            tiled=args.tiled_ocr,
+            engine=_make_engine(args, in_process=args.executor != "process"),
+            profile=_load_profile(args),
+            mask_engine=args.mask_engine,
+        )
+    _log_cache_stats(cache)
     if board.errors:
         print(
             f"Warning: {len(board.errors)} card(s) failed extraction. "
@@ -69,3 +470,165 @@ def main() -> None:
         )
     json.dump(board.to_dict(), sys.stdout, indent=2)
     sys.stdout.write("\n")
+
+
+def _run_watch(args: argparse.Namespace) -> None:
+    """Poll the board and print one JSON line per change."""
+    from zora.vision.track import BoardTracker
+    from zora.watch import BoardWatcher
+
+    source = _make_source(args)
+    cache = _make_cache(args, in_memory=True)
+    executor: "Executor | None"
+    with _make_executor(args) as executor:
+        watcher = BoardWatcher(
+            source,
+            interval=args.interval,
+            executor=executor,
+            cache=cache,
+            tracker=BoardTracker(multiscale=args.multiscale),
+            glyphs=_load_glyphs(args),
+            tiled=args.tiled_ocr,
+            engine=_make_engine(args, in_process=args.executor != "process"),
+            profile=_load_profile(args),
+            mask_engine=args.mask_engine,
+        )
+        try:
+            for board in watcher.watch(max_frames=args.max_frames):
+                json.dump(board.to_dict(), sys.stdout)
+                sys.stdout.write("\n")
+                sys.stdout.flush()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            logger.info("Watch stats: %s", watcher.stats.to_dict())
+            logger.info("Board tracker: %s", watcher.tracker.stats.to_dict())
+            logger.info("Card tracker: %s", watcher.card_tracker.stats.to_dict())
+            _log_cache_stats(cache)
+
+
+def _run_batch(args: argparse.Namespace) -> None:
+    """Read many screenshots in parallel and print one JSON line per image."""
+    from zora.batch import BatchStats, collect_image_paths, run_batch
+
+    paths = collect_image_paths(args.target)
+    if not paths:
+        print(f"Error: no images found for {args.target!r}", file=sys.stderr)
+        sys.exit(1)
+    _make_engine(args, in_process=False)  # fail early if the engine is unavailable
+    _load_profile(args)  # ...or the profile unreadable
+
+    stats = BatchStats()
+    for result in run_batch(
+        paths,
+        workers=args.workers,
+        ordered=args.ordered,
+        stats=stats,
+        cache_path=args.cache,
+        glyphs_path=args.glyphs,
+        engine_name=args.ocr_engine,
+        profile_path=args.profile,
+    ):
+        json.dump(result, sys.stdout)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+    print(
+        f"Processed {stats.images} image(s) in {stats.seconds:.2f}s "
+        f"({stats.images_per_second:.1f} images/s, {stats.failed} failed)",
+        file=sys.stderr,
+    )
+
+
+def _run_stitch(args: argparse.Namespace) -> None:
+    """Read screenshots of a scrolled board and print the merged board."""
+    from zora.capture.file import FileCapture
+    from zora.pipeline import read_scrolling_board
+    from zora.vision.scroll import CardStitcher
+
+    try:
+        sources = [FileCapture(path) for path in args.frames]
+    except FileNotFoundError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    cache = _make_cache(args)
+    stitcher = CardStitcher()
+    executor: "Executor | None"
+    with _make_executor(args) as executor:
+        board = read_scrolling_board(
+            (source() for source in sources),
+            executor=executor,
+            cache=cache,
+            glyphs=_load_glyphs(args),
+            engine=_make_engine(args, in_process=args.executor != "process"),
+            stitcher=stitcher,
+            mask_engine=args.mask_engine,
+        )
+    _log_cache_stats(cache)
+    stats = stitcher.stats
+    print(
+        f"Stitched {stats.frames} frame(s): {stats.new} card(s) read, "
+        f"{stats.repeated} repeated and {stats.cut_off} cut off skipped",
+        file=sys.stderr,
+    )
+    json.dump(board.to_dict(), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+def _run_glyphs(args: argparse.Namespace) -> None:
+    """Build a glyph bank from labeled crops and save it."""
+    from zora.vision.glyphs import GlyphBank
+
+    try:
+        bank = GlyphBank.from_directory(args.samples)
+    except (OSError, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    bank.save(args.output)
+    print(
+        f"Saved {len(bank)} templates for {bank.alphabet!r} to {args.output}",
+        file=sys.stderr,
+    )
+
+
+def _run_calibrate(args: argparse.Namespace) -> None:
+    """Record the board layout of one capture as a profile and save it."""
+    from zora.vision.profile import calibrate
+
+    image = _make_source(args)()
+    try:
+        profile = calibrate(image, multiscale=args.multiscale)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    profile.save(args.output)
+    board = profile.board
+    with_fields = sum(1 for card in profile.cards if card.fields)
+    print(
+        f"Saved profile for {profile.frame_size[0]}x{profile.frame_size[1]}: "
+        f"board {board.width}x{board.height} at ({board.x}, {board.y}), "
+        f"{len(profile.cards)} cards ({with_fields} with field regions) "
+        f"to {args.output}",
+        file=sys.stderr,
+    )
+
+
+def main() -> None:
+    """Run the Zora admiralty board reader."""
+    args = _build_parser().parse_args()
+
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG, format="%(name)s: %(message)s")
+
+    if args.command == "watch":
+        _run_watch(args)
+    elif args.command == "batch":
+        _run_batch(args)
+    elif args.command == "stitch":
+        _run_stitch(args)
+    elif args.command == "glyphs":
+        _run_glyphs(args)
+    elif args.command == "calibrate":
+        _run_calibrate(args)
+    else:
+        _run_read(args)
@@ -0,0 +1,13 @@
+"""Option choices and defaults shared by the CLI and the modules behind it.
+
+The CLI builds its argument parser from these before it knows whether a
+board will be read at all (``zora --help`` won't), so this module must
+stay free of OpenCV, numpy and OCR imports.
+"""
+
+# Executor kinds accepted by zora.pipeline.make_executor
+EXECUTOR_KINDS = ("thread", "process")
+# Default seconds between captures in watch mode
+DEFAULT_WATCH_INTERVAL = 1.0
+# Mask engines accepted by zora.vision.masks.color_masks
+MASK_ENGINES = ("hsv", "lut")
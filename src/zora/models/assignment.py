@@ -10,6 +10,9 @@ class Assignment:
     Represents one assignment card from the admiralty board. Fields match
     what the spec requires for milestone 1: name, stats, ship slots,
     duration, rarity, and event rewards.
+
+    ``confidence`` maps field names to the OCR confidence (0-100) they
+    were read with, for fields whose reader reports one.
     """
 
     name: str
@@ -21,6 +24,7 @@ class Assignment:
     duration: str = ""
     rarity: str = ""
     event_rewards: list[str] = field(default_factory=list)
+    confidence: dict[str, float] = field(default_factory=dict)
 
     def total_required(self) -> int:
         """Return the sum of all three required stat values."""
@@ -28,7 +32,7 @@ class Assignment:
 
     def to_dict(self) -> dict:
         """Serialize to a plain dict for JSON output."""
-        return {
+        result = {
             "name": self.name,
             "engineering": self.engineering,
             "science": self.science,
@@ -39,3 +43,6 @@ class Assignment:
             "rarity": self.rarity,
             "event_rewards": self.event_rewards,
         }
+        if self.confidence:
+            result["confidence"] = self.confidence
+        return result
@@ -4,39 +4,188 @@ Orchestrates the full flow from screen capture to structured BoardState.
 """
 
 import logging
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 from zora.capture import BGRImage, CaptureSource
+from zora.defaults import EXECUTOR_KINDS
 from zora.models.assignment import Assignment
 from zora.models.board import BoardState
-from zora.vision.detect import crop_board, detect_board
-from zora.vision.extract import extract_assignment
-from zora.vision.regions import crop_region, find_assignment_cards
+from zora.vision.cache import OcrCache
+from zora.vision.detect import detect_board
+from zora.vision.extract import extract_assignment_fields
+from zora.vision.frame import FrameContext, FrameLike
+from zora.vision.glyphs import GlyphBank
+from zora.vision.ocr import OcrEngine, resolve_engine
+from zora.vision.profile import LayoutProfile
+from zora.vision.regions import CardFieldRegions, find_assignment_cards
+from zora.vision.scroll import CardStitcher
+from zora.vision.tiling import extract_assignments_tiled
+from zora.vision.track import BoardTracker, CardTracker
 
 logger = logging.getLogger(__name__)
 
 
-def read_board(source: CaptureSource) -> BoardState:
+def make_executor(kind: str = "thread", workers: int | None = None) -> Executor:
+    """Create an executor for concurrent per-card extraction.
+
+    Threads suit the in-process OCR engine, which releases the GIL while
+    recognizing; processes sidestep the GIL entirely at the cost of
+    pickling each card crop. ``workers`` defaults to the executor's own
+    default worker count.
+    """
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zora-ocr")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    raise ValueError(
+        f"Unknown executor kind {kind!r}; expected one of {EXECUTOR_KINDS}"
+    )
+
+
+def read_board(
+    source: CaptureSource,
+    executor: Executor | None = None,
+    cache: OcrCache | None = None,
+    tracker: BoardTracker | None = None,
+    glyphs: GlyphBank | None = None,
+    tiled: bool = False,
+    engine: OcrEngine | str | None = None,
+    card_tracker: CardTracker | None = None,
+    profile: LayoutProfile | None = None,
+    share_planes: bool = True,
+    mask_engine: str = "hsv",
+) -> BoardState:
     """Run the full pipeline: capture → detect → extract.
 
     Takes a CaptureSource (any callable returning a BGR image) and
     returns a BoardState with all detected assignments.
     """
     image = source()
-    return read_board_from_image(image)
+    return read_board_from_image(
+        image,
+        executor=executor,
+        cache=cache,
+        tracker=tracker,
+        glyphs=glyphs,
+        tiled=tiled,
+        engine=engine,
+        card_tracker=card_tracker,
+        profile=profile,
+        share_planes=share_planes,
+        mask_engine=mask_engine,
+    )
+
+
+def _extract_card(
+    index: int,
+    card_image: FrameLike,
+    cache: OcrCache | None = None,
+    glyphs: GlyphBank | None = None,
+    engine: OcrEngine | str | None = None,
+    regions: CardFieldRegions | None = None,
+) -> tuple[Assignment | None, str | None]:
+    """Extract one card, returning (assignment, None) or (None, error message).
+
+    Exceptions are caught here rather than in the caller so one bad card
+    doesn't abort an ``executor.map`` over the whole board. An engine
+    name is resolved here, so process workers each create their own.
+    """
+    try:
+        assignment = extract_assignment_fields(
+            card_image,
+            engine=resolve_engine(engine),
+            cache=cache,
+            glyphs=glyphs,
+            regions=regions,
+        )
+    except Exception:
+        msg = f"Failed to extract assignment from card {index}"
+        logger.exception(msg)
+        return None, msg
+    logger.debug("Card %d: %s", index, assignment.name)
+    return assignment, None
 
 
-def read_board_from_image(image: BGRImage) -> BoardState:
+def read_board_from_image(
+    image: BGRImage,
+    executor: Executor | None = None,
+    cache: OcrCache | None = None,
+    tracker: BoardTracker | None = None,
+    glyphs: GlyphBank | None = None,
+    tiled: bool = False,
+    engine: OcrEngine | str | None = None,
+    card_tracker: CardTracker | None = None,
+    profile: LayoutProfile | None = None,
+    share_planes: bool = True,
+    mask_engine: str = "hsv",
+) -> BoardState:
     """Run the pipeline on an already-captured image.
 
-    Useful for testing and when the image is already loaded.
+    Useful for testing and when the image is already loaded. Cards are
+    extracted one at a time unless an ``executor`` (see ``make_executor``)
+    is given, in which case they are extracted concurrently; either way
+    assignments come back in reading order. With a ``cache``, cards whose
+    preprocessed crop has been read before skip OCR. A ``tracker`` reuses
+    the previous frame's board location when it still checks out. A
+    ``glyphs`` bank reads numeric fields by template matching.
+
+    With ``tiled``, all cards are read in one OCR call on a stacked canvas
+    (see ``zora.vision.tiling``) instead of field by field; the executor
+    and glyph bank are then unused. If the tiled read fails, the board
+    falls back to the per-card path.
+
+    ``engine`` is the OCR engine, or its name in the ``zora.vision.ocr``
+    registry (e.g. ``"easyocr"``); None uses the default engine. Pass a
+    name rather than an engine to a process executor, since engines hold
+    unpicklable library handles.
+
+    A ``card_tracker`` (see ``zora.vision.track.CardTracker``) carries
+    cards over from the previous frame it saw: cards whose crop is
+    unchanged keep their ``Assignment`` objects and only the others are
+    extracted; ``card_tracker.stats.last_skipped`` counts the reused ones.
+
+    A layout ``profile`` (see ``zora.vision.profile``, ``zora calibrate``)
+    supplies the board, card and field regions without detecting them,
+    as long as it passes a quick check against the frame; otherwise the
+    board and cards are detected as usual.
+
+    With ``share_planes`` (the default) the frame is wrapped in a
+    ``zora.vision.frame.FrameContext``, so detection, card finding and
+    extraction share its HSV and grayscale planes instead of each
+    converting its own crop; turn it off to compare. ``mask_engine``
+    (one of ``zora.defaults.MASK_ENGINES``, see ``zora.vision.masks``)
+    picks how the board and card colour masks are made.
+
+    Raises ValueError if a cache is combined with a process executor: the
+    cache lives in this process and can't be shared with workers, or for
+    an unknown mask engine.
     """
-    # Step 1: Detect the board region
-    board_box = detect_board(image)
-    if board_box is None:
-        logger.warning("No admiralty board detected in image")
-        return BoardState(assignments=[], ships=[])
+    if cache is not None and isinstance(executor, ProcessPoolExecutor):
+        raise ValueError("An OcrCache can't be used with a process executor")
+
+    frame = FrameContext(image, mask_engine=mask_engine)
 
-    board_image = crop_board(image, board_box)
+    # Step 1: Detect the board region, unless the layout profile still fits
+    matched = profile if profile is not None and profile.matches(image) else None
+    if matched is not None:
+        board_box = matched.board
+    else:
+        if profile is not None:
+            logger.info("Frame doesn't match the layout profile; detecting")
+        detect_frame = (
+            frame if share_planes else FrameContext(image, mask_engine=mask_engine)
+        )
+        if tracker is not None:
+            board_box = tracker.locate(detect_frame)
+        else:
+            board_box = detect_board(detect_frame)
+        if board_box is None:
+            logger.warning("No admiralty board detected in image")
+            return BoardState(assignments=[], ships=[])
+
+    board = frame.crop(board_box)
+    board_image = board.image
     logger.info(
         "Board detected at (%d, %d) size %dx%d",
         board_box.x,
@@ -46,24 +195,153 @@ def read_board_from_image(image: BGRImage) -> BoardState:
     )
 
     # Step 2: Find assignment card regions within the board
-    card_boxes = find_assignment_cards(board_image)
+    if matched is not None:
+        card_boxes = matched.card_boxes
+    else:
+        card_boxes = find_assignment_cards(
+            board
+            if share_planes
+            else FrameContext(board_image, mask_engine=mask_engine)
+        )
     logger.info("Found %d assignment cards", len(card_boxes))
 
     if not card_boxes:
         return BoardState(assignments=[], ships=[])
 
-    # Step 3: Extract assignment data from each card
-    assignments: list[Assignment] = []
-    errors: list[str] = []
-    for i, box in enumerate(card_boxes):
-        card_image = crop_region(board_image, box)
+    cards = [board.crop(box) for box in card_boxes]
+    card_images = [card.image for card in cards]
+    signatures: list[bytes] = []
+    reused: list[Assignment | None] = [None] * len(card_images)
+    if card_tracker is not None:
+        signatures, reused = card_tracker.match(card_images)
+        logger.info("Reusing %d unchanged cards", card_tracker.stats.last_skipped)
+    pending = [i for i, assignment in enumerate(reused) if assignment is None]
+    pending_images = [card_images[i] for i in pending]
+
+    results: list[tuple[Assignment | None, str | None]] | None = None
+    if tiled and pending:
         try:
-            assignment = extract_assignment(card_image)
-            assignments.append(assignment)
-            logger.debug("Card %d: %s", i, assignment.name)
+            results = [
+                (assignment, None)
+                for assignment in extract_assignments_tiled(
+                    pending_images, engine=resolve_engine(engine), cache=cache
+                )
+            ]
         except Exception:
-            msg = f"Failed to extract assignment from card {i}"
-            logger.exception(msg)
-            errors.append(msg)
+            logger.exception("Tiled OCR failed; reading cards one at a time")
+
+    # Step 3: Extract assignment data from each changed card, field by field
+    if results is None:
+        caches = [cache] * len(pending)
+        banks = [glyphs] * len(pending)
+        engines = [engine] * len(pending)
+        # Card contexts take their grayscale plane from the frame's, if any
+        pending_cards = [cards[i] for i in pending] if share_planes else pending_images
+        if matched is not None:
+            regions = [
+                matched.field_regions(i, card)
+                for i, card in zip(pending, pending_cards)
+            ]
+        else:
+            regions = [None] * len(pending)
+        args = (pending, pending_cards, caches, banks, engines, regions)
+        if executor is None:
+            results = list(map(_extract_card, *args))
+        else:
+            results = list(executor.map(_extract_card, *args))
+        logger.debug("Frame planes: %s", frame.stats.to_dict())
+
+    assignments = list(reused)
+    errors: list[str] = []
+    for index, (assignment, error) in zip(pending, results):
+        assignments[index] = assignment
+        if error is not None:
+            errors.append(error)
+    if card_tracker is not None:
+        card_tracker.update(signatures, assignments)
+
+    return BoardState(
+        assignments=[a for a in assignments if a is not None],
+        ships=[],
+        errors=errors,
+    )
+
 
-    return BoardState(assignments=assignments, ships=[], errors=errors)
+def read_scrolling_board(
+    frames: Iterable[BGRImage],
+    executor: Executor | None = None,
+    cache: OcrCache | None = None,
+    glyphs: GlyphBank | None = None,
+    engine: OcrEngine | str | None = None,
+    stitcher: CardStitcher | None = None,
+    mask_engine: str = "hsv",
+) -> BoardState:
+    """Read a board list from screenshots taken while scrolling through it.
+
+    ``frames`` are in capture order, consecutive ones overlapping (scroll
+    by less than the board's height minus a card's between captures, or
+    a card may never be seen whole). Each frame's board and cards are
+    detected, a ``CardStitcher`` (see ``zora.vision.scroll``) places the
+    frame within the list, and only cards not seen in an earlier frame
+    are extracted, so overlapping cards are read once. Returns one
+    ``BoardState`` holding every card in list order.
+
+    ``executor``, ``cache``, ``glyphs``, ``engine`` and ``mask_engine``
+    are as for ``read_board_from_image``. Pass a ``stitcher`` to inspect
+    its ``stats`` afterwards. Frames without a board, or that don't
+    overlap the previous frame, are reported in ``errors``.
+    """
+    if cache is not None and isinstance(executor, ProcessPoolExecutor):
+        raise ValueError("An OcrCache can't be used with a process executor")
+    stitcher = stitcher if stitcher is not None else CardStitcher()
+    tracker = BoardTracker()
+
+    placed: list[tuple[tuple[int, int], Assignment]] = []
+    errors: list[str] = []
+    read = 0  # cards extracted so far, numbering them in error messages
+    for number, image in enumerate(frames):
+        frame = FrameContext(image, mask_engine=mask_engine)
+        board_box = tracker.locate(frame)
+        if board_box is None:
+            logger.warning("No admiralty board detected in frame %d", number)
+            errors.append(f"No admiralty board detected in frame {number}")
+            continue
+        board = frame.crop(board_box)
+        card_boxes = find_assignment_cards(board)
+        new_cards = stitcher.add(board, card_boxes)
+        if not stitcher.registered:
+            errors.append(
+                f"Frame {number} doesn't overlap the previous frame; "
+                "cards shown in both are listed twice"
+            )
+        logger.info(
+            "Frame %d: %d cards, %d new", number, len(card_boxes), len(new_cards)
+        )
+        if not new_cards:
+            continue
+
+        args = (
+            range(read, read + len(new_cards)),
+            [board.crop(card_boxes[card.index]) for card in new_cards],
+            [cache] * len(new_cards),
+            [glyphs] * len(new_cards),
+            [engine] * len(new_cards),
+        )
+        if executor is None:
+            results = list(map(_extract_card, *args))
+        else:
+            results = list(executor.map(_extract_card, *args))
+        read += len(new_cards)
+        for card, (assignment, error) in zip(new_cards, results):
+            if assignment is not None:
+                placed.append(((card.y, card.x), assignment))
+            if error is not None:
+                errors.append(error)
+    logger.info("Scroll stats: %s", stitcher.stats.to_dict())
+
+    placed.sort(key=lambda item: item[0])
+    return BoardState(
+        assignments=[assignment for _, assignment in placed],
+        ships=[],
+        errors=errors,
+    )
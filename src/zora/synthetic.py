@@ -0,0 +1,269 @@
+"""Synthetic admiralty board images for tests and benchmarks.
+
+Generates simplified boards: a dark board rectangle holding lighter
+assignment cards with white text, optionally inset in a bright desktop.
+Real screenshots will differ, but these exercise the same detection →
+extraction path at any resolution and card count without game assets.
+"""
+
+import math
+
+import cv2
+import numpy as np
+
+from zora.capture import BGRImage
+
+# Board background (BGR), inside BOARD_BG_LOWER/UPPER in vision.detect
+BOARD_BG_COLOR = (30, 25, 20)
+# Desktop around the board when rendering a full screenshot
+DESKTOP_COLOR = (200, 190, 180)
+# Card fill and border (BGR), inside CARD_BG_LOWER/UPPER in vision.regions
+CARD_COLOR = (120, 110, 100)
+CARD_BORDER_COLOR = (180, 170, 160)
+TEXT_COLOR = (255, 255, 255)
+
+# Card size the text layout of draw_assignment_card was designed for
+BASE_CARD_SIZE = (300, 200)
+# Gap between cards and around the card grid, as a fraction of card width
+CARD_GAP_FRACTION = 0.1
+# Fraction of the screenshot the board covers on each axis when inset
+BOARD_INSET_FRACTION = (0.8, 0.84)
+
+# Card contents cycled through by render_board
+SAMPLE_ASSIGNMENTS: list[dict] = [
+    {
+        "name": "Patrol Sector 42",
+        "eng": 30,
+        "sci": 20,
+        "tac": 15,
+        "slots": 2,
+        "duration": "4h",
+        "rarity": "Common",
+    },
+    {
+        "name": "Rescue Mission",
+        "eng": 50,
+        "sci": 40,
+        "tac": 30,
+        "slots": 3,
+        "duration": "8h",
+        "rarity": "Rare",
+    },
+    {
+        "name": "Supply Run",
+        "eng": 15,
+        "sci": 5,
+        "tac": 25,
+        "slots": 1,
+        "duration": "2h",
+        "rarity": "Uncommon",
+    },
+    {
+        "name": "Survey Nebula",
+        "eng": 10,
+        "sci": 45,
+        "tac": 5,
+        "slots": 2,
+        "duration": "6h",
+        "rarity": "Very Rare",
+    },
+]
+
+
+def make_board_image(
+    width: int = 800,
+    height: int = 600,
+    bg_color: tuple[int, int, int] = BOARD_BG_COLOR,
+    num_cards: int = 3,
+) -> BGRImage:
+    """Create an empty synthetic board filling the whole image.
+
+    Cards are added separately with ``draw_assignment_card``.
+    """
+    image = np.full((height, width, 3), bg_color, dtype=np.uint8)
+    return image
+
+
+def draw_assignment_card(
+    image: BGRImage,
+    x: int,
+    y: int,
+    w: int,
+    h: int,
+    name: str = "Patrol Sector 42",
+    eng: int = 30,
+    sci: int = 20,
+    tac: int = 15,
+    slots: int = 2,
+    duration: str = "4h",
+    rarity: str = "Common",
+    scale: float = 1.0,
+) -> BGRImage:
+    """Draw a synthetic assignment card onto an image.
+
+    The card has a lighter background with text content laid out
+    similar to the actual STO assignment card format. ``scale`` grows the
+    text and line spacing for cards larger than 300x200. Newlines in
+    ``name`` wrap the title onto several lines, pushing the rest down.
+    """
+    cv2.rectangle(image, (x, y), (x + w, y + h), CARD_COLOR, -1)
+    cv2.rectangle(
+        image, (x, y), (x + w, y + h), CARD_BORDER_COLOR, max(2, round(2 * scale))
+    )
+
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    small = 0.5 * scale
+    thickness = max(1, round(scale))
+    line_h = round(25 * scale)
+    left = x + round(10 * scale)
+
+    # Title
+    title_y = y + round(25 * scale)
+    title_h = round(22 * scale)
+    titles = name.split("\n")
+    for i, title in enumerate(titles):
+        position = (left, title_y + i * title_h)
+        cv2.putText(image, title, position, font, 0.6 * scale, TEXT_COLOR, thickness)
+
+    # Stats
+    lines = [
+        f"Eng: {eng}",
+        f"Sci: {sci}",
+        f"Tac: {tac}",
+        f"Slots: {slots}",
+        f"Duration: {duration}",
+        rarity,
+    ]
+    cy = y + round(55 * scale) + (len(titles) - 1) * title_h
+    for line in lines:
+        cv2.putText(image, line, (left, cy), font, small, TEXT_COLOR, thickness)
+        cy += line_h
+
+    return image
+
+
+def render_field(text: str, scale: float = 1.0) -> BGRImage:
+    """Render one card field value as cropped from a card drawn at ``scale``.
+
+    Uses the font, colors and size of ``draw_assignment_card``'s stat
+    lines, with a margin around the text.
+    """
+    size = round(18 * scale)
+    image = np.full((3 * size, size * (len(text) + 2), 3), CARD_COLOR, np.uint8)
+    cv2.putText(
+        image,
+        text,
+        (size, 2 * size),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        0.5 * scale,
+        TEXT_COLOR,
+        max(1, round(scale)),
+    )
+    return image
+
+
+def render_board(
+    width: int = 1920,
+    height: int = 1080,
+    num_cards: int = 6,
+    desktop: bool = True,
+) -> BGRImage:
+    """Render a screenshot-like image with ``num_cards`` cards on a board.
+
+    With ``desktop`` the board is inset in a bright surround, as in a real
+    screenshot; otherwise it fills the image. Cards are laid out in
+    reading order on the grid that fits the largest cards, and cycle through
+    ``SAMPLE_ASSIGNMENTS``.
+    """
+    image = np.full((height, width, 3), DESKTOP_COLOR, dtype=np.uint8)
+    if desktop:
+        board_w = int(width * BOARD_INSET_FRACTION[0])
+        board_h = int(height * BOARD_INSET_FRACTION[1])
+    else:
+        board_w, board_h = width, height
+    board_x, board_y = (width - board_w) // 2, (height - board_h) // 2
+    image[board_y : board_y + board_h, board_x : board_x + board_w] = BOARD_BG_COLOR
+    if num_cards <= 0:
+        return image
+
+    base_w, base_h = BASE_CARD_SIZE
+
+    def fitted_width(columns: int) -> float:
+        """Widest card such that the grid (cards plus gaps) fits both ways."""
+        rows = math.ceil(num_cards / columns)
+        return min(
+            board_w / (columns + (columns + 1) * CARD_GAP_FRACTION),
+            board_h / (rows * base_h / base_w + (rows + 1) * CARD_GAP_FRACTION),
+        )
+
+    columns = max(range(1, num_cards + 1), key=fitted_width)
+    card_w = fitted_width(columns)
+    card_h = card_w * base_h / base_w
+    gap = card_w * CARD_GAP_FRACTION
+
+    for i in range(num_cards):
+        row, col = divmod(i, columns)
+        x = board_x + round(gap + col * (card_w + gap))
+        y = board_y + round(gap + row * (card_h + gap))
+        draw_assignment_card(
+            image,
+            x,
+            y,
+            round(card_w),
+            round(card_h),
+            scale=card_w / base_w,
+            **SAMPLE_ASSIGNMENTS[i % len(SAMPLE_ASSIGNMENTS)],
+        )
+    return image
+
+
+def render_scrolling_board(
+    width: int = 1920,
+    height: int = 1080,
+    num_cards: int = 24,
+    columns: int = 3,
+    step: int | None = None,
+) -> list[BGRImage]:
+    """Render the screenshots taken while scrolling a board taller than its view.
+
+    The board is inset in a desktop as in ``render_board``, but holds
+    ``num_cards`` cards in ``columns`` columns, sized to the board's
+    width, on a list taller than the board. Returns one screenshot per
+    scroll position, ``step`` board pixels apart (default: half the
+    board's height), from the top of the list down to its bottom.
+    """
+    board_w = int(width * BOARD_INSET_FRACTION[0])
+    board_h = int(height * BOARD_INSET_FRACTION[1])
+    board_x, board_y = (width - board_w) // 2, (height - board_h) // 2
+
+    base_w, base_h = BASE_CARD_SIZE
+    card_w = board_w / (columns + (columns + 1) * CARD_GAP_FRACTION)
+    card_h = card_w * base_h / base_w
+    gap = card_w * CARD_GAP_FRACTION
+    rows = math.ceil(num_cards / columns)
+    list_h = max(board_h, round(gap + rows * (card_h + gap)))
+
+    board = np.full((list_h, board_w, 3), BOARD_BG_COLOR, dtype=np.uint8)
+    for i in range(num_cards):
+        row, col = divmod(i, columns)
+        draw_assignment_card(
+            board,
+            round(gap + col * (card_w + gap)),
+            round(gap + row * (card_h + gap)),
+            round(card_w),
+            round(card_h),
+            scale=card_w / base_w,
+            **SAMPLE_ASSIGNMENTS[i % len(SAMPLE_ASSIGNMENTS)],
+        )
+
+    step = step if step is not None else board_h // 2
+    last = list_h - board_h
+    offsets = [*range(0, last, step), last]
+    frames = []
+    for offset in offsets:
+        image = np.full((height, width, 3), DESKTOP_COLOR, dtype=np.uint8)
+        image[board_y : board_y + board_h, board_x : board_x + board_w] = board[
+            offset : offset + board_h
+        ]
+        frames.append(image)
+    return frames
@@ -0,0 +1,156 @@
+"""Content-addressed OCR result cache.
+
+The same assignment cards appear again and again across reads and across
+days, and OCR is by far the most expensive pipeline stage. This cache maps
+a hash of the *preprocessed* crop (the binary image actually sent to the
+engine) plus the engine name and config to the recognized text, so a card
+that has been read before skips the engine entirely.
+
+Hashing after preprocessing makes keys robust to capture noise: the OTSU
+threshold maps near-identical crops to the same binary image.
+
+Entries live in a bounded in-memory LRU, optionally backed by a SQLite
+file that survives restarts.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+# Default number of entries kept in memory
+DEFAULT_CACHE_ENTRIES = 4096
+# Seconds to wait on a SQLite write lock held by another process
+SQLITE_TIMEOUT = 30.0
+# Appended to the config in keys of word-box (TSV) results, so they never
+# collide with plain text read with the same config
+TSV_CACHE_SUFFIX = " [tsv]"
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for an OcrCache."""
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict for JSON output."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+def ocr_cache_key(processed: NDArray[np.uint8], engine_name: str, config: str) -> str:
+    """Return the cache key for a preprocessed image read with a given config."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{engine_name}\0{config}\0{processed.shape}\0".encode())
+    digest.update(np.ascontiguousarray(processed).data)
+    return digest.hexdigest()
+
+
+class OcrCache:
+    """Bounded LRU of OCR results with optional SQLite persistence.
+
+    Safe to share between threads (e.g. with a thread executor). Each
+    process should open its own instance; several processes may point at
+    the same ``path``.
+
+    Usage::
+
+        cache = OcrCache(path="~/.cache/zora/ocr.sqlite")
+        board = read_board_from_image(image, cache=cache)
+        print(cache.stats.hit_rate)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        path: str | Path | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.path = Path(path).expanduser() if path is not None else None
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(
+                self.path, timeout=SQLITE_TIMEOUT, check_same_thread=False
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS ocr (key TEXT PRIMARY KEY, text TEXT)"
+            )
+            self._db.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        """Return the cached text for ``key``, or None on a miss."""
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return text
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT text FROM ocr WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._remember(key, row[0])
+                    self.stats.hits += 1
+                    self.stats.disk_hits += 1
+                    return row[0]
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, text: str) -> None:
+        """Store the OCR text for ``key``."""
+        with self._lock:
+            self._remember(key, text)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO ocr (key, text) VALUES (?, ?)",
+                    (key, text),
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, text: str) -> None:
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def close(self) -> None:
+        """Close the on-disk store, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __enter__(self) -> "OcrCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -4,13 +4,17 @@ The admiralty board is a rectangular UI panel with a dark background
 containing assignment cards. This module finds that panel region.
 """
 
+import functools
 import logging
 
 import cv2
 import numpy as np
+from numpy.typing import NDArray
 
 from zora.capture import BGRImage
 from zora.vision import BoundingBox
+from zora.vision.frame import FrameContext, FrameLike, as_frame
+from zora.vision.masks import color_masks
 
 logger = logging.getLogger(__name__)
 
@@ -24,20 +28,25 @@ MIN_BOARD_AREA_FRACTION = 0.05
 # Morphological kernel size for noise cleanup in board detection
 BOARD_MORPH_KERNEL_SIZE = (15, 15)
 
+# Multiscale detection: width of the downscaled copy that is segmented
+PYRAMID_COARSE_WIDTH = 640
+# Half-width, in coarse pixels, of the full-resolution band searched for
+# each board edge
+PYRAMID_EDGE_MARGIN_PX = 3
+# Fraction of a band line that must be board background to count as board
+PYRAMID_EDGE_MIN_FRACTION = 0.5
 
-def detect_board(image: BGRImage) -> BoundingBox | None:
-    """Locate the admiralty board region within a full screenshot.
 
-    Uses color-based segmentation to find the dark UI panel, then
-    returns the bounding box of the largest qualifying region.
-
-    Returns None if no board-like region is found.
-    """
-    hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-    mask = cv2.inRange(hsv, BOARD_BG_LOWER, BOARD_BG_UPPER)
+def _segment_board(
+    frame: FrameContext, kernel_size: tuple[int, int]
+) -> BoundingBox | None:
+    """Find the largest board-coloured region after morphological cleanup."""
+    # The mask isn't kept on the frame: it's needed once, and dropping it as
+    # cleanup goes lets its buffer be reused
+    mask = frame.mask(BOARD_BG_LOWER, BOARD_BG_UPPER, keep=False)
 
     # Clean up noise with morphological operations
-    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, BOARD_MORPH_KERNEL_SIZE)
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, kernel_size)
     mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
     mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
 
@@ -46,7 +55,7 @@ def detect_board(image: BGRImage) -> BoundingBox | None:
         logger.debug("No contours found in board detection")
         return None
 
-    image_area = image.shape[0] * image.shape[1]
+    image_area = frame.shape[0] * frame.shape[1]
     min_area = int(image_area * MIN_BOARD_AREA_FRACTION)
 
     # Find the largest contour that meets the minimum area threshold
@@ -67,6 +76,123 @@ def detect_board(image: BGRImage) -> BoundingBox | None:
     return best
 
 
+def detect_board(image: FrameLike, multiscale: bool = False) -> BoundingBox | None:
+    """Locate the admiralty board region within a full screenshot.
+
+    Uses color-based segmentation to find the dark UI panel, then
+    returns the bounding box of the largest qualifying region. Returns
+    None if no board-like region is found.
+
+    With ``multiscale``, segmentation runs on a downscaled copy and only
+    the edges are refined at full resolution (see
+    ``detect_board_multiscale``). ``image`` may be a ``FrameContext``,
+    whose mask engine is then used and whose HSV plane (with the
+    ``"hsv"`` engine) is kept for later stages.
+    """
+    frame = as_frame(image)
+    if multiscale:
+        return detect_board_multiscale(frame.image, mask_engine=frame.mask_engine)
+    return _segment_board(frame, BOARD_MORPH_KERNEL_SIZE)
+
+
+def _board_mask(image: BGRImage, mask_engine: str) -> NDArray[np.uint8]:
+    return color_masks(image, [(BOARD_BG_LOWER, BOARD_BG_UPPER)], mask_engine)[0]
+
+
+def _refine_edge(
+    image: BGRImage,
+    start: int,
+    stop: int,
+    lo: int,
+    hi: int,
+    axis: int,
+    leading: bool,
+    mask_engine: str = "hsv",
+) -> int:
+    """Locate one board edge precisely within a narrow full-resolution band.
+
+    The band spans ``start:stop`` along ``axis`` (1 = columns for a left or
+    right edge, 0 = rows for a top or bottom edge) and ``lo:hi`` along the
+    other axis. Each line across the band is classified as board when most
+    of its pixels match the board background. Returns the first board line
+    for a ``leading`` (left/top) edge, or one past the last board line for a
+    trailing (right/bottom) edge, in full-image coordinates.
+    """
+    if axis == 1:
+        band = image[lo:hi, start:stop]
+    else:
+        band = image[start:stop, lo:hi]
+    mask = _board_mask(band, mask_engine)
+    fractions = np.count_nonzero(mask, axis=1 - axis) / mask.shape[1 - axis]
+    board_lines = np.flatnonzero(fractions >= PYRAMID_EDGE_MIN_FRACTION)
+    if board_lines.size == 0:
+        # No board inside the band; keep the coarse estimate (band centre)
+        return (start + stop) // 2
+    if leading:
+        return start + int(board_lines[0])
+    return start + int(board_lines[-1]) + 1
+
+
+def detect_board_multiscale(
+    image: BGRImage,
+    coarse_width: int = PYRAMID_COARSE_WIDTH,
+    mask_engine: str = "hsv",
+) -> BoundingBox | None:
+    """Coarse-to-fine board detection for large screenshots.
+
+    Segments the board on a copy downscaled to ``coarse_width`` pixels wide
+    (with the morphology kernel scaled to match), then refines each edge of
+    the candidate rectangle inside a narrow band at full resolution. Only
+    the bands are converted to HSV at full size, so the cost no longer
+    grows with the whole frame. The result matches ``detect_board`` to
+    within a few pixels.
+
+    Images less than twice as wide as ``coarse_width`` gain nothing from
+    the pyramid and use full-resolution detection. Masks are made by
+    ``mask_engine`` (see ``zora.vision.masks``).
+    """
+    h, w = image.shape[:2]
+    scale = coarse_width / w
+    if scale > 0.5:
+        return _segment_board(
+            FrameContext(image, mask_engine=mask_engine), BOARD_MORPH_KERNEL_SIZE
+        )
+
+    small_size = (coarse_width, max(1, round(h * scale)))
+    # Bilinear sampling is far cheaper than area averaging at these ratios;
+    # the morphology below absorbs the aliasing of small text
+    small = cv2.resize(image, small_size, interpolation=cv2.INTER_LINEAR)
+    kernel = tuple(max(3, round(k * scale)) for k in BOARD_MORPH_KERNEL_SIZE)
+    coarse = _segment_board(FrameContext(small, mask_engine=mask_engine), kernel)
+    if coarse is None:
+        return None
+
+    # Map back to full resolution; the band must cover the coarse rounding
+    # error plus the kernel-scaling error on either side of each edge.
+    inv = 1.0 / scale
+    margin = int(np.ceil(inv * PYRAMID_EDGE_MARGIN_PX))
+    x1, y1 = round(coarse.x * inv), round(coarse.y * inv)
+    x2, y2 = round(coarse.x2 * inv), round(coarse.y2 * inv)
+
+    # Sample the middle of each edge, away from corners
+    inset_x = min(margin, (x2 - x1) // 4)
+    inset_y = min(margin, (y2 - y1) // 4)
+    col_lo, col_hi = max(0, x1 + inset_x), min(w, x2 - inset_x)
+    row_lo, row_hi = max(0, y1 + inset_y), min(h, y2 - inset_y)
+
+    refine = functools.partial(_refine_edge, image, mask_engine=mask_engine)
+    left = refine(max(0, x1 - margin), min(w, x1 + margin), row_lo, row_hi, 1, True)
+    right = refine(max(0, x2 - margin), min(w, x2 + margin), row_lo, row_hi, 1, False)
+    top = refine(max(0, y1 - margin), min(h, y1 + margin), col_lo, col_hi, 0, True)
+    bottom = refine(max(0, y2 - margin), min(h, y2 + margin), col_lo, col_hi, 0, False)
+    if right <= left or bottom <= top:
+        return None
+
+    box = BoundingBox(x=left, y=top, width=right - left, height=bottom - top)
+    logger.debug("Multiscale board at %s (coarse %s at scale %.3f)", box, coarse, scale)
+    return box
+
+
 def crop_board(image: BGRImage, box: BoundingBox) -> BGRImage:
     """Crop the image to the board bounding box."""
     return image[box.y : box.y2, box.x : box.x2]
@@ -1,17 +1,46 @@
 """Data extraction — read text and numbers from detected card regions.
 
-Uses Tesseract OCR (via pytesseract) to read assignment details from
-card images. Preprocessing improves OCR accuracy on game UI text.
+Uses Tesseract OCR (via an engine from ``zora.vision.ocr``) to read
+assignment details from card images. Preprocessing improves OCR accuracy
+on game UI text.
 """
 
 import logging
 import re
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 import cv2
-import pytesseract
+import numpy as np
+from numpy.typing import NDArray
 
 from zora.capture import BGRImage
 from zora.models.assignment import Assignment
+from zora.vision import BoundingBox
+from zora.vision.cache import TSV_CACHE_SUFFIX, OcrCache, ocr_cache_key
+from zora.vision.frame import FrameLike, as_frame
+from zora.vision.glyphs import GlyphBank
+from zora.vision.ocr import (
+    OcrEngine,
+    OcrWord,
+    get_default_engine,
+    parse_tsv,
+    words_to_text,
+)
+from zora.vision.parse import (
+    DURATION_PATTERN,
+    match_rarity,
+    normalize_duration,
+    parse_assignment_text,
+)
+from zora.vision.regions import (
+    DEFAULT_CARD_LAYOUT,
+    CardFieldRegions,
+    CardLayout,
+    locate_card_fields,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +52,19 @@ TESSERACT_CONFIG = "--oem 3 --psm 6"
 # For reading individual numbers/stats
 TESSERACT_DIGITS_CONFIG = "--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789"
 
+# For reading one line of text (a card title or rarity)
+# PSM 7 = treat the image as a single text line
+TESSERACT_LINE_CONFIG = "--oem 3 --psm 7"
+
+# For reading a duration value such as "4h" or "1h 30m"
+TESSERACT_DURATION_CONFIG = "--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789hm"
+
+# Card fields read through the digits-only path
+DIGIT_FIELDS = frozenset({"engineering", "science", "tactical", "ship_slots"})
+# Margin around a field region when cropping it for OCR, as a fraction of
+# the line height; Tesseract misreads glyphs that touch the image edge
+FIELD_MARGIN_FRACTION = 0.5
+
 # Minimum image dimensions for OCR — smaller images are upscaled
 MIN_OCR_HEIGHT = 100
 MIN_OCR_WIDTH = 200
@@ -30,46 +72,287 @@ MIN_OCR_WIDTH = 200
 MIN_UPSCALE_FACTOR = 2.0
 # Gaussian blur kernel size for noise reduction before thresholding
 BLUR_KERNEL_SIZE = (5, 5)
+# Page segmentation mode in a Tesseract config string
+PSM_PATTERN = re.compile(r"--psm \d+")
 
 
-def preprocess_for_ocr(image: BGRImage) -> BGRImage:
+@dataclass(frozen=True)
+class OcrEffort:
+    """The preprocessing and page segmentation of one OCR pass.
+
+    The defaults are the settings ``ocr_text`` and ``ocr_number`` use.
+    ``psm`` replaces the config's page segmentation mode; ``invert``
+    thresholds to dark text on a light background.
+    """
+
+    min_height: int = MIN_OCR_HEIGHT
+    min_width: int = MIN_OCR_WIDTH
+    min_upscale: float = MIN_UPSCALE_FACTOR
+    psm: int | None = None
+    invert: bool = False
+
+    def apply(self, config: str) -> str:
+        """``config`` with this pass's page segmentation mode."""
+        if self.psm is None:
+            return config
+        psm = f"--psm {self.psm}"
+        if PSM_PATTERN.search(config):
+            return PSM_PATTERN.sub(psm, config)
+        return f"{config} {psm}"
+
+    def upscales_at_least(self, other: "OcrEffort") -> bool:
+        """True if this pass enlarges small crops at least as much as ``other``."""
+        return (
+            self.min_height >= other.min_height
+            and self.min_width >= other.min_width
+            and self.min_upscale >= other.min_upscale
+        )
+
+
+DEFAULT_EFFORT = OcrEffort()
+
+# Field OCR passes: the default preprocessing, then a larger upscale, a
+# raw-line page segmentation, and an inverted threshold. Only fields read
+# with low confidence go past the first pass. Nothing starts below the
+# default upscale: small digits shrunk less than that are misread with
+# high confidence ("15" as "5" at 90), which no retry would catch.
+FIELD_EFFORTS = (
+    DEFAULT_EFFORT,
+    OcrEffort(min_height=150, min_width=300, min_upscale=3.0),
+    OcrEffort(psm=13),
+    OcrEffort(invert=True),
+)
+# Lowest word confidence (Tesseract's 0-100 scale) at which a field pass
+# is accepted without trying the next one
+FIELD_MIN_CONFIDENCE = 80.0
+
+
+def _upscale_factor(
+    height: int, width: int, effort: OcrEffort = DEFAULT_EFFORT
+) -> float | None:
+    """Factor small images are scaled up by before OCR, or None if not small."""
+    if height < effort.min_height or width < effort.min_width:
+        return max(
+            effort.min_width / width, effort.min_height / height, effort.min_upscale
+        )
+    return None
+
+
+class PreprocessWorkspace:
+    """Reusable buffers for ``preprocess_for_ocr``.
+
+    Each intermediate image (grayscale, upscaled, blurred/binary) is
+    written with OpenCV's ``dst=`` into a view of a byte arena that only
+    grows, so preprocessing crops of the same or smaller size allocates
+    nothing. The returned image is a view into the workspace and is
+    overwritten by the next call; copy it to keep it. Not thread-safe:
+    use one workspace per thread (``ocr_text`` and ``ocr_number`` do).
+    """
+
+    def __init__(self) -> None:
+        self._arenas: dict[str, NDArray[np.uint8]] = {}
+        self.allocations = 0
+
+    def buffer(self, name: str, shape: tuple[int, ...]) -> NDArray[np.uint8]:
+        """A contiguous uint8 array of ``shape`` backed by the arena ``name``."""
+        size = int(np.prod(shape))
+        arena = self._arenas.get(name)
+        if arena is None or arena.size < size:
+            arena = self._arenas[name] = np.empty(size, dtype=np.uint8)
+            self.allocations += 1
+        return arena[:size].reshape(shape)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the buffers held."""
+        return sum(arena.nbytes for arena in self._arenas.values())
+
+
+def preprocess_for_ocr(
+    image: BGRImage,
+    workspace: PreprocessWorkspace | None = None,
+    effort: OcrEffort = DEFAULT_EFFORT,
+) -> BGRImage:
     """Preprocess a card image for better OCR accuracy.
 
-    Converts to grayscale, applies Gaussian blur + OTSU thresholding,
-    and scales up small text to improve Tesseract recognition.
+    Converts to grayscale (a grayscale ``image`` is used as is), applies
+    Gaussian blur + OTSU thresholding, and scales up small text to
+    improve Tesseract recognition.
+
+    With a ``workspace``, intermediates and the result live in its
+    buffers instead of fresh arrays (see ``PreprocessWorkspace``).
+    ``effort`` sets the upscaling and threshold polarity.
     """
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    if image.ndim == 2:
+        gray = image
+    elif workspace is None:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = cv2.cvtColor(
+            image, cv2.COLOR_BGR2GRAY, dst=workspace.buffer("gray", image.shape[:2])
+        )
 
     # Scale up if the image is small — Tesseract works better on larger text
     h, w = gray.shape
-    if h < MIN_OCR_HEIGHT or w < MIN_OCR_WIDTH:
-        scale = max(MIN_OCR_WIDTH / w, MIN_OCR_HEIGHT / h, MIN_UPSCALE_FACTOR)
-        gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+    scale = _upscale_factor(h, w, effort)
+    if scale is not None:
+        dst = None
+        if workspace is not None:
+            # The size cv2.resize derives from fx/fy (rounded to nearest)
+            dst = workspace.buffer("scaled", (round(h * scale), round(w * scale)))
+        gray = cv2.resize(
+            gray, None, dst=dst, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC
+        )
 
     # Blur to reduce noise, then apply OTSU threshold for clean binary output
-    blurred = cv2.GaussianBlur(gray, BLUR_KERNEL_SIZE, 0)
-    _, binary = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
+    kind = cv2.THRESH_BINARY_INV if effort.invert else cv2.THRESH_BINARY
+    if workspace is None:
+        blurred = cv2.GaussianBlur(gray, BLUR_KERNEL_SIZE, 0)
+        _, binary = cv2.threshold(blurred, 0, 255, kind + cv2.THRESH_OTSU)
+        return binary
+    # The threshold is per pixel, so it can run in place on the blurred copy
+    binary = cv2.GaussianBlur(
+        gray, BLUR_KERNEL_SIZE, 0, dst=workspace.buffer("binary", gray.shape)
+    )
+    cv2.threshold(binary, 0, 255, kind + cv2.THRESH_OTSU, dst=binary)
     return binary
 
 
-def ocr_text(image: BGRImage, config: str = TESSERACT_CONFIG) -> str:
+_local = threading.local()
+
+
+def thread_workspace() -> PreprocessWorkspace:
+    """The calling thread's preprocessing workspace, created on first use."""
+    workspace = getattr(_local, "workspace", None)
+    if workspace is None:
+        workspace = _local.workspace = PreprocessWorkspace()
+    return workspace
+
+
+def _recognize(
+    processed: BGRImage,
+    config: str,
+    engine: OcrEngine | None,
+    cache: OcrCache | None,
+) -> str:
+    """Run the engine on a preprocessed image, consulting the cache first."""
+    engine = engine or get_default_engine()
+    if cache is None:
+        return engine.image_to_string(processed, config)
+    key = ocr_cache_key(processed, engine.name, config)
+    text = cache.get(key)
+    if text is None:
+        text = engine.image_to_string(processed, config)
+        cache.put(key, text)
+    return text
+
+
+def _recognize_words(
+    processed: BGRImage,
+    config: str,
+    engine: OcrEngine,
+    cache: OcrCache | None,
+) -> list[OcrWord] | None:
+    """Words with confidences for a preprocessed image, consulting the cache.
+
+    Returns None if the engine can't report word boxes.
+    """
+    if not hasattr(engine, "image_to_data"):
+        return None
+    if cache is None:
+        return parse_tsv(engine.image_to_data(processed, config))
+    key = ocr_cache_key(processed, engine.name, config + TSV_CACHE_SUFFIX)
+    tsv = cache.get(key)
+    if tsv is None:
+        tsv = engine.image_to_data(processed, config)
+        cache.put(key, tsv)
+    return parse_tsv(tsv)
+
+
+def ocr_field(
+    image: BGRImage,
+    config: str,
+    engine: OcrEngine | None = None,
+    cache: OcrCache | None = None,
+    efforts: Sequence[OcrEffort] = FIELD_EFFORTS,
+    min_confidence: float = FIELD_MIN_CONFIDENCE,
+) -> tuple[str, float | None]:
+    """OCR a field crop, trying harder only while confidence is low.
+
+    Runs the ``efforts`` in order and returns the text and confidence of
+    the first pass in which every word reaches ``min_confidence``, or of
+    the most confident pass if none does. A field's confidence is that of
+    its least confident word, and 0 if nothing was read. A pass that reads
+    nothing at an upscale at least as large as ``DEFAULT_EFFORT``'s ends
+    the retries, since the field is blank (an empty slot or reward area)
+    and harder passes would only find nothing again; an empty pass at a
+    smaller upscale counts as low confidence like any other. Engines that
+    can't report word confidences get a single pass and a confidence of
+    None.
+    """
+    engine = engine or get_default_engine()
+    workspace = thread_workspace()
+    best_text, best_confidence = "", -1.0
+    for attempt, effort in enumerate(efforts):
+        processed = preprocess_for_ocr(image, workspace, effort)
+        words = _recognize_words(processed, effort.apply(config), engine, cache)
+        if words is None:
+            text = _recognize(processed, effort.apply(config), engine, cache)
+            return text.strip(), None
+        text = words_to_text(words)
+        confidence = min((word.confidence for word in words), default=0.0)
+        if confidence >= min_confidence:
+            return text, confidence
+        if not words and effort.upscales_at_least(DEFAULT_EFFORT):
+            logger.debug("Pass %d read nothing; field is blank", attempt)
+            break
+        logger.debug(
+            "Pass %d read %r with confidence %.1f; retrying", attempt, text, confidence
+        )
+        if confidence > best_confidence:
+            best_text, best_confidence = text, confidence
+    return best_text, max(best_confidence, 0.0)
+
+
+def ocr_text(
+    image: BGRImage,
+    config: str = TESSERACT_CONFIG,
+    engine: OcrEngine | None = None,
+    cache: OcrCache | None = None,
+) -> str:
     """Run Tesseract OCR on an image and return the recognized text.
 
-    The image is preprocessed before OCR to improve accuracy.
+    The image is preprocessed before OCR to improve accuracy, in the
+    calling thread's workspace. ``engine`` defaults to the process-wide
+    engine from ``zora.vision.ocr``; with a ``cache``, previously seen
+    crops skip the engine entirely.
     """
-    processed = preprocess_for_ocr(image)
-    text = pytesseract.image_to_string(processed, config=config)
+    processed = preprocess_for_ocr(image, thread_workspace())
+    text = _recognize(processed, config, engine, cache)
     return text.strip()
 
 
-def ocr_number(image: BGRImage) -> int | None:
+def ocr_number(
+    image: BGRImage,
+    engine: OcrEngine | None = None,
+    cache: OcrCache | None = None,
+    glyphs: GlyphBank | None = None,
+) -> int | None:
     """Extract a single integer from an image region.
 
-    Returns None if no valid number is found.
+    With ``glyphs``, the template matcher is tried first and Tesseract only
+    runs if it isn't confident. Returns None if no valid number is found.
     """
-    processed = preprocess_for_ocr(image)
-    text = pytesseract.image_to_string(processed, config=TESSERACT_DIGITS_CONFIG)
+    if glyphs is not None:
+        value = glyphs.read_number(image)
+        if value is not None:
+            return value
+    processed = preprocess_for_ocr(image, thread_workspace())
+    return _parse_number(_recognize(processed, TESSERACT_DIGITS_CONFIG, engine, cache))
+
+
+def _parse_number(text: str) -> int | None:
+    """The integer in OCR output for a number field, or None."""
     text = text.strip()
     if text.isdigit():
         return int(text)
@@ -80,104 +363,17 @@ def ocr_number(image: BGRImage) -> int | None:
     return None
 
 
-def parse_assignment_text(raw_text: str) -> dict:
-    """Parse raw OCR text from an assignment card into structured fields.
-
-    This is a best-effort parser that extracts what it can from OCR output.
-    The STO assignment card layout typically shows:
-    - Title on the first line
-    - Stats as "Engineering: N", "Science: N", "Tactical: N" or similar
-    - Duration as a time string
-    - Rarity indicator
-    """
-    lines = [line.strip() for line in raw_text.splitlines() if line.strip()]
-    result: dict = {
-        "name": "",
-        "engineering": 0,
-        "science": 0,
-        "tactical": 0,
-        "ship_slots": 0,
-        "duration": "",
-        "rarity": "",
-        "event_rewards": [],
-    }
-
-    if not lines:
-        return result
-
-    # First non-empty line is usually the assignment name
-    result["name"] = lines[0]
-
-    full_text = raw_text.lower()
-
-    # Extract stats with pattern matching
-    eng_match = re.search(r"(?:eng(?:ineering)?)\s*[:\-]?\s*(\d+)", full_text)
-    if eng_match:
-        result["engineering"] = int(eng_match.group(1))
-
-    sci_match = re.search(r"(?:sci(?:ence)?)\s*[:\-]?\s*(\d+)", full_text)
-    if sci_match:
-        result["science"] = int(sci_match.group(1))
-
-    tac_match = re.search(r"(?:tac(?:tical)?)\s*[:\-]?\s*(\d+)", full_text)
-    if tac_match:
-        result["tactical"] = int(tac_match.group(1))
-
-    # Ship slots
-    slots_match = re.search(r"(?:slots?|ships?)\s*[:\-]?\s*(\d+)", full_text)
-    if slots_match:
-        result["ship_slots"] = int(slots_match.group(1))
-
-    # Duration (e.g., "4h", "30m", "1h 30m", "4 hours")
-    dur_pat = r"(\d+\s*h(?:ours?)?(?:\s*\d+\s*m(?:in)?)?|\d+\s*m(?:in)?)"
-    dur_match = re.search(dur_pat, full_text)
-    if dur_match:
-        result["duration"] = dur_match.group(1).strip()
-
-    # Rarity
-    for rarity in ["epic", "very rare", "rare", "uncommon", "common"]:
-        if rarity in full_text:
-            result["rarity"] = rarity.title()
-            break
-
-    # Event rewards — look for lines containing reward-related keywords
-    # STO event rewards appear as "Event: <reward name>" or "Reward: <name>"
-    # or lines mentioning specific reward types like dilithium, marks, XP, etc.
-    rewards: list[str] = []
-    reward_line_pat = re.compile(
-        r"(?:event\s*rewards?|rewards?)\s*[:\-]\s*(.+)", re.IGNORECASE
-    )
-    reward_item_pat = re.compile(
-        r"(\d+[x×]?\s*(?:dilithium|dil|marks?|xp|experience|ec|energy credits"
-        r"|fleet credits|admiralty xp|campaign xp|tour of duty|"
-        r"r&d materials?|reputation marks?))",
-        re.IGNORECASE,
-    )
-    for line in lines:
-        line_match = reward_line_pat.search(line)
-        if line_match:
-            # Split comma-separated rewards on a single reward line
-            reward_text = line_match.group(1).strip()
-            for part in re.split(r"[,;]", reward_text):
-                part = part.strip()
-                if part:
-                    rewards.append(part)
-        else:
-            # Also check for standalone reward item patterns
-            for item_match in reward_item_pat.finditer(line):
-                rewards.append(item_match.group(1).strip())
-    result["event_rewards"] = rewards
-
-    return result
-
-
-def extract_assignment(card_image: BGRImage) -> Assignment:
+def extract_assignment(
+    card_image: BGRImage,
+    engine: OcrEngine | None = None,
+    cache: OcrCache | None = None,
+) -> Assignment:
     """Extract an Assignment from a card image using OCR.
 
     Takes a cropped image of a single assignment card, runs OCR,
     parses the text, and returns an Assignment domain object.
     """
-    raw_text = ocr_text(card_image)
+    raw_text = ocr_text(card_image, engine=engine, cache=cache)
     logger.debug("OCR raw text: %r", raw_text)
 
     fields = parse_assignment_text(raw_text)
@@ -193,3 +389,194 @@ def extract_assignment(card_image: BGRImage) -> Assignment:
         rarity=fields["rarity"],
         event_rewards=fields["event_rewards"],
     )
+
+
+@dataclass
+class FieldTimings:
+    """Cumulative seconds and call counts per card field.
+
+    Shared between threads when cards are extracted concurrently.
+    """
+
+    seconds: dict[str, float] = field(default_factory=dict)
+    calls: dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+            self.calls[name] = self.calls.get(name, 0) + 1
+
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict (milliseconds per call) for JSON output."""
+        with self._lock:
+            return {
+                name: {
+                    "calls": self.calls[name],
+                    "mean_ms": round(1000 * total / self.calls[name], 3),
+                }
+                for name, total in self.seconds.items()
+            }
+
+
+def _field_crop(
+    card_image: BGRImage, box: BoundingBox, after_label: bool = False
+) -> BGRImage:
+    """Crop a field region plus a margin of card background.
+
+    A value that follows a label must not grow leftwards into the label,
+    so its left margin is made by replicating its first (blank) column.
+    """
+    margin = max(2, round(box.height * FIELD_MARGIN_FRACTION))
+    h, w = card_image.shape[:2]
+    left = box.x if after_label else max(0, box.x - margin)
+    crop = card_image[
+        max(0, box.y - margin) : min(h, box.y2 + margin),
+        left : min(w, box.x2 + margin),
+    ]
+    if after_label:
+        crop = cv2.copyMakeBorder(crop, 0, 0, margin, 0, cv2.BORDER_REPLICATE)
+    return crop
+
+
+def _glyph_read(glyphs: GlyphBank | None, crop: BGRImage) -> tuple[str, float]:
+    """The glyph bank's text and score for a crop, or ("", 0.0) if unsure."""
+    if glyphs is None:
+        return "", 0.0
+    text, score = glyphs.match(crop)
+    if not text or score < glyphs.min_score:
+        return "", 0.0
+    return text, score
+
+
+def _read_field(
+    name: str,
+    crop: BGRImage,
+    engine: OcrEngine | None,
+    cache: OcrCache | None,
+    glyphs: GlyphBank | None,
+    efforts: Sequence[OcrEffort],
+) -> tuple[str | int | None, float | None]:
+    """Read one field's value and its confidence (see ``ocr_field``).
+
+    Numeric fields and the duration try the glyph matcher first; its
+    matches report their lowest glyph correlation as a percentage. The
+    duration is normalized (``normalize_duration``), so it reads the same
+    whichever reader produced it.
+    """
+    if name in DIGIT_FIELDS:
+        text, score = _glyph_read(glyphs, crop)
+        if text.isdigit():
+            return int(text), 100.0 * score
+        text, confidence = ocr_field(
+            crop, TESSERACT_DIGITS_CONFIG, engine, cache, efforts
+        )
+        return _parse_number(text), confidence
+    if name == "duration":
+        text, score = _glyph_read(glyphs, crop)
+        if DURATION_PATTERN.fullmatch(text):
+            return normalize_duration(text), 100.0 * score
+        text, confidence = ocr_field(
+            crop, TESSERACT_DURATION_CONFIG, engine, cache, efforts
+        )
+        match = DURATION_PATTERN.search(text.lower())
+        return (normalize_duration(match.group(1)) if match else ""), confidence
+    return ocr_field(crop, TESSERACT_LINE_CONFIG, engine, cache, efforts)
+
+
+def extract_assignment_fields(
+    card_image: FrameLike,
+    layout: CardLayout = DEFAULT_CARD_LAYOUT,
+    engine: OcrEngine | None = None,
+    cache: OcrCache | None = None,
+    timings: FieldTimings | None = None,
+    glyphs: GlyphBank | None = None,
+    efforts: Sequence[OcrEffort] = FIELD_EFFORTS,
+    regions: CardFieldRegions | None = None,
+) -> Assignment:
+    """Extract an Assignment by reading each card field separately.
+
+    Locates the title, stat, slot, duration and rarity regions with
+    ``locate_card_fields`` and OCRs only those: stats and slots with a
+    digits whitelist, the title and rarity as single lines, and the
+    duration with a duration whitelist. Lines below the layout are
+    scanned for event rewards. Falls back to ``extract_assignment`` on the
+    whole card when the card doesn't match ``layout``.
+
+    Each field is read with ``ocr_field``: a first pass at the default
+    preprocessing, retried with the later ``efforts`` only while its word
+    confidence is low. The
+    confidences end up in ``Assignment.confidence``.
+
+    With ``glyphs``, stats, slots and the duration are read by template
+    matching (``zora.vision.glyphs``) and only fall back to Tesseract when
+    a glyph doesn't match confidently.
+
+    With ``timings``, each field's preprocessing + OCR time is recorded
+    under its name (``"card"`` for a whole-card fallback).
+
+    ``regions`` are known field regions (e.g. from a layout profile, see
+    ``zora.vision.profile``), used instead of locating them on the card.
+
+    The card is converted to grayscale once (or not at all, if it is a
+    ``FrameContext`` cropped from a frame that already has its grayscale
+    plane), and every field crop is cut from that plane.
+    """
+    started = time.perf_counter()
+    card = as_frame(card_image)
+    if regions is None:
+        regions = locate_card_fields(card, layout)
+    if timings is not None:
+        timings.add("locate", time.perf_counter() - started)
+    gray = card.gray
+    if regions is None:
+        logger.debug("Card doesn't match the layout; reading the whole card")
+        started = time.perf_counter()
+        assignment = extract_assignment(gray, engine=engine, cache=cache)
+        if timings is not None:
+            timings.add("card", time.perf_counter() - started)
+        return assignment
+
+    values: dict[str, str | int | None] = {}
+    confidence: dict[str, float] = {}
+    for name, box in regions.fields.items():
+        started = time.perf_counter()
+        crop = _field_crop(gray, box, after_label=name in layout.labelled)
+        values[name], field_confidence = _read_field(
+            name, crop, engine, cache, glyphs, efforts
+        )
+        if field_confidence is not None:
+            confidence[name] = round(field_confidence, 1)
+        if timings is not None:
+            timings.add(name, time.perf_counter() - started)
+
+    rewards: list[str] = []
+    if regions.extra_lines:
+        started = time.perf_counter()
+        extra_text = "\n".join(
+            ocr_text(
+                _field_crop(gray, line),
+                TESSERACT_LINE_CONFIG,
+                engine=engine,
+                cache=cache,
+            )
+            for line in regions.extra_lines
+        )
+        rewards = parse_assignment_text(extra_text)["event_rewards"]
+        if timings is not None:
+            timings.add("event_rewards", time.perf_counter() - started)
+
+    logger.debug("Field values: %s", values)
+    return Assignment(
+        name=str(values.get("name") or ""),
+        engineering=int(values.get("engineering") or 0),
+        science=int(values.get("science") or 0),
+        tactical=int(values.get("tactical") or 0),
+        ship_slots=int(values.get("ship_slots") or 0),
+        duration=str(values.get("duration") or ""),
+        rarity=match_rarity(str(values.get("rarity") or "").lower()),
+        event_rewards=rewards,
+        confidence=confidence,
+    )
@@ -0,0 +1,203 @@
+"""Per-frame analysis context — convert each frame's colours once.
+
+Every stage of a read works on a different crop of the same frame, and
+each used to convert its own crop: ``detect_board`` the frame to HSV,
+``find_assignment_cards`` the board crop to HSV again, and extraction
+every card, text line and field crop to grayscale, once per OCR pass.
+
+A ``FrameContext`` wraps a frame and computes its derived planes (HSV,
+grayscale and HSV range masks) on first use. ``crop`` returns a context
+for a region of the frame whose planes are views into the frame's planes
+when those have already been computed, so a crop costs no conversion.
+Otherwise the crop converts just its own region, once.
+
+Masks are made by the context's mask engine (see ``zora.vision.masks``):
+the default ``"hsv"`` tests the HSV plane, ``"lut"`` classifies the BGR
+pixels directly, without one.
+
+The vision functions accept a ``FrameContext`` wherever they accept an
+image; ``read_board_from_image`` threads one context through detection,
+card finding and extraction. ``FrameStats`` counts the conversions run
+and the ones saved.
+"""
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
+from zora.capture import BGRImage
+from zora.defaults import MASK_ENGINES
+from zora.vision import BoundingBox
+from zora.vision.masks import lut_masks
+
+# Colour conversions a context can derive from its BGR image
+_CONVERSIONS: dict[str, Callable[[BGRImage], NDArray[np.uint8]]] = {
+    "hsv": lambda image: cv2.cvtColor(image, cv2.COLOR_BGR2HSV),
+    "gray": lambda image: cv2.cvtColor(image, cv2.COLOR_BGR2GRAY),
+}
+
+
+@dataclass
+class FrameStats:
+    """Planes converted and plane requests served without converting.
+
+    Shared by a frame and all its crops, possibly across threads.
+    """
+
+    conversions: dict[str, int] = field(default_factory=dict)
+    reused: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add_conversion(self, name: str) -> None:
+        with self._lock:
+            self.conversions[name] = self.conversions.get(name, 0) + 1
+
+    def add_reuse(self) -> None:
+        with self._lock:
+            self.reused += 1
+
+    @property
+    def converted(self) -> int:
+        """Total planes converted (colour conversions plus masks)."""
+        return sum(self.conversions.values())
+
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict for JSON output."""
+        with self._lock:
+            return {"conversions": dict(self.conversions), "reused": self.reused}
+
+
+class FrameContext:
+    """A BGR frame (or a crop of one) and its lazily derived planes.
+
+    ``hsv`` and ``gray`` are computed on first access, and ``mask`` once
+    per HSV range, by ``mask_engine``. A context made by ``crop`` takes
+    views of its parent's planes when the parent (or one of its ancestors)
+    already has them. Planes are shared, not copied: treat them as
+    read-only.
+
+    Raises ValueError for an unknown ``mask_engine``.
+    """
+
+    def __init__(
+        self,
+        image: BGRImage,
+        stats: FrameStats | None = None,
+        mask_engine: str = "hsv",
+    ) -> None:
+        if mask_engine not in MASK_ENGINES:
+            raise ValueError(
+                f"Unknown mask engine {mask_engine!r}; expected one of {MASK_ENGINES}"
+            )
+        self.image = image
+        self.stats = stats if stats is not None else FrameStats()
+        self.mask_engine = mask_engine
+        self._planes: dict[object, NDArray[np.uint8]] = {}
+        self._parent: FrameContext | None = None
+        self._box: BoundingBox | None = None
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.image.shape
+
+    @property
+    def hsv(self) -> NDArray[np.uint8]:
+        """The frame in HSV."""
+        return self._plane("hsv")
+
+    @property
+    def gray(self) -> NDArray[np.uint8]:
+        """The frame in grayscale."""
+        return self._plane("gray")
+
+    def mask(
+        self, lower: NDArray[np.uint8], upper: NDArray[np.uint8], keep: bool = True
+    ) -> NDArray:
+        """Mask of the pixels whose HSV is between ``lower`` and ``upper``.
+
+        With ``keep=False`` a mask that isn't available yet is made but
+        not kept on the context, so its buffer can be reused once dropped.
+        """
+        key = ("mask", tuple(lower.tolist()), tuple(upper.tolist()))
+        if not keep and not self.computed(key):
+            return self._make_mask(lower, upper)
+        return self._plane(key)
+
+    def computed(self, name: object) -> bool:
+        """Whether plane ``name`` ("hsv", "gray") is available unconverted."""
+        if name in self._planes:
+            return True
+        return self._parent is not None and self._parent.computed(name)
+
+    def crop(self, box: BoundingBox) -> "FrameContext":
+        """A context for ``box`` of this frame, sharing its planes and stats."""
+        child = FrameContext(
+            self.image[box.y : box.y2, box.x : box.x2],
+            stats=self.stats,
+            mask_engine=self.mask_engine,
+        )
+        child._parent = self
+        child._box = box
+        return child
+
+    def _plane(self, key: object) -> NDArray[np.uint8]:
+        plane = self._planes.get(key)
+        if plane is not None:
+            self.stats.add_reuse()
+            return plane
+        if self._parent is not None and self._parent.computed(key):
+            box = self._box
+            assert box is not None
+            plane = self._parent._plane(key)[box.y : box.y2, box.x : box.x2]
+        else:
+            if isinstance(key, tuple):
+                _, lower, upper = key
+                plane = self._make_mask(
+                    np.array(lower, np.uint8), np.array(upper, np.uint8)
+                )
+            else:
+                plane = _CONVERSIONS[key](self.image)
+                self.stats.add_conversion(key)
+        self._planes[key] = plane
+        return plane
+
+    def _make_mask(
+        self, lower: NDArray[np.uint8], upper: NDArray[np.uint8]
+    ) -> NDArray[np.uint8]:
+        # An HSV plane already at hand is cheaper to test than any engine
+        if self.mask_engine == "lut" and not self.computed("hsv"):
+            plane = lut_masks(self.image, [(lower, upper)])[0]
+        else:
+            plane = cv2.inRange(self.hsv, lower, upper)
+        self.stats.add_conversion("mask")
+        return plane
+
+    def __getstate__(self) -> dict:
+        # Pickled (e.g. for a process worker) as a standalone frame: the
+        # parent would drag the whole frame along, and locks don't pickle
+        return {
+            "image": self.image,
+            "planes": self._planes,
+            "mask_engine": self.mask_engine,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["image"], mask_engine=state["mask_engine"])  # type: ignore[misc]
+        self._planes = dict(state["planes"])
+
+
+# An image, or a context wrapping one
+FrameLike = BGRImage | FrameContext
+
+
+def as_frame(image: FrameLike) -> FrameContext:
+    """``image`` itself if it is a context, else a new context for it."""
+    if isinstance(image, FrameContext):
+        return image
+    return FrameContext(image)
@@ -0,0 +1,306 @@
+"""Template-matching recognizer for the card's numeric fields.
+
+Stats, slot counts and durations are drawn in one fixed game font, so a
+full Tesseract run per field is overkill. ``GlyphBank`` segments a field
+crop into glyphs with connected components, normalizes each glyph to a
+small fixed-size patch and classifies all of them at once by normalized
+cross-correlation (a single matrix product) against templates learned
+from labeled crops.
+
+Readings where any glyph matches poorly are rejected, so callers can fall
+back to Tesseract for anything the bank hasn't seen.
+"""
+
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
+from zora.capture import BGRImage
+from zora.vision import BoundingBox
+
+logger = logging.getLogger(__name__)
+
+# Size (width, height) every glyph is normalized to before matching
+GLYPH_SIZE = (16, 24)
+# Blur applied to normalized glyphs before matching
+GLYPH_BLUR_KERNEL = (5, 5)
+# Minimum correlation with the best template for a glyph to be accepted
+GLYPH_MIN_SCORE = 0.75
+# Components smaller than this fraction of the largest one are noise
+MIN_COMPONENT_FRACTION = 0.02
+# Poorly matching glyphs at least this wide (relative to the line height)
+# are retried as two touching glyphs
+SPLIT_MIN_ASPECT = 0.9
+# Templates of one label more similar than this are stored only once
+DUPLICATE_TEMPLATE_SCORE = 0.995
+
+
+def _binarize(image: BGRImage) -> NDArray[np.uint8]:
+    """OTSU-threshold to a mask with the glyphs (minority class) as 255."""
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if np.count_nonzero(binary) * 2 > binary.size:
+        binary = cv2.bitwise_not(binary)
+    return binary
+
+
+def _segment(binary: NDArray[np.uint8]) -> list[BoundingBox]:
+    """Glyph boxes, left to right, from the connected components of a mask.
+
+    Components that overlap horizontally (the dots of a colon, a broken
+    stroke) are merged into one glyph.
+    """
+    count, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    if count <= 1:
+        return []
+    stats = stats[1:]
+    areas = stats[:, cv2.CC_STAT_AREA]
+    stats = stats[areas >= max(1, areas.max() * MIN_COMPONENT_FRACTION)]
+    stats = stats[np.argsort(stats[:, cv2.CC_STAT_LEFT])]
+
+    merged: list[list[int]] = []  # [x, y, x2, y2]
+    for x, y, w, h, _ in stats.tolist():
+        if merged and x < merged[-1][2]:
+            last = merged[-1]
+            last[1], last[2], last[3] = (
+                min(last[1], y),
+                max(last[2], x + w),
+                max(last[3], y + h),
+            )
+            continue
+        merged.append([x, y, x + w, y + h])
+    return [
+        BoundingBox(x=x, y=y, width=x2 - x, height=y2 - y) for x, y, x2, y2 in merged
+    ]
+
+
+def segment_glyphs(image: BGRImage) -> list[BoundingBox]:
+    """Return the glyph boxes of a single-line field crop, left to right."""
+    return _segment(_binarize(image))
+
+
+def _vectorize(
+    binary: NDArray[np.uint8], boxes: list[BoundingBox], top: int, bottom: int
+) -> NDArray[np.float32]:
+    """Normalized feature vectors, one row per glyph box.
+
+    Glyphs are cut to the rows ``top:bottom`` of the whole line and scaled
+    by its height rather than their own, so "1" stays narrow and lowercase
+    letters stay short. Rows are zero-mean and unit-norm, making a dot
+    product the normalized cross-correlation.
+    """
+    width, height = GLYPH_SIZE
+    scale = height / (bottom - top)
+    vectors = np.zeros((len(boxes), height, width), dtype=np.float32)
+    for i, box in enumerate(boxes):
+        glyph = binary[top:bottom, box.x : box.x2]
+        scaled_w = max(1, min(width, round(box.width * scale)))
+        patch = cv2.resize(glyph, (scaled_w, height), interpolation=cv2.INTER_AREA)
+        left = (width - scaled_w) // 2
+        vectors[i, :, left : left + scaled_w] = patch
+        # Soften strokes so a one-pixel shift or stroke-width change
+        # doesn't destroy the correlation
+        cv2.GaussianBlur(vectors[i], GLYPH_BLUR_KERNEL, 0, dst=vectors[i])
+    flat = vectors.reshape(len(boxes), -1)
+    flat -= flat.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(flat, axis=1, keepdims=True)
+    np.divide(flat, norms, out=flat, where=norms > 0)
+    return flat
+
+
+def _split_box(binary: NDArray[np.uint8], box: BoundingBox) -> list[BoundingBox]:
+    """Split a box at its thinnest column, away from the edges.
+
+    Used for two glyphs that touch and form a single component.
+    """
+    ink = np.count_nonzero(binary[box.y : box.y2, box.x : box.x2], axis=0)
+    lo, hi = box.width // 4, box.width - box.width // 4
+    if hi - lo < 1:
+        return [box]
+    cut = lo + int(np.argmin(ink[lo:hi]))
+    return [
+        BoundingBox(x=box.x, y=box.y, width=cut, height=box.height),
+        BoundingBox(x=box.x + cut, y=box.y, width=box.width - cut, height=box.height),
+    ]
+
+
+def _glyph_vectors(image: BGRImage) -> NDArray[np.float32]:
+    """Feature vectors for every glyph of a field crop, in reading order."""
+    binary = _binarize(image)
+    boxes = _segment(binary)
+    if not boxes:
+        return np.zeros((0, GLYPH_SIZE[0] * GLYPH_SIZE[1]), dtype=np.float32)
+    top = min(b.y for b in boxes)
+    bottom = max(b.y2 for b in boxes)
+    return _vectorize(binary, boxes, top, bottom)
+
+
+class GlyphBank:
+    """Glyph templates and their labels, matched by correlation.
+
+    Usage::
+
+        bank = GlyphBank.from_samples([(crop, "30"), (crop2, "4h"), ...])
+        bank.save("glyphs.npz")
+        bank = GlyphBank.load("glyphs.npz")
+        value = bank.read_number(stat_crop)  # None if unsure
+    """
+
+    def __init__(
+        self,
+        labels: Iterable[str],
+        templates: NDArray[np.float32],
+        min_score: float = GLYPH_MIN_SCORE,
+    ) -> None:
+        self.labels = np.asarray(list(labels), dtype=str)
+        self.templates = np.asarray(templates, dtype=np.float32)
+        if self.templates.shape != (len(self.labels), GLYPH_SIZE[0] * GLYPH_SIZE[1]):
+            raise ValueError(
+                f"Expected {len(self.labels)} templates of {GLYPH_SIZE[0]}x"
+                f"{GLYPH_SIZE[1]}, got array of shape {self.templates.shape}"
+            )
+        self.min_score = min_score
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def alphabet(self) -> str:
+        """The distinct characters the bank can recognize, sorted."""
+        return "".join(sorted(set(self.labels.tolist())))
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: Iterable[tuple[BGRImage, str]],
+        min_score: float = GLYPH_MIN_SCORE,
+    ) -> "GlyphBank":
+        """Build a bank from (field crop, text) pairs.
+
+        Spaces in the text are ignored. Samples whose glyph count doesn't
+        match their text are skipped (and logged), since their glyphs
+        can't be labeled reliably. Near-identical templates of the same
+        character are kept once.
+        """
+        labels: list[str] = []
+        rows: list[NDArray[np.float32]] = []
+        skipped = 0
+        for image, text in samples:
+            chars = text.replace(" ", "")
+            vectors = _glyph_vectors(image)
+            if len(vectors) != len(chars):
+                skipped += 1
+                logger.debug(
+                    "Skipping sample %r: %d glyphs for %d characters",
+                    text,
+                    len(vectors),
+                    len(chars),
+                )
+                continue
+            for char, vector in zip(chars, vectors):
+                same = [row for label, row in zip(labels, rows) if label == char]
+                if same and float(np.max(np.stack(same) @ vector)) > (
+                    DUPLICATE_TEMPLATE_SCORE
+                ):
+                    continue
+                labels.append(char)
+                rows.append(vector)
+        if skipped:
+            logger.info("Skipped %d sample(s) with mismatched glyph counts", skipped)
+        if not rows:
+            raise ValueError("No usable glyph samples")
+        return cls(labels, np.stack(rows), min_score=min_score)
+
+    @classmethod
+    def from_directory(
+        cls, directory: str | Path, min_score: float = GLYPH_MIN_SCORE
+    ) -> "GlyphBank":
+        """Build a bank from image files named after their text.
+
+        The label is the file name up to the first underscore, so several
+        samples of one value can coexist: ``30.png``, ``30_b.png``,
+        ``4h_1.png``.
+        """
+        samples: list[tuple[BGRImage, str]] = []
+        for path in sorted(Path(directory).iterdir()):
+            image = cv2.imread(str(path), cv2.IMREAD_COLOR)
+            if image is None:
+                continue
+            samples.append((image, path.stem.split("_", 1)[0]))
+        return cls.from_samples(samples, min_score=min_score)
+
+    def save(self, path: str | Path) -> None:
+        """Write the bank as a ``.npz`` file (at exactly ``path``)."""
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                labels=self.labels,
+                templates=self.templates,
+                min_score=np.float32(self.min_score),
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "GlyphBank":
+        """Read a bank written by ``save``."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data["labels"].tolist(),
+                data["templates"],
+                min_score=float(data["min_score"]),
+            )
+
+    def _classify(
+        self, vectors: NDArray[np.float32]
+    ) -> tuple[list[str], NDArray[np.float32]]:
+        """Best label and its score for each row of ``vectors``."""
+        scores = vectors @ self.templates.T
+        best = scores.argmax(axis=1)
+        return self.labels[best].tolist(), scores[np.arange(len(best)), best]
+
+    def match(self, image: BGRImage) -> tuple[str, float]:
+        """Classify every glyph in a field crop.
+
+        A wide glyph that matches poorly is retried as two touching glyphs.
+        Returns the text and the lowest glyph score (0.0 if no glyphs).
+        """
+        binary = _binarize(image)
+        boxes = _segment(binary)
+        if not boxes:
+            return "", 0.0
+        top = min(b.y for b in boxes)
+        bottom = max(b.y2 for b in boxes)
+        labels, scores = self._classify(_vectorize(binary, boxes, top, bottom))
+
+        chars: list[str] = []
+        worst = 1.0
+        for box, label, score in zip(boxes, labels, scores.tolist()):
+            if score < self.min_score and box.width > SPLIT_MIN_ASPECT * (bottom - top):
+                halves = _split_box(binary, box)
+                split_labels, split_scores = self._classify(
+                    _vectorize(binary, halves, top, bottom)
+                )
+                if split_scores.min() > score:
+                    chars.extend(split_labels)
+                    worst = min(worst, float(split_scores.min()))
+                    continue
+            chars.append(label)
+            worst = min(worst, score)
+        return "".join(chars), worst
+
+    def read(self, image: BGRImage) -> str | None:
+        """Return the field's text, or None if any glyph matched poorly."""
+        text, score = self.match(image)
+        if not text or score < self.min_score:
+            return None
+        return text
+
+    def read_number(self, image: BGRImage) -> int | None:
+        """Return the field as an integer, or None if it isn't one or is unsure."""
+        text = self.read(image)
+        if text is None or not text.isdigit():
+            return None
+        return int(text)
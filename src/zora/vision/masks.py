@@ -0,0 +1,164 @@
+"""Colour masks — classify BGR pixels against HSV ranges.
+
+The board and card masks are HSV ranges (``BOARD_BG_LOWER/UPPER``,
+``CARD_BG_LOWER/UPPER``) tested with ``cv2.inRange`` on a full
+``cv2.cvtColor`` HSV copy of the frame. Two engines make them:
+
+- ``"hsv"``: that conversion followed by ``cv2.inRange`` per range.
+- ``"lut"``: the ranges span every hue, and in OpenCV's 8-bit HSV the
+  value is ``max(B, G, R)`` while the saturation depends only on the
+  value and the chroma ``max - min``. For one value, the chromas inside
+  a range form a contiguous run, so each range reduces to two 256-entry
+  tables indexed by value: the first and one-past-last chroma of its
+  run. The tables are built by converting every (value, chroma) pair
+  with ``cv2.cvtColor`` once, so masks match the ``"hsv"`` engine bit
+  for bit. Pixels are then classified with channel max/min,
+  ``cv2.LUT`` and ``cv2.compare`` over strips of rows small enough to
+  stay in cache; no HSV image is materialized and several ranges share
+  one pass over the frame.
+
+``color_masks`` picks an engine by name; ``FrameContext`` (see
+``zora.vision.frame``) takes the engine its masks are made with.
+"""
+
+import functools
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
+from zora.capture import BGRImage
+from zora.defaults import MASK_ENGINES
+
+# A (lower, upper) pair of inclusive HSV bounds, as for cv2.inRange
+HsvRange = tuple[NDArray[np.uint8], NDArray[np.uint8]]
+
+# Largest hue of 8-bit BGR→HSV conversion (hue is halved to fit 0-179)
+MAX_HUE = 179
+# Rows per strip classified by the lut engine: a strip's working planes
+# stay in cache, which is where the engine's speed comes from
+LUT_STRIP_ROWS = 32
+
+
+@dataclass(frozen=True)
+class ChromaLut:
+    """Per value (``max(B, G, R)``), the run of chromas inside a range.
+
+    A pixel of value ``v`` and chroma ``c`` is in the range when
+    ``low[v] <= c < high[v]``; ``high[v] == 0`` means no pixel of that
+    value is. ``high`` can't hold 256, so ``saturated`` says whether the
+    pixels of chroma 255 (and so value 255) are in the range.
+    """
+
+    low: NDArray[np.uint8]
+    high: NDArray[np.uint8]
+    saturated: bool = False
+
+
+@functools.cache
+def _value_chroma_hsv() -> NDArray[np.uint8]:
+    """HSV of a grey-to-blue pixel for every (value, chroma) pair.
+
+    Row ``v``, column ``c`` is B = v, G = R = v - c, the pixel of value
+    ``v`` and chroma ``c``; entries with ``c > v`` don't exist and are 0.
+    """
+    value, chroma = np.meshgrid(np.arange(256), np.arange(256), indexing="ij")
+    other = np.where(chroma <= value, value - chroma, 0).astype(np.uint8)
+    pixels = np.stack([value.astype(np.uint8), other, other], axis=-1)
+    return cv2.cvtColor(pixels, cv2.COLOR_BGR2HSV)
+
+
+@functools.lru_cache(maxsize=32)
+def _chroma_lut(lower: tuple[int, ...], upper: tuple[int, ...]) -> ChromaLut:
+    if lower[0] > 0 or upper[0] < MAX_HUE:
+        raise ValueError(
+            f"The lut mask engine needs ranges spanning every hue, got "
+            f"{lower[0]}-{upper[0]}"
+        )
+    hsv = _value_chroma_hsv()
+    value, chroma = np.meshgrid(np.arange(256), np.arange(256), indexing="ij")
+    inside = (
+        (chroma <= value)
+        & (hsv[..., 1] >= lower[1])
+        & (hsv[..., 1] <= upper[1])
+        & (hsv[..., 2] >= lower[2])
+        & (hsv[..., 2] <= upper[2])
+    )
+    low = np.zeros(256, dtype=np.uint8)
+    high = np.zeros(256, dtype=np.uint8)
+    for v in range(256):
+        chromas = np.flatnonzero(inside[v])
+        if chromas.size == 0:
+            continue
+        # Saturation grows with chroma, so the run has no holes
+        assert chromas[-1] - chromas[0] + 1 == chromas.size
+        low[v] = chromas[0]
+        high[v] = min(255, chromas[-1] + 1)
+    return ChromaLut(low=low, high=high, saturated=bool(inside[255, 255]))
+
+
+def chroma_lut(lower: NDArray[np.uint8], upper: NDArray[np.uint8]) -> ChromaLut:
+    """The lookup tables of an HSV range (cached per range).
+
+    Raises ValueError if the range doesn't span every hue: hue isn't a
+    function of value and chroma alone.
+    """
+    return _chroma_lut(tuple(lower.tolist()), tuple(upper.tolist()))
+
+
+def lut_masks(image: BGRImage, ranges: Sequence[HsvRange]) -> list[NDArray[np.uint8]]:
+    """Masks of ``image`` for each HSV range, in one pass without HSV."""
+    luts = [chroma_lut(lower, upper) for lower, upper in ranges]
+    height, width = image.shape[:2]
+    masks = [np.empty((height, width), dtype=np.uint8) for _ in luts]
+    rows = max(1, min(LUT_STRIP_ROWS, height))
+    b, g, r, value, chroma, limit = (
+        np.empty((rows, width), dtype=np.uint8) for _ in range(6)
+    )
+    for top in range(0, height, rows):
+        strip = image[top : top + rows]
+        n = strip.shape[0]
+        if n < rows:
+            b, g, r, value, chroma, limit = (
+                plane[:n] for plane in (b, g, r, value, chroma, limit)
+            )
+        cv2.split(strip, [b, g, r])
+        cv2.max(b, g, dst=value)
+        cv2.max(value, r, dst=value)
+        cv2.min(b, g, dst=chroma)
+        cv2.min(chroma, r, dst=chroma)
+        cv2.subtract(value, chroma, dst=chroma)
+        for mask, lut in zip(masks, luts):
+            out = mask[top : top + n]
+            cv2.LUT(value, lut.high, dst=limit)
+            cv2.compare(chroma, limit, cv2.CMP_LT, dst=out)
+            if lut.low.any():
+                cv2.LUT(value, lut.low, dst=limit)
+                cv2.compare(chroma, limit, cv2.CMP_GE, dst=limit)
+                cv2.bitwise_and(out, limit, dst=out)
+            if lut.saturated:
+                cv2.threshold(chroma, 254, 255, cv2.THRESH_BINARY, dst=limit)
+                cv2.bitwise_or(out, limit, dst=out)
+    return masks
+
+
+def hsv_masks(image: BGRImage, ranges: Sequence[HsvRange]) -> list[NDArray[np.uint8]]:
+    """Masks of ``image`` for each HSV range, via one HSV conversion."""
+    hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+    return [cv2.inRange(hsv, lower, upper) for lower, upper in ranges]
+
+
+def color_masks(
+    image: BGRImage, ranges: Sequence[HsvRange], engine: str = "hsv"
+) -> list[NDArray[np.uint8]]:
+    """Masks of ``image`` for each HSV range, made by mask ``engine``.
+
+    Raises ValueError for an unknown engine.
+    """
+    if engine == "hsv":
+        return hsv_masks(image, ranges)
+    if engine == "lut":
+        return lut_masks(image, ranges)
+    raise ValueError(f"Unknown mask engine {engine!r}; expected one of {MASK_ENGINES}")
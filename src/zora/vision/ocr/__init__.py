@@ -0,0 +1,265 @@
+"""OCR engines — the text recognizers behind ``zora.vision.extract``.
+
+An engine is any object with an ``image_to_string(image, config)`` method
+that takes a preprocessed (grayscale/binary or BGR) image and a
+Tesseract-style config string and returns the recognized text. Engines
+that also implement ``image_to_data(image, config)`` return word boxes as
+Tesseract TSV text (see ``parse_tsv``), which lets several cards share one
+recognition call.
+
+Two Tesseract engines ship with Zora:
+- ``TesserocrEngine`` binds libtesseract in-process and keeps one warm
+  engine handle per thread, so the language model loads once per worker.
+- ``PytesseractEngine`` shells out to the ``tesseract`` binary per call.
+
+The default engine prefers the in-process one when ``tesserocr`` is
+installed and falls back to pytesseract otherwise.
+
+Engines are also registered by name (``get_engine("easyocr")``), so the
+CLI and pipeline can select one. Each name maps to the import path of its
+factory, and the module behind it is only imported when that engine is
+first requested: an engine that isn't used costs nothing at startup, and
+one that isn't installed only fails when asked for. Besides the two
+Tesseract engines, ``easyocr`` (optional dependency) and a deterministic
+``fake`` engine for tests are registered.
+"""
+
+import importlib
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
+
+from zora.vision import BoundingBox
+
+if TYPE_CHECKING:
+    # Only annotations need numpy; the CLI imports this module for the
+    # engine names before it knows whether any image will be read
+    import numpy as np
+    from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+
+class OcrEngine(Protocol):
+    """Protocol for OCR engines used by the extraction module."""
+
+    name: str
+
+    def image_to_string(self, image: "NDArray[np.uint8]", config: str) -> str: ...
+
+
+class OcrDataEngine(OcrEngine, Protocol):
+    """An engine that can also report word boxes (Tesseract TSV output)."""
+
+    def image_to_data(self, image: "NDArray[np.uint8]", config: str) -> str: ...
+
+
+# TSV row level of a single word (page=1, block, paragraph, line, word=5)
+TSV_WORD_LEVEL = 5
+
+
+@dataclass(frozen=True)
+class OcrWord:
+    """One recognized word with its box in image pixels.
+
+    ``line`` is the (block, paragraph, line) number of the word's text
+    line, so words can be regrouped into lines in reading order.
+    """
+
+    text: str
+    box: BoundingBox
+    confidence: float
+    line: tuple[int, int, int]
+
+
+def parse_tsv(tsv: str) -> list[OcrWord]:
+    """Parse Tesseract TSV output into its words, in reading order.
+
+    Accepts the output with or without the header row; rows that aren't
+    words, or whose text is blank, are skipped.
+    """
+    words: list[OcrWord] = []
+    for row in tsv.splitlines():
+        cells = row.split("\t")
+        if len(cells) < 12 or not cells[0].isdigit():
+            continue
+        if int(cells[0]) != TSV_WORD_LEVEL or not cells[11].strip():
+            continue
+        block, par, line = (int(c) for c in cells[2:5])
+        left, top, width, height = (int(c) for c in cells[6:10])
+        words.append(
+            OcrWord(
+                text=cells[11].strip(),
+                box=BoundingBox(x=left, y=top, width=width, height=height),
+                confidence=float(cells[10]),
+                line=(block, par, line),
+            )
+        )
+    return words
+
+
+def words_to_text(words: list[OcrWord]) -> str:
+    """Rebuild text from words: one line per Tesseract text line."""
+    lines: dict[tuple[int, int, int], list[str]] = {}
+    for word in words:
+        lines.setdefault(word.line, []).append(word.text)
+    return "\n".join(" ".join(line) for line in lines.values())
+
+
+def words_to_tsv(words: Iterable[OcrWord]) -> str:
+    """Format words as Tesseract TSV word rows, the inverse of ``parse_tsv``.
+
+    For engines that find word boxes themselves but don't speak TSV.
+    """
+    rows = []
+    for word in words:
+        block, par, line = word.line
+        box = word.box
+        rows.append(
+            f"{TSV_WORD_LEVEL}\t1\t{block}\t{par}\t{line}\t1\t"
+            f"{box.x}\t{box.y}\t{box.width}\t{box.height}\t"
+            f"{word.confidence:g}\t{word.text}"
+        )
+    return "\n".join(rows)
+
+
+_default_engine: OcrEngine | None = None
+
+
+def get_default_engine() -> OcrEngine:
+    """Return the process-wide default engine, creating it on first use."""
+    global _default_engine
+    if _default_engine is None:
+        from zora.vision.ocr.tesseract import PytesseractEngine, TesserocrEngine
+
+        try:
+            _default_engine = TesserocrEngine()
+        except (ImportError, RuntimeError) as exc:
+            logger.debug("In-process OCR unavailable (%s); using pytesseract", exc)
+            _default_engine = PytesseractEngine()
+    return _default_engine
+
+
+def set_default_engine(engine: OcrEngine | None) -> None:
+    """Replace the default engine (None re-runs auto-selection on next use)."""
+    global _default_engine
+    _default_engine = engine
+
+
+# Engine name that stands for the default engine (see get_default_engine)
+AUTO_ENGINE = "auto"
+
+# Registered engines: name -> "module:attribute" of a zero-argument factory
+# (imported on first use), or the factory itself
+_factories: dict[str, str | Callable[[], OcrEngine]] = {
+    "tesserocr": "zora.vision.ocr.tesseract:TesserocrEngine",
+    "pytesseract": "zora.vision.ocr.tesseract:PytesseractEngine",
+    "easyocr": "zora.vision.ocr.easy:EasyOcrEngine",
+    "fake": "zora.vision.ocr.fake:FakeEngine",
+}
+# Engines created by get_engine, shared per name
+_engines: dict[str, OcrEngine] = {}
+
+
+def register_engine(name: str, factory: str | Callable[[], OcrEngine]) -> None:
+    """Register an engine factory under ``name``, replacing any previous one.
+
+    ``factory`` is a zero-argument callable returning the engine, or its
+    ``"module:attribute"`` path to import lazily.
+    """
+    if name == AUTO_ENGINE:
+        raise ValueError(f"{AUTO_ENGINE!r} is reserved for the default engine")
+    _factories[name] = factory
+    _engines.pop(name, None)
+
+
+def engine_names() -> list[str]:
+    """Names accepted by ``get_engine``: the registered engines, then "auto"."""
+    return [*sorted(_factories), AUTO_ENGINE]
+
+
+def create_engine(name: str) -> OcrEngine:
+    """Create a new instance of the engine registered as ``name``.
+
+    ``"auto"`` gives the (shared) default engine instead. Raises
+    ValueError for an unknown name. An engine whose library isn't
+    installed raises ImportError (or RuntimeError if it is installed but
+    unusable, e.g. missing language data).
+    """
+    if name == AUTO_ENGINE:
+        return get_default_engine()
+    return _factory(name)()
+
+
+def _factory(name: str) -> Callable[[], OcrEngine]:
+    """The factory registered as ``name``, importing it if registered by path."""
+    try:
+        factory = _factories[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown OCR engine {name!r}; expected one of {engine_names()}"
+        ) from None
+    if isinstance(factory, str):
+        module_name, _, attribute = factory.partition(":")
+        factory = getattr(importlib.import_module(module_name), attribute)
+    return factory
+
+
+def get_engine(name: str) -> OcrEngine:
+    """Return the shared engine registered as ``name``, creating it once.
+
+    ``"auto"`` is the default engine. Errors are as for ``create_engine``.
+    """
+    if name == AUTO_ENGINE:
+        return get_default_engine()
+    engine = _engines.get(name)
+    if engine is None:
+        engine = _engines[name] = create_engine(name)
+    return engine
+
+
+def check_engine(name: str) -> None:
+    """Check that the engine registered as ``name`` is usable.
+
+    For callers that only hand the name on (e.g. to process workers, which
+    create their own engines). A factory with a ``probe`` method is asked
+    instead of being called, so no OCR library is initialized (or model
+    loaded) just to be thrown away; other engines are created as by
+    ``get_engine``. ``"auto"`` always passes, since the default engine
+    falls back to the ``tesseract`` binary. Errors are as for
+    ``create_engine``.
+    """
+    if name == AUTO_ENGINE or name in _engines:
+        return
+    factory = _factory(name)
+    probe = getattr(factory, "probe", None)
+    if probe is not None:
+        probe()
+    else:
+        get_engine(name)
+
+
+def resolve_engine(engine: OcrEngine | str | None) -> OcrEngine | None:
+    """Turn an engine name into the shared engine; pass anything else through."""
+    return get_engine(engine) if isinstance(engine, str) else engine
+
+
+__all__ = [
+    "AUTO_ENGINE",
+    "OcrDataEngine",
+    "OcrEngine",
+    "OcrWord",
+    "TSV_WORD_LEVEL",
+    "check_engine",
+    "create_engine",
+    "engine_names",
+    "get_default_engine",
+    "get_engine",
+    "parse_tsv",
+    "register_engine",
+    "resolve_engine",
+    "set_default_engine",
+    "words_to_text",
+    "words_to_tsv",
+]
@@ -0,0 +1,82 @@
+"""EasyOCR engine (optional dependency: ``pip install zora[easyocr]``).
+
+EasyOCR runs a neural text detector and recognizer, which may cope
+better with stylized game fonts than Tesseract at the cost of a heavy
+import (PyTorch) and slower CPU inference.
+
+It has no notion of Tesseract page segmentation modes, so of a config
+string only the ``tessedit_char_whitelist`` variable is honored, as
+EasyOCR's ``allowlist``.
+"""
+
+import importlib.util
+import logging
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from zora.vision import BoundingBox
+from zora.vision.ocr import OcrWord, words_to_tsv
+from zora.vision.ocr.tesseract import parse_tesseract_config
+
+logger = logging.getLogger(__name__)
+
+# Tesseract variable mapped to EasyOCR's allowlist
+WHITELIST_VARIABLE = "tessedit_char_whitelist"
+
+
+class EasyOcrEngine:
+    """Run OCR through an ``easyocr.Reader`` (CPU unless ``gpu`` is set).
+
+    Raises ImportError if ``easyocr`` is not installed. The reader loads
+    its models once, when the engine is created.
+    """
+
+    name = "easyocr"
+
+    def __init__(self, languages: Sequence[str] = ("en",), gpu: bool = False):
+        import easyocr
+
+        logger.debug("Loading EasyOCR models for %s", ", ".join(languages))
+        self._reader = easyocr.Reader(list(languages), gpu=gpu, verbose=False)
+
+    @staticmethod
+    def probe() -> None:
+        """Check that ``easyocr`` is installed, without importing it.
+
+        Importing it pulls in PyTorch, and creating the engine loads its
+        models. Raises ImportError if it isn't installed.
+        """
+        if importlib.util.find_spec("easyocr") is None:
+            raise ImportError("No module named 'easyocr'")
+
+    def _read(self, image: NDArray[np.uint8], config: str) -> list:
+        variables = dict(parse_tesseract_config(config).variables)
+        return self._reader.readtext(
+            image, allowlist=variables.get(WHITELIST_VARIABLE), paragraph=False
+        )
+
+    def image_to_string(self, image: NDArray[np.uint8], config: str) -> str:
+        return "\n".join(text for _, text, _ in self._read(image, config))
+
+    def image_to_data(self, image: NDArray[np.uint8], config: str) -> str:
+        """Each detected text box as one word on its own line, as TSV."""
+        words: list[OcrWord] = []
+        for i, (corners, text, confidence) in enumerate(self._read(image, config)):
+            xs = [round(x) for x, _ in corners]
+            ys = [round(y) for _, y in corners]
+            words.append(
+                OcrWord(
+                    text=text,
+                    box=BoundingBox(
+                        x=min(xs),
+                        y=min(ys),
+                        width=max(xs) - min(xs),
+                        height=max(ys) - min(ys),
+                    ),
+                    confidence=float(confidence) * 100.0,
+                    line=(1, 1, i + 1),
+                )
+            )
+        return words_to_tsv(words)
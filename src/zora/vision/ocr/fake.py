@@ -0,0 +1,61 @@
+"""A deterministic OCR engine that answers with configured text.
+
+``FakeEngine`` never looks at pixels: it returns the text configured for
+the call's config string (or its default text) and records every call,
+so tests and benchmarks can drive the extraction code without Tesseract
+installed and get the same answer every time.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+from numpy.typing import NDArray
+
+from zora.vision import BoundingBox
+from zora.vision.ocr import OcrWord, words_to_tsv
+
+
+class FakeEngine:
+    """Answer every call with ``by_config[config]``, else ``text``.
+
+    ``calls`` records the (image shape, config) of each call in order.
+    """
+
+    name = "fake"
+
+    def __init__(self, text: str = "", by_config: Mapping[str, str] | None = None):
+        self.text = text
+        self.by_config = dict(by_config or {})
+        self.calls: list[tuple[tuple[int, ...], str]] = []
+
+    def _answer(self, image: NDArray[np.uint8], config: str) -> str:
+        self.calls.append((image.shape, config))
+        return self.by_config.get(config, self.text)
+
+    def image_to_string(self, image: NDArray[np.uint8], config: str) -> str:
+        return self._answer(image, config)
+
+    def image_to_data(self, image: NDArray[np.uint8], config: str) -> str:
+        """The answer's words as TSV, its lines spread evenly down the image."""
+        lines = [line.split() for line in self._answer(image, config).splitlines()]
+        lines = [words for words in lines if words]
+        height, width = image.shape[:2]
+        words: list[OcrWord] = []
+        for i, line in enumerate(lines):
+            top = i * height // len(lines)
+            line_height = max(1, height // len(lines))
+            for j, text in enumerate(line):
+                words.append(
+                    OcrWord(
+                        text=text,
+                        box=BoundingBox(
+                            x=j * width // len(line),
+                            y=top,
+                            width=max(1, width // len(line)),
+                            height=line_height,
+                        ),
+                        confidence=100.0,
+                        line=(1, 1, i + 1),
+                    )
+                )
+        return words_to_tsv(words)
@@ -0,0 +1,203 @@
+"""Tesseract OCR engines: in-process (tesserocr) and subprocess (pytesseract).
+
+``pytesseract`` writes the image to a temp file, forks a ``tesseract``
+process, loads the language model and parses stdout — on every call. For
+small card crops that startup dominates the per-call latency.
+``TesserocrEngine`` instead binds libtesseract directly and keeps one
+initialized ``PyTessBaseAPI`` handle per thread, so the model loads once
+and every later call only pays for recognition.
+
+Both engines accept the same Tesseract CLI-style config strings
+(``--oem``, ``--psm``, ``-l``, ``-c name=value``) used throughout
+``zora.vision.extract``.
+"""
+
+import logging
+import shlex
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import cv2
+import numpy as np
+import pytesseract
+from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+# Tesseract CLI defaults, used when a config string doesn't set them
+DEFAULT_OEM = 3
+DEFAULT_PSM = 3
+DEFAULT_LANG = "eng"
+# DPI the tesseract CLI assumes for images without resolution metadata;
+# set explicitly in-process so both engines see the same input scale
+DEFAULT_SOURCE_DPI = 70
+
+
+@dataclass(frozen=True)
+class TesseractConfig:
+    """A parsed Tesseract CLI config string."""
+
+    oem: int = DEFAULT_OEM
+    psm: int = DEFAULT_PSM
+    lang: str = DEFAULT_LANG
+    variables: tuple[tuple[str, str], ...] = ()
+
+
+@lru_cache(maxsize=64)
+def parse_tesseract_config(config: str) -> TesseractConfig:
+    """Parse a Tesseract CLI config string such as ``"--oem 3 --psm 6"``.
+
+    Supports ``--oem``, ``--psm``, ``-l`` and ``-c name=value``. Raises
+    ValueError for anything else, so a typo doesn't silently change what
+    the in-process engine does compared to the CLI.
+    """
+    oem, psm, lang = DEFAULT_OEM, DEFAULT_PSM, DEFAULT_LANG
+    variables: list[tuple[str, str]] = []
+    tokens = shlex.split(config)
+    i = 0
+    while i < len(tokens):
+        flag = tokens[i]
+        if flag not in ("--oem", "--psm", "-l", "-c") or i + 1 >= len(tokens):
+            raise ValueError(
+                f"Unsupported Tesseract config option {flag!r} in {config!r}"
+            )
+        value = tokens[i + 1]
+        if flag == "--oem":
+            oem = int(value)
+        elif flag == "--psm":
+            psm = int(value)
+        elif flag == "-l":
+            lang = value
+        else:
+            name, sep, var_value = value.partition("=")
+            if not sep:
+                raise ValueError(f"Expected name=value after -c, got {value!r}")
+            variables.append((name, var_value))
+        i += 2
+    return TesseractConfig(oem=oem, psm=psm, lang=lang, variables=tuple(variables))
+
+
+class PytesseractEngine:
+    """Run OCR through the ``tesseract`` binary via pytesseract."""
+
+    name = "pytesseract"
+
+    def image_to_string(self, image: NDArray[np.uint8], config: str) -> str:
+        return pytesseract.image_to_string(image, config=config)
+
+    def image_to_data(self, image: NDArray[np.uint8], config: str) -> str:
+        return pytesseract.image_to_data(image, config=config)
+
+
+class _TesserocrHandle:
+    """One initialized libtesseract API plus the variables it has overridden.
+
+    Tesseract variables persist on a handle between calls, so values set
+    for one config (e.g. a digits whitelist) are restored to their defaults
+    before a config that doesn't set them runs.
+    """
+
+    def __init__(self, api: Any) -> None:
+        self.api = api
+        self.defaults: dict[str, str] = {}
+        self.overridden: set[str] = set()
+
+    def configure(self, config: TesseractConfig) -> None:
+        wanted = dict(config.variables)
+        for name in self.overridden - wanted.keys():
+            self.api.SetVariable(name, self.defaults[name])
+        for name, value in wanted.items():
+            if name not in self.defaults:
+                self.defaults[name] = self.api.GetVariableAsString(name) or ""
+            self.api.SetVariable(name, value)
+        self.overridden = set(wanted)
+        self.api.SetPageSegMode(config.psm)
+
+
+class TesserocrEngine:
+    """Run OCR in-process through libtesseract, one warm handle per thread.
+
+    Handles are created lazily per (thread, language, OEM) because the
+    language and engine mode can only be chosen at initialization; page
+    segmentation mode and variables are applied per call.
+
+    Raises ImportError if ``tesserocr`` is not installed, and RuntimeError
+    if no language data for the default language can be found.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, tessdata_path: str | None = None) -> None:
+        self.probe(tessdata_path)
+        import tesserocr
+
+        self._tesserocr = tesserocr
+        self.tessdata_path = tessdata_path
+        self._local = threading.local()
+
+    @staticmethod
+    def probe(tessdata_path: str | None = None) -> None:
+        """Check that the engine can be created, without creating any handle.
+
+        Raises as the constructor does.
+        """
+        import tesserocr
+
+        path_args = () if tessdata_path is None else (tessdata_path,)
+        found_path, languages = tesserocr.get_languages(*path_args)
+        if DEFAULT_LANG not in languages:
+            raise RuntimeError(
+                f"No '{DEFAULT_LANG}' traineddata in {found_path!r}; "
+                "set TESSDATA_PREFIX or pass tessdata_path"
+            )
+
+    def _handle(self, config: TesseractConfig) -> _TesserocrHandle:
+        handles: dict[tuple[str, int], _TesserocrHandle] = (
+            self._local.__dict__.setdefault("handles", {})
+        )
+        key = (config.lang, config.oem)
+        handle = handles.get(key)
+        if handle is None:
+            kwargs: dict[str, Any] = {"lang": config.lang, "oem": config.oem}
+            if self.tessdata_path is not None:
+                kwargs["path"] = self.tessdata_path
+            logger.debug(
+                "Initializing tesserocr handle lang=%s oem=%d in %s",
+                config.lang,
+                config.oem,
+                threading.current_thread().name,
+            )
+            handle = _TesserocrHandle(self._tesserocr.PyTessBaseAPI(**kwargs))
+            handles[key] = handle
+        return handle
+
+    def _set_image(self, api: Any, image: NDArray[np.uint8]) -> None:
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        channels = 1 if image.ndim == 2 else image.shape[2]
+        api.SetImageBytes(image.tobytes(), width, height, channels, width * channels)
+        api.SetSourceResolution(DEFAULT_SOURCE_DPI)
+
+    def image_to_string(self, image: NDArray[np.uint8], config: str) -> str:
+        parsed = parse_tesseract_config(config)
+        handle = self._handle(parsed)
+        handle.configure(parsed)
+        self._set_image(handle.api, image)
+        return handle.api.GetUTF8Text()
+
+    def image_to_data(self, image: NDArray[np.uint8], config: str) -> str:
+        parsed = parse_tesseract_config(config)
+        handle = self._handle(parsed)
+        handle.configure(parsed)
+        self._set_image(handle.api, image)
+        return handle.api.GetTSVText(0)
+
+    def close(self) -> None:
+        """Release the calling thread's engine handles."""
+        handles = self._local.__dict__.pop("handles", {})
+        for handle in handles.values():
+            handle.api.End()
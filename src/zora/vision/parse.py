@@ -0,0 +1,216 @@
+"""Parse raw OCR text from an assignment card into structured fields.
+
+Kept apart from the OCR code so stored raw text can be re-parsed in bulk
+without loading OpenCV or an OCR engine. All patterns are compiled once
+at import, durations are located from their unit letter instead of by a
+regex scan over every digit, and the per-line reward scan only runs when
+the text could contain a reward at all.
+
+``parse_many`` streams results for large corpora, reusing the results of
+recently seen texts.
+
+On unique text the parser alone is about 2x faster than the original
+(``benchmarks/bench_parse.py``, 1M lines: about 5s vs 2.5s), short of the
+5x asked for; larger speedups come only from ``parse_many`` reusing the
+results of repeated texts.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+# Rarity names, most specific first ("very rare" before "rare")
+RARITIES = ("epic", "very rare", "rare", "uncommon", "common")
+# Duration (e.g., "4h", "30m", "1h 30m", "4 hours")
+DURATION_PATTERN = re.compile(
+    r"(\d+\s*h(?:ours?)?(?:\s*\d+\s*m(?:in)?)?|\d+\s*m(?:in)?)"
+)
+# The hours and minutes of a DURATION_PATTERN match
+DURATION_PARTS_PATTERN = re.compile(
+    r"(\d+)\s*h(?:ours?)?(?:\s*(\d+)\s*m(?:in)?)?|(\d+)\s*m(?:in)?"
+)
+# Stat labels and values ("Eng: 30", "science 20", "Slots - 2"), matched on
+# lowercased text. Each starts with a literal the regex engine can skip to,
+# so four searches are cheaper than one scan for an alternation of labels.
+STAT_PATTERNS = (
+    ("engineering", re.compile(r"eng(?:ineering)?\s*[:\-]?\s*(\d+)")),
+    ("science", re.compile(r"sci(?:ence)?\s*[:\-]?\s*(\d+)")),
+    ("tactical", re.compile(r"tac(?:tical)?\s*[:\-]?\s*(\d+)")),
+    ("ship_slots", re.compile(r"(?:slots?|ships?)\s*[:\-]?\s*(\d+)")),
+)
+# STO event rewards appear as "Event: <reward name>" or "Reward: <name>"
+REWARD_LINE_PATTERN = re.compile(
+    r"(?:event\s*rewards?|rewards?)\s*[:\-]\s*(.+)", re.IGNORECASE
+)
+# ...or as standalone items such as "500 Dilithium" or "2x Marks"
+REWARD_ITEM_PATTERN = re.compile(
+    r"(\d+[x×]?\s*(?:dilithium|dil|marks?|xp|experience|ec|energy credits"
+    r"|fleet credits|admiralty xp|campaign xp|tour of duty|"
+    r"r&d materials?|reputation marks?))",
+    re.IGNORECASE,
+)
+# Separators between rewards listed on one reward line
+REWARD_SEPARATOR_PATTERN = re.compile(r"[,;]")
+# Distinct texts whose results parse_many keeps for reuse
+PARSE_CACHE_SIZE = 4096
+
+# Matches lowercased text wherever REWARD_ITEM_PATTERN matches the original,
+# provided the text is ASCII (where ignoring case is the same as
+# lowercasing): the last digit of the count and the start of an item name
+# are enough, and avoiding re.IGNORECASE makes the scan several times faster
+REWARD_ITEM_HINT_PATTERN = re.compile(
+    r"\d[x×]?\s*(?:dil|marks?|xp|experience|ec|energy credits|fleet credits"
+    r"|admiralty xp|campaign xp|tour of duty|r&d materials?|reputation marks?)"
+)
+
+
+def match_rarity(text: str) -> str:
+    """Return the first rarity name found in lowercase ``text``, title-cased."""
+    for rarity in RARITIES:
+        if rarity in text:
+            return rarity.title()
+    return ""
+
+
+def normalize_duration(duration: str) -> str:
+    """Spell a duration one way: "1h 30m", "4h" or "45m".
+
+    OCR engines and the glyph matcher space (and Tesseract spells out)
+    durations differently; text that isn't a duration is returned as is.
+    """
+    match = DURATION_PARTS_PATTERN.fullmatch(duration.strip().lower())
+    if match is None:
+        return duration
+    hours, minutes, only_minutes = match.groups()
+    if hours is None:
+        return f"{only_minutes}m"
+    return f"{hours}h {minutes}m" if minutes is not None else f"{hours}h"
+
+
+def _duration_start(text: str) -> int:
+    """Index where DURATION_PATTERN's first match in ``text`` starts, or -1.
+
+    Every duration is a digit run, optional whitespace and then "h" or "m".
+    Walking back from each "h"/"m" with ``str.find`` is much cheaper than
+    letting the regex engine try a match at every digit, and the first unit
+    letter preceded by a number belongs to the leftmost match.
+    """
+    h = text.find("h")
+    m = text.find("m")
+    while h >= 0 or m >= 0:
+        if h >= 0 and (m < 0 or h < m):
+            unit, h = h, text.find("h", h + 1)
+        else:
+            unit, m = m, text.find("m", m + 1)
+        start = unit
+        while start and text[start - 1].isspace():
+            start -= 1
+        if start and text[start - 1].isdecimal():
+            while start and text[start - 1].isdecimal():
+                start -= 1
+            return start
+    return -1
+
+
+def _parse_rewards(raw_text: str, full_text: str) -> list[str]:
+    """Event rewards, from reward lines or standalone reward items.
+
+    ``full_text`` is ``raw_text`` lowercased; for ASCII text its lines are
+    used to skip the case-insensitive patterns on lines that can't match.
+    """
+    rewards: list[str] = []
+    raw_lines = raw_text.splitlines()
+    if raw_text.isascii():
+        hints = full_text.splitlines()
+    else:
+        hints = [None] * len(raw_lines)
+    for line, hint in zip(raw_lines, hints):
+        line = line.strip()
+        if not line:
+            continue
+        line_match = (
+            REWARD_LINE_PATTERN.search(line)
+            if hint is None or "reward" in hint
+            else None
+        )
+        if line_match:
+            # Split comma-separated rewards on a single reward line
+            for part in REWARD_SEPARATOR_PATTERN.split(line_match.group(1).strip()):
+                part = part.strip()
+                if part:
+                    rewards.append(part)
+        elif hint is None or REWARD_ITEM_HINT_PATTERN.search(hint):
+            for item_match in REWARD_ITEM_PATTERN.finditer(line):
+                rewards.append(item_match.group(1).strip())
+    return rewards
+
+
+def parse_assignment_text(raw_text: str) -> dict:
+    """Parse raw OCR text from an assignment card into structured fields.
+
+    This is a best-effort parser that extracts what it can from OCR output.
+    The STO assignment card layout typically shows:
+    - Title on the first line
+    - Stats as "Engineering: N", "Science: N", "Tactical: N" or similar
+    - Duration as a time string
+    - Rarity indicator
+    """
+    result: dict = {
+        "name": "",
+        "engineering": 0,
+        "science": 0,
+        "tactical": 0,
+        "ship_slots": 0,
+        "duration": "",
+        "rarity": "",
+        "event_rewards": [],
+    }
+
+    # First non-empty line is usually the assignment name
+    text = raw_text.lstrip()
+    if not text:
+        return result
+    result["name"] = text.partition("\n")[0].splitlines()[0].strip()
+
+    full_text = raw_text.lower()
+
+    for name, pattern in STAT_PATTERNS:
+        match = pattern.search(full_text)
+        if match:
+            result[name] = int(match.group(1))
+
+    start = _duration_start(full_text)
+    if start >= 0:
+        result["duration"] = DURATION_PATTERN.match(full_text, start).group(1).strip()
+
+    result["rarity"] = match_rarity(full_text)
+
+    # Skip the per-line reward scan unless some line could hold a reward
+    if "reward" in full_text or (
+        REWARD_ITEM_HINT_PATTERN.search(full_text)
+        if raw_text.isascii()
+        else REWARD_ITEM_PATTERN.search(raw_text)
+    ):
+        result["event_rewards"] = _parse_rewards(raw_text, full_text)
+
+    return result
+
+
+def parse_many(
+    texts: Iterable[str], cache_size: int = PARSE_CACHE_SIZE
+) -> Iterator[dict]:
+    """Parse raw OCR texts one at a time, yielding each result as it's ready.
+
+    Suited to re-parsing large stores of raw text: results are streamed,
+    so memory stays flat however long ``texts`` is. Stored OCR text repeats
+    heavily (the same card is read frame after frame), so the results for
+    the ``cache_size`` most recently used texts are kept and reused; every
+    yielded dict is still a fresh copy. ``cache_size=0`` disables reuse.
+    """
+    if cache_size <= 0:
+        yield from map(parse_assignment_text, texts)
+        return
+    parse = lru_cache(maxsize=cache_size)(parse_assignment_text)
+    for text in texts:
+        result = parse(text)
+        yield {**result, "event_rewards": list(result["event_rewards"])}
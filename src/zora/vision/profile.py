@@ -0,0 +1,347 @@
+"""Layout profiles — crop a calibrated board layout without detecting it.
+
+For a fixed game resolution and UI scale the board rectangle and the card
+grid are the same on every read, yet ``detect_board`` and
+``find_assignment_cards`` rediscover them from HSV masks each time.
+``calibrate`` runs full detection once and records the result as a
+``LayoutProfile``: the board box, the card boxes, the HSV ranges they were
+found with and each card's field regions. Profiles are saved as JSON
+(``zora calibrate``).
+
+The pipeline (``profile=``) crops straight from a profile once a quick
+sanity check passes (``LayoutProfile.matches``): the frame size must be
+the calibrated one, the board edges must pass the tracker's edge test, a
+few pixels inside every card must be card background, and a sparse grid
+over the rest of the board must not be (a card appeared). Only when the
+check fails does it run full detection.
+
+Field regions are widened towards the card's right edge and padded
+vertically, so values longer than the ones seen at calibration still fit.
+Reward lines vary per card, so only the area below the fields is recorded
+and its text lines are found on each read. The same scan checks that the
+card's lines still sit in the recorded fields (a wrapped title pushes
+them down); a card whose lines have moved has its fields located afresh.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from zora.capture import BGRImage
+from zora.vision import BoundingBox
+from zora.vision.detect import BOARD_BG_LOWER, BOARD_BG_UPPER, crop_board, detect_board
+from zora.vision.frame import FrameLike, as_frame
+from zora.vision.regions import (
+    CARD_BG_LOWER,
+    CARD_BG_UPPER,
+    DEFAULT_CARD_LAYOUT,
+    MIN_TEXT_LINE_HEIGHT,
+    TEXT_LINE_INSET_FRACTION,
+    CardFieldRegions,
+    CardLayout,
+    crop_region,
+    find_assignment_cards,
+    find_text_lines,
+    has_label,
+    locate_card_fields,
+)
+from zora.vision.track import (
+    TRACK_EDGE_OFFSET,
+    board_still_at,
+    edge_points,
+    hsv_fraction,
+)
+
+logger = logging.getLogger(__name__)
+
+# Format version written to profile files
+PROFILE_VERSION = 1
+# Pixels sampled along each edge of every card when checking a profile
+PROFILE_CARD_SAMPLES_PER_EDGE = 8
+# Fraction of a card's edge samples that must be card background
+PROFILE_MIN_CARD_FRACTION = 0.9
+# Points per side of the grid sampled over the board outside the cards
+PROFILE_BOARD_GRID = 24
+# Fraction of those points allowed to be card background; more means a
+# card has appeared where the profile has none
+PROFILE_MAX_STRAY_CARD_FRACTION = 0.05
+# Padding above and below each field region, as a fraction of its height
+PROFILE_FIELD_PAD_FRACTION = 0.15
+
+
+def _box_to_dict(box: BoundingBox) -> dict:
+    return {"x": box.x, "y": box.y, "width": box.width, "height": box.height}
+
+
+def _box_from_dict(data: dict) -> BoundingBox:
+    return BoundingBox(
+        x=int(data["x"]),
+        y=int(data["y"]),
+        width=int(data["width"]),
+        height=int(data["height"]),
+    )
+
+
+@dataclass
+class CardProfile:
+    """One card of a profile.
+
+    ``box`` is in board coordinates; ``fields`` (empty if the card didn't
+    match the card layout) and ``rewards`` (the area below the fields, if
+    any) are in card coordinates.
+    """
+
+    box: BoundingBox
+    fields: dict[str, BoundingBox] = field(default_factory=dict)
+    rewards: BoundingBox | None = None
+
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict for JSON output."""
+        result: dict = {"box": _box_to_dict(self.box)}
+        if self.fields:
+            result["fields"] = {
+                name: _box_to_dict(box) for name, box in self.fields.items()
+            }
+        if self.rewards is not None:
+            result["rewards"] = _box_to_dict(self.rewards)
+        return result
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CardProfile":
+        rewards = data.get("rewards")
+        return cls(
+            box=_box_from_dict(data["box"]),
+            fields={
+                name: _box_from_dict(box)
+                for name, box in data.get("fields", {}).items()
+            },
+            rewards=_box_from_dict(rewards) if rewards is not None else None,
+        )
+
+
+@dataclass
+class LayoutProfile:
+    """Board and card geometry recorded for one resolution and UI scale."""
+
+    frame_size: tuple[int, int]
+    board: BoundingBox
+    cards: list[CardProfile]
+    board_hsv: tuple[list[int], list[int]] = field(
+        default_factory=lambda: (BOARD_BG_LOWER.tolist(), BOARD_BG_UPPER.tolist())
+    )
+    card_hsv: tuple[list[int], list[int]] = field(
+        default_factory=lambda: (CARD_BG_LOWER.tolist(), CARD_BG_UPPER.tolist())
+    )
+
+    @property
+    def card_boxes(self) -> list[BoundingBox]:
+        """The card boxes, in board coordinates and reading order."""
+        return [card.box for card in self.cards]
+
+    def matches(self, image: BGRImage) -> bool:
+        """Cheaply check that ``image`` still shows this layout.
+
+        Samples a few hundred pixels: the board's edges, every card's
+        edges and a sparse grid over the board outside the cards.
+        """
+        height, width = image.shape[:2]
+        if (width, height) != tuple(self.frame_size):
+            return False
+        board_lower, board_upper = (np.array(r, np.uint8) for r in self.board_hsv)
+        if not board_still_at(image, self.board, board_lower, board_upper):
+            return False
+
+        card_lower, card_upper = (np.array(r, np.uint8) for r in self.card_hsv)
+        for card in self.cards:
+            box = BoundingBox(
+                x=self.board.x + card.box.x,
+                y=self.board.y + card.box.y,
+                width=card.box.width,
+                height=card.box.height,
+            )
+            points = edge_points(box, TRACK_EDGE_OFFSET, PROFILE_CARD_SAMPLES_PER_EDGE)
+            fraction = hsv_fraction(image, *points, card_lower, card_upper)
+            if fraction is None or fraction < PROFILE_MIN_CARD_FRACTION:
+                return False
+
+        ys, xs = self._board_grid()
+        if len(ys):
+            stray = hsv_fraction(image, ys, xs, card_lower, card_upper)
+            if stray is not None and stray > PROFILE_MAX_STRAY_CARD_FRACTION:
+                return False
+        return True
+
+    def _board_grid(self) -> tuple[np.ndarray, np.ndarray]:
+        """(ys, xs) of a grid over the board, minus points near any card."""
+        board = self.board
+        ys, xs = np.meshgrid(
+            np.linspace(board.y, board.y2 - 1, PROFILE_BOARD_GRID).astype(np.intp),
+            np.linspace(board.x, board.x2 - 1, PROFILE_BOARD_GRID).astype(np.intp),
+            indexing="ij",
+        )
+        ys, xs = ys.ravel(), xs.ravel()
+        keep = np.ones(len(ys), dtype=bool)
+        margin = TRACK_EDGE_OFFSET
+        for card in self.cards:
+            left = board.x + card.box.x - margin
+            top = board.y + card.box.y - margin
+            keep &= ~(
+                (xs >= left)
+                & (xs < left + card.box.width + 2 * margin)
+                & (ys >= top)
+                & (ys < top + card.box.height + 2 * margin)
+            )
+        return ys[keep], xs[keep]
+
+    def field_regions(
+        self,
+        index: int,
+        card_image: FrameLike,
+        layout: CardLayout = DEFAULT_CARD_LAYOUT,
+    ) -> CardFieldRegions | None:
+        """The field regions of card ``index``, if they still fit the card.
+
+        Finds the text lines of ``card_image`` and checks them against the
+        recorded fields: each field must hold exactly one line, a labelled
+        one (per ``layout``) still starting with its label, and no other
+        line may sit above the reward area. Lines in the reward area are
+        the reward lines. Returns None if no fields were recorded or the
+        lines don't fit, so the caller locates the fields itself.
+        """
+        card = self.cards[index]
+        if not card.fields:
+            return None
+        frame = as_frame(card_image)
+        lines = find_text_lines(frame)
+        rewards = card.rewards
+        extra_lines = (
+            [line for line in lines if _holds_line(rewards, line)]
+            if rewards is not None
+            else []
+        )
+        field_lines = [line for line in lines if line not in extra_lines]
+        for name, box in card.fields.items():
+            inside = [line for line in field_lines if _holds_line(box, line)]
+            if len(inside) != 1 or (
+                name in layout.labelled and not has_label(frame, inside[0])
+            ):
+                logger.info("Card %d's %s line has moved; locating fields", index, name)
+                return None
+            field_lines.remove(inside[0])
+        if field_lines:
+            logger.info("Card %d has lines outside its fields; locating fields", index)
+            return None
+        return CardFieldRegions(fields=dict(card.fields), extra_lines=extra_lines)
+
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict for JSON output."""
+        return {
+            "version": PROFILE_VERSION,
+            "frame_size": list(self.frame_size),
+            "board": _box_to_dict(self.board),
+            "board_hsv": [list(r) for r in self.board_hsv],
+            "card_hsv": [list(r) for r in self.card_hsv],
+            "cards": [card.to_dict() for card in self.cards],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LayoutProfile":
+        """Build a profile from ``to_dict`` output.
+
+        Raises ValueError for an unsupported format version.
+        """
+        version = data.get("version")
+        if version != PROFILE_VERSION:
+            raise ValueError(f"Unsupported layout profile version {version!r}")
+        width, height = data["frame_size"]
+        board_lower, board_upper = data["board_hsv"]
+        card_lower, card_upper = data["card_hsv"]
+        return cls(
+            frame_size=(int(width), int(height)),
+            board=_box_from_dict(data["board"]),
+            cards=[CardProfile.from_dict(card) for card in data["cards"]],
+            board_hsv=(list(board_lower), list(board_upper)),
+            card_hsv=(list(card_lower), list(card_upper)),
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the profile as JSON."""
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LayoutProfile":
+        """Read a profile written by ``save``.
+
+        Raises OSError if the file can't be read, ValueError (including
+        JSON errors) or KeyError if it isn't a valid profile.
+        """
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+
+def _holds_line(box: BoundingBox, line: BoundingBox) -> bool:
+    """Whether a text line's vertical center is within ``box``'s rows."""
+    return box.y <= line.y + line.height // 2 < box.y2
+
+
+def _profile_fields(
+    card_image: BGRImage, layout: CardLayout
+) -> tuple[dict[str, BoundingBox], BoundingBox | None]:
+    """Field regions of a card, widened for other values, and its reward area."""
+    regions = locate_card_fields(card_image, layout)
+    if regions is None:
+        return {}, None
+    height, width = card_image.shape[:2]
+    inset = max(2, round(min(height, width) * TEXT_LINE_INSET_FRACTION))
+    fields: dict[str, BoundingBox] = {}
+    for name, box in regions.fields.items():
+        pad = max(1, round(box.height * PROFILE_FIELD_PAD_FRACTION))
+        top = max(inset, box.y - pad)
+        bottom = min(height - inset, box.y2 + pad)
+        # Stop a field height short of the border: OCR crops add a margin
+        right = width - 2 * inset - (bottom - top)
+        fields[name] = BoundingBox(
+            x=box.x, y=top, width=max(box.width, right - box.x), height=bottom - top
+        )
+
+    last = max(fields.values(), key=lambda box: box.y2)
+    rewards = None
+    if height - inset - last.y2 >= MIN_TEXT_LINE_HEIGHT:
+        rewards = BoundingBox(
+            x=inset,
+            y=last.y2,
+            width=width - 2 * inset,
+            height=height - inset - last.y2,
+        )
+    return fields, rewards
+
+
+def calibrate(
+    image: BGRImage,
+    layout: CardLayout = DEFAULT_CARD_LAYOUT,
+    multiscale: bool = False,
+) -> LayoutProfile:
+    """Detect the board, its cards and their fields once, as a profile.
+
+    Calibrate on a screenshot showing a full board: cards missing from it
+    make later reads fail the profile check and fall back to detection.
+    Raises ValueError if no board or no cards are found.
+    """
+    board_box = detect_board(image, multiscale=multiscale)
+    if board_box is None:
+        raise ValueError("No admiralty board found to calibrate on")
+    board_image = crop_board(image, board_box)
+    card_boxes = find_assignment_cards(board_image)
+    if not card_boxes:
+        raise ValueError("No assignment cards found on the board")
+
+    cards = []
+    for box in card_boxes:
+        fields, rewards = _profile_fields(crop_region(board_image, box), layout)
+        if not fields:
+            logger.warning("Card at %s doesn't match the card layout", box)
+        cards.append(CardProfile(box=box, fields=fields, rewards=rewards))
+    height, width = image.shape[:2]
+    return LayoutProfile(frame_size=(width, height), board=board_box, cards=cards)
@@ -2,16 +2,25 @@
 
 Once the board region is located, this module identifies the sub-regions
 corresponding to individual assignment cards. Each card is a lighter
-rectangle within the dark board background.
+rectangle within the dark board background, and the cards sit on a
+regular grid: ``find_assignment_cards`` infers that grid from projection
+profiles of the card mask, and only traces card contours when the board
+doesn't fit one.
+
+Within a card, ``locate_card_fields`` finds the text lines and maps them
+onto a ``CardLayout``, so extraction can OCR each field on its own.
 """
 
 import logging
+from dataclasses import dataclass, field
 
 import cv2
 import numpy as np
 
 from zora.capture import BGRImage
 from zora.vision import BoundingBox
+from zora.vision.frame import FrameLike, as_frame
+from zora.vision.masks import color_masks
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +28,9 @@ logger = logging.getLogger(__name__)
 # In HSV, they have moderate-to-high value (brightness).
 CARD_BG_LOWER = np.array([0, 0, 80], dtype=np.uint8)
 CARD_BG_UPPER = np.array([180, 100, 200], dtype=np.uint8)
+# Card background plus its (brighter, unsaturated) text: everything on a
+# card, so content reaching the card's edge doesn't cut the card in two
+CARD_CONTENT_UPPER = np.array([180, 100, 255], dtype=np.uint8)
 
 # Minimum card dimensions as fraction of board dimensions
 MIN_CARD_WIDTH_FRACTION = 0.15
@@ -26,28 +38,167 @@ MIN_CARD_HEIGHT_FRACTION = 0.05
 # Morphological kernel size for noise cleanup in card detection
 CARD_MORPH_KERNEL_SIZE = (5, 5)
 
+# Grid inference: every nth row is sampled for the column profile and
+# every nth column for the row profile, so band edges stay pixel-exact
+GRID_SAMPLE_STEP = 8
+# A column (row) belongs to a card band when at least this fraction of the
+# minimum card height (width) of it is card
+GRID_BAND_FRACTION = 0.5
+# Allowed spread of band sizes and of the grid pitch around their medians,
+# as a fraction of the median
+GRID_PITCH_TOLERANCE = 0.1
+# A grid cell is a card when at least this fraction of it is card
+# background, and empty below GRID_EMPTY_CELL_FILL; in between the fit fails
+GRID_MIN_CELL_FILL = 0.5
+GRID_EMPTY_CELL_FILL = 0.1
+# Fraction of the card-coloured pixels allowed outside the grid's cards
+GRID_MAX_STRAY_FRACTION = 0.05
 
-def find_assignment_cards(
-    board_image: BGRImage,
+
+def _grid_bands(
+    profile: np.ndarray, threshold: float, min_size: int
+) -> list[tuple[int, int]] | None:
+    """[start, stop) card bands of a projection profile, or None if irregular.
+
+    Bands must be about the same size, and evenly spaced.
+    """
+    bands = [
+        (start, stop)
+        for start, stop in _runs(profile >= threshold)
+        if stop - start >= min_size
+    ]
+    if len(bands) < 2:
+        return bands
+    sizes = np.array([stop - start for start, stop in bands])
+    pitches = np.diff([start for start, _ in bands])
+    for values in (sizes, pitches):
+        median = float(np.median(values))
+        if np.abs(values - median).max() > max(2.0, median * GRID_PITCH_TOLERANCE):
+            return None
+    return bands
+
+
+def _sampled(start: int, stop: int, step: int) -> slice:
+    """The indices of [start, stop) within an array sampled every ``step``."""
+    return slice(-(-start // step), -(-stop // step))
+
+
+def find_cards_by_grid(
+    board_image: FrameLike,
     min_width_frac: float = MIN_CARD_WIDTH_FRACTION,
     min_height_frac: float = MIN_CARD_HEIGHT_FRACTION,
-) -> list[BoundingBox]:
-    """Find assignment card regions within the cropped board image.
+) -> list[BoundingBox] | None:
+    """Find the cards as cells of a regular grid, from projection profiles.
 
-    Returns bounding boxes for each detected card, sorted top-to-bottom
-    then left-to-right (reading order).
+    Cards sit on a regular grid, so the column and row sums of the card
+    mask are runs ("bands") of card columns and rows separated by the
+    gaps between cards. Each band of columns crossed with a band of rows
+    is a grid cell, kept as a card if it's mostly card background. The
+    mask counts card text as card, so content touching a card's border
+    neither splits the card nor joins it to a neighbour.
+
+    Returns None when the mask doesn't fit a grid: bands of different
+    sizes or spacing, a cell that is neither card nor empty, or too much
+    card colour outside the cards. Returns cards in reading order.
+
+    Only the sampled rows and columns are classified, by the context's
+    mask engine, unless a ``FrameContext`` already holds the board's HSV
+    plane.
     """
-    h, w = board_image.shape[:2]
+    frame = as_frame(board_image)
+    h, w = frame.shape[:2]
     min_width = int(w * min_width_frac)
     min_height = int(h * min_height_frac)
+    step = GRID_SAMPLE_STEP
+
+    # Full-resolution columns of every nth row, and rows of every nth column
+    # (an exact nearest-neighbour downscale picks those columns, and is much
+    # faster than copying a column-strided view)
+    converted = frame.computed("hsv")
+    source = frame.hsv if converted else frame.image
+    sampled_w = w // step
+    row_sample = source[::step]
+    column_sample = cv2.resize(
+        source[:, : sampled_w * step], (sampled_w, h), interpolation=cv2.INTER_NEAREST
+    )
+    content_range = (CARD_BG_LOWER, CARD_CONTENT_UPPER)
+    background_range = (CARD_BG_LOWER, CARD_BG_UPPER)
+    if converted:
+        content, background = (
+            cv2.inRange(row_sample, lower, upper)
+            for lower, upper in (content_range, background_range)
+        )
+        column_content = cv2.inRange(column_sample, *content_range)
+    else:
+        # Content and background masks of the rows in a single pass
+        content, background = color_masks(
+            row_sample, [content_range, background_range], frame.mask_engine
+        )
+        (column_content,) = color_masks(
+            column_sample, [content_range], frame.mask_engine
+        )
+
+    columns = _grid_bands(
+        content.sum(axis=0, dtype=np.int32) // 255,
+        GRID_BAND_FRACTION * min_height / step,
+        min_width,
+    )
+    rows = _grid_bands(
+        column_content.sum(axis=1, dtype=np.int32) // 255,
+        GRID_BAND_FRACTION * min_width / step,
+        min_height,
+    )
+    if columns is None or rows is None:
+        return None
+    if not columns or not rows:
+        # No card-sized run of card colour on either axis: no card either
+        return []
+
+    # Cell fills and stray colour are measured on every nth row and column
+    content = content[:, ::step]
+    background = background[:, ::step]
+    cards: list[BoundingBox] = []
+    in_cards = 0
+    for top, bottom in rows:
+        for left, right in columns:
+            cell = (_sampled(top, bottom, step), _sampled(left, right, step))
+            fill = np.count_nonzero(background[cell]) / max(1, background[cell].size)
+            if fill >= GRID_MIN_CELL_FILL:
+                cards.append(
+                    BoundingBox(x=left, y=top, width=right - left, height=bottom - top)
+                )
+                in_cards += np.count_nonzero(content[cell])
+            elif fill > GRID_EMPTY_CELL_FILL:
+                return None
+
+    total = np.count_nonzero(content)
+    if not cards or total - in_cards > total * GRID_MAX_STRAY_FRACTION:
+        return None
+    return cards
+
+
+def find_cards_by_contours(
+    board_image: FrameLike,
+    min_width_frac: float = MIN_CARD_WIDTH_FRACTION,
+    min_height_frac: float = MIN_CARD_HEIGHT_FRACTION,
+) -> list[BoundingBox]:
+    """Find the cards as external contours of the cleaned-up card mask.
 
-    hsv = cv2.cvtColor(board_image, cv2.COLOR_BGR2HSV)
-    mask = cv2.inRange(hsv, CARD_BG_LOWER, CARD_BG_UPPER)
+    Works for any arrangement of cards, but a card whose content touches
+    its border can come out split or merged with a neighbour. Returns
+    cards in reading order.
+    """
+    frame = as_frame(board_image)
+    h, w = frame.shape[:2]
+    min_width = int(w * min_width_frac)
+    min_height = int(h * min_height_frac)
 
-    # Clean up the mask
+    # Clean up the mask (the frame's stays as it is, for other stages)
     kernel = cv2.getStructuringElement(cv2.MORPH_RECT, CARD_MORPH_KERNEL_SIZE)
-    mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
-    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
+    mask = cv2.morphologyEx(
+        frame.mask(CARD_BG_LOWER, CARD_BG_UPPER), cv2.MORPH_CLOSE, kernel
+    )
+    cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel, dst=mask)
 
     contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
@@ -59,6 +210,26 @@ def find_assignment_cards(
 
     # Sort by y first (top to bottom), then x (left to right)
     cards.sort(key=lambda b: (b.y, b.x))
+    return cards
+
+
+def find_assignment_cards(
+    board_image: FrameLike,
+    min_width_frac: float = MIN_CARD_WIDTH_FRACTION,
+    min_height_frac: float = MIN_CARD_HEIGHT_FRACTION,
+) -> list[BoundingBox]:
+    """Find assignment card regions within the cropped board image.
+
+    Infers the card grid (``find_cards_by_grid``), falling back to card
+    contours (``find_cards_by_contours``) when the board doesn't fit one.
+    Returns bounding boxes for each detected card, sorted top-to-bottom
+    then left-to-right (reading order).
+    """
+    frame = as_frame(board_image)
+    cards = find_cards_by_grid(frame, min_width_frac, min_height_frac)
+    if cards is None:
+        logger.debug("Cards don't fit a grid, finding them by contours")
+        cards = find_cards_by_contours(frame, min_width_frac, min_height_frac)
 
     logger.debug("Found %d assignment card regions", len(cards))
     return cards
@@ -67,3 +238,181 @@ def find_assignment_cards(
 def crop_region(image: BGRImage, box: BoundingBox) -> BGRImage:
     """Crop a sub-region from an image using a bounding box."""
     return image[box.y : box.y2, box.x : box.x2]
+
+
+# Inset from the card edge excluded from text line search, as a fraction
+# of the card's smaller side (keeps the card border out of the profile)
+TEXT_LINE_INSET_FRACTION = 0.02
+# Minimum text line height in pixels; shorter runs of ink are noise
+MIN_TEXT_LINE_HEIGHT = 4
+# Horizontal gap separating a label from its value, as a fraction of the
+# line height (gaps between letters of one word are much narrower)
+LABEL_GAP_FRACTION = 0.25
+# A label ends in a colon: a glyph of two stacked dots, the glyph and each
+# dot at most this fraction of the line height wide and tall
+LABEL_COLON_FRACTION = 0.4
+
+
+@dataclass(frozen=True)
+class CardLayout:
+    """The text lines of an assignment card, top to bottom.
+
+    ``lines`` names the field on each line. Lines in ``labelled`` start
+    with a label ("Eng:", "Duration:"), and only the value after the label
+    is that field's region. Lines below the last named one are extras
+    (e.g. event rewards).
+    """
+
+    lines: tuple[str, ...] = (
+        "name",
+        "engineering",
+        "science",
+        "tactical",
+        "ship_slots",
+        "duration",
+        "rarity",
+    )
+    labelled: frozenset[str] = frozenset(
+        {"engineering", "science", "tactical", "ship_slots", "duration"}
+    )
+
+
+DEFAULT_CARD_LAYOUT = CardLayout()
+
+
+@dataclass
+class CardFieldRegions:
+    """Where each field of one card is, in card-image coordinates."""
+
+    fields: dict[str, BoundingBox]
+    extra_lines: list[BoundingBox] = field(default_factory=list)
+
+
+def _runs(mask: np.ndarray) -> list[tuple[int, int]]:
+    """Return [start, stop) index pairs of the True runs in a 1-D mask."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return list(
+        zip(np.flatnonzero(edges == 1).tolist(), np.flatnonzero(edges == -1).tolist())
+    )
+
+
+def _text_mask(gray: np.ndarray) -> np.ndarray:
+    """Binarize with OTSU, with text (the minority class) as foreground."""
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if np.count_nonzero(binary) * 2 > binary.size:
+        binary = cv2.bitwise_not(binary)
+    return binary
+
+
+def find_text_lines(card_image: FrameLike) -> list[BoundingBox]:
+    """Find the text lines of a card, top to bottom.
+
+    Uses the row profile of the binarized card: each run of rows holding
+    text ink is one line, boxed to the columns its ink spans.
+    """
+    frame = as_frame(card_image)
+    h, w = frame.shape[:2]
+    inset = max(2, round(min(h, w) * TEXT_LINE_INSET_FRACTION))
+    if h <= 2 * inset or w <= 2 * inset:
+        return []
+    gray = frame.gray[inset : h - inset, inset : w - inset]
+    ink = _text_mask(gray) > 0
+
+    lines: list[BoundingBox] = []
+    for top, bottom in _runs(ink.any(axis=1)):
+        if bottom - top < MIN_TEXT_LINE_HEIGHT:
+            continue
+        columns = np.flatnonzero(ink[top:bottom].any(axis=0))
+        lines.append(
+            BoundingBox(
+                x=inset + int(columns[0]),
+                y=inset + top,
+                width=int(columns[-1] - columns[0]) + 1,
+                height=bottom - top,
+            )
+        )
+    return lines
+
+
+def find_line_value(card_image: FrameLike, line: BoundingBox) -> BoundingBox | None:
+    """Return the part of a "Label: value" line after the label.
+
+    Splits the line at the first gap wider than ``LABEL_GAP_FRACTION`` of
+    the line height. The returned box starts halfway into that gap, so it
+    carries some background margin but none of the label. Returns None if
+    the line has no such gap.
+    """
+    split = _split_label(as_frame(card_image).gray, line)
+    return split[0] if split is not None else None
+
+
+def has_label(card_image: FrameLike, line: BoundingBox) -> bool:
+    """Whether a line starts with a label ("Eng:") followed by a value."""
+    split = _split_label(as_frame(card_image).gray, line)
+    return split is not None and split[1]
+
+
+def _is_colon(ink: np.ndarray) -> bool:
+    """Whether one glyph's ink (its line's rows, its columns) is a colon."""
+    limit = max(2, ink.shape[0] * LABEL_COLON_FRACTION)
+    dots = _runs(ink.any(axis=1))
+    return (
+        ink.shape[1] <= limit
+        and len(dots) == 2
+        and all(bottom - top <= limit for top, bottom in dots)
+    )
+
+
+def _split_label(
+    gray: np.ndarray, line: BoundingBox
+) -> tuple[BoundingBox, bool] | None:
+    """Split a line as ``find_line_value`` does.
+
+    Returns the value box and whether the glyph before the gap is a colon
+    (so the part before it is a label), or None if the line has no gap.
+    """
+    ink = _text_mask(crop_region(gray, line)) > 0
+    glyphs = _runs(ink.any(axis=0))
+    min_gap = max(2, line.height * LABEL_GAP_FRACTION)
+    for (glyph_start, label_end), (value_start, _) in zip(glyphs, glyphs[1:]):
+        if value_start - label_end > min_gap:
+            x = line.x + (label_end + value_start) // 2
+            value = BoundingBox(x=x, y=line.y, width=line.x2 - x, height=line.height)
+            return value, _is_colon(ink[:, glyph_start:label_end])
+    return None
+
+
+def locate_card_fields(
+    card_image: FrameLike, layout: CardLayout = DEFAULT_CARD_LAYOUT
+) -> CardFieldRegions | None:
+    """Map each field in ``layout`` to its region on the card.
+
+    Lines are matched to fields by their labels as well as their order:
+    a labelled field's line must start with a word ending in a colon
+    ("Eng:") and then a value, and an unlabelled field's line must not.
+    Returns None when the card doesn't match the layout (too few text
+    lines, or a label where the layout has none or none where it has one,
+    as when a long title wraps onto a second line), so callers can fall
+    back to reading the whole card. The card is converted to grayscale
+    once for all of its lines.
+    """
+    card = as_frame(card_image)
+    lines = find_text_lines(card)
+    if len(lines) < len(layout.lines):
+        logger.debug(
+            "Card has %d text lines, layout expects %d", len(lines), len(layout.lines)
+        )
+        return None
+
+    gray = card.gray
+    fields: dict[str, BoundingBox] = {}
+    for name, line in zip(layout.lines, lines):
+        split = _split_label(gray, line)
+        value = split[0] if split is not None and split[1] else None
+        if (value is not None) != (name in layout.labelled):
+            logger.debug(
+                "The %s line %s a label", name, "lacks" if value is None else "has"
+            )
+            return None
+        fields[name] = value or line
+    return CardFieldRegions(fields=fields, extra_lines=lines[len(layout.lines) :])
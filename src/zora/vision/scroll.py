@@ -0,0 +1,256 @@
+"""Scroll registration — place the cards of a scrolled board list once each.
+
+The admiralty list scrolls, so one screenshot shows only part of it.
+Reading a list from screenshots taken while scrolling means working out
+how far the list moved between consecutive frames, so that a card seen
+in several frames is read only once.
+
+``register_scroll`` finds that distance from row hashes: each row of the
+board crop is hashed (in coarsely quantized grayscale, so slight colour
+differences between captures mostly leave it unchanged), rows of the new
+frame vote for the shift that lines them up with equal rows of the
+previous frame, and the winning shift must then match most of the
+overlapping rows. Rows that repeat all over
+the board (plain background, card fill) don't vote. Screenshots that
+went through lossy compression, or captures with dithering, can leave
+too few rows equal; those frames are registered by phase correlation of
+narrow row profiles instead (the rows averaged into a few columns), and
+the shift is accepted when the overlapping profiles agree.
+
+``CardStitcher`` keeps each frame's offset within the whole list and the
+list positions of the cards already seen, and tells the caller which of
+a frame's cards are new. Cards cut off by the top or bottom of the view
+are left for a frame that shows them whole.
+"""
+
+import logging
+import math
+from collections import Counter
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
+from zora.vision import BoundingBox
+from zora.vision.frame import FrameContext, FrameLike, as_frame
+
+logger = logging.getLogger(__name__)
+
+# Low bits dropped from each grayscale pixel before hashing its row
+SCROLL_QUANT_SHIFT = 3
+# Rows whose hash appears more often than this in a frame don't vote
+SCROLL_MAX_ROW_REPEATS = 4
+# Candidate shifts (by votes) checked against the overlapping rows
+SCROLL_CANDIDATES = 3
+# Fewest overlapping rows, and fraction of them that must be equal, for
+# a shift to count as the frames' registration
+SCROLL_MIN_OVERLAP_ROWS = 16
+SCROLL_MIN_MATCH_FRACTION = 0.9
+# Columns each row is averaged into for phase correlation
+SCROLL_PROFILE_COLUMNS = 64
+# Largest mean absolute difference (gray levels) between the overlapping
+# profiles for a phase-correlation shift to count
+SCROLL_MAX_PROFILE_DIFF = 4.0
+# Cards closer than this (px) to the top or bottom of the view are cut off
+SCROLL_EDGE_MARGIN = 2
+# Cards whose list positions differ by at most this (px) are the same card
+SCROLL_POSITION_TOLERANCE = 4
+
+
+def row_hashes(image: FrameLike) -> NDArray[np.int64]:
+    """One hash per row of ``image``, from its quantized grayscale."""
+    quantized = as_frame(image).gray >> SCROLL_QUANT_SHIFT
+    return np.array([hash(row.tobytes()) for row in quantized], dtype=np.int64)
+
+
+def row_profiles(image: FrameLike) -> NDArray[np.float32]:
+    """``image``'s grayscale, each row averaged into a few columns."""
+    gray = as_frame(image).gray
+    size = (SCROLL_PROFILE_COLUMNS, gray.shape[0])
+    return cv2.resize(gray, size, interpolation=cv2.INTER_AREA).astype(np.float32)
+
+
+def register_scroll(previous: FrameLike, current: FrameLike) -> int | None:
+    """How many rows the content moved up from ``previous`` to ``current``.
+
+    Row ``y`` of ``current`` shows row ``y + shift`` of ``previous``; the
+    shift is negative when the list scrolled up. Returns None when the
+    frames don't overlap or differ in width.
+
+    A list that repeats itself exactly fits at several shifts; the one
+    with the largest overlap wins, so scroll by less than half the repeat.
+    """
+    previous, current = as_frame(previous), as_frame(current)
+    return _register(previous, current, row_hashes(previous), row_hashes(current))
+
+
+def _register(
+    previous: FrameContext,
+    current: FrameContext,
+    previous_hashes: NDArray[np.int64],
+    current_hashes: NDArray[np.int64],
+) -> int | None:
+    if previous.shape[1] != current.shape[1]:
+        return None
+    shift = _register_rows(previous_hashes, current_hashes)
+    if shift is None:
+        shift = _register_profiles(row_profiles(previous), row_profiles(current))
+    return shift
+
+
+def _overlap(previous_rows: int, current_rows: int, shift: int) -> tuple[int, int]:
+    """Rows ``top:bottom`` of the current frame that the previous one shows."""
+    return max(0, -shift), min(current_rows, previous_rows - shift)
+
+
+def _register_rows(
+    previous: NDArray[np.int64], current: NDArray[np.int64]
+) -> int | None:
+    counts = Counter(previous.tolist())
+    rows_of: dict[int, list[int]] = {}
+    for y, value in enumerate(previous.tolist()):
+        if counts[value] <= SCROLL_MAX_ROW_REPEATS:
+            rows_of.setdefault(value, []).append(y)
+    votes: Counter[int] = Counter()
+    for y, value in enumerate(current.tolist()):
+        for row in rows_of.get(value, ()):
+            votes[row - y] += 1
+
+    # Most votes first; among equals (a periodic list), the smallest move
+    candidates = sorted(votes.items(), key=lambda item: (-item[1], abs(item[0])))
+    for shift, _ in candidates[:SCROLL_CANDIDATES]:
+        top, bottom = _overlap(len(previous), len(current), shift)
+        overlap = bottom - top
+        if overlap < SCROLL_MIN_OVERLAP_ROWS:
+            continue
+        equal = np.count_nonzero(
+            previous[top + shift : bottom + shift] == current[top:bottom]
+        )
+        if equal >= SCROLL_MIN_MATCH_FRACTION * overlap:
+            return shift
+    return None
+
+
+def _register_profiles(
+    previous: NDArray[np.float32], current: NDArray[np.float32]
+) -> int | None:
+    if previous.shape != current.shape:
+        return None
+    window = cv2.createHanningWindow(previous.shape[::-1], cv2.CV_32F)
+    (_, dy), _ = cv2.phaseCorrelate(previous, current, window)
+    best: tuple[float, int] | None = None
+    # The peak is subpixel; try the whole shifts either side of it
+    for shift in {math.floor(-dy), math.ceil(-dy)}:
+        top, bottom = _overlap(len(previous), len(current), shift)
+        if bottom - top < SCROLL_MIN_OVERLAP_ROWS:
+            continue
+        difference = previous[top + shift : bottom + shift] - current[top:bottom]
+        diff = float(np.abs(difference).mean())
+        if best is None or diff < best[0]:
+            best = (diff, shift)
+    if best is None or best[0] > SCROLL_MAX_PROFILE_DIFF:
+        return None
+    return best[1]
+
+
+@dataclass(frozen=True)
+class PlacedCard:
+    """A card of the current frame that hasn't been seen before.
+
+    ``index`` is its position in the frame's card list; ``x`` and ``y``
+    are its top-left corner in the whole list.
+    """
+
+    index: int
+    x: int
+    y: int
+
+
+@dataclass
+class ScrollStats:
+    """Cards seen across scrolled frames, and how many were new."""
+
+    frames: int = 0
+    cards: int = 0
+    new: int = 0
+    repeated: int = 0
+    cut_off: int = 0
+    unregistered: int = 0
+
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict for JSON output."""
+        return {
+            "frames": self.frames,
+            "cards": self.cards,
+            "new": self.new,
+            "repeated": self.repeated,
+            "cut_off": self.cut_off,
+            "unregistered": self.unregistered,
+        }
+
+
+class CardStitcher:
+    """Track a scrolling board's frames and pick out the cards not seen yet.
+
+    Usage (``read_scrolling_board`` does this)::
+
+        stitcher = CardStitcher()
+        for board, card_boxes in frames:
+            for card in stitcher.add(board, card_boxes):
+                ...  # extract card_boxes[card.index]; it sits at (card.x, card.y)
+
+    A frame that can't be registered against the previous one (no
+    overlap) is placed just below it, and ``add`` sets ``registered``
+    to False for it; cards it shares with the previous frame are then
+    reported again.
+    """
+
+    def __init__(self) -> None:
+        self.stats = ScrollStats()
+        self.offset = 0
+        self.registered = True
+        self._last: FrameContext | None = None
+        self._last_hashes: NDArray[np.int64] | None = None
+        self._seen: list[tuple[int, int]] = []
+
+    def add(self, board: FrameLike, card_boxes: list[BoundingBox]) -> list[PlacedCard]:
+        """Place the next frame's board crop; return its whole, unseen cards."""
+        board = as_frame(board)
+        hashes = row_hashes(board)
+        self.registered = True
+        if self._last is not None and self._last_hashes is not None:
+            shift = _register(self._last, board, self._last_hashes, hashes)
+            if shift is None:
+                logger.warning("Frame %d doesn't overlap the last", self.stats.frames)
+                self.registered = False
+                self.stats.unregistered += 1
+                shift = self._last.shape[0]
+            self.offset += shift
+            logger.debug("Frame %d at list offset %d", self.stats.frames, self.offset)
+        self._last, self._last_hashes = board, hashes
+        self.stats.frames += 1
+
+        height = board.shape[0]
+        placed: list[PlacedCard] = []
+        for index, box in enumerate(card_boxes):
+            self.stats.cards += 1
+            if box.y < SCROLL_EDGE_MARGIN or box.y2 > height - SCROLL_EDGE_MARGIN:
+                self.stats.cut_off += 1
+                continue
+            x, y = box.x, box.y + self.offset
+            if any(
+                abs(x - seen_x) <= SCROLL_POSITION_TOLERANCE
+                and abs(y - seen_y) <= SCROLL_POSITION_TOLERANCE
+                for seen_x, seen_y in self._seen
+            ):
+                self.stats.repeated += 1
+                continue
+            self._seen.append((x, y))
+            self.stats.new += 1
+            placed.append(PlacedCard(index=index, x=x, y=y))
+        return placed
+
+    def reset(self) -> None:
+        """Forget all frames, to stitch another list."""
+        self.__init__()  # type: ignore[misc]
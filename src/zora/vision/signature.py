@@ -0,0 +1,60 @@
+"""Cheap image signatures for change detection between frames.
+
+A signature is a hash of a tiny, coarsely quantized thumbnail. Two frames
+with the same signature are treated as showing the same content, which
+lets polling loops skip detection and OCR entirely for unchanged frames.
+The area-averaged downscale plus quantization absorbs capture noise while
+still catching real UI changes like a card appearing or disappearing.
+
+Card signatures apply the same idea to one assignment card at a finer
+scale, so a frame that did change only re-reads the cards that changed.
+"""
+
+import hashlib
+
+import cv2
+
+from zora.capture import BGRImage
+
+# Thumbnail size (width, height) used for signatures
+SIGNATURE_SIZE = (64, 36)
+# Bits dropped from each thumbnail channel before hashing
+SIGNATURE_QUANT_SHIFT = 2
+# Downscale factor of card signatures (card_signature): small enough that
+# the strokes of one changed digit survive area averaging
+CARD_SIGNATURE_SCALE = 2
+
+
+def image_signature(
+    image: BGRImage,
+    size: tuple[int, int] = SIGNATURE_SIZE,
+    quant_shift: int = SIGNATURE_QUANT_SHIFT,
+) -> bytes:
+    """Return a short digest summarizing the visible content of an image.
+
+    The image is area-averaged down to ``size``, each channel is quantized
+    by dropping ``quant_shift`` low bits, and the result is hashed together
+    with the original shape (so a resized window never collides).
+    """
+    thumb = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    thumb >>= quant_shift
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(image.shape).encode())
+    digest.update(thumb.tobytes())
+    return digest.digest()
+
+
+def card_signature(
+    card: BGRImage,
+    scale: int = CARD_SIGNATURE_SCALE,
+    quant_shift: int = SIGNATURE_QUANT_SHIFT,
+) -> bytes:
+    """Return a digest of one card crop, detailed enough to see text change.
+
+    Rather than a fixed-size thumbnail, the card is only downscaled by
+    ``scale``, so a ticking timer or a changed stat on any card size gives
+    a new signature.
+    """
+    height, width = card.shape[:2]
+    size = (max(1, width // scale), max(1, height // scale))
+    return image_signature(card, size, quant_shift)
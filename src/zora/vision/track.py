@@ -0,0 +1,255 @@
+"""Board tracking — reuse the last board location while it stays valid.
+
+The admiralty board almost never moves between frames, yet a full
+``detect_board`` converts the whole screenshot to HSV and runs two large
+morphology passes. ``BoardTracker`` remembers the last bounding box and
+verifies it on the next frame by sampling a few hundred pixels just inside
+and just outside its edges. Only when that check fails does it fall back
+to a full detection.
+
+Cards get the same treatment one level down: in a polling loop usually
+only a card or two changes at a time (a timer ticks, an assignment is
+taken). ``CardTracker`` remembers each card crop's ``card_signature``
+with the assignment read from it, so the pipeline re-extracts only the
+cards whose crop changed and reuses the other ``Assignment`` objects.
+Cards are matched by content rather than position, so cards that merely
+shift (when one before them disappears) are reused too.
+"""
+
+import logging
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from zora.capture import BGRImage
+from zora.models.assignment import Assignment
+from zora.vision import BoundingBox
+from zora.vision.detect import BOARD_BG_LOWER, BOARD_BG_UPPER, detect_board
+from zora.vision.frame import FrameLike, as_frame
+from zora.vision.signature import card_signature
+
+logger = logging.getLogger(__name__)
+
+# Distance in pixels from each board edge at which pixels are sampled
+TRACK_EDGE_OFFSET = 4
+# Pixels sampled along each edge of the board, inside and outside
+TRACK_SAMPLES_PER_EDGE = 32
+# Fraction of inside samples that must match the board background
+TRACK_MIN_INSIDE_FRACTION = 0.9
+# Fraction of outside samples allowed to match the board background;
+# more than this means the board has grown or moved
+TRACK_MAX_OUTSIDE_FRACTION = 0.5
+
+
+def edge_points(
+    box: BoundingBox, offset: int, samples: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return (ys, xs) of points along the four edges, shifted by ``offset``.
+
+    Positive offsets move the points into the box, negative ones out of it.
+    """
+    xs = np.linspace(box.x + offset, box.x2 - 1 - offset, samples).astype(np.intp)
+    ys = np.linspace(box.y + offset, box.y2 - 1 - offset, samples).astype(np.intp)
+    top = np.full(samples, box.y + offset, dtype=np.intp)
+    bottom = np.full(samples, box.y2 - 1 - offset, dtype=np.intp)
+    left = np.full(samples, box.x + offset, dtype=np.intp)
+    right = np.full(samples, box.x2 - 1 - offset, dtype=np.intp)
+    return (
+        np.concatenate([top, bottom, ys, ys]),
+        np.concatenate([xs, xs, left, right]),
+    )
+
+
+def hsv_fraction(
+    image: BGRImage,
+    ys: np.ndarray,
+    xs: np.ndarray,
+    lower: np.ndarray = BOARD_BG_LOWER,
+    upper: np.ndarray = BOARD_BG_UPPER,
+) -> float | None:
+    """Fraction of in-bounds sample points within an HSV colour range.
+
+    The range defaults to the board background. Returns None if every
+    point falls outside the image.
+    """
+    h, w = image.shape[:2]
+    keep = (ys >= 0) & (ys < h) & (xs >= 0) & (xs < w)
+    if not keep.any():
+        return None
+    pixels = image[ys[keep], xs[keep]].reshape(-1, 1, 3)
+    hsv = cv2.cvtColor(pixels, cv2.COLOR_BGR2HSV)
+    mask = cv2.inRange(hsv, lower, upper)
+    return float(np.count_nonzero(mask)) / mask.size
+
+
+def board_still_at(
+    image: BGRImage,
+    box: BoundingBox,
+    lower: np.ndarray = BOARD_BG_LOWER,
+    upper: np.ndarray = BOARD_BG_UPPER,
+) -> bool:
+    """Cheaply check whether the board still occupies ``box`` in ``image``.
+
+    Samples pixels a few pixels inside each edge (which must be board
+    background, by default the ``detect_board`` HSV range) and a few pixels
+    outside (which must mostly not be).
+    """
+    offset = TRACK_EDGE_OFFSET
+    if box.width <= 2 * offset or box.height <= 2 * offset:
+        return False
+    h, w = image.shape[:2]
+    if box.x2 > w or box.y2 > h:
+        return False
+
+    samples = TRACK_SAMPLES_PER_EDGE
+    inside = hsv_fraction(image, *edge_points(box, offset, samples), lower, upper)
+    if inside is None or inside < TRACK_MIN_INSIDE_FRACTION:
+        return False
+
+    outside = hsv_fraction(image, *edge_points(box, -offset, samples), lower, upper)
+    # A board filling the whole frame has no outside samples to check
+    return outside is None or outside <= TRACK_MAX_OUTSIDE_FRACTION
+
+
+@dataclass
+class TrackerStats:
+    """How often the tracker could skip full board detection."""
+
+    fast_hits: int = 0
+    full_scans: int = 0
+
+    @property
+    def fast_path_rate(self) -> float:
+        total = self.fast_hits + self.full_scans
+        return self.fast_hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict for JSON output."""
+        return {
+            "fast_hits": self.fast_hits,
+            "full_scans": self.full_scans,
+            "fast_path_rate": round(self.fast_path_rate, 4),
+        }
+
+
+class BoardTracker:
+    """Locate the board, re-detecting only when the last location fails.
+
+    Usage::
+
+        tracker = BoardTracker()
+        for image in frames:
+            box = tracker.locate(image)
+        print(tracker.stats.fast_path_rate)
+    """
+
+    def __init__(self, multiscale: bool = False) -> None:
+        """``multiscale`` selects coarse-to-fine detection for full scans."""
+        self.multiscale = multiscale
+        self.box: BoundingBox | None = None
+        self.stats = TrackerStats()
+        self._shape: tuple[int, ...] | None = None
+
+    def locate(self, image: FrameLike) -> BoundingBox | None:
+        """Return the board's bounding box in ``image`` (None if not found).
+
+        ``image`` may be a ``FrameContext``, which a full scan then uses.
+        """
+        frame = as_frame(image)
+        if (
+            self.box is not None
+            and frame.shape == self._shape
+            and board_still_at(frame.image, self.box)
+        ):
+            self.stats.fast_hits += 1
+            return self.box
+
+        self.stats.full_scans += 1
+        self.box = detect_board(frame, multiscale=self.multiscale)
+        self._shape = frame.shape
+        if self.box is not None:
+            logger.debug("Tracker re-detected board at %s", self.box)
+        return self.box
+
+    def reset(self) -> None:
+        """Forget the last location so the next frame runs full detection."""
+        self.box = None
+        self._shape = None
+
+
+@dataclass
+class CardTrackerStats:
+    """How many cards were reused instead of re-extracted."""
+
+    frames: int = 0
+    cards: int = 0
+    skipped: int = 0
+    last_skipped: int = 0
+
+    @property
+    def skip_rate(self) -> float:
+        return self.skipped / self.cards if self.cards else 0.0
+
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict for JSON output."""
+        return {
+            "frames": self.frames,
+            "cards": self.cards,
+            "skipped": self.skipped,
+            "last_skipped": self.last_skipped,
+            "skip_rate": round(self.skip_rate, 4),
+        }
+
+
+class CardTracker:
+    """Reuse the assignments of cards that look the same as last frame.
+
+    Usage (``read_board_from_image(card_tracker=...)`` does this)::
+
+        signatures, reused = tracker.match(card_images)
+        # ...extract the cards whose entry in ``reused`` is None...
+        tracker.update(signatures, assignments)
+
+    ``stats.last_skipped`` is the number of cards reused on the most
+    recent frame.
+    """
+
+    def __init__(self) -> None:
+        self.stats = CardTrackerStats()
+        self._assignments: dict[bytes, Assignment] = {}
+
+    def match(
+        self, card_images: list[BGRImage]
+    ) -> tuple[list[bytes], list[Assignment | None]]:
+        """Return each card's signature and its reusable assignment, if any.
+
+        An assignment is reusable when a card with the same signature was
+        read successfully on the previous frame; otherwise it is None.
+        """
+        signatures = [card_signature(card) for card in card_images]
+        reused = [self._assignments.get(signature) for signature in signatures]
+        skipped = sum(assignment is not None for assignment in reused)
+        self.stats.frames += 1
+        self.stats.cards += len(card_images)
+        self.stats.skipped += skipped
+        self.stats.last_skipped = skipped
+        return signatures, reused
+
+    def update(
+        self, signatures: list[bytes], assignments: list[Assignment | None]
+    ) -> None:
+        """Remember this frame's cards, forgetting the previous frame's.
+
+        Cards that failed extraction (None) are not remembered, so they
+        are retried next frame.
+        """
+        self._assignments = {
+            signature: assignment
+            for signature, assignment in zip(signatures, assignments)
+            if assignment is not None
+        }
+
+    def reset(self) -> None:
+        """Forget all cards so the next frame re-extracts every card."""
+        self._assignments = {}
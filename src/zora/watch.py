@@ -0,0 +1,177 @@
+"""Continuous board watching with frame-change gating.
+
+Polls a CaptureSource at a fixed interval and only runs the (expensive)
+detection + OCR pipeline when the captured frame actually changed. Most
+frames in a polling loop are identical, so the common case costs one
+capture and one thumbnail hash. When a frame did change, a CardTracker
+limits OCR to the cards whose crops changed. A failed capture (the game
+window minimised, unmapped or restarting) is logged and skipped, and
+polling carries on until the source recovers.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
+from zora.capture import CaptureSource
+from zora.defaults import DEFAULT_WATCH_INTERVAL
+from zora.models.board import BoardState
+from zora.pipeline import read_board_from_image
+from zora.vision.cache import OcrCache
+from zora.vision.glyphs import GlyphBank
+from zora.vision.ocr import OcrEngine
+from zora.vision.profile import LayoutProfile
+from zora.vision.signature import image_signature
+from zora.vision.track import BoardTracker, CardTracker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WatchStats:
+    """Counters describing how much work a watch loop did.
+
+    ``frames`` counts capture attempts, including the ``capture_errors``
+    that produced no frame.
+    """
+
+    frames: int = 0
+    capture_errors: int = 0
+    unchanged: int = 0
+    reads: int = 0
+    emitted: int = 0
+
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict for JSON output."""
+        return {
+            "frames": self.frames,
+            "capture_errors": self.capture_errors,
+            "unchanged": self.unchanged,
+            "reads": self.reads,
+            "emitted": self.emitted,
+        }
+
+
+def _board_content(output: dict) -> dict:
+    """Board output without OCR confidences, which shift with capture noise."""
+    return {
+        **output,
+        "assignments": [
+            {key: value for key, value in assignment.items() if key != "confidence"}
+            for assignment in output["assignments"]
+        ],
+    }
+
+
+class BoardWatcher:
+    """Repeatedly capture the board and yield it whenever it changes.
+
+    Usage::
+
+        watcher = BoardWatcher(ScreenshotCapture(), interval=2.0)
+        for board in watcher.watch():
+            print(board.to_dict())
+    """
+
+    def __init__(
+        self,
+        source: CaptureSource,
+        interval: float = DEFAULT_WATCH_INTERVAL,
+        executor: Executor | None = None,
+        cache: OcrCache | None = None,
+        tracker: BoardTracker | None = None,
+        glyphs: GlyphBank | None = None,
+        tiled: bool = False,
+        engine: OcrEngine | str | None = None,
+        card_tracker: CardTracker | None = None,
+        profile: LayoutProfile | None = None,
+        mask_engine: str = "hsv",
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.source = source
+        self.interval = interval
+        self.executor = executor
+        self.cache = cache
+        self.tracker = tracker if tracker is not None else BoardTracker()
+        self.glyphs = glyphs
+        self.tiled = tiled
+        self.engine = engine
+        self.card_tracker = card_tracker if card_tracker is not None else CardTracker()
+        self.profile = profile
+        self.mask_engine = mask_engine
+        self.stats = WatchStats()
+        self._sleep = sleep
+        self._clock = clock
+        self._last_signature: bytes | None = None
+        self._last_content: dict | None = None
+        self._capture_failing = False
+
+    def poll(self) -> BoardState | None:
+        """Capture one frame; return a BoardState only if the board changed.
+
+        Returns None when the capture fails (logged, so the caller can keep
+        polling), when the frame is pixel-equivalent to the previous one
+        (no pipeline run) or when the re-read board serializes identically,
+        OCR confidences aside.
+        """
+        self.stats.frames += 1
+        try:
+            image = self.source()
+        except Exception as exc:
+            self.stats.capture_errors += 1
+            # Warn once per outage; a minimised window fails every poll
+            log = logger.debug if self._capture_failing else logger.warning
+            log("Capture failed: %s", exc)
+            self._capture_failing = True
+            return None
+        if self._capture_failing:
+            logger.info("Capture recovered")
+            self._capture_failing = False
+
+        signature = image_signature(image)
+        if signature == self._last_signature:
+            self.stats.unchanged += 1
+            return None
+        self._last_signature = signature
+
+        board = read_board_from_image(
+            image,
+            executor=self.executor,
+            cache=self.cache,
+            tracker=self.tracker,
+            glyphs=self.glyphs,
+            tiled=self.tiled,
+            engine=self.engine,
+            card_tracker=self.card_tracker,
+            profile=self.profile,
+            mask_engine=self.mask_engine,
+        )
+        self.stats.reads += 1
+
+        content = _board_content(board.to_dict())
+        if content == self._last_content:
+            logger.debug("Frame changed but board content did not")
+            return None
+        self._last_content = content
+        self.stats.emitted += 1
+        return board
+
+    def watch(self, max_frames: int | None = None) -> Iterator[BoardState]:
+        """Poll every ``interval`` seconds, yielding each new board state.
+
+        Runs until ``max_frames`` captures have been taken, or forever if
+        it is None.
+        """
+        while max_frames is None or self.stats.frames < max_frames:
+            started = self._clock()
+            board = self.poll()
+            if board is not None:
+                yield board
+            if max_frames is not None and self.stats.frames >= max_frames:
+                break
+            remaining = self.interval - (self._clock() - started)
+            if remaining > 0:
+                self._sleep(remaining)
@@ -0,0 +1,131 @@
+"""Tests for parallel batch processing (zora.batch module)."""
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from zora.batch import BatchStats, collect_image_paths, read_image_file, run_batch
+from zora.capture import BGRImage
+from zora.vision.profile import calibrate
+
+
+@pytest.fixture
+def screenshot_dir(tmp_path: Path, synthetic_board: BGRImage) -> Path:
+    """A directory with a few screenshots plus a non-image file."""
+    for i in range(4):
+        cv2.imwrite(str(tmp_path / f"shot_{i}.png"), synthetic_board)
+    (tmp_path / "notes.txt").write_text("not an image")
+    return tmp_path
+
+
+class TestCollectImagePaths:
+    def test_directory_lists_images_sorted(self, screenshot_dir: Path) -> None:
+        paths = collect_image_paths(screenshot_dir)
+        assert [p.name for p in paths] == [f"shot_{i}.png" for i in range(4)]
+
+    def test_directory_includes_npy_frames(self, tmp_path: Path) -> None:
+        np.save(tmp_path / "frame.npy", np.zeros((4, 4, 3), dtype=np.uint8))
+        assert [p.name for p in collect_image_paths(tmp_path)] == ["frame.npy"]
+
+    def test_glob_pattern(self, screenshot_dir: Path) -> None:
+        paths = collect_image_paths(str(screenshot_dir / "shot_[12].png"))
+        assert [p.name for p in paths] == ["shot_1.png", "shot_2.png"]
+
+    def test_single_file(self, screenshot_dir: Path) -> None:
+        target = screenshot_dir / "shot_0.png"
+        assert collect_image_paths(target) == [target]
+
+    def test_no_matches(self, tmp_path: Path) -> None:
+        assert collect_image_paths(str(tmp_path / "*.png")) == []
+
+
+class TestReadImageFile:
+    def test_result_includes_image_path(self, screenshot_dir: Path) -> None:
+        path = screenshot_dir / "shot_0.png"
+        result = read_image_file(path)
+        assert result["image"] == str(path)
+        assert "assignments" in result
+
+    def test_unreadable_file_reports_error(self, tmp_path: Path) -> None:
+        bad = tmp_path / "corrupt.png"
+        bad.write_bytes(b"not a png")
+        result = read_image_file(bad)
+        assert result["image"] == str(bad)
+        assert "error" in result
+
+    def test_npy_frame_read_without_decoding(
+        self, tmp_path: Path, synthetic_board: BGRImage
+    ) -> None:
+        """Raw .npy frames go through the pipeline like encoded screenshots."""
+        png, npy = tmp_path / "shot.png", tmp_path / "shot.npy"
+        cv2.imwrite(str(png), synthetic_board)
+        np.save(npy, synthetic_board)
+        from_npy = read_image_file(npy)
+        from_png = read_image_file(png)
+        assert "error" not in from_npy
+        assert {k: v for k, v in from_npy.items() if k != "image"} == {
+            k: v for k, v in from_png.items() if k != "image"
+        }
+
+
+class TestRunBatch:
+    def test_serial_yields_one_result_per_image(self, screenshot_dir: Path) -> None:
+        paths = collect_image_paths(screenshot_dir)
+        stats = BatchStats()
+        results = list(run_batch(paths, workers=1, stats=stats))
+        assert [r["image"] for r in results] == [str(p) for p in paths]
+        assert stats.images == 4
+        assert stats.failed == 0
+
+    def test_engine_name(self, screenshot_dir: Path) -> None:
+        paths = collect_image_paths(screenshot_dir)[:1]
+        (result,) = run_batch(paths, workers=1, engine_name="fake")
+        assert result["assignments"]
+        assert {a["name"] for a in result["assignments"]} == {""}
+
+    def test_profile_path(self, screenshot_dir: Path, tmp_path: Path) -> None:
+        paths = collect_image_paths(screenshot_dir)
+        profile_path = tmp_path / "profile.json"
+        calibrate(cv2.imread(str(paths[0]))).save(profile_path)
+        expected = list(run_batch(paths, workers=2, ordered=True, engine_name="fake"))
+        results = run_batch(
+            paths,
+            workers=2,
+            ordered=True,
+            engine_name="fake",
+            profile_path=profile_path,
+        )
+        assert list(results) == expected
+
+    def test_pool_ordered_keeps_input_order(self, screenshot_dir: Path) -> None:
+        paths = collect_image_paths(screenshot_dir)
+        results = list(run_batch(paths, workers=2, ordered=True))
+        assert [r["image"] for r in results] == [str(p) for p in paths]
+
+    def test_pool_unordered_covers_all_images(self, screenshot_dir: Path) -> None:
+        paths = collect_image_paths(screenshot_dir)
+        results = list(run_batch(paths, workers=2))
+        assert sorted(r["image"] for r in results) == sorted(str(p) for p in paths)
+
+    def test_stats_counts_failures(self, tmp_path: Path) -> None:
+        bad = tmp_path / "corrupt.png"
+        bad.write_bytes(b"not a png")
+        stats = BatchStats()
+        list(run_batch([bad], stats=stats))
+        assert stats.images == 1
+        assert stats.failed == 1
+
+    def test_throughput(self) -> None:
+        stats = BatchStats(images=10, seconds=2.0)
+        assert stats.images_per_second == 5.0
+        assert BatchStats().images_per_second == 0.0
+
+
+class TestBatchCache:
+    def test_disk_cache_written(self, screenshot_dir: Path, tmp_path: Path) -> None:
+        cache_path = tmp_path / "cache" / "ocr.sqlite"
+        paths = collect_image_paths(screenshot_dir)
+        list(run_batch(paths, workers=1, cache_path=cache_path))
+        assert cache_path.exists()
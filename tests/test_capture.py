@@ -1,13 +1,30 @@
 """Tests for the capture module."""
 
+import os
+import shutil
+import subprocess
+import time
+from collections.abc import Iterator
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 
-from zora.capture import BGRImage, CaptureSource, FileCapture
+from zora.capture import (
+    BGRImage,
+    CaptureSource,
+    FileCapture,
+    MmapFileCapture,
+    NpyCapture,
+    RawFrameCapture,
+    open_frame_source,
+)
 from zora.capture.screenshot import ScreenshotCapture
+from zora.capture.window import WindowCapture
+from zora.vision import BoundingBox
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -60,6 +77,108 @@ class TestFileCapture:
         assert isinstance(result, np.ndarray)
 
 
+class TestNpyCapture:
+    def test_single_frame_is_zero_copy(self, tmp_path: Path) -> None:
+        """A single-frame .npy is returned as a read-only view of the mapping."""
+        frame = np.random.default_rng(0).integers(0, 256, (40, 60, 3), np.uint8)
+        np.save(tmp_path / "frame.npy", frame)
+        image = NpyCapture(tmp_path / "frame.npy")()
+        np.testing.assert_array_equal(image, frame)
+        assert not image.flags.writeable
+        assert not image.flags.owndata
+
+    def test_stack_requires_index(self, tmp_path: Path) -> None:
+        frames = np.zeros((3, 20, 30, 3), dtype=np.uint8)
+        frames[2] = 7
+        np.save(tmp_path / "frames.npy", frames)
+        with pytest.raises(ValueError, match="pass index"):
+            NpyCapture(tmp_path / "frames.npy")
+        capture = NpyCapture(tmp_path / "frames.npy", index=2)
+        assert len(capture) == 3
+        assert capture()[0, 0, 0] == 7
+        with pytest.raises(IndexError):
+            NpyCapture(tmp_path / "frames.npy", index=3)
+
+    def test_bgra_frame_converted(self, tmp_path: Path) -> None:
+        frame = np.zeros((10, 10, 4), dtype=np.uint8)
+        frame[..., :3] = (1, 2, 3)
+        np.save(tmp_path / "frame.npy", frame)
+        image = NpyCapture(tmp_path / "frame.npy")()
+        assert image.shape == (10, 10, 3)
+        assert tuple(image[0, 0]) == (1, 2, 3)
+
+    def test_rejects_non_image_array(self, tmp_path: Path) -> None:
+        np.save(tmp_path / "gray.npy", np.zeros((10, 10), dtype=np.uint8))
+        with pytest.raises(ValueError, match="HxWx3"):
+            NpyCapture(tmp_path / "gray.npy")()
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            NpyCapture(tmp_path / "absent.npy")
+
+
+class TestRawFrameCapture:
+    def test_reads_indexed_frame_after_offset(self, tmp_path: Path) -> None:
+        """Frames are located by header offset plus index * frame size."""
+        frames = np.arange(2 * 4 * 5 * 3, dtype=np.uint8).reshape(2, 4, 5, 3)
+        (tmp_path / "dump.bgr").write_bytes(b"HDR!" + frames.tobytes())
+        capture = RawFrameCapture(
+            tmp_path / "dump.bgr", shape=(4, 5, 3), index=1, offset=4
+        )
+        np.testing.assert_array_equal(capture(), frames[1])
+
+    def test_bgra_dump_converted(self, tmp_path: Path) -> None:
+        frame = np.full((4, 5, 4), 9, dtype=np.uint8)
+        (tmp_path / "dump.bgra").write_bytes(frame.tobytes())
+        image = RawFrameCapture(tmp_path / "dump.bgra", shape=(4, 5, 4))()
+        assert image.shape == (4, 5, 3)
+
+    def test_frame_past_end_raises(self, tmp_path: Path) -> None:
+        (tmp_path / "dump.bgr").write_bytes(bytes(4 * 5 * 3))
+        with pytest.raises(ValueError, match="does not fit"):
+            RawFrameCapture(tmp_path / "dump.bgr", shape=(4, 5, 3), index=1)
+
+    def test_rejects_bad_channel_count(self, tmp_path: Path) -> None:
+        (tmp_path / "dump.bgr").write_bytes(bytes(40))
+        with pytest.raises(ValueError, match="shape"):
+            RawFrameCapture(tmp_path / "dump.bgr", shape=(4, 5, 2))
+
+
+class TestMmapFileCapture:
+    def test_matches_file_capture(self) -> None:
+        """Decoding from the mapping gives the same pixels as cv2.imread."""
+        path = FIXTURES / "test_capture.png"
+        with MmapFileCapture(path) as capture:
+            np.testing.assert_array_equal(capture(), FileCapture(path)())
+            np.testing.assert_array_equal(capture(), capture())
+
+    def test_corrupt_file_raises(self, tmp_path: Path) -> None:
+        bad = tmp_path / "bad.png"
+        bad.write_bytes(b"not a png")
+        with MmapFileCapture(bad) as capture, pytest.raises(ValueError):
+            capture()
+
+    def test_empty_file_raises(self, tmp_path: Path) -> None:
+        (tmp_path / "empty.png").write_bytes(b"")
+        with pytest.raises(ValueError, match="empty"):
+            MmapFileCapture(tmp_path / "empty.png")
+
+    def test_closed_capture_raises(self) -> None:
+        capture = MmapFileCapture(FIXTURES / "test_capture.png")
+        capture.close()
+        with pytest.raises(RuntimeError):
+            capture()
+
+
+class TestOpenFrameSource:
+    def test_picks_source_by_suffix(self, tmp_path: Path) -> None:
+        np.save(tmp_path / "frame.npy", np.zeros((4, 4, 3), dtype=np.uint8))
+        assert isinstance(open_frame_source(tmp_path / "frame.npy"), NpyCapture)
+        source = open_frame_source(FIXTURES / "test_capture.png")
+        assert isinstance(source, MmapFileCapture)
+        source.close()
+
+
 class TestCaptureSource:
     def test_lambda_satisfies_protocol(self) -> None:
         """A simple lambda returning a numpy array satisfies CaptureSource."""
@@ -175,3 +294,194 @@ class TestScreenshotCapture:
         assert result.dtype == np.uint8
         assert result.ndim == 3
         assert result.shape[2] == 3  # BGR has 3 channels
+
+
+def _mock_mss(mock_sct: MagicMock) -> MagicMock:
+    """Build a fake ``mss`` module whose ``mss()`` context yields mock_sct."""
+    mock_mss_module = MagicMock()
+    mock_mss_module.mss.return_value.__enter__.return_value = mock_sct
+    mock_mss_module.mss.return_value.__exit__.return_value = None
+    return mock_mss_module
+
+
+class TestScreenshotSession:
+    def test_session_reused_across_calls(self) -> None:
+        """The mss grabber is opened once and reused for every frame."""
+        mock_sct = MagicMock()
+        mock_sct.monitors = [{}]
+        mock_sct.grab.return_value = np.zeros((10, 10, 4), dtype=np.uint8)
+        mock_mss_module = _mock_mss(mock_sct)
+
+        with patch.dict("sys.modules", {"mss": mock_mss_module}):
+            capture = ScreenshotCapture()
+            capture()
+            capture()
+            capture()
+
+        assert mock_mss_module.mss.call_count == 1
+        assert mock_sct.grab.call_count == 3
+
+    def test_close_releases_session(self) -> None:
+        """close() exits the mss context; the next call opens a new one."""
+        mock_sct = MagicMock()
+        mock_sct.monitors = [{}]
+        mock_sct.grab.return_value = np.zeros((10, 10, 4), dtype=np.uint8)
+        mock_mss_module = _mock_mss(mock_sct)
+
+        with patch.dict("sys.modules", {"mss": mock_mss_module}):
+            with ScreenshotCapture() as capture:
+                capture()
+            mock_mss_module.mss.return_value.__exit__.assert_called_once()
+            capture()
+
+        assert mock_mss_module.mss.call_count == 2
+
+    def test_region_offsets_from_monitor_origin(self) -> None:
+        """A region is grabbed relative to the monitor's top-left corner."""
+        mock_sct = MagicMock()
+        mock_sct.monitors = [
+            {"left": 0, "top": 0, "width": 3840, "height": 1080},
+            {"left": 1920, "top": 0, "width": 1920, "height": 1080},
+        ]
+        mock_sct.grab.return_value = np.zeros((300, 400, 4), dtype=np.uint8)
+
+        with patch.dict("sys.modules", {"mss": _mock_mss(mock_sct)}):
+            region = BoundingBox(x=100, y=50, width=400, height=300)
+            capture = ScreenshotCapture(monitor=1, region=region)
+            result = capture()
+
+        mock_sct.grab.assert_called_once_with(
+            {"left": 2020, "top": 50, "width": 400, "height": 300}
+        )
+        assert result.shape == (300, 400, 3)
+
+    def test_grab_bgra_is_zero_copy(self) -> None:
+        """grab_bgra() returns a view over the grabber's buffer."""
+        fake_bgra = np.zeros((20, 30, 4), dtype=np.uint8)
+        mock_sct = MagicMock()
+        mock_sct.monitors = [{}]
+        mock_sct.grab.return_value = fake_bgra
+
+        with patch.dict("sys.modules", {"mss": _mock_mss(mock_sct)}):
+            bgra = ScreenshotCapture().grab_bgra()
+
+        assert bgra.shape == (20, 30, 4)
+        assert np.shares_memory(bgra, fake_bgra)
+
+    def test_bgr_output_is_contiguous(self) -> None:
+        """The BGR frame is a contiguous array, not a strided alpha-drop view."""
+        mock_sct = MagicMock()
+        mock_sct.monitors = [{}]
+        mock_sct.grab.return_value = np.zeros((20, 30, 4), dtype=np.uint8)
+
+        with patch.dict("sys.modules", {"mss": _mock_mss(mock_sct)}):
+            result = ScreenshotCapture()()
+
+        assert result.flags["C_CONTIGUOUS"]
+
+
+requires_xvfb = pytest.mark.skipif(
+    shutil.which("Xvfb") is None
+    or find_spec("Xlib") is None
+    or find_spec("mss") is None,
+    reason="Needs Xvfb, python-xlib and mss",
+)
+
+# Game window colour, as BGR and as a 24-bit X pixel value
+WINDOW_BGR = (40, 90, 160)
+WINDOW_PIXEL = (160 << 16) | (90 << 8) | 40
+
+
+@pytest.fixture
+def xvfb(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """A private 800x600 X server with a black root window, as DISPLAY."""
+    read, write = os.pipe()
+    server = subprocess.Popen(
+        ["Xvfb", "-displayfd", str(write), "-screen", "0", "800x600x24", "-br"],
+        pass_fds=(write,),
+        stderr=subprocess.DEVNULL,
+    )
+    os.close(write)
+    with os.fdopen(read) as displayfd:
+        number = displayfd.readline().strip()
+    if not number:
+        server.kill()
+        pytest.skip("Xvfb failed to start")
+    monkeypatch.setenv("DISPLAY", f":{number}")
+    yield f":{number}"
+    server.terminate()
+    server.wait()
+
+
+@pytest.fixture
+def game_window(xvfb: str) -> Iterator[Any]:
+    """A mapped 320x200 window titled like the game, at (100, 50)."""
+    from Xlib import display
+
+    client = display.Display(xvfb)
+    screen = client.screen()
+    window = screen.root.create_window(
+        100, 50, 320, 200, 0, screen.root_depth, background_pixel=WINDOW_PIXEL
+    )
+    window.set_wm_name("Star Trek Online")
+    window.set_wm_class("sto", "GameClient")
+    window.map()
+    client.sync()
+    yield window
+    client.close()
+
+
+def _settle(window: Any) -> None:
+    """Let the server process a change and deliver its events."""
+    window.display.sync()
+    time.sleep(0.05)
+
+
+class TestWindowCapture:
+    def test_needs_title_or_class(self) -> None:
+        with pytest.raises(ValueError, match="title or class"):
+            WindowCapture()
+
+    @requires_xvfb
+    def test_captures_client_area_only(self, game_window: Any) -> None:
+        with WindowCapture(title="star trek") as capture:
+            image = capture()
+        assert image.shape == (200, 320, 3)
+        assert (image == WINDOW_BGR).all()
+        assert capture.box is None  # forgotten on close
+
+    @requires_xvfb
+    def test_geometry_resolved_only_on_change(self, game_window: Any) -> None:
+        with WindowCapture(wm_class="GameClient") as capture:
+            for _ in range(3):
+                capture()
+            assert capture.stats.lookups == 1
+            assert capture.stats.geometry_updates == 1
+            assert capture.box == BoundingBox(x=100, y=50, width=320, height=200)
+
+            game_window.configure(x=300, y=200, width=240)
+            _settle(game_window)
+            image = capture()
+            assert capture.stats.geometry_updates == 2
+            assert capture.box == BoundingBox(x=300, y=200, width=240, height=200)
+            assert image.shape == (200, 240, 3)
+            assert (image == WINDOW_BGR).all()
+
+            # Partly off screen: clipped to the 800x600 screen
+            game_window.configure(x=700)
+            _settle(game_window)
+            assert capture().shape == (200, 100, 3)
+            assert capture.stats.lookups == 1
+
+    @requires_xvfb
+    def test_missing_or_destroyed_window_raises(self, game_window: Any) -> None:
+        with WindowCapture(title="Some Other Game") as capture:
+            with pytest.raises(RuntimeError, match="No window"):
+                capture()
+        with WindowCapture(title="Star Trek", wm_class="sto") as capture:
+            capture()
+            game_window.destroy()
+            _settle(game_window)
+            with pytest.raises(RuntimeError, match="No window"):
+                capture()
+            assert capture.stats.lookups == 2
@@ -7,12 +7,20 @@ and live-capture workflows.
 
 import builtins
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import cv2
+import numpy as np
 import pytest
 
 from zora.cli import _get_version, main
+from zora.synthetic import render_field, render_scrolling_board
+from zora.vision.glyphs import GlyphBank
+from zora.vision.profile import LayoutProfile
 
 _real_import = builtins.__import__
 
@@ -39,6 +47,47 @@ class TestVersion:
         assert any(c.isdigit() for c in captured.out)
 
 
+class TestStartupImports:
+    """--version and --help must not pay for OpenCV, numpy or OCR imports."""
+
+    HEAVY_MODULES = ("cv2", "numpy", "pytesseract", "tesserocr", "zora.pipeline")
+
+    def _modules_after(self, *argv: str) -> list[str]:
+        """Run the CLI in a fresh interpreter; return heavy modules it loaded."""
+        code = (
+            "import sys\n"
+            "from zora.cli import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            f"print([m for m in {self.HEAVY_MODULES!r} if m in sys.modules])\n"
+        )
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(
+                None, [str(Path(__file__).parent.parent / "src"), env.get("PYTHONPATH")]
+            )
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, *argv],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(result.stdout.splitlines()[-1].replace("'", '"'))
+
+    def test_version_skips_heavy_imports(self) -> None:
+        assert self._modules_after("--version") == []
+
+    def test_help_skips_heavy_imports(self) -> None:
+        assert self._modules_after("--help") == []
+
+    def test_subcommand_help_skips_heavy_imports(self) -> None:
+        assert self._modules_after("watch", "--help") == []
+
+
 class TestImageFlag:
     def test_image_with_valid_fixture(self, capsys: pytest.CaptureFixture[str]) -> None:
         """--image with a valid fixture produces valid JSON."""
@@ -83,6 +132,33 @@ class TestNoImageFlag:
         assert "mss" in captured.err
 
 
+class TestWindowFlags:
+    def test_window_selects_window_capture(self) -> None:
+        from zora.capture.window import WindowCapture
+        from zora.cli import _build_parser, _make_source
+
+        args = _build_parser().parse_args(["--window", "Star Trek Online"])
+        source = _make_source(args)
+        assert isinstance(source, WindowCapture)
+        assert source.title == "Star Trek Online"
+        assert source.wm_class is None
+
+        args = _build_parser().parse_args(["watch", "--window-class", "GameClient"])
+        assert _make_source(args).wm_class == "GameClient"
+
+    def test_window_exits_without_xlib(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        with (
+            patch("sys.argv", ["zora", "--window", "Star Trek Online"]),
+            patch("importlib.util.find_spec", return_value=None),
+            pytest.raises(SystemExit) as exc,
+        ):
+            main()
+        assert exc.value.code == 1
+        assert "python-xlib" in capsys.readouterr().err
+
+
 class TestVerboseFlag:
     def test_verbose_enables_debug_logging(
         self, capsys: pytest.CaptureFixture[str]
@@ -126,3 +202,235 @@ class TestJsonOutput:
         data = json.loads(captured.out)
         assert "assignments" in data
         assert "ships" in data
+
+    def test_tiled_ocr_output(self, capsys: pytest.CaptureFixture[str]) -> None:
+        fixture = FIXTURES / "test_capture.png"
+        if not fixture.exists():
+            pytest.skip("test_capture.png fixture not found")
+        with patch("sys.argv", ["zora", "--image", str(fixture), "--tiled-ocr"]):
+            main()
+        assert "assignments" in json.loads(capsys.readouterr().out)
+
+
+class TestOcrEngineFlag:
+    def test_fake_engine(self, capsys: pytest.CaptureFixture[str]) -> None:
+        fixture = FIXTURES / "test_capture.png"
+        if not fixture.exists():
+            pytest.skip("test_capture.png fixture not found")
+        with patch(
+            "sys.argv", ["zora", "--image", str(fixture), "--ocr-engine", "fake"]
+        ):
+            main()
+        data = json.loads(capsys.readouterr().out)
+        assert all(a["name"] == "" for a in data["assignments"])
+
+    def test_unavailable_engine_exits(self, capsys: pytest.CaptureFixture[str]) -> None:
+        argv = ["zora", "--image", str(FIXTURES / "test_capture.png")]
+        argv += ["--ocr-engine", "easyocr"]
+        with (
+            patch("sys.argv", argv),
+            patch.dict("sys.modules", {"easyocr": None}),
+            pytest.raises(SystemExit),
+        ):
+            main()
+        assert "unavailable" in capsys.readouterr().err
+
+    def test_unknown_engine_rejected(self) -> None:
+        with patch("sys.argv", ["zora", "--ocr-engine", "nonesuch"]):
+            with pytest.raises(SystemExit):
+                main()
+
+
+class TestWatchCommand:
+    def test_watch_emits_one_line_for_static_image(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A static image produces a single JSON line across many frames."""
+        fixture = FIXTURES / "test_capture.png"
+        if not fixture.exists():
+            pytest.skip("test_capture.png fixture not found")
+        argv = [
+            "zora",
+            "watch",
+            "--image",
+            str(fixture),
+            "--interval",
+            "0",
+            "--max-frames",
+            "3",
+        ]
+        with patch("sys.argv", argv):
+            main()
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 1
+        data = json.loads(lines[0])
+        assert "assignments" in data
+
+    def test_options_before_subcommand_are_kept(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Top-level --image still applies when given before 'watch'."""
+        fixture = FIXTURES / "test_capture.png"
+        if not fixture.exists():
+            pytest.skip("test_capture.png fixture not found")
+        argv = ["zora", "--image", str(fixture), "watch", "--max-frames", "1"]
+        with patch("sys.argv", argv):
+            main()
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 1
+
+
+class TestBatchCommand:
+    def test_batch_prints_json_lines_and_throughput(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Each image yields one JSON line; throughput goes to stderr."""
+        fixture = FIXTURES / "test_capture.png"
+        if not fixture.exists():
+            pytest.skip("test_capture.png fixture not found")
+        for name in ("a.png", "b.png"):
+            (tmp_path / name).write_bytes(fixture.read_bytes())
+        argv = ["zora", "batch", str(tmp_path), "--workers", "1", "--ordered"]
+        with patch("sys.argv", argv):
+            main()
+        captured = capsys.readouterr()
+        lines = [json.loads(line) for line in captured.out.splitlines()]
+        assert [Path(r["image"]).name for r in lines] == ["a.png", "b.png"]
+        assert "images/s" in captured.err
+
+    def test_batch_checks_engine_without_creating_it(self, tmp_path: Path) -> None:
+        """Workers create their own engine; the parent only checks it."""
+        (tmp_path / "a.png").write_bytes(b"")
+        argv = ["zora", "batch", str(tmp_path), "--ocr-engine", "easyocr"]
+        with (
+            patch("sys.argv", argv),
+            patch("zora.vision.ocr.easy.EasyOcrEngine.probe") as probe,
+            patch("zora.vision.ocr.easy.EasyOcrEngine.__init__") as create,
+            patch("zora.batch.run_batch", return_value=iter([])) as run,
+        ):
+            main()
+        probe.assert_called_once_with()
+        create.assert_not_called()
+        assert run.call_args.kwargs["engine_name"] == "easyocr"
+
+    def test_batch_unavailable_engine_exits(self, tmp_path: Path) -> None:
+        (tmp_path / "a.png").write_bytes(b"")
+        argv = ["zora", "batch", str(tmp_path), "--ocr-engine", "easyocr"]
+        with (
+            patch("sys.argv", argv),
+            patch.dict("sys.modules", {"easyocr": None}),
+            pytest.raises(SystemExit) as exc,
+        ):
+            main()
+        assert exc.value.code == 1
+
+    def test_batch_without_matches_exits(self, tmp_path: Path) -> None:
+        argv = ["zora", "batch", str(tmp_path / "*.png")]
+        with patch("sys.argv", argv), pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 1
+
+
+class TestStitchCommand:
+    def test_stitch_prints_merged_board(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        frames = render_scrolling_board(1280, 720, 8, columns=2, step=150)
+        paths = []
+        for i, frame in enumerate(frames):
+            paths.append(str(tmp_path / f"page{i}.png"))
+            cv2.imwrite(paths[-1], frame)
+        argv = ["zora", "stitch", *paths, "--ocr-engine", "fake"]
+        with patch("sys.argv", argv):
+            main()
+        captured = capsys.readouterr()
+        assert len(json.loads(captured.out)["assignments"]) == 8
+        assert f"Stitched {len(frames)} frame(s): 8 card(s) read" in captured.err
+
+    def test_missing_frame_exits(self, tmp_path: Path) -> None:
+        argv = ["zora", "stitch", str(tmp_path / "missing.png")]
+        with patch("sys.argv", argv), pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 1
+
+
+class TestGlyphsCommand:
+    def test_glyphs_builds_loadable_bank(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Labeled crops become a bank file that --glyphs can load."""
+        samples = tmp_path / "samples"
+        samples.mkdir()
+        for text in ("1234", "5678", "90"):
+            cv2.imwrite(str(samples / f"{text}.png"), render_field(text))
+        output = tmp_path / "bank.npz"
+        argv = ["zora", "glyphs", str(samples), "-o", str(output)]
+        with patch("sys.argv", argv):
+            main()
+        assert "0123456789" in capsys.readouterr().err
+        assert GlyphBank.load(output).read_number(render_field("2048")) == 2048
+
+    def test_missing_bank_exits(self) -> None:
+        fixture = FIXTURES / "test_capture.png"
+        argv = ["zora", "--image", str(fixture), "--glyphs", "/nonexistent.npz"]
+        with patch("sys.argv", argv), pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 1
+
+
+class TestCalibrateCommand:
+    def test_calibrate_writes_profile_used_by_profile_flag(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        fixture = FIXTURES / "synthetic_board.png"
+        output = tmp_path / "profile.json"
+        argv = ["zora", "calibrate", "--image", str(fixture), "-o", str(output)]
+        with patch("sys.argv", argv):
+            main()
+        assert "Saved profile" in capsys.readouterr().err
+        assert LayoutProfile.load(output).cards
+
+        argv = ["zora", "--image", str(fixture), "--ocr-engine", "fake"]
+        with patch("sys.argv", argv):
+            main()
+        expected = capsys.readouterr().out
+        with (
+            patch("sys.argv", [*argv, "--profile", str(output)]),
+            patch("zora.pipeline.detect_board") as detect,
+        ):
+            main()
+        detect.assert_not_called()
+        assert capsys.readouterr().out == expected
+
+    def test_calibrate_without_board_exits(self, tmp_path: Path) -> None:
+        blank = tmp_path / "blank.png"
+        cv2.imwrite(str(blank), np.full((200, 300, 3), 200, dtype=np.uint8))
+        argv = ["zora", "calibrate", "--image", str(blank), "-o", "p.json"]
+        with patch("sys.argv", argv), pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 1
+
+    def test_invalid_profile_exits(self, tmp_path: Path) -> None:
+        bad = tmp_path / "profile.json"
+        bad.write_text("{}")
+        fixture = FIXTURES / "synthetic_board.png"
+        argv = ["zora", "--image", str(fixture), "--profile", str(bad)]
+        with patch("sys.argv", argv), pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 1
+
+
+class TestWorkersFlag:
+    def test_workers_output_matches_sequential(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        fixture = FIXTURES / "test_capture.png"
+        if not fixture.exists():
+            pytest.skip("test_capture.png fixture not found")
+        with patch("sys.argv", ["zora", "--image", str(fixture)]):
+            main()
+        sequential = json.loads(capsys.readouterr().out)
+        argv = ["zora", "--image", str(fixture), "--workers", "4"]
+        with patch("sys.argv", argv):
+            main()
+        assert json.loads(capsys.readouterr().out) == sequential
@@ -109,6 +109,18 @@ class TestAssignment:
         assert d["campaign"] == "Ferengi"
         assert d["duration"] == "2h"
         assert d["rarity"] == "Common"
+        assert "confidence" not in d
+
+    def test_to_dict_includes_confidence(self) -> None:
+        a = Assignment(
+            name="Supply Run",
+            engineering=15,
+            science=5,
+            tactical=25,
+            ship_slots=2,
+            confidence={"name": 91.5, "engineering": 96.0},
+        )
+        assert a.to_dict()["confidence"] == {"name": 91.5, "engineering": 96.0}
 
     def test_event_rewards_default_not_shared(self) -> None:
         """Each Assignment instance gets its own list for event_rewards."""
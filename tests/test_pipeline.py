@@ -1,10 +1,30 @@
 """Tests for the end-to-end pipeline."""
 
+from unittest.mock import patch
+
 import numpy as np
+import pytest
 
+from tests.test_vision_extract import requires_tesseract
 from zora.capture import BGRImage
-from zora.models import BoardState
-from zora.pipeline import read_board, read_board_from_image
+from zora.models import Assignment, BoardState
+from zora.pipeline import (
+    make_executor,
+    read_board,
+    read_board_from_image,
+    read_scrolling_board,
+)
+from zora.synthetic import (
+    SAMPLE_ASSIGNMENTS,
+    draw_assignment_card,
+    render_board,
+    render_scrolling_board,
+)
+from zora.vision.extract import TESSERACT_DIGITS_CONFIG
+from zora.vision.ocr.fake import FakeEngine
+from zora.vision.profile import calibrate
+from zora.vision.scroll import CardStitcher
+from zora.vision.track import BoardTracker, CardTracker
 
 
 class TestReadBoardFromImage:
@@ -44,3 +64,286 @@ class TestReadBoard:
         assert "assignments" in d
         assert "ships" in d
         assert isinstance(d["assignments"], list)
+
+
+def _fake_extract(card_image: BGRImage, **kwargs: object) -> Assignment:
+    """Name each assignment after its crop size so order is observable."""
+    h, w = card_image.shape[:2]
+    return Assignment(
+        name=f"{w}x{h}", engineering=0, science=0, tactical=0, ship_slots=0
+    )
+
+
+class TestConcurrentExtraction:
+    def test_thread_executor_keeps_reading_order(
+        self, synthetic_board: BGRImage
+    ) -> None:
+        with patch(
+            "zora.pipeline.extract_assignment_fields", side_effect=_fake_extract
+        ):
+            sequential = read_board_from_image(synthetic_board)
+            with make_executor("thread", 4) as executor:
+                concurrent = read_board_from_image(synthetic_board, executor=executor)
+        assert len(sequential.assignments) > 1
+        assert concurrent.to_dict() == sequential.to_dict()
+
+    def test_process_executor_matches_sequential(
+        self, synthetic_board: BGRImage
+    ) -> None:
+        sequential = read_board_from_image(synthetic_board)
+        with make_executor("process", 2) as executor:
+            concurrent = read_board_from_image(synthetic_board, executor=executor)
+        assert concurrent.to_dict() == sequential.to_dict()
+
+    def test_errors_collected_per_card(self, synthetic_board: BGRImage) -> None:
+        """A failing card is reported while the others still come through."""
+        calls = {"n": 0}
+
+        def flaky(card_image: BGRImage, **kwargs: object) -> Assignment:
+            calls["n"] += 1
+            if calls["n"] == 2:
+                raise RuntimeError("OCR blew up")
+            return _fake_extract(card_image)
+
+        with (
+            patch("zora.pipeline.extract_assignment_fields", side_effect=flaky),
+            make_executor("thread", 1) as executor,
+        ):
+            board = read_board_from_image(synthetic_board, executor=executor)
+        assert board.errors == ["Failed to extract assignment from card 1"]
+        assert len(board.assignments) == calls["n"] - 1
+
+    def test_unknown_executor_kind(self) -> None:
+        with pytest.raises(ValueError):
+            make_executor("fiber")
+
+
+class TestTrackedPipeline:
+    def test_tracker_matches_untracked(self, synthetic_board: BGRImage) -> None:
+        tracker = BoardTracker()
+        with patch(
+            "zora.pipeline.extract_assignment_fields", side_effect=_fake_extract
+        ):
+            expected = read_board_from_image(synthetic_board)
+            for _ in range(3):
+                board = read_board_from_image(synthetic_board, tracker=tracker)
+                assert board.to_dict() == expected.to_dict()
+        assert tracker.stats.fast_hits == 2
+
+
+class TestCardTracking:
+    def test_unchanged_cards_reuse_assignments(self, synthetic_board: BGRImage) -> None:
+        tracker = CardTracker()
+        with patch(
+            "zora.pipeline.extract_assignment_fields", side_effect=_fake_extract
+        ) as extract:
+            first = read_board_from_image(synthetic_board, card_tracker=tracker)
+            extract.reset_mock()
+            second = read_board_from_image(synthetic_board, card_tracker=tracker)
+        extract.assert_not_called()
+        assert len(second.assignments) == 3
+        assert all(a is b for a, b in zip(first.assignments, second.assignments))
+        assert tracker.stats.last_skipped == 3
+
+    def test_only_changed_card_is_extracted(self, synthetic_board: BGRImage) -> None:
+        """A ticking timer on one card re-reads that card alone."""
+        tracker = CardTracker()
+        ticked = synthetic_board.copy()
+        draw_assignment_card(
+            ticked,
+            400,
+            30,
+            300,
+            200,
+            name="Supply Run",
+            eng=15,
+            sci=5,
+            tac=25,
+            slots=1,
+            duration="1h",
+            rarity="Uncommon",
+        )
+        with patch(
+            "zora.pipeline.extract_assignment_fields", side_effect=_fake_extract
+        ) as extract:
+            first = read_board_from_image(synthetic_board, card_tracker=tracker)
+            extract.reset_mock()
+            second = read_board_from_image(ticked, card_tracker=tracker)
+        assert extract.call_count == 1
+        assert tracker.stats.last_skipped == 2
+        assert sum(a is b for a, b in zip(first.assignments, second.assignments)) == 2
+
+    def test_failed_card_is_retried(self, synthetic_board: BGRImage) -> None:
+        tracker = CardTracker()
+        calls = {"n": 0}
+
+        def flaky(card_image: BGRImage, **kwargs: object) -> Assignment:
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise RuntimeError("OCR blew up")
+            return _fake_extract(card_image)
+
+        with patch("zora.pipeline.extract_assignment_fields", side_effect=flaky):
+            first = read_board_from_image(synthetic_board, card_tracker=tracker)
+            second = read_board_from_image(synthetic_board, card_tracker=tracker)
+        assert first.errors == ["Failed to extract assignment from card 0"]
+        assert second.errors == []
+        assert len(second.assignments) == 3
+        assert calls["n"] == 4
+        assert tracker.stats.last_skipped == 2
+
+    def test_tiled_reads_only_changed_cards(self, synthetic_board: BGRImage) -> None:
+        tracker = CardTracker()
+        with patch(
+            "zora.pipeline.extract_assignments_tiled",
+            side_effect=lambda cards, **kw: [_fake_extract(c) for c in cards],
+        ) as tiled:
+            read_board_from_image(synthetic_board, tiled=True, card_tracker=tracker)
+            board = read_board_from_image(
+                synthetic_board, tiled=True, card_tracker=tracker
+            )
+        assert tiled.call_count == 1
+        assert len(board.assignments) == 3
+
+
+class TestProfilePipeline:
+    def test_matching_profile_skips_detection(self, synthetic_board: BGRImage) -> None:
+        profile = calibrate(synthetic_board)
+        with patch(
+            "zora.pipeline.extract_assignment_fields", side_effect=_fake_extract
+        ) as extract:
+            expected = read_board_from_image(synthetic_board)
+            with (
+                patch("zora.pipeline.detect_board") as detect,
+                patch("zora.pipeline.find_assignment_cards") as find_cards,
+            ):
+                board = read_board_from_image(synthetic_board, profile=profile)
+        detect.assert_not_called()
+        find_cards.assert_not_called()
+        assert board.to_dict() == expected.to_dict()
+        regions = [call.kwargs["regions"] for call in extract.call_args_list[-3:]]
+        assert [r.fields for r in regions] == [c.fields for c in profile.cards]
+
+    def test_mismatched_profile_falls_back(self, synthetic_board: BGRImage) -> None:
+        profile = calibrate(synthetic_board)
+        profile.frame_size = (1920, 1080)
+        with patch(
+            "zora.pipeline.extract_assignment_fields", side_effect=_fake_extract
+        ) as extract:
+            expected = read_board_from_image(synthetic_board)
+            board = read_board_from_image(synthetic_board, profile=profile)
+        assert board.to_dict() == expected.to_dict()
+        assert extract.call_args.kwargs["regions"] is None
+
+
+class TestTiledPipeline:
+    def test_tiled_reads_all_cards_at_once(self, synthetic_board: BGRImage) -> None:
+        """With tiled=True all crops go to one batched call, in reading order."""
+        with (
+            patch(
+                "zora.pipeline.extract_assignments_tiled",
+                side_effect=lambda cards, **kw: [_fake_extract(c) for c in cards],
+            ) as tiled,
+            patch(
+                "zora.pipeline.extract_assignment_fields", side_effect=_fake_extract
+            ) as per_card,
+        ):
+            expected = read_board_from_image(synthetic_board)
+            per_card.reset_mock()
+            board = read_board_from_image(synthetic_board, tiled=True)
+        assert board.to_dict() == expected.to_dict()
+        assert tiled.call_count == 1
+        per_card.assert_not_called()
+
+    def test_falls_back_to_per_card(self, synthetic_board: BGRImage) -> None:
+        with (
+            patch(
+                "zora.pipeline.extract_assignments_tiled",
+                side_effect=RuntimeError("no word boxes"),
+            ),
+            patch("zora.pipeline.extract_assignment_fields", side_effect=_fake_extract),
+        ):
+            expected = read_board_from_image(synthetic_board)
+            board = read_board_from_image(synthetic_board, tiled=True)
+        assert board.to_dict() == expected.to_dict()
+
+
+class TestEngineSelection:
+    def test_engine_instance(self, synthetic_board: BGRImage) -> None:
+        engine = FakeEngine("Rescue Op", by_config={TESSERACT_DIGITS_CONFIG: "3"})
+        board = read_board_from_image(synthetic_board, engine=engine)
+        assert len(board.assignments) > 1
+        assert {(a.name, a.engineering) for a in board.assignments} == {
+            ("Rescue Op", 3)
+        }
+        assert engine.calls
+
+    def test_engine_name(self, synthetic_board: BGRImage) -> None:
+        board = read_board(lambda: synthetic_board, engine="fake")
+        assert board.assignments
+        assert {a.name for a in board.assignments} == {""}
+
+    def test_engine_name_in_process_workers(self, synthetic_board: BGRImage) -> None:
+        """Workers create the named engine themselves."""
+        with make_executor("process", 2) as executor:
+            board = read_board_from_image(
+                synthetic_board, executor=executor, engine="fake"
+            )
+        assert board.errors == []
+        assert {a.name for a in board.assignments} == {""}
+
+    def test_tiled_uses_engine(self, synthetic_board: BGRImage) -> None:
+        engine = FakeEngine("Survey")
+        board = read_board_from_image(synthetic_board, tiled=True, engine=engine)
+        assert len(engine.calls) == 1
+        assert board.assignments
+
+
+class TestSharedPlanes:
+    def test_same_reads_as_unshared(self, synthetic_board: BGRImage) -> None:
+        shared_engine = FakeEngine("Survey", by_config={TESSERACT_DIGITS_CONFIG: "5"})
+        engine = FakeEngine("Survey", by_config={TESSERACT_DIGITS_CONFIG: "5"})
+        shared = read_board_from_image(synthetic_board, engine=shared_engine)
+        unshared = read_board_from_image(
+            synthetic_board, engine=engine, share_planes=False
+        )
+        assert shared.assignments
+        assert shared.to_dict() == unshared.to_dict()
+        assert shared_engine.calls == engine.calls
+
+
+@pytest.fixture(scope="module")
+def scroll_frames() -> list[BGRImage]:
+    return render_scrolling_board(1280, 720, 12, columns=2, step=150)
+
+
+class TestScrollingBoard:
+    def test_each_card_read_once(self, scroll_frames: list[BGRImage]) -> None:
+        engine = FakeEngine("7")
+        stitcher = CardStitcher()
+        board = read_scrolling_board(scroll_frames, engine=engine, stitcher=stitcher)
+        assert len(board.assignments) == 12
+        assert not board.errors
+        assert stitcher.stats.repeated > 0
+
+        # As many OCR calls as reading 12 cards, none for repeated cards
+        single = FakeEngine("7")
+        read_board_from_image(render_board(1280, 720, 1), engine=single)
+        assert len(engine.calls) == 12 * len(single.calls)
+
+    @requires_tesseract
+    def test_merged_in_list_order(self, scroll_frames: list[BGRImage]) -> None:
+        board = read_scrolling_board(scroll_frames)
+        names = [sample["name"] for sample in SAMPLE_ASSIGNMENTS]
+        assert [a.name for a in board.assignments] == (names * 3)
+
+    def test_bad_frames_reported(self, scroll_frames: list[BGRImage]) -> None:
+        no_board = np.full_like(scroll_frames[0], 200)
+        other_list = render_scrolling_board(1280, 720, 12, columns=3)[0]
+        board = read_scrolling_board(
+            [scroll_frames[0], no_board, other_list], engine=FakeEngine("7")
+        )
+        assert len(board.errors) == 2
+        assert "No admiralty board" in board.errors[0]
+        assert "doesn't overlap" in board.errors[1]
+        assert board.assignments
@@ -0,0 +1,69 @@
+"""Tests for the synthetic board generator (zora.synthetic module)."""
+
+import numpy as np
+import pytest
+
+from zora.synthetic import (
+    CARD_COLOR,
+    DESKTOP_COLOR,
+    render_board,
+    render_field,
+    render_scrolling_board,
+)
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.regions import find_assignment_cards
+
+
+class TestRenderBoard:
+    @pytest.mark.parametrize(
+        ("width", "height"), [(800, 600), (1920, 1080), (3840, 2160), (5120, 1440)]
+    )
+    @pytest.mark.parametrize("num_cards", [1, 3, 6, 12])
+    def test_cards_are_detectable(
+        self, width: int, height: int, num_cards: int
+    ) -> None:
+        """Every rendered card is found by the real detection pipeline."""
+        image = render_board(width, height, num_cards)
+        assert image.shape == (height, width, 3)
+        box = detect_board(image)
+        assert box is not None
+        assert len(find_assignment_cards(crop_board(image, box))) == num_cards
+
+    def test_desktop_surrounds_board(self) -> None:
+        image = render_board(1920, 1080, 3)
+        assert tuple(image[0, 0]) == DESKTOP_COLOR
+        assert tuple(render_board(1920, 1080, 3, desktop=False)[0, 0]) != DESKTOP_COLOR
+
+    def test_deterministic(self) -> None:
+        np.testing.assert_array_equal(render_board(1280, 720), render_board(1280, 720))
+
+    def test_no_cards(self) -> None:
+        image = render_board(640, 480, 0)
+        box = detect_board(image)
+        assert box is not None
+        assert find_assignment_cards(crop_board(image, box)) == []
+
+
+class TestRenderField:
+    def test_scales_with_text_and_scale(self) -> None:
+        small = render_field("42")
+        large = render_field("4200", scale=2.0)
+        assert large.shape[0] == 2 * small.shape[0]
+        assert large.shape[1] > 2 * small.shape[1]
+        assert tuple(small[0, 0]) == CARD_COLOR
+        assert small.max() == 255
+
+
+class TestRenderScrollingBoard:
+    def test_frames_scroll_through_list(self) -> None:
+        frames = render_scrolling_board(1280, 720, 12, columns=2, step=200)
+        assert len(frames) > 2
+        assert all(frame.shape == (720, 1280, 3) for frame in frames)
+        box = detect_board(frames[0])
+        assert box is not None
+        assert all(detect_board(frame) == box for frame in frames)
+        first, second = (crop_board(frame, box) for frame in frames[:2])
+        np.testing.assert_array_equal(first[200:], second[:-200])
+
+    def test_short_list_is_one_frame(self) -> None:
+        assert len(render_scrolling_board(1280, 720, 2, columns=2)) == 1
@@ -0,0 +1,135 @@
+"""Tests for the OCR result cache (vision.cache module)."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from zora.capture import BGRImage
+from zora.pipeline import make_executor, read_board_from_image
+from zora.vision.cache import OcrCache, ocr_cache_key
+from zora.vision.extract import extract_assignment, ocr_number, ocr_text
+from zora.vision.ocr import set_default_engine
+
+
+class CountingEngine:
+    """An OCR engine stand-in that records how often it is called."""
+
+    name = "counting"
+
+    def __init__(self, text: str = "Patrol\nEng: 30\nSci: 20") -> None:
+        self.text = text
+        self.calls = 0
+
+    def image_to_string(self, image: np.ndarray, config: str) -> str:
+        self.calls += 1
+        return self.text
+
+
+class TestOcrCacheKey:
+    def test_same_image_same_key(self) -> None:
+        image = np.zeros((10, 20), dtype=np.uint8)
+        assert ocr_cache_key(image, "e", "c") == ocr_cache_key(image.copy(), "e", "c")
+
+    def test_key_depends_on_content_engine_and_config(self) -> None:
+        image = np.zeros((10, 20), dtype=np.uint8)
+        other = image.copy()
+        other[5, 5] = 255
+        base = ocr_cache_key(image, "e", "c")
+        assert ocr_cache_key(other, "e", "c") != base
+        assert ocr_cache_key(image, "other", "c") != base
+        assert ocr_cache_key(image, "e", "--psm 7") != base
+
+    def test_key_depends_on_shape(self) -> None:
+        image = np.zeros((10, 20), dtype=np.uint8)
+        assert ocr_cache_key(image, "e", "c") != ocr_cache_key(
+            image.reshape(20, 10), "e", "c"
+        )
+
+
+class TestOcrCache:
+    def test_get_put_and_stats(self) -> None:
+        cache = OcrCache()
+        assert cache.get("k") is None
+        cache.put("k", "text")
+        assert cache.get("k") == "text"
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_lru_eviction(self) -> None:
+        cache = OcrCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")  # a is now most recently used
+        cache.put("c", "3")
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_disk_store_survives_restart(self, tmp_path: Path) -> None:
+        path = tmp_path / "ocr.sqlite"
+        with OcrCache(path=path) as cache:
+            cache.put("k", "persisted")
+        with OcrCache(path=path) as reopened:
+            assert reopened.get("k") == "persisted"
+            assert reopened.stats.disk_hits == 1
+            # Promoted into memory: the second lookup doesn't hit disk
+            assert reopened.get("k") == "persisted"
+            assert reopened.stats.disk_hits == 1
+
+    def test_disk_store_outlives_memory_eviction(self, tmp_path: Path) -> None:
+        with OcrCache(max_entries=1, path=tmp_path / "ocr.sqlite") as cache:
+            cache.put("a", "1")
+            cache.put("b", "2")
+            assert cache.get("a") == "1"
+
+    def test_empty_stats(self) -> None:
+        assert OcrCache().stats.hit_rate == 0.0
+
+
+class TestCachedExtraction:
+    def test_ocr_text_hit_skips_engine(self) -> None:
+        engine = CountingEngine("hello")
+        cache = OcrCache()
+        image = np.zeros((40, 80, 3), dtype=np.uint8)
+        assert ocr_text(image, engine=engine, cache=cache) == "hello"
+        assert ocr_text(image, engine=engine, cache=cache) == "hello"
+        assert engine.calls == 1
+        assert cache.stats.hits == 1
+
+    def test_text_and_digits_cached_separately(self) -> None:
+        engine = CountingEngine("42")
+        cache = OcrCache()
+        image = np.zeros((40, 80, 3), dtype=np.uint8)
+        ocr_text(image, engine=engine, cache=cache)
+        assert ocr_number(image, engine=engine, cache=cache) == 42
+        assert engine.calls == 2
+
+    def test_extract_assignment_uses_cache(self, single_card_image: BGRImage) -> None:
+        engine = CountingEngine()
+        cache = OcrCache()
+        first = extract_assignment(single_card_image, engine=engine, cache=cache)
+        second = extract_assignment(single_card_image, engine=engine, cache=cache)
+        assert first == second
+        assert engine.calls == 1
+
+    def test_repeated_board_reads_hit_cache(self, synthetic_board: BGRImage) -> None:
+        engine = CountingEngine()
+        cache = OcrCache()
+        set_default_engine(engine)
+        try:
+            for _ in range(10):
+                read_board_from_image(synthetic_board, cache=cache)
+        finally:
+            set_default_engine(None)
+        assert cache.stats.hit_rate >= 0.9
+        assert engine.calls == cache.stats.misses
+
+    def test_process_executor_rejected(self, synthetic_board: BGRImage) -> None:
+        with make_executor("process", 1) as executor:
+            with pytest.raises(ValueError):
+                read_board_from_image(
+                    synthetic_board, executor=executor, cache=OcrCache()
+                )
@@ -3,8 +3,13 @@
 import numpy as np
 
 from zora.capture import BGRImage
+from zora.synthetic import render_board
 from zora.vision import BoundingBox
-from zora.vision.detect import crop_board, detect_board
+from zora.vision.detect import crop_board, detect_board, detect_board_multiscale
+
+
+def _max_edge_error(a: BoundingBox, b: BoundingBox) -> int:
+    return max(abs(a.x - b.x), abs(a.y - b.y), abs(a.x2 - b.x2), abs(a.y2 - b.y2))
 
 
 class TestDetectBoard:
@@ -29,6 +34,30 @@ class TestDetectBoard:
         assert box.area > image_area * 0.05
 
 
+class TestDetectBoardMultiscale:
+    def test_matches_full_resolution_on_large_frames(self) -> None:
+        """Coarse-to-fine boxes agree with full detection within a few pixels."""
+        for width, height in [(1920, 1080), (3840, 2160), (5120, 1440)]:
+            image = render_board(width, height)
+            full = detect_board(image)
+            coarse = detect_board_multiscale(image)
+            assert full is not None and coarse is not None
+            assert _max_edge_error(full, coarse) <= 3, (width, height)
+
+    def test_small_frames_use_full_resolution(self, synthetic_board: BGRImage) -> None:
+        """Frames barely larger than the coarse width are not downscaled."""
+        assert detect_board_multiscale(synthetic_board) == detect_board(synthetic_board)
+
+    def test_returns_none_for_bright_image(self) -> None:
+        bright = np.full((2160, 3840, 3), (200, 200, 200), dtype=np.uint8)
+        assert detect_board_multiscale(bright) is None
+
+    def test_detect_board_flag(self) -> None:
+        """detect_board(multiscale=True) delegates to the coarse-to-fine path."""
+        image = render_board(3840, 2160)
+        assert detect_board(image, multiscale=True) == detect_board_multiscale(image)
+
+
 class TestCropBoard:
     def test_crop_returns_subimage(self, synthetic_board: BGRImage) -> None:
         box = BoundingBox(x=10, y=20, width=100, height=50)
@@ -1,26 +1,94 @@
 """Tests for data extraction (vision.extract module)."""
 
 import shutil
+import threading
 
 import cv2
 import numpy as np
 import pytest
 
 from zora.capture import BGRImage
+from zora.synthetic import draw_assignment_card, render_field
+from zora.vision import BoundingBox
 from zora.vision.extract import (
+    FIELD_EFFORTS,
+    TESSERACT_DIGITS_CONFIG,
+    TESSERACT_DURATION_CONFIG,
+    TESSERACT_LINE_CONFIG,
+    FieldTimings,
+    OcrEffort,
+    PreprocessWorkspace,
     extract_assignment,
+    extract_assignment_fields,
+    ocr_field,
     ocr_number,
     ocr_text,
     parse_assignment_text,
     preprocess_for_ocr,
+    thread_workspace,
 )
+from zora.vision.ocr.fake import FakeEngine
+from zora.vision.ocr.tesseract import TesserocrEngine
+from zora.vision.regions import CardFieldRegions
+
+
+def _ocr_engine_available() -> bool:
+    """True if either the tesseract binary or in-process tesserocr works."""
+    if shutil.which("tesseract") is not None:
+        return True
+    try:
+        TesserocrEngine()
+    except (ImportError, RuntimeError):
+        return False
+    return True
+
 
 requires_tesseract = pytest.mark.skipif(
-    shutil.which("tesseract") is None,
-    reason="Tesseract OCR binary not installed",
+    not _ocr_engine_available(),
+    reason="No Tesseract engine (binary or tesserocr) installed",
 )
 
 
+class ScriptedEngine:
+    """An OCR engine stand-in answering by config and recording each call."""
+
+    name = "scripted"
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[int, ...], str]] = []
+
+    def image_to_string(self, image: np.ndarray, config: str) -> str:
+        self.calls.append((image.shape, config))
+        if config == TESSERACT_DIGITS_CONFIG:
+            return "7\n"
+        if config == TESSERACT_DURATION_CONFIG:
+            return "4h\n"
+        return "Patrol Sector 42\nEng: 30\n"
+
+
+class ConfidenceEngine:
+    """Answers image_to_data with one word at each call's confidence.
+
+    A confidence of None answers with no words at all.
+    """
+
+    name = "confidence"
+
+    def __init__(self, confidences: list[float | None]) -> None:
+        self.confidences = confidences
+        self.configs: list[str] = []
+
+    def image_to_string(self, image: np.ndarray, config: str) -> str:
+        raise AssertionError("fields must be read with image_to_data")
+
+    def image_to_data(self, image: np.ndarray, config: str) -> str:
+        confidence = self.confidences[len(self.configs)]
+        self.configs.append(config)
+        if confidence is None:
+            return ""
+        return f"5\t1\t1\t1\t1\t1\t0\t0\t9\t9\t{confidence}\tpass{len(self.configs)}"
+
+
 class TestPreprocessForOcr:
     def test_returns_binary_image(self) -> None:
         """Preprocessing produces a binary (black/white) image."""
@@ -38,6 +106,138 @@ class TestPreprocessForOcr:
         assert result.shape[1] > 50
 
 
+class TestOcrEffort:
+    def test_replaces_psm(self) -> None:
+        assert OcrEffort(psm=13).apply(TESSERACT_DIGITS_CONFIG) == (
+            "--oem 3 --psm 13 -c tessedit_char_whitelist=0123456789"
+        )
+        assert OcrEffort(psm=8).apply("--oem 1") == "--oem 1 --psm 8"
+        assert OcrEffort().apply(TESSERACT_LINE_CONFIG) == TESSERACT_LINE_CONFIG
+
+    def test_upscale(self) -> None:
+        image = np.full((30, 50, 3), 128, dtype=np.uint8)
+        cheap = preprocess_for_ocr(image, effort=OcrEffort(min_height=60, min_width=0))
+        large = preprocess_for_ocr(image, effort=OcrEffort(min_upscale=4.0))
+        assert cheap.shape == (60, 100)
+        assert large.shape == (120, 200)
+
+    def test_invert(self) -> None:
+        image = np.zeros((100, 200, 3), dtype=np.uint8)
+        image[40:60, 50:150] = 255
+        normal = preprocess_for_ocr(image)
+        inverted = preprocess_for_ocr(image, effort=OcrEffort(invert=True))
+        assert np.array_equal(inverted, 255 - normal)
+
+
+class TestOcrField:
+    def test_confident_first_pass_accepted(self) -> None:
+        engine = ConfidenceEngine([95.0])
+        image = np.zeros((20, 40, 3), dtype=np.uint8)
+        assert ocr_field(image, TESSERACT_LINE_CONFIG, engine) == ("pass1", 95.0)
+        assert len(engine.configs) == 1
+
+    def test_retries_until_confident(self) -> None:
+        """Later passes run only while confidence is low, up to the PSM change."""
+        engine = ConfidenceEngine([40.0, 60.0, 90.0, 99.0])
+        image = np.zeros((20, 40, 3), dtype=np.uint8)
+        assert ocr_field(image, TESSERACT_LINE_CONFIG, engine) == ("pass3", 90.0)
+        assert engine.configs[-1] == "--oem 3 --psm 13"
+
+    def test_most_confident_pass_when_none_is_confident(self) -> None:
+        engine = ConfidenceEngine([40.0, 70.0, 50.0, 10.0])
+        image = np.zeros((20, 40, 3), dtype=np.uint8)
+        assert ocr_field(image, TESSERACT_LINE_CONFIG, engine) == ("pass2", 70.0)
+        assert len(engine.configs) == len(FIELD_EFFORTS)
+
+    def test_nothing_read(self) -> None:
+        """A blank field is read once, not retried along every effort."""
+        engine = FakeEngine()
+        image = np.zeros((20, 40, 3), dtype=np.uint8)
+        text, confidence = ocr_field(image, TESSERACT_LINE_CONFIG, engine)
+        assert (text, confidence) == ("", 0.0)
+        assert len(engine.calls) == 1
+
+    def test_empty_small_upscale_pass_retried(self) -> None:
+        """Nothing read below the default upscale is low confidence, not blank."""
+        engine = ConfidenceEngine([None, 95.0])
+        image = np.zeros((20, 40, 3), dtype=np.uint8)
+        efforts = [OcrEffort(min_height=64, min_width=0, min_upscale=1.0), OcrEffort()]
+        text, confidence = ocr_field(
+            image, TESSERACT_LINE_CONFIG, engine, efforts=efforts
+        )
+        assert (text, confidence) == ("pass2", 95.0)
+
+    def test_blank_after_low_confidence_read(self) -> None:
+        engine = ConfidenceEngine([40.0, None])
+        image = np.zeros((20, 40, 3), dtype=np.uint8)
+        assert ocr_field(image, TESSERACT_LINE_CONFIG, engine) == ("pass1", 40.0)
+        assert len(engine.configs) == 2
+
+    @requires_tesseract
+    @pytest.mark.parametrize(
+        ("value", "scale"),
+        [
+            ("5", 0.5),
+            ("15", 0.5),
+            ("23", 0.5),
+            ("15", 0.6),
+            ("45", 0.6),
+            ("99", 0.6),
+            ("15", 0.7),
+            ("30", 0.7),
+            ("45", 0.7),
+        ],
+    )
+    def test_small_stat_fields(self, value: str, scale: float) -> None:
+        """Stats on cards drawn well below full size are read, not blank."""
+        text, _ = ocr_field(render_field(value, scale), TESSERACT_DIGITS_CONFIG)
+        assert text == value
+
+    def test_engine_without_confidences(self) -> None:
+        engine = ScriptedEngine()
+        image = np.zeros((20, 40, 3), dtype=np.uint8)
+        text, confidence = ocr_field(image, TESSERACT_DIGITS_CONFIG, engine)
+        assert (text, confidence) == ("7", None)
+        assert len(engine.calls) == 1
+
+
+class TestPreprocessWorkspace:
+    @pytest.mark.parametrize("shape", [(30, 50), (100, 200), (61, 333), (240, 120)])
+    def test_matches_allocating_path(self, shape: tuple[int, int]) -> None:
+        rng = np.random.default_rng(0)
+        image = rng.integers(0, 256, (*shape, 3), dtype=np.uint8)
+        workspace = PreprocessWorkspace()
+        expected = preprocess_for_ocr(image)
+        assert np.array_equal(preprocess_for_ocr(image, workspace), expected)
+
+    def test_reuses_buffers(self) -> None:
+        """Same-size and smaller crops are written into the same memory."""
+        workspace = PreprocessWorkspace()
+        first = preprocess_for_ocr(np.zeros((40, 80, 3), np.uint8), workspace)
+        allocations = workspace.allocations
+        second = preprocess_for_ocr(np.zeros((40, 80, 3), np.uint8), workspace)
+        smaller = preprocess_for_ocr(np.zeros((30, 60, 3), np.uint8), workspace)
+        assert workspace.allocations == allocations
+        assert np.shares_memory(first, second)
+        assert np.shares_memory(first, smaller)
+
+    def test_grows_for_larger_crops(self) -> None:
+        workspace = PreprocessWorkspace()
+        preprocess_for_ocr(np.zeros((40, 80, 3), np.uint8), workspace)
+        nbytes = workspace.nbytes
+        result = preprocess_for_ocr(np.zeros((400, 800, 3), np.uint8), workspace)
+        assert result.shape == (400, 800)
+        assert workspace.nbytes > nbytes
+
+    def test_one_workspace_per_thread(self) -> None:
+        assert thread_workspace() is thread_workspace()
+        other: list[PreprocessWorkspace] = []
+        thread = threading.Thread(target=lambda: other.append(thread_workspace()))
+        thread.start()
+        thread.join()
+        assert other[0] is not thread_workspace()
+
+
 class TestParseAssignmentText:
     def test_parses_complete_text(self) -> None:
         text = """Patrol Sector 42
@@ -184,3 +384,127 @@ class TestExtractAssignment:
         assert isinstance(assignment.engineering, int)
         assert isinstance(assignment.science, int)
         assert isinstance(assignment.tactical, int)
+
+
+class TestExtractAssignmentFields:
+    def test_stats_use_digit_path(self, single_card_image: BGRImage) -> None:
+        """Stats and slots are read through the digits-only config."""
+        engine = ScriptedEngine()
+        assignment = extract_assignment_fields(single_card_image, engine=engine)
+        configs = [config for _, config in engine.calls]
+        assert configs.count(TESSERACT_DIGITS_CONFIG) == 4
+        assert configs.count(TESSERACT_DURATION_CONFIG) == 1
+        assert len(configs) == 7
+        assert assignment.engineering == 7
+        assert assignment.ship_slots == 7
+        assert assignment.duration == "4h"
+
+    def test_sends_fewer_pixels_than_whole_card(
+        self, single_card_image: BGRImage
+    ) -> None:
+        """Field crops before upscaling are a fraction of the card."""
+        card_area = single_card_image.shape[0] * single_card_image.shape[1]
+        engine = ScriptedEngine()
+        extract_assignment_fields(single_card_image, engine=engine)
+        digit_shapes = [
+            shape for shape, config in engine.calls if config == TESSERACT_DIGITS_CONFIG
+        ]
+        # Upscaled crops are still smaller than an upscaled whole card would be
+        assert all(h * w < card_area * 4 for h, w in digit_shapes)
+
+    def test_reports_field_confidence(self, single_card_image: BGRImage) -> None:
+        engine = FakeEngine("Patrol", by_config={TESSERACT_DIGITS_CONFIG: "30"})
+        assignment = extract_assignment_fields(single_card_image, engine=engine)
+        assert assignment.engineering == 30
+        assert assignment.confidence["engineering"] == 100.0
+        assert set(assignment.confidence) == {
+            "name",
+            "engineering",
+            "science",
+            "tactical",
+            "ship_slots",
+            "duration",
+            "rarity",
+        }
+        # Every field was confident on the first pass
+        assert len(engine.calls) == 7
+        assert assignment.to_dict()["confidence"] == assignment.confidence
+
+    def test_single_default_effort(self, single_card_image: BGRImage) -> None:
+        """Passing one default effort reads every field exactly as ocr_text."""
+        engine = ConfidenceEngine([0.0] * 7)
+        extract_assignment_fields(
+            single_card_image, engine=engine, efforts=[OcrEffort()]
+        )
+        assert len(engine.configs) == 7
+
+    def test_given_regions_skip_locating(self) -> None:
+        """Known regions (from a layout profile) are read as they are."""
+        blank = np.full((200, 300, 3), (120, 110, 100), dtype=np.uint8)
+        regions = CardFieldRegions(
+            fields={
+                "name": BoundingBox(x=10, y=10, width=200, height=14),
+                "engineering": BoundingBox(x=40, y=40, width=60, height=14),
+            }
+        )
+        engine = FakeEngine("Patrol", by_config={TESSERACT_DIGITS_CONFIG: "30"})
+        assignment = extract_assignment_fields(blank, engine=engine, regions=regions)
+        assert (assignment.name, assignment.engineering) == ("Patrol", 30)
+        assert len(engine.calls) == 2
+
+    def test_falls_back_to_whole_card(self) -> None:
+        """A card that doesn't match the layout is read in one OCR call."""
+        card = np.full((200, 300, 3), (120, 110, 100), dtype=np.uint8)
+        cv2.putText(
+            card, "Patrol", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1
+        )
+        engine = ScriptedEngine()
+        timings = FieldTimings()
+        assignment = extract_assignment_fields(card, engine=engine, timings=timings)
+        assert len(engine.calls) == 1
+        assert assignment.name == "Patrol Sector 42"
+        assert assignment.engineering == 30
+        assert set(timings.calls) == {"locate", "card"}
+
+    def test_wrapped_title_falls_back_to_whole_card(self) -> None:
+        card = np.full((230, 300, 3), (120, 110, 100), dtype=np.uint8)
+        draw_assignment_card(card, 0, 0, 300, 230, name="Survey Anomalies\nof Vega")
+        engine = ScriptedEngine()
+        assignment = extract_assignment_fields(card, engine=engine)
+        assert len(engine.calls) == 1
+        assert assignment.engineering == 30
+
+    def test_records_per_field_timings(self, single_card_image: BGRImage) -> None:
+        timings = FieldTimings()
+        extract_assignment_fields(
+            single_card_image, engine=ScriptedEngine(), timings=timings
+        )
+        extract_assignment_fields(
+            single_card_image, engine=ScriptedEngine(), timings=timings
+        )
+        breakdown = timings.to_dict()
+        assert set(breakdown) == {
+            "locate",
+            "name",
+            "engineering",
+            "science",
+            "tactical",
+            "ship_slots",
+            "duration",
+            "rarity",
+        }
+        assert all(entry["calls"] == 2 for entry in breakdown.values())
+
+    @requires_tesseract
+    def test_reads_synthetic_card(self, single_card_image: BGRImage) -> None:
+        """With a real engine, every field of the synthetic card is read."""
+        assignment = extract_assignment_fields(single_card_image)
+        assert assignment.name == "Patrol Sector 42"
+        assert (assignment.engineering, assignment.science, assignment.tactical) == (
+            30,
+            20,
+            15,
+        )
+        assert assignment.ship_slots == 2
+        assert assignment.duration == "4h"
+        assert assignment.rarity == "Common"
@@ -0,0 +1,109 @@
+"""Tests for shared per-frame planes (vision.frame module)."""
+
+import pickle
+
+import cv2
+import numpy as np
+import pytest
+
+from zora.capture import BGRImage
+from zora.synthetic import render_board
+from zora.vision import BoundingBox
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.extract import extract_assignment_fields
+from zora.vision.frame import FrameContext, as_frame
+from zora.vision.ocr.fake import FakeEngine
+from zora.vision.regions import (
+    CARD_BG_LOWER,
+    CARD_BG_UPPER,
+    crop_region,
+    find_assignment_cards,
+    locate_card_fields,
+)
+
+BOX = BoundingBox(x=10, y=20, width=60, height=40)
+
+
+@pytest.fixture
+def image() -> BGRImage:
+    return np.random.default_rng(0).integers(0, 256, (120, 160, 3), dtype=np.uint8)
+
+
+class TestFrameContext:
+    def test_planes_are_lazy_and_computed_once(self, image: BGRImage) -> None:
+        frame = FrameContext(image)
+        assert frame.stats.converted == 0
+        assert np.array_equal(frame.hsv, cv2.cvtColor(image, cv2.COLOR_BGR2HSV))
+        assert frame.hsv is frame.hsv
+        assert np.array_equal(frame.gray, cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))
+        assert frame.stats.conversions == {"hsv": 1, "gray": 1}
+        assert frame.stats.reused == 2
+
+    def test_mask_per_range(self, image: BGRImage) -> None:
+        frame = FrameContext(image)
+        mask = frame.mask(CARD_BG_LOWER, CARD_BG_UPPER)
+        expected = cv2.inRange(
+            cv2.cvtColor(image, cv2.COLOR_BGR2HSV), CARD_BG_LOWER, CARD_BG_UPPER
+        )
+        assert np.array_equal(mask, expected)
+        assert frame.mask(CARD_BG_LOWER, CARD_BG_UPPER) is mask
+        assert frame.stats.conversions == {"hsv": 1, "mask": 1}
+
+    def test_crop_views_computed_parent_plane(self, image: BGRImage) -> None:
+        frame = FrameContext(image)
+        hsv = frame.hsv
+        crop = frame.crop(BOX).crop(BoundingBox(x=5, y=5, width=20, height=10))
+        assert np.shares_memory(crop.hsv, hsv)
+        assert np.array_equal(crop.hsv, hsv[25:35, 15:35])
+        assert frame.stats.conversions == {"hsv": 1}
+
+    def test_crop_converts_only_its_region(self, image: BGRImage) -> None:
+        """Without a parent plane, a crop converts itself, not the frame."""
+        frame = FrameContext(image)
+        crop = frame.crop(BOX)
+        expected = cv2.cvtColor(crop_region(image, BOX), cv2.COLOR_BGR2GRAY)
+        assert np.array_equal(crop.gray, expected)
+        assert not frame.computed("gray")
+        assert frame.stats.conversions == {"gray": 1}
+
+    def test_pickles_as_standalone_frame(self, image: BGRImage) -> None:
+        frame = FrameContext(image)
+        original = frame.crop(BOX)
+        original.gray
+        crop = pickle.loads(pickle.dumps(original))
+        assert np.array_equal(crop.image, crop_region(image, BOX))
+        assert np.array_equal(crop.gray, crop_region(frame.gray, BOX))
+        assert crop.stats.converted == 0
+
+    def test_as_frame(self, image: BGRImage) -> None:
+        frame = FrameContext(image)
+        assert as_frame(frame) is frame
+        assert as_frame(image).image is image
+
+
+class TestSharedStages:
+    def test_cards_reuse_detection_planes(self) -> None:
+        image = render_board(1280, 720, 4)
+        frame = FrameContext(image)
+        box = detect_board(frame)
+        assert box == detect_board(image)
+        board = frame.crop(box)
+        assert find_assignment_cards(board) == find_assignment_cards(
+            crop_board(image, box)
+        )
+        # One HSV conversion, and the board mask made from it
+        assert frame.stats.conversions == {"hsv": 1, "mask": 1}
+
+    def test_card_converted_once_for_all_fields(self) -> None:
+        image = render_board(1280, 720, 1, desktop=False)
+        box = find_assignment_cards(image)[0]
+        card = FrameContext(image).crop(box)
+        assert locate_card_fields(card) == locate_card_fields(crop_region(image, box))
+
+        engine = FakeEngine("7")
+        extract_assignment_fields(card, engine=engine)
+        assert card.stats.conversions == {"gray": 1}
+
+        expected = FakeEngine("7")
+        extract_assignment_fields(crop_region(image, box), engine=expected)
+        assert engine.calls == expected.calls
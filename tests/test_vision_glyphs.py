@@ -0,0 +1,153 @@
+"""Tests for the template-matching glyph recognizer (vision.glyphs module)."""
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from zora.capture import BGRImage
+from zora.synthetic import draw_assignment_card, render_field
+from zora.vision.extract import (
+    TESSERACT_DIGITS_CONFIG,
+    TESSERACT_DURATION_CONFIG,
+    extract_assignment_fields,
+    ocr_number,
+)
+from zora.vision.glyphs import GlyphBank, segment_glyphs
+from zora.vision.ocr.fake import FakeEngine
+
+# Enough values to show every digit plus the duration units
+TRAINING_TEXTS = ["1234", "5678", "90", "12h", "30m"]
+
+
+@pytest.fixture(scope="module")
+def bank() -> GlyphBank:
+    return GlyphBank.from_samples(
+        (render_field(text, scale), text)
+        for scale in (1.0, 1.5)
+        for text in TRAINING_TEXTS
+    )
+
+
+class FailingEngine:
+    """An OCR engine that must not be reached."""
+
+    name = "failing"
+
+    def image_to_string(self, image: np.ndarray, config: str) -> str:
+        raise AssertionError(f"engine called with {config!r}")
+
+
+class TestSegmentGlyphs:
+    def test_one_box_per_character(self) -> None:
+        boxes = segment_glyphs(render_field("4507"))
+        assert len(boxes) == 4
+        assert [b.x for b in boxes] == sorted(b.x for b in boxes)
+
+    def test_colon_dots_merge(self) -> None:
+        """The two dots of a colon overlap horizontally and form one glyph."""
+        assert len(segment_glyphs(render_field("1:2", scale=2.0))) == 3
+
+    def test_blank_crop(self) -> None:
+        blank = np.full((30, 60, 3), (120, 110, 100), dtype=np.uint8)
+        assert segment_glyphs(blank) == []
+
+
+class TestGlyphBank:
+    def test_alphabet(self, bank: GlyphBank) -> None:
+        assert bank.alphabet == "0123456789hm"
+
+    @pytest.mark.parametrize("value", [0, 7, 15, 30, 45, 2048, 96])
+    def test_reads_unseen_numbers(self, bank: GlyphBank, value: int) -> None:
+        assert bank.read_number(render_field(str(value))) == value
+
+    def test_reads_duration(self, bank: GlyphBank) -> None:
+        assert bank.read(render_field("4h", scale=1.5)) == "4h"
+
+    def test_rejects_unknown_glyphs(self, bank: GlyphBank) -> None:
+        """Letters the bank has never seen don't match confidently."""
+        assert bank.read(render_field("XK")) is None
+        assert bank.read_number(render_field("XK")) is None
+
+    def test_non_numeric_reading_is_not_a_number(self, bank: GlyphBank) -> None:
+        assert bank.read_number(render_field("4h")) is None
+
+    def test_mismatched_samples_skipped(self) -> None:
+        bank = GlyphBank.from_samples(
+            [(render_field("12"), "12"), (render_field("34"), "345")]
+        )
+        assert bank.alphabet == "12"
+
+    def test_no_usable_samples(self) -> None:
+        with pytest.raises(ValueError):
+            GlyphBank.from_samples([(render_field("12"), "1")])
+
+    def test_save_load_roundtrip(self, bank: GlyphBank, tmp_path: Path) -> None:
+        path = tmp_path / "bank.glyphs"
+        bank.save(path)
+        loaded = GlyphBank.load(path)
+        assert loaded.alphabet == bank.alphabet
+        np.testing.assert_array_equal(loaded.templates, bank.templates)
+        assert loaded.read_number(render_field("83")) == 83
+
+    def test_from_directory_uses_file_names(self, tmp_path: Path) -> None:
+        cv2.imwrite(str(tmp_path / "12.png"), render_field("12"))
+        cv2.imwrite(str(tmp_path / "12_b.png"), render_field("12", scale=1.5))
+        cv2.imwrite(str(tmp_path / "30m.png"), render_field("30m"))
+        (tmp_path / "notes.txt").write_text("not an image")
+        assert GlyphBank.from_directory(tmp_path).alphabet == "0123m"
+
+
+class TestGlyphExtraction:
+    def test_ocr_number_skips_engine(self, bank: GlyphBank) -> None:
+        image = render_field("42")
+        assert ocr_number(image, engine=FailingEngine(), glyphs=bank) == 42
+
+    def test_ocr_number_falls_back_when_unsure(self, bank: GlyphBank) -> None:
+        class DigitsEngine:
+            name = "digits"
+
+            def image_to_string(self, image: np.ndarray, config: str) -> str:
+                assert config == TESSERACT_DIGITS_CONFIG
+                return "17"
+
+        assert ocr_number(render_field("XK"), engine=DigitsEngine(), glyphs=bank) == 17
+
+    def test_fields_read_without_engine(
+        self, bank: GlyphBank, single_card_image: BGRImage
+    ) -> None:
+        """Only the title and rarity lines still go to the OCR engine."""
+
+        class TextEngine:
+            name = "text"
+
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def image_to_string(self, image: np.ndarray, config: str) -> str:
+                self.calls += 1
+                return "Common"
+
+        engine = TextEngine()
+        assignment = extract_assignment_fields(
+            single_card_image, engine=engine, glyphs=bank
+        )
+        assert engine.calls == 2
+        assert (assignment.engineering, assignment.science, assignment.tactical) == (
+            30,
+            20,
+            15,
+        )
+        assert assignment.ship_slots == 2
+        assert assignment.duration == "4h"
+
+    def test_duration_same_from_either_reader(self, bank: GlyphBank) -> None:
+        """Glyph reads drop the space Tesseract keeps; both come out alike."""
+        card = np.full((200, 300, 3), (120, 110, 100), dtype=np.uint8)
+        draw_assignment_card(card, 0, 0, 300, 200, duration="1h 30m")
+        engine = FakeEngine("Common", by_config={TESSERACT_DURATION_CONFIG: "1h30m"})
+        by_glyphs = extract_assignment_fields(card, engine=engine, glyphs=bank)
+        assert all(config != TESSERACT_DURATION_CONFIG for _, config in engine.calls)
+        by_engine = extract_assignment_fields(card, engine=engine)
+        assert by_glyphs.duration == by_engine.duration == "1h 30m"
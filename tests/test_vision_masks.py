@@ -0,0 +1,113 @@
+"""Tests for the colour mask engines (vision.masks module)."""
+
+import numpy as np
+import pytest
+
+from zora.capture import BGRImage
+from zora.pipeline import read_board_from_image
+from zora.synthetic import render_board
+from zora.vision.detect import BOARD_BG_LOWER, BOARD_BG_UPPER, detect_board
+from zora.vision.frame import FrameContext
+from zora.vision.masks import (
+    LUT_STRIP_ROWS,
+    chroma_lut,
+    color_masks,
+    hsv_masks,
+    lut_masks,
+)
+from zora.vision.ocr.fake import FakeEngine
+from zora.vision.regions import (
+    CARD_BG_LOWER,
+    CARD_BG_UPPER,
+    CARD_CONTENT_UPPER,
+    find_cards_by_contours,
+    find_cards_by_grid,
+)
+from zora.vision.track import BoardTracker
+
+RANGES = [
+    (BOARD_BG_LOWER, BOARD_BG_UPPER),
+    (CARD_BG_LOWER, CARD_BG_UPPER),
+    (CARD_BG_LOWER, CARD_CONTENT_UPPER),
+    # A saturation floor, and a range reaching chroma 255
+    (np.array([0, 50, 0], np.uint8), np.array([179, 255, 255], np.uint8)),
+]
+
+
+@pytest.fixture(scope="module")
+def every_color() -> BGRImage:
+    """All 2^24 BGR colours, as a 4096x4096 image."""
+    colors = np.arange(1 << 24, dtype=np.uint32)
+    pixels = np.stack([colors & 255, (colors >> 8) & 255, colors >> 16], axis=-1)
+    return pixels.astype(np.uint8).reshape(4096, 4096, 3)
+
+
+class TestLutMasks:
+    def test_matches_hsv_for_every_color(self, every_color: BGRImage) -> None:
+        for lut, hsv in zip(
+            lut_masks(every_color, RANGES), hsv_masks(every_color, RANGES)
+        ):
+            assert np.array_equal(lut, hsv)
+
+    @pytest.mark.parametrize(
+        "shape", [(1, 1), (LUT_STRIP_ROWS + 1, 7), (3 * LUT_STRIP_ROWS - 5, 33)]
+    )
+    def test_odd_sizes(self, shape: tuple[int, int]) -> None:
+        image = np.random.default_rng(0).integers(0, 256, (*shape, 3), np.uint8)
+        for lut, hsv in zip(lut_masks(image, RANGES), hsv_masks(image, RANGES)):
+            assert lut.shape == shape
+            assert np.array_equal(lut, hsv)
+
+    def test_views_classified(self) -> None:
+        image = render_board(640, 360, 2)[10:200, 20:300]
+        assert np.array_equal(
+            lut_masks(image, RANGES[:1])[0], hsv_masks(image, RANGES[:1])[0]
+        )
+
+    def test_partial_hue_range_rejected(self) -> None:
+        with pytest.raises(ValueError, match="hue"):
+            chroma_lut(np.array([10, 0, 0], np.uint8), BOARD_BG_UPPER)
+
+    def test_unknown_engine_rejected(self) -> None:
+        image = np.zeros((4, 4, 3), np.uint8)
+        with pytest.raises(ValueError, match="mask engine"):
+            color_masks(image, RANGES, engine="gpu")
+        with pytest.raises(ValueError, match="mask engine"):
+            FrameContext(image, mask_engine="gpu")
+
+
+class TestLutEngine:
+    def test_frame_masks_skip_hsv(self) -> None:
+        image = render_board(1280, 720, 4)
+        frame = FrameContext(image, mask_engine="lut")
+        mask = frame.mask(CARD_BG_LOWER, CARD_BG_UPPER)
+        assert np.array_equal(
+            mask, FrameContext(image).mask(CARD_BG_LOWER, CARD_BG_UPPER)
+        )
+        assert frame.stats.conversions == {"mask": 1}
+        assert frame.crop(detect_board(image)).mask_engine == "lut"
+
+    def test_detection_matches(self) -> None:
+        image = render_board(2560, 1440, 6)
+        hsv, lut = FrameContext(image), FrameContext(image, mask_engine="lut")
+        assert detect_board(lut) == detect_board(hsv)
+        assert detect_board(lut, multiscale=True) == detect_board(hsv, multiscale=True)
+        assert BoardTracker().locate(lut) == detect_board(image)
+        assert not lut.computed("hsv")
+
+        board = lut.crop(detect_board(image))
+        assert find_cards_by_grid(board) == find_cards_by_grid(board.image)
+        assert find_cards_by_contours(board) == find_cards_by_contours(board.image)
+        assert not board.computed("hsv")
+
+    def test_pipeline_matches(self) -> None:
+        image = render_board(1280, 720, 4)
+        expected = read_board_from_image(image, engine=FakeEngine("7"))
+        for share_planes in (True, False):
+            board = read_board_from_image(
+                image,
+                engine=FakeEngine("7"),
+                mask_engine="lut",
+                share_planes=share_planes,
+            )
+            assert board.to_dict() == expected.to_dict()
@@ -0,0 +1,401 @@
+"""Tests for OCR engines (vision.ocr package)."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from zora.vision import BoundingBox
+from zora.vision.extract import TESSERACT_CONFIG, TESSERACT_DIGITS_CONFIG
+from zora.vision.ocr import (
+    OcrWord,
+    check_engine,
+    create_engine,
+    engine_names,
+    get_default_engine,
+    get_engine,
+    parse_tsv,
+    register_engine,
+    resolve_engine,
+    set_default_engine,
+    words_to_tsv,
+)
+from zora.vision.ocr.fake import FakeEngine
+from zora.vision.ocr.tesseract import (
+    PytesseractEngine,
+    TesseractConfig,
+    TesserocrEngine,
+    parse_tesseract_config,
+)
+
+
+def _fake_tesserocr(languages: list[str] | None = None) -> MagicMock:
+    """A stand-in ``tesserocr`` module whose API handles are MagicMocks."""
+    module = MagicMock()
+    module.get_languages.return_value = ("/tessdata/", languages or ["eng"])
+
+    def make_api(**kwargs: object) -> MagicMock:
+        api = MagicMock()
+        api.init_kwargs = kwargs
+        api.GetUTF8Text.return_value = "text\n"
+        api.GetVariableAsString.return_value = ""
+        return api
+
+    module.PyTessBaseAPI.side_effect = make_api
+    return module
+
+
+def _in_process_ocr_available() -> bool:
+    try:
+        TesserocrEngine()
+    except (ImportError, RuntimeError):
+        return False
+    return True
+
+
+requires_tesserocr = pytest.mark.skipif(
+    not _in_process_ocr_available(),
+    reason="tesserocr or its language data not installed",
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_default_engine():
+    yield
+    set_default_engine(None)
+
+
+class TestParseTesseractConfig:
+    def test_empty_config_uses_cli_defaults(self) -> None:
+        assert parse_tesseract_config("") == TesseractConfig(oem=3, psm=3, lang="eng")
+
+    def test_block_text_config(self) -> None:
+        config = parse_tesseract_config(TESSERACT_CONFIG)
+        assert config.oem == 3
+        assert config.psm == 6
+        assert config.variables == ()
+
+    def test_digits_config_variables(self) -> None:
+        config = parse_tesseract_config(TESSERACT_DIGITS_CONFIG)
+        assert config.psm == 7
+        assert config.variables == (("tessedit_char_whitelist", "0123456789"),)
+
+    def test_language(self) -> None:
+        assert parse_tesseract_config("-l deu --psm 7").lang == "deu"
+
+    def test_unsupported_option_raises(self) -> None:
+        with pytest.raises(ValueError):
+            parse_tesseract_config("--psm 6 --dpi 300")
+
+    def test_missing_value_raises(self) -> None:
+        with pytest.raises(ValueError):
+            parse_tesseract_config("--psm")
+
+
+# image_to_data output for "Eng: 30" on one line, with pytesseract's header
+SAMPLE_TSV = "\n".join(
+    [
+        "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\t"
+        "left\ttop\twidth\theight\tconf\ttext",
+        "1\t1\t0\t0\t0\t0\t0\t0\t200\t40\t-1\t",
+        "4\t1\t1\t1\t1\t0\t10\t5\t90\t20\t-1\t",
+        "5\t1\t1\t1\t1\t1\t10\t5\t40\t20\t91.5\tEng:",
+        "5\t1\t1\t1\t1\t2\t60\t5\t30\t20\t88.0\t30",
+        "5\t1\t1\t1\t1\t3\t95\t5\t4\t20\t0.0\t ",
+    ]
+)
+
+
+class TestParseTsv:
+    def test_words_only(self) -> None:
+        """Only word rows with text are returned, header and blanks skipped."""
+        words = parse_tsv(SAMPLE_TSV)
+        assert [w.text for w in words] == ["Eng:", "30"]
+        assert words[1].box == BoundingBox(x=60, y=5, width=30, height=20)
+        assert words[0].confidence == 91.5
+        assert words[0].line == words[1].line == (1, 1, 1)
+
+    def test_headerless(self) -> None:
+        """tesserocr's GetTSVText output has no header row."""
+        body = SAMPLE_TSV.split("\n", 1)[1]
+        assert parse_tsv(body) == parse_tsv(SAMPLE_TSV)
+
+    def test_empty(self) -> None:
+        assert parse_tsv("") == []
+
+    def test_words_to_tsv_round_trips(self) -> None:
+        words = parse_tsv(SAMPLE_TSV)
+        assert parse_tsv(words_to_tsv(words)) == words
+
+    def test_words_to_tsv_empty(self) -> None:
+        assert words_to_tsv([]) == ""
+
+
+class TestPytesseractEngine:
+    def test_delegates_to_pytesseract(self) -> None:
+        image = np.zeros((10, 10), dtype=np.uint8)
+        with patch(
+            "zora.vision.ocr.tesseract.pytesseract.image_to_string",
+            return_value="hi",
+        ) as call:
+            assert PytesseractEngine().image_to_string(image, "--psm 7") == "hi"
+        call.assert_called_once_with(image, config="--psm 7")
+
+    def test_image_to_data_delegates(self) -> None:
+        image = np.zeros((10, 10), dtype=np.uint8)
+        with patch(
+            "zora.vision.ocr.tesseract.pytesseract.image_to_data",
+            return_value=SAMPLE_TSV,
+        ) as call:
+            assert PytesseractEngine().image_to_data(image, "--psm 6") == SAMPLE_TSV
+        call.assert_called_once_with(image, config="--psm 6")
+
+
+class TestTesserocrEngine:
+    def test_handle_reused_across_calls(self) -> None:
+        """The engine is initialized once and reused for later calls."""
+        fake = _fake_tesserocr()
+        with patch.dict("sys.modules", {"tesserocr": fake}):
+            engine = TesserocrEngine()
+            image = np.zeros((20, 30), dtype=np.uint8)
+            for _ in range(3):
+                assert engine.image_to_string(image, TESSERACT_CONFIG) == "text\n"
+        assert fake.PyTessBaseAPI.call_count == 1
+
+    def test_one_handle_per_thread(self) -> None:
+        fake = _fake_tesserocr()
+        with patch.dict("sys.modules", {"tesserocr": fake}):
+            engine = TesserocrEngine()
+            image = np.zeros((20, 30), dtype=np.uint8)
+            engine.image_to_string(image, TESSERACT_CONFIG)
+            worker = threading.Thread(
+                target=engine.image_to_string, args=(image, TESSERACT_CONFIG)
+            )
+            worker.start()
+            worker.join()
+            engine.image_to_string(image, TESSERACT_CONFIG)
+        assert fake.PyTessBaseAPI.call_count == 2
+
+    def test_sets_psm_and_image_bytes(self) -> None:
+        fake = _fake_tesserocr()
+        with patch.dict("sys.modules", {"tesserocr": fake}):
+            engine = TesserocrEngine()
+            image = np.zeros((20, 30), dtype=np.uint8)
+            engine.image_to_string(image, TESSERACT_DIGITS_CONFIG)
+        api = fake.PyTessBaseAPI.call_args_list[0]
+        assert api.kwargs == {"lang": "eng", "oem": 3}
+        handle = engine._local.handles[("eng", 3)].api
+        handle.SetPageSegMode.assert_called_with(7)
+        handle.SetImageBytes.assert_called_once_with(image.tobytes(), 30, 20, 1, 30)
+
+    def test_image_to_data_returns_tsv(self) -> None:
+        fake = _fake_tesserocr()
+        with patch.dict("sys.modules", {"tesserocr": fake}):
+            engine = TesserocrEngine()
+            image = np.zeros((20, 30), dtype=np.uint8)
+            engine.image_to_string(image, TESSERACT_CONFIG)
+            handle = engine._local.handles[("eng", 3)].api
+            handle.GetTSVText.return_value = SAMPLE_TSV
+            assert engine.image_to_data(image, TESSERACT_CONFIG) == SAMPLE_TSV
+        handle.GetTSVText.assert_called_once_with(0)
+
+    def test_color_images_passed_as_rgb(self) -> None:
+        fake = _fake_tesserocr()
+        with patch.dict("sys.modules", {"tesserocr": fake}):
+            engine = TesserocrEngine()
+            image = np.zeros((2, 3, 3), dtype=np.uint8)
+            image[:, :, 0] = 255  # blue
+            engine.image_to_string(image, TESSERACT_CONFIG)
+        handle = engine._local.handles[("eng", 3)].api
+        data, width, height, channels, stride = handle.SetImageBytes.call_args.args
+        assert (width, height, channels, stride) == (3, 2, 3, 9)
+        assert data[:3] == bytes([0, 0, 255])
+
+    def test_variables_restored_between_configs(self) -> None:
+        """A digits whitelist doesn't leak into a later block-text call."""
+        fake = _fake_tesserocr()
+        with patch.dict("sys.modules", {"tesserocr": fake}):
+            engine = TesserocrEngine()
+            image = np.zeros((20, 30), dtype=np.uint8)
+            engine.image_to_string(image, TESSERACT_DIGITS_CONFIG)
+            engine.image_to_string(image, TESSERACT_CONFIG)
+        handle = engine._local.handles[("eng", 3)].api
+        assert handle.SetVariable.call_args_list[-1].args == (
+            "tessedit_char_whitelist",
+            "",
+        )
+
+    def test_missing_language_data_raises(self) -> None:
+        with patch.dict("sys.modules", {"tesserocr": _fake_tesserocr(["osd"])}):
+            with pytest.raises(RuntimeError):
+                TesserocrEngine()
+
+    def test_probe_creates_no_handle(self) -> None:
+        fake = _fake_tesserocr()
+        with patch.dict("sys.modules", {"tesserocr": fake}):
+            TesserocrEngine.probe()
+        fake.PyTessBaseAPI.assert_not_called()
+
+    def test_probe_missing_language_data_raises(self) -> None:
+        with patch.dict("sys.modules", {"tesserocr": _fake_tesserocr(["osd"])}):
+            with pytest.raises(RuntimeError):
+                TesserocrEngine.probe()
+
+    def test_close_ends_handles(self) -> None:
+        fake = _fake_tesserocr()
+        with patch.dict("sys.modules", {"tesserocr": fake}):
+            engine = TesserocrEngine()
+            engine.image_to_string(np.zeros((5, 5), dtype=np.uint8), "")
+            handle = engine._local.handles[("eng", 3)].api
+            engine.close()
+        handle.End.assert_called_once()
+
+    @requires_tesserocr
+    def test_reads_clear_text(self) -> None:
+        image = np.full((60, 300), 255, dtype=np.uint8)
+        cv2.putText(image, "Hello 42", (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, 0, 2)
+        text = TesserocrEngine().image_to_string(image, "--psm 7")
+        assert "Hello" in text
+
+
+class TestDefaultEngine:
+    def test_falls_back_to_pytesseract(self) -> None:
+        set_default_engine(None)
+        with patch.dict("sys.modules", {"tesserocr": None}):
+            assert isinstance(get_default_engine(), PytesseractEngine)
+
+    def test_prefers_in_process_engine(self) -> None:
+        set_default_engine(None)
+        with patch.dict("sys.modules", {"tesserocr": _fake_tesserocr()}):
+            assert isinstance(get_default_engine(), TesserocrEngine)
+
+    def test_default_is_cached(self) -> None:
+        set_default_engine(None)
+        assert get_default_engine() is get_default_engine()
+
+    def test_set_default_engine(self) -> None:
+        engine = PytesseractEngine()
+        set_default_engine(engine)
+        assert get_default_engine() is engine
+
+
+@pytest.fixture
+def registry():
+    """Undo registrations and forget engines created during a test."""
+    with (
+        patch.dict("zora.vision.ocr._factories"),
+        patch.dict("zora.vision.ocr._engines", clear=True),
+    ):
+        yield
+
+
+@pytest.mark.usefixtures("registry")
+class TestEngineRegistry:
+    def test_builtin_names(self) -> None:
+        names = engine_names()
+        assert {"tesserocr", "pytesseract", "easyocr", "fake"} <= set(names)
+        assert names[-1] == "auto"
+
+    def test_get_engine_is_shared(self) -> None:
+        engine = get_engine("fake")
+        assert isinstance(engine, FakeEngine)
+        assert get_engine("fake") is engine
+        assert create_engine("fake") is not engine
+
+    def test_auto_is_default_engine(self) -> None:
+        engine = FakeEngine()
+        set_default_engine(engine)
+        assert get_engine("auto") is engine
+
+    def test_unknown_name(self) -> None:
+        with pytest.raises(ValueError, match="Unknown OCR engine"):
+            get_engine("nonesuch")
+
+    def test_register_factory(self) -> None:
+        engine = FakeEngine("hello")
+        register_engine("mine", lambda: engine)
+        assert get_engine("mine") is engine
+        assert "mine" in engine_names()
+
+    def test_register_replaces_created_engine(self) -> None:
+        first = get_engine("fake")
+        register_engine("fake", lambda: FakeEngine("new"))
+        assert get_engine("fake") is not first
+
+    def test_auto_is_reserved(self) -> None:
+        with pytest.raises(ValueError):
+            register_engine("auto", FakeEngine)
+
+    def test_import_path_is_lazy(self) -> None:
+        """A registered path is only imported when the engine is requested."""
+        register_engine("missing", "zora.no_such_module:Engine")
+        with pytest.raises(ImportError):
+            get_engine("missing")
+
+    def test_uninstalled_engine_raises_import_error(self) -> None:
+        with patch.dict("sys.modules", {"easyocr": None}):
+            with pytest.raises(ImportError):
+                get_engine("easyocr")
+
+    def test_check_engine_probes_without_creating(self) -> None:
+        created: list[FakeEngine] = []
+
+        class Probed(FakeEngine):
+            probed = 0
+
+            def __init__(self) -> None:
+                super().__init__()
+                created.append(self)
+
+            @classmethod
+            def probe(cls) -> None:
+                cls.probed += 1
+
+        register_engine("probed", Probed)
+        check_engine("probed")
+        assert Probed.probed == 1
+        assert created == []
+
+    def test_check_engine_creates_engine_without_probe(self) -> None:
+        engine = FakeEngine()
+        register_engine("mine", lambda: engine)
+        check_engine("mine")
+        assert get_engine("mine") is engine
+
+    def test_check_uninstalled_engine_raises_import_error(self) -> None:
+        with patch.dict("sys.modules", {"easyocr": None}):
+            with pytest.raises(ImportError):
+                check_engine("easyocr")
+
+    def test_check_unknown_name(self) -> None:
+        with pytest.raises(ValueError, match="Unknown OCR engine"):
+            check_engine("nonesuch")
+
+    def test_resolve_engine(self) -> None:
+        engine = FakeEngine()
+        assert resolve_engine(engine) is engine
+        assert resolve_engine(None) is None
+        assert resolve_engine("fake") is get_engine("fake")
+
+
+class TestFakeEngine:
+    def test_answers_by_config(self) -> None:
+        engine = FakeEngine("card", by_config={TESSERACT_DIGITS_CONFIG: "7"})
+        image = np.zeros((20, 40), dtype=np.uint8)
+        assert engine.image_to_string(image, TESSERACT_DIGITS_CONFIG) == "7"
+        assert engine.image_to_string(image, TESSERACT_CONFIG) == "card"
+        assert engine.calls == [
+            ((20, 40), TESSERACT_DIGITS_CONFIG),
+            ((20, 40), TESSERACT_CONFIG),
+        ]
+
+    def test_image_to_data_lays_out_lines(self) -> None:
+        engine = FakeEngine("Eng: 30\n\nRare")
+        words = parse_tsv(engine.image_to_data(np.zeros((100, 200)), ""))
+        assert [w.text for w in words] == ["Eng:", "30", "Rare"]
+        assert [w.line for w in words] == [(1, 1, 1), (1, 1, 1), (1, 1, 2)]
+        assert words[1].box.x == 100
+        assert words[2].box.y == 50
+        assert all(isinstance(w, OcrWord) for w in words)
@@ -0,0 +1,191 @@
+"""Tests for the OCR text parser (vision.parse module)."""
+
+import random
+import re
+from collections.abc import Iterator
+
+import pytest
+
+from zora.vision.parse import normalize_duration, parse_assignment_text, parse_many
+
+
+def _reference_parse(raw_text: str) -> dict:
+    """The parser before it was compiled, kept verbatim for parity tests."""
+    lines = [line.strip() for line in raw_text.splitlines() if line.strip()]
+    result: dict = {
+        "name": "",
+        "engineering": 0,
+        "science": 0,
+        "tactical": 0,
+        "ship_slots": 0,
+        "duration": "",
+        "rarity": "",
+        "event_rewards": [],
+    }
+    if not lines:
+        return result
+    result["name"] = lines[0]
+    full_text = raw_text.lower()
+    eng_match = re.search(r"(?:eng(?:ineering)?)\s*[:\-]?\s*(\d+)", full_text)
+    if eng_match:
+        result["engineering"] = int(eng_match.group(1))
+    sci_match = re.search(r"(?:sci(?:ence)?)\s*[:\-]?\s*(\d+)", full_text)
+    if sci_match:
+        result["science"] = int(sci_match.group(1))
+    tac_match = re.search(r"(?:tac(?:tical)?)\s*[:\-]?\s*(\d+)", full_text)
+    if tac_match:
+        result["tactical"] = int(tac_match.group(1))
+    slots_match = re.search(r"(?:slots?|ships?)\s*[:\-]?\s*(\d+)", full_text)
+    if slots_match:
+        result["ship_slots"] = int(slots_match.group(1))
+    dur_match = re.search(
+        r"(\d+\s*h(?:ours?)?(?:\s*\d+\s*m(?:in)?)?|\d+\s*m(?:in)?)", full_text
+    )
+    if dur_match:
+        result["duration"] = dur_match.group(1).strip()
+    for rarity in ("epic", "very rare", "rare", "uncommon", "common"):
+        if rarity in full_text:
+            result["rarity"] = rarity.title()
+            break
+    rewards: list[str] = []
+    reward_line_pat = re.compile(
+        r"(?:event\s*rewards?|rewards?)\s*[:\-]\s*(.+)", re.IGNORECASE
+    )
+    reward_item_pat = re.compile(
+        r"(\d+[x×]?\s*(?:dilithium|dil|marks?|xp|experience|ec|energy credits"
+        r"|fleet credits|admiralty xp|campaign xp|tour of duty|"
+        r"r&d materials?|reputation marks?))",
+        re.IGNORECASE,
+    )
+    for line in lines:
+        line_match = reward_line_pat.search(line)
+        if line_match:
+            reward_text = line_match.group(1).strip()
+            for part in re.split(r"[,;]", reward_text):
+                part = part.strip()
+                if part:
+                    rewards.append(part)
+        else:
+            for item_match in reward_item_pat.finditer(line):
+                rewards.append(item_match.group(1).strip())
+    result["event_rewards"] = rewards
+    return result
+
+
+# Fragments that exercise every pattern, including overlaps, odd spacing
+# and non-ASCII text where case folding and digit classes differ
+FRAGMENTS = [
+    "Patrol Sector 42",
+    "Eng: 30",
+    "ENGINEERING 12",
+    "engineeringx 5",
+    "Sci:",
+    "20",
+    "Science - 7",
+    "Tac 15",
+    "Tactical:\n9",
+    "Slots: 2",
+    "ships 3",
+    "Duration: 4h",
+    "1h 30m",
+    "6 hours",
+    "45 min",
+    "4 hoursci 5",
+    "500 marks",
+    "2x Dilithium",
+    "100 EC",
+    "Event Rewards: 50 Marks, 1000 XP; Tour of Duty",
+    "reward - Fleet Credits",
+    "rarepic",
+    "Very Rare",
+    "uncommon",
+    "Common",
+    "١٢ h",
+    "5 dılithium",
+    "7 marK",
+    "\x1c",
+    "  ",
+    "",
+    "\t",
+    "\r\n",
+    "×",
+    "Ship Slots 4",
+]
+
+
+def _random_text(rng: random.Random) -> str:
+    parts = rng.choices(FRAGMENTS, k=rng.randint(0, 9))
+    return "".join(part + rng.choice(["\n", " ", "", "\n\n", "\r\n"]) for part in parts)
+
+
+class TestParity:
+    def test_matches_reference_on_fragments(self) -> None:
+        """Every fragment, alone and in random combinations, parses the same."""
+        rng = random.Random(0)
+        texts = FRAGMENTS + [_random_text(rng) for _ in range(3000)]
+        for text in texts:
+            assert parse_assignment_text(text) == _reference_parse(text), text
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Sector 7\nEng 3\n4 \n\n m",
+            "h m 3h",
+            "12 m",
+            "१२h",
+            "Tour 5 ıxp",
+            "3 hours 20 mins",
+        ],
+    )
+    def test_matches_reference_on_edge_cases(self, text: str) -> None:
+        assert parse_assignment_text(text) == _reference_parse(text)
+
+
+class TestNormalizeDuration:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("1h30m", "1h 30m"),
+            ("1h 30m", "1h 30m"),
+            ("1 h 30 min", "1h 30m"),
+            ("4h", "4h"),
+            ("6 hours", "6h"),
+            ("45m", "45m"),
+            ("45 min", "45m"),
+            ("soon", "soon"),
+        ],
+    )
+    def test_one_spelling(self, text: str, expected: str) -> None:
+        assert normalize_duration(text) == expected
+
+
+class TestParseMany:
+    def test_streams_lazily(self) -> None:
+        """Results come out as texts go in, without reading ahead."""
+        consumed: list[str] = []
+
+        def texts() -> Iterator[str]:
+            for text in ["A\nEng: 1", "B\nEng: 2", "C\nEng: 3"]:
+                consumed.append(text)
+                yield text
+
+        results = parse_many(texts())
+        assert next(results)["engineering"] == 1
+        assert len(consumed) == 1
+        assert [r["name"] for r in results] == ["B", "C"]
+
+    def test_matches_single_parse(self) -> None:
+        texts = ["Supply Run\nTac 5\n500 marks", "", "Rescue\n8h\nRare"] * 3
+        assert list(parse_many(texts)) == [parse_assignment_text(t) for t in texts]
+
+    def test_repeated_texts_yield_independent_copies(self) -> None:
+        first, second = parse_many(["X\n500 marks"] * 2)
+        first["event_rewards"].append("mutated")
+        first["name"] = "mutated"
+        assert second == parse_assignment_text("X\n500 marks")
+
+    @pytest.mark.parametrize("cache_size", [0, 1])
+    def test_small_or_no_cache(self, cache_size: int) -> None:
+        texts = ["A\nEng 1", "B\nEng 2", "A\nEng 1"]
+        results = list(parse_many(texts, cache_size=cache_size))
+        assert [r["engineering"] for r in results] == [1, 2, 1]
@@ -0,0 +1,150 @@
+"""Tests for layout profiles (vision.profile module)."""
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from zora.capture import BGRImage
+from zora.synthetic import TEXT_COLOR, draw_assignment_card, render_board
+from zora.vision import BoundingBox
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.profile import PROFILE_VERSION, LayoutProfile, calibrate
+from zora.vision.regions import crop_region, find_assignment_cards
+
+
+@pytest.fixture
+def screenshot() -> BGRImage:
+    return render_board(1280, 720, 4)
+
+
+class TestCalibrate:
+    def test_records_detected_layout(self, screenshot: BGRImage) -> None:
+        profile = calibrate(screenshot)
+        board_box = detect_board(screenshot)
+        assert profile.frame_size == (1280, 720)
+        assert profile.board == board_box
+        board = crop_board(screenshot, board_box)
+        assert profile.card_boxes == find_assignment_cards(board)
+        assert all(card.fields for card in profile.cards)
+
+    def test_fields_widened_for_longer_values(self, screenshot: BGRImage) -> None:
+        """Value regions reach well past the values seen at calibration."""
+        card = calibrate(screenshot).cards[0]
+        slots = card.fields["ship_slots"]
+        assert slots.x2 > card.box.width * 0.8
+        assert slots.x2 < card.box.width
+
+    def test_no_board_raises(self) -> None:
+        bright = np.full((400, 600, 3), 200, dtype=np.uint8)
+        with pytest.raises(ValueError, match="board"):
+            calibrate(bright)
+
+    def test_no_cards_raises(self) -> None:
+        dark = np.full((400, 600, 3), (30, 25, 20), dtype=np.uint8)
+        with pytest.raises(ValueError, match="cards"):
+            calibrate(dark)
+
+
+class TestProfileFile:
+    def test_round_trip(self, screenshot: BGRImage, tmp_path: Path) -> None:
+        profile = calibrate(screenshot)
+        path = tmp_path / "profile.json"
+        profile.save(path)
+        assert LayoutProfile.load(path) == profile
+
+    def test_default_hsv_ranges_not_shared(self) -> None:
+        """Editing one profile's colour ranges leaves other profiles alone."""
+        board = BoundingBox(0, 0, 100, 100)
+        first = LayoutProfile((100, 100), board, [])
+        second = LayoutProfile((100, 100), board, [])
+        first.board_hsv[0][0] += 1
+        first.card_hsv[1][0] += 1
+        assert second.board_hsv[0] is not first.board_hsv[0]
+        assert second == LayoutProfile((100, 100), board, [])
+        assert second != first
+
+    def test_unknown_version_rejected(self, screenshot: BGRImage) -> None:
+        data = calibrate(screenshot).to_dict()
+        data["version"] = PROFILE_VERSION + 1
+        with pytest.raises(ValueError, match="version"):
+            LayoutProfile.from_dict(data)
+
+
+class TestMatches:
+    def test_same_layout_matches(self, screenshot: BGRImage) -> None:
+        profile = calibrate(screenshot)
+        assert profile.matches(screenshot)
+        assert profile.matches(render_board(1280, 720, 4))
+
+    def test_other_resolution_fails(self, screenshot: BGRImage) -> None:
+        assert not calibrate(screenshot).matches(render_board(1920, 1080, 4))
+
+    def test_missing_card_fails(self, screenshot: BGRImage) -> None:
+        assert not calibrate(screenshot).matches(render_board(1280, 720, 3))
+
+    def test_extra_card_fails(self) -> None:
+        profile = calibrate(render_board(1280, 720, 3))
+        assert not profile.matches(render_board(1280, 720, 4))
+
+    def test_moved_board_fails(self, screenshot: BGRImage) -> None:
+        shifted = np.roll(screenshot, 40, axis=1)
+        assert not calibrate(screenshot).matches(shifted)
+
+
+class TestFieldRegions:
+    def _board_with_rewards(
+        self, reward: bool, name: str = "Patrol Sector 42"
+    ) -> BGRImage:
+        image = np.full((400, 800, 3), (30, 25, 20), dtype=np.uint8)
+        draw_assignment_card(image, 40, 40, 360, 260, name=name)
+        if reward:
+            cv2.putText(
+                image,
+                "Reward: 500 Dilithium",
+                (50, 270),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.5,
+                TEXT_COLOR,
+                1,
+            )
+        return image
+
+    def test_fields_and_reward_lines(self) -> None:
+        profile = calibrate(self._board_with_rewards(reward=False))
+        image = self._board_with_rewards(reward=True)
+        assert profile.matches(image)
+
+        board = crop_board(image, profile.board)
+        card = crop_region(board, profile.card_boxes[0])
+        regions = profile.field_regions(0, card)
+        assert regions is not None
+        assert regions.fields == profile.cards[0].fields
+        assert len(regions.extra_lines) == 1
+        assert regions.extra_lines[0].y > regions.fields["rarity"].y
+
+    def test_wrapped_title_locates_fields(self) -> None:
+        """A title wrapped since calibration pushes the lines out of the fields."""
+        profile = calibrate(self._board_with_rewards(False, "Rescue Mission"))
+        image = self._board_with_rewards(False, "Rescue\nMission")
+        assert profile.matches(image)
+
+        board = crop_board(image, profile.board)
+        card = crop_region(board, profile.card_boxes[0])
+        assert profile.field_regions(0, card) is None
+
+    def test_shifted_lines_locate_fields(self) -> None:
+        profile = calibrate(self._board_with_rewards(reward=False))
+        image = self._board_with_rewards(reward=False)
+        board = crop_board(image, profile.board)
+        box = profile.card_boxes[0]
+        card = crop_region(board, box).copy()
+        inner = card[60 : box.height - 30, 10 : box.width - 10]
+        inner[:] = np.roll(inner, 12, axis=0)
+        assert profile.field_regions(0, card) is None
+
+    def test_card_without_fields(self, screenshot: BGRImage) -> None:
+        profile = calibrate(screenshot)
+        profile.cards[0].fields = {}
+        assert profile.field_regions(0, screenshot) is None
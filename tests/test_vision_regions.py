@@ -1,10 +1,23 @@
 """Tests for region identification (vision.regions module)."""
 
+import cv2
 import numpy as np
+import pytest
 
 from zora.capture import BGRImage
+from zora.synthetic import TEXT_COLOR, draw_assignment_card, render_board
 from zora.vision import BoundingBox
-from zora.vision.regions import crop_region, find_assignment_cards
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.regions import (
+    DEFAULT_CARD_LAYOUT,
+    crop_region,
+    find_assignment_cards,
+    find_cards_by_contours,
+    find_cards_by_grid,
+    find_line_value,
+    find_text_lines,
+    locate_card_fields,
+)
 
 
 class TestFindAssignmentCards:
@@ -42,6 +55,130 @@ class TestFindAssignmentCards:
         assert len(cards) == 0
 
 
+def _dark_board() -> BGRImage:
+    return np.full((400, 800, 3), (30, 25, 20), dtype=np.uint8)
+
+
+class TestFindCardsByGrid:
+    @pytest.mark.parametrize(
+        ("width", "height", "num_cards"),
+        [(1280, 720, 1), (1280, 720, 5), (1920, 1080, 6), (3840, 2160, 9)],
+    )
+    def test_matches_contours_on_grid(
+        self, width: int, height: int, num_cards: int
+    ) -> None:
+        """Same boxes as the contour method, empty grid cells included."""
+        image = render_board(width, height, num_cards)
+        board = crop_board(image, detect_board(image))
+        cards = find_cards_by_grid(board)
+        assert cards is not None
+        assert len(cards) == num_cards
+        assert cards == find_cards_by_contours(board)
+
+    def test_content_touching_border_keeps_card_whole(self) -> None:
+        """A bar of text colour across a card doesn't split it in two."""
+        board = _dark_board()
+        draw_assignment_card(board, 40, 40, 320, 220)
+        draw_assignment_card(board, 400, 40, 320, 220)
+        board[140:150, 40:360] = TEXT_COLOR
+        assert len(find_cards_by_contours(board)) == 3
+
+        cards = find_cards_by_grid(board)
+        assert cards is not None
+        assert [(c.y, c.height) for c in cards] == [(39, 223), (39, 223)]
+        assert find_assignment_cards(board) == cards
+
+    def test_irregular_layout_falls_back_to_contours(self) -> None:
+        board = _dark_board()
+        draw_assignment_card(board, 40, 40, 200, 220)
+        draw_assignment_card(board, 300, 40, 420, 220)
+        assert find_cards_by_grid(board) is None
+        cards = find_assignment_cards(board)
+        assert cards == find_cards_by_contours(board)
+        assert [c.width for c in cards] == [203, 423]
+
+    def test_no_cards_in_empty_board(self) -> None:
+        assert find_cards_by_grid(_dark_board()) == []
+
+
+class TestFindTextLines:
+    def test_one_line_per_text_row(self, single_card_image: BGRImage) -> None:
+        """The title plus six stat/info lines, top to bottom."""
+        lines = find_text_lines(single_card_image)
+        assert len(lines) == 7
+        assert [line.y for line in lines] == sorted(line.y for line in lines)
+        assert all(a.y2 <= b.y for a, b in zip(lines, lines[1:]))
+
+    def test_lines_scale_with_card(self) -> None:
+        card = np.full((400, 600, 3), (120, 110, 100), dtype=np.uint8)
+        draw_assignment_card(card, 0, 0, 600, 400, scale=2.0)
+        lines = find_text_lines(card)
+        assert len(lines) == 7
+        assert min(line.height for line in lines) >= 20
+
+    def test_blank_card_has_no_lines(self) -> None:
+        card = np.full((200, 300, 3), (120, 110, 100), dtype=np.uint8)
+        assert find_text_lines(card) == []
+
+
+class TestFindLineValue:
+    def test_value_excludes_label(self, single_card_image: BGRImage) -> None:
+        """The value box of "Eng: 30" starts right of the label."""
+        eng_line = find_text_lines(single_card_image)[1]
+        value = find_line_value(single_card_image, eng_line)
+        assert value is not None
+        assert eng_line.x < value.x < eng_line.x2
+        assert value.x2 == eng_line.x2
+        assert value.width < eng_line.width / 2
+
+    def test_single_word_has_no_value(self, single_card_image: BGRImage) -> None:
+        rarity_line = find_text_lines(single_card_image)[6]
+        assert find_line_value(single_card_image, rarity_line) is None
+
+
+class TestLocateCardFields:
+    def test_maps_layout_fields(self, single_card_image: BGRImage) -> None:
+        regions = locate_card_fields(single_card_image)
+        assert regions is not None
+        assert list(regions.fields) == list(DEFAULT_CARD_LAYOUT.lines)
+        assert regions.extra_lines == []
+
+    def test_extra_lines_kept(self) -> None:
+        card = np.full((260, 300, 3), (120, 110, 100), dtype=np.uint8)
+        draw_assignment_card(card, 0, 0, 300, 260)
+        cv2.putText(
+            card,
+            "Reward: 50 Dilithium",
+            (10, 235),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.5,
+            (255, 255, 255),
+            1,
+        )
+        regions = locate_card_fields(card)
+        assert regions is not None
+        assert len(regions.extra_lines) == 1
+
+    def test_wrapped_title_returns_none(self) -> None:
+        """A title's second line doesn't shift the stats onto the wrong fields."""
+        card = np.full((230, 300, 3), (120, 110, 100), dtype=np.uint8)
+        name = "Survey Anomalies\nof the Neutral Zone"
+        draw_assignment_card(card, 0, 0, 300, 230, name=name)
+        lines = find_text_lines(card)
+        assert len(lines) == 8
+        # Every line but the rarity splits after its first word
+        assert all(find_line_value(card, line) for line in lines[:7])
+        assert locate_card_fields(card) is None
+
+    def test_mismatched_card_returns_none(self) -> None:
+        """A card with too few lines doesn't match the default layout."""
+        card = np.full((200, 300, 3), (120, 110, 100), dtype=np.uint8)
+        cv2.putText(
+            card, "Patrol", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1
+        )
+        assert locate_card_fields(card) is None
+
+
 class TestCropRegion:
     def test_crop_returns_subimage(self) -> None:
         image = np.zeros((200, 300, 3), dtype=np.uint8)
@@ -0,0 +1,114 @@
+"""Tests for scroll registration and card stitching (vision.scroll module)."""
+
+import numpy as np
+import pytest
+
+from zora.capture import BGRImage
+from zora.synthetic import render_scrolling_board
+from zora.vision import BoundingBox
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.regions import find_assignment_cards
+from zora.vision.scroll import CardStitcher, register_scroll, row_hashes
+
+STEP = 150
+
+
+def _boards(columns: int) -> list[BGRImage]:
+    frames = render_scrolling_board(1280, 720, 14, columns=columns, step=STEP)
+    box = detect_board(frames[0])
+    return [crop_board(frame, box) for frame in frames]
+
+
+@pytest.fixture(scope="module")
+def boards() -> list[BGRImage]:
+    """Board crops of a 14-card list scrolled by STEP rows per frame."""
+    return _boards(columns=2)
+
+
+@pytest.fixture(scope="module")
+def other_board() -> BGRImage:
+    """A board crop of the same size from a list laid out differently."""
+    return _boards(columns=3)[2]
+
+
+def _noisy(image: BGRImage, amplitude: int) -> BGRImage:
+    noise = np.random.default_rng(0).integers(-amplitude, amplitude + 1, image.shape)
+    return np.clip(image + noise, 0, 255).astype(np.uint8)
+
+
+class TestRegisterScroll:
+    def test_scroll_down_and_up(self, boards: list[BGRImage]) -> None:
+        assert register_scroll(boards[0], boards[1]) == STEP
+        assert register_scroll(boards[1], boards[0]) == -STEP
+        assert register_scroll(boards[0], boards[2]) == 2 * STEP
+
+    def test_same_frame(self, boards: list[BGRImage]) -> None:
+        assert register_scroll(boards[1], boards[1].copy()) == 0
+
+    def test_no_overlap(self, boards: list[BGRImage], other_board: BGRImage) -> None:
+        assert register_scroll(boards[0], other_board) is None
+        assert register_scroll(boards[0], _noisy(other_board, 2)) is None
+
+    def test_different_widths(self, boards: list[BGRImage]) -> None:
+        assert register_scroll(boards[0], boards[1][:, :-10]) is None
+
+    def test_noisy_frames(self, boards: list[BGRImage]) -> None:
+        """Too few rows hash equal; phase correlation registers them."""
+        noisy = _noisy(boards[1], 2)
+        same = row_hashes(boards[1]) == row_hashes(noisy)
+        assert np.count_nonzero(same) < 0.9 * same.size
+        assert register_scroll(boards[0], noisy) == STEP
+        assert register_scroll(noisy, boards[0]) == -STEP
+
+
+class TestCardStitcher:
+    def _stitch(
+        self, stitcher: CardStitcher, boards: list[BGRImage]
+    ) -> list[tuple[int, int]]:
+        positions = []
+        for board in boards:
+            cards = stitcher.add(board, find_assignment_cards(board))
+            positions.extend((card.y, card.x) for card in cards)
+        return positions
+
+    def test_each_card_placed_once(self, boards: list[BGRImage]) -> None:
+        stitcher = CardStitcher()
+        positions = self._stitch(stitcher, boards)
+        assert len(positions) == 14
+        assert len(set(positions)) == 14
+        assert stitcher.stats.new == 14
+        assert stitcher.stats.repeated > 0
+        assert stitcher.stats.cut_off > 0
+        assert stitcher.stats.unregistered == 0
+        assert stitcher.offset == sum(
+            register_scroll(a, b) for a, b in zip(boards, boards[1:])
+        )
+
+    def test_cut_off_cards_skipped(self) -> None:
+        board = np.zeros((400, 600, 3), np.uint8)
+        boxes = [
+            BoundingBox(x=10, y=0, width=100, height=80),
+            BoundingBox(x=10, y=100, width=100, height=80),
+            BoundingBox(x=10, y=340, width=100, height=60),
+        ]
+        cards = CardStitcher().add(board, boxes)
+        assert [card.index for card in cards] == [1]
+
+    def test_unregistered_frame_placed_below(
+        self, boards: list[BGRImage], other_board: BGRImage
+    ) -> None:
+        stitcher = CardStitcher()
+        self._stitch(stitcher, boards[:1])
+        assert stitcher.registered
+        cards = stitcher.add(other_board, find_assignment_cards(other_board))
+        assert not stitcher.registered
+        assert stitcher.stats.unregistered == 1
+        assert stitcher.offset == boards[0].shape[0]
+        assert all(card.y >= boards[0].shape[0] for card in cards)
+
+    def test_reset(self, boards: list[BGRImage]) -> None:
+        stitcher = CardStitcher()
+        first = self._stitch(stitcher, boards)
+        stitcher.reset()
+        assert stitcher.stats.frames == 0
+        assert self._stitch(stitcher, boards) == first
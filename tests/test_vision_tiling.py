@@ -0,0 +1,168 @@
+"""Tests for batched OCR of tiled cards (vision.tiling module)."""
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from tests.test_vision_extract import requires_tesseract
+from zora.capture import BGRImage
+from zora.synthetic import SAMPLE_ASSIGNMENTS, render_board
+from zora.vision import BoundingBox
+from zora.vision.cache import OcrCache
+from zora.vision.detect import crop_board, detect_board
+from zora.vision.extract import preprocess_for_ocr
+from zora.vision.ocr import OcrWord
+from zora.vision.regions import crop_region, find_assignment_cards
+from zora.vision.tiling import (
+    MIN_TILE_GAP,
+    assign_words,
+    extract_assignments_tiled,
+    ocr_cards_tiled,
+    tile_images,
+    words_to_text,
+)
+
+
+def _word(text: str, y: int, line: int, x: int = 0) -> OcrWord:
+    return OcrWord(
+        text=text,
+        box=BoundingBox(x=x, y=y, width=10, height=10),
+        confidence=90.0,
+        line=(1, 1, line),
+    )
+
+
+class TileTextEngine:
+    """Answers image_to_data with each card's text lines inside its tile."""
+
+    name = "tile-text"
+
+    def __init__(self, cards: list[BGRImage], texts: list[str]) -> None:
+        tiles = [preprocess_for_ocr(c) for c in cards]
+        self.tops = [box.y for box in tile_images(tiles)[1]] if tiles else []
+        self.texts = texts
+        self.canvases: list[NDArray[np.uint8]] = []
+
+    def image_to_string(self, image: NDArray[np.uint8], config: str) -> str:
+        raise AssertionError("tiled OCR must use image_to_data")
+
+    def image_to_data(self, image: NDArray[np.uint8], config: str) -> str:
+        self.canvases.append(image)
+        rows = []
+        for i, (top, text) in enumerate(zip(self.tops, self.texts)):
+            for j, line in enumerate(text.splitlines()):
+                y = top + 2 + 10 * j
+                rows.append(f"5\t1\t{i + 1}\t1\t{j + 1}\t1\t2\t{y}\t8\t8\t90\t{line}")
+        return "\n".join(rows)
+
+
+def _cards(width: int = 1280, height: int = 720, num_cards: int = 4) -> list[BGRImage]:
+    image = render_board(width, height, num_cards)
+    board = crop_board(image, detect_board(image))
+    return [crop_region(board, box) for box in find_assignment_cards(board)]
+
+
+class TestTileImages:
+    def test_stacks_with_bands(self) -> None:
+        """Tiles are stacked top to bottom, left-aligned, with a gap between."""
+        tiles = [np.full((20, 30), 255, np.uint8), np.zeros((10, 50), np.uint8)]
+        canvas, boxes = tile_images(tiles)
+        assert canvas.shape == (30 + MIN_TILE_GAP, 50)
+        assert boxes == [
+            BoundingBox(x=0, y=0, width=30, height=20),
+            BoundingBox(x=0, y=20 + MIN_TILE_GAP, width=50, height=10),
+        ]
+        assert (canvas[boxes[1].y : boxes[1].y2] == 0).all()
+
+    def test_padding_uses_tile_background(self) -> None:
+        """A mostly white tile is padded and followed by white, not black."""
+        tile = np.full((20, 30), 255, np.uint8)
+        tile[5:15, 5:25] = 0
+        canvas, _ = tile_images([tile, np.zeros((20, 40), np.uint8)])
+        assert (canvas[:20, 30:] == 255).all()
+        assert (canvas[20 : 20 + MIN_TILE_GAP] == 255).all()
+
+    def test_empty(self) -> None:
+        with pytest.raises(ValueError):
+            tile_images([])
+
+
+class TestAssignWords:
+    def test_by_center(self) -> None:
+        boxes = [
+            BoundingBox(x=0, y=0, width=100, height=50),
+            BoundingBox(x=0, y=70, width=100, height=50),
+        ]
+        words = [_word("a", 5, 1), _word("b", 75, 1), _word("c", 100, 2)]
+        groups = assign_words(words, boxes)
+        assert [[w.text for w in g] for g in groups] == [["a"], ["b", "c"]]
+
+    def test_drops_words_in_bands(self) -> None:
+        boxes = [
+            BoundingBox(x=0, y=0, width=100, height=50),
+            BoundingBox(x=0, y=70, width=100, height=50),
+        ]
+        assert assign_words([_word("noise", 55, 1)], boxes) == [[], []]
+
+
+class TestWordsToText:
+    def test_groups_lines(self) -> None:
+        words = [_word("Eng:", 0, 1), _word("30", 0, 1, x=40), _word("Rare", 20, 2)]
+        assert words_to_text(words) == "Eng: 30\nRare"
+
+    def test_empty(self) -> None:
+        assert words_to_text([]) == ""
+
+
+class TestOcrCardsTiled:
+    def test_one_call_for_all_cards(self) -> None:
+        cards = _cards()
+        engine = TileTextEngine(cards, [f"Card {i}" for i in range(len(cards))])
+        texts = ocr_cards_tiled(cards, engine=engine)
+        assert texts == [f"Card {i}" for i in range(len(cards))]
+        assert len(engine.canvases) == 1
+
+    def test_no_cards(self) -> None:
+        engine = TileTextEngine([], [])
+        assert ocr_cards_tiled([], engine=engine) == []
+        assert engine.canvases == []
+
+    def test_engine_without_word_boxes(self) -> None:
+        class TextOnly:
+            name = "text-only"
+
+            def image_to_string(self, image: NDArray[np.uint8], config: str) -> str:
+                return ""
+
+        with pytest.raises(TypeError):
+            ocr_cards_tiled(_cards(), engine=TextOnly())  # type: ignore[arg-type]
+
+    def test_cache_skips_engine(self) -> None:
+        cards = _cards()
+        engine = TileTextEngine(cards, ["x"] * len(cards))
+        cache = OcrCache()
+        first = ocr_cards_tiled(cards, engine=engine, cache=cache)
+        assert ocr_cards_tiled(cards, engine=engine, cache=cache) == first
+        assert len(engine.canvases) == 1
+
+    def test_parses_assignments(self) -> None:
+        cards = _cards(num_cards=2)
+        engine = TileTextEngine(
+            cards,
+            ["Supply Run\nEng: 15\nSlots: 1\nRare", "Survey\nTac: 5\nDuration: 2h"],
+        )
+        first, second = extract_assignments_tiled(cards, engine=engine)
+        assert (first.name, first.engineering, first.rarity) == (
+            "Supply Run",
+            15,
+            "Rare",
+        )
+        assert (second.tactical, second.duration) == (5, "2h")
+
+    @requires_tesseract
+    def test_reads_synthetic_board(self) -> None:
+        """With a real engine, every card's title comes back on its own card."""
+        cards = _cards(1920, 1080, 4)
+        assignments = extract_assignments_tiled(cards)
+        names = [a.name for a in assignments]
+        assert names == [s["name"] for s in SAMPLE_ASSIGNMENTS]
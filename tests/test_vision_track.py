@@ -0,0 +1,153 @@
+"""Tests for board tracking (vision.track module)."""
+
+import numpy as np
+
+from zora.capture import BGRImage
+from zora.models import Assignment
+from zora.synthetic import draw_assignment_card
+from zora.vision import BoundingBox
+from zora.vision.detect import detect_board
+from zora.vision.track import BoardTracker, CardTracker, board_still_at
+
+
+def _desktop_with_board(board_x: int = 200, board_y: int = 100) -> BGRImage:
+    """A bright 1280x800 desktop with an 800x600 dark board on it."""
+    image = np.full((800, 1280, 3), (200, 200, 200), dtype=np.uint8)
+    image[board_y : board_y + 600, board_x : board_x + 800] = (30, 25, 20)
+    draw_assignment_card(image, board_x + 50, board_y + 30, 300, 200)
+    return image
+
+
+class TestBoardStillAt:
+    def test_detected_box_passes(self) -> None:
+        image = _desktop_with_board()
+        box = detect_board(image)
+        assert box is not None
+        assert board_still_at(image, box)
+
+    def test_moved_board_fails(self) -> None:
+        box = detect_board(_desktop_with_board())
+        assert box is not None
+        assert not board_still_at(_desktop_with_board(board_x=260), box)
+
+    def test_missing_board_fails(self) -> None:
+        image = np.full((800, 1280, 3), (200, 200, 200), dtype=np.uint8)
+        assert not board_still_at(image, BoundingBox(200, 100, 800, 600))
+
+    def test_box_outside_image_fails(self) -> None:
+        image = _desktop_with_board()
+        assert not board_still_at(image, BoundingBox(900, 500, 800, 600))
+
+    def test_full_frame_board(self, synthetic_board: BGRImage) -> None:
+        """A board filling the frame has no outside pixels but still passes."""
+        box = detect_board(synthetic_board)
+        assert box is not None
+        assert board_still_at(synthetic_board, box)
+
+
+class TestBoardTracker:
+    def test_second_frame_takes_fast_path(self) -> None:
+        tracker = BoardTracker()
+        image = _desktop_with_board()
+        first = tracker.locate(image)
+        second = tracker.locate(image)
+        assert first == second == detect_board(image)
+        assert tracker.stats.full_scans == 1
+        assert tracker.stats.fast_hits == 1
+        assert tracker.stats.fast_path_rate == 0.5
+
+    def test_moved_board_triggers_full_scan(self) -> None:
+        tracker = BoardTracker()
+        tracker.locate(_desktop_with_board())
+        moved = _desktop_with_board(board_x=300, board_y=150)
+        box = tracker.locate(moved)
+        assert box == detect_board(moved)
+        assert tracker.stats.full_scans == 2
+
+    def test_resolution_change_triggers_full_scan(self) -> None:
+        tracker = BoardTracker()
+        tracker.locate(_desktop_with_board())
+        tracker.locate(np.full((600, 800, 3), (30, 25, 20), dtype=np.uint8))
+        assert tracker.stats.full_scans == 2
+
+    def test_no_board_keeps_scanning(self) -> None:
+        tracker = BoardTracker()
+        bright = np.full((400, 600, 3), (200, 200, 200), dtype=np.uint8)
+        assert tracker.locate(bright) is None
+        assert tracker.locate(bright) is None
+        assert tracker.stats.full_scans == 2
+
+    def test_reset(self) -> None:
+        tracker = BoardTracker()
+        image = _desktop_with_board()
+        tracker.locate(image)
+        tracker.reset()
+        tracker.locate(image)
+        assert tracker.stats.full_scans == 2
+
+
+def _card(duration: str = "4h") -> BGRImage:
+    image = np.zeros((200, 300, 3), dtype=np.uint8)
+    return draw_assignment_card(image, 0, 0, 300, 200, duration=duration)
+
+
+def _assignment(name: str) -> Assignment:
+    return Assignment(name=name, engineering=0, science=0, tactical=0, ship_slots=0)
+
+
+class TestCardTracker:
+    def test_first_frame_reuses_nothing(self) -> None:
+        tracker = CardTracker()
+        _, reused = tracker.match([_card(), _card("2h")])
+        assert reused == [None, None]
+        assert tracker.stats.last_skipped == 0
+
+    def test_identical_cards_are_reused(self) -> None:
+        tracker = CardTracker()
+        first = [_assignment("A"), _assignment("B")]
+        signatures, _ = tracker.match([_card(), _card("2h")])
+        tracker.update(signatures, first)
+
+        _, reused = tracker.match([_card(), _card("2h")])
+        assert reused[0] is first[0] and reused[1] is first[1]
+        assert tracker.stats.to_dict() == {
+            "frames": 2,
+            "cards": 4,
+            "skipped": 2,
+            "last_skipped": 2,
+            "skip_rate": 0.5,
+        }
+
+    def test_changed_card_is_not_reused(self) -> None:
+        tracker = CardTracker()
+        signatures, _ = tracker.match([_card("4h"), _card("8h")])
+        tracker.update(signatures, [_assignment("A"), _assignment("B")])
+
+        _, reused = tracker.match([_card("3h"), _card("8h")])
+        assert reused[0] is None
+        assert reused[1] is not None
+
+    def test_shifted_cards_are_matched_by_content(self) -> None:
+        """When a card disappears, the ones after it are still reused."""
+        tracker = CardTracker()
+        signatures, _ = tracker.match([_card("4h"), _card("8h")])
+        b = _assignment("B")
+        tracker.update(signatures, [_assignment("A"), b])
+
+        _, reused = tracker.match([_card("8h")])
+        assert reused == [b]
+
+    def test_failed_cards_are_not_remembered(self) -> None:
+        tracker = CardTracker()
+        signatures, _ = tracker.match([_card()])
+        tracker.update(signatures, [None])
+        _, reused = tracker.match([_card()])
+        assert reused == [None]
+
+    def test_reset(self) -> None:
+        tracker = CardTracker()
+        signatures, _ = tracker.match([_card()])
+        tracker.update(signatures, [_assignment("A")])
+        tracker.reset()
+        _, reused = tracker.match([_card()])
+        assert reused == [None]
@@ -0,0 +1,200 @@
+"""Tests for continuous watch mode (zora.watch) and frame signatures."""
+
+from unittest.mock import patch
+
+import numpy as np
+
+from zora.capture import BGRImage
+from zora.models import Assignment, BoardState
+from zora.synthetic import draw_assignment_card
+from zora.vision.ocr.fake import FakeEngine
+from zora.vision.signature import card_signature, image_signature
+from zora.watch import BoardWatcher
+
+
+def _board(name: str) -> BoardState:
+    assignment = Assignment(
+        name=name, engineering=1, science=2, tactical=3, ship_slots=1
+    )
+    return BoardState(assignments=[assignment])
+
+
+class _FrameSequence:
+    """A capture source that replays a fixed list of frames."""
+
+    def __init__(self, frames: list[BGRImage]) -> None:
+        self.frames = frames
+        self.calls = 0
+
+    def __call__(self) -> BGRImage:
+        frame = self.frames[min(self.calls, len(self.frames) - 1)]
+        self.calls += 1
+        return frame
+
+
+class TestImageSignature:
+    def test_identical_frames_match(self, synthetic_board: BGRImage) -> None:
+        assert image_signature(synthetic_board) == image_signature(
+            synthetic_board.copy()
+        )
+
+    def test_changed_frame_differs(self, synthetic_board: BGRImage) -> None:
+        changed = synthetic_board.copy()
+        changed[300:500, 400:700] = (120, 110, 100)  # a new card appears
+        assert image_signature(synthetic_board) != image_signature(changed)
+
+    def test_tolerates_capture_noise(self) -> None:
+        """Single-level pixel noise doesn't change the signature."""
+        image = np.full((360, 640, 3), 100, dtype=np.uint8)
+        noisy = image.copy()
+        noisy[::7, ::5] += 1
+        assert image_signature(image) == image_signature(noisy)
+
+    def test_shape_is_part_of_signature(self) -> None:
+        small = np.zeros((100, 200, 3), dtype=np.uint8)
+        large = np.zeros((200, 400, 3), dtype=np.uint8)
+        assert image_signature(small) != image_signature(large)
+
+
+class TestCardSignature:
+    def _card(self, duration: str) -> BGRImage:
+        image = np.zeros((200, 300, 3), dtype=np.uint8)
+        return draw_assignment_card(image, 0, 0, 300, 200, duration=duration)
+
+    def test_identical_cards_match(self) -> None:
+        assert card_signature(self._card("4h")) == card_signature(self._card("4h"))
+
+    def test_ticking_timer_changes_signature(self) -> None:
+        before, after = self._card("4h"), self._card("3h")
+        assert card_signature(before) != card_signature(after)
+
+    def test_shape_is_part_of_signature(self) -> None:
+        card = self._card("4h")
+        assert card_signature(card) != card_signature(card[:, :-2])
+
+
+class TestBoardWatcher:
+    def test_unchanged_frames_skip_pipeline(self, synthetic_board: BGRImage) -> None:
+        """Identical frames run the pipeline once and emit once."""
+        source = _FrameSequence([synthetic_board] * 5)
+        watcher = BoardWatcher(source, interval=0, sleep=lambda _: None)
+
+        with patch(
+            "zora.watch.read_board_from_image", return_value=_board("A")
+        ) as read:
+            boards = list(watcher.watch(max_frames=5))
+
+        assert len(boards) == 1
+        assert read.call_count == 1
+        assert watcher.stats.frames == 5
+        assert watcher.stats.unchanged == 4
+        assert watcher.stats.emitted == 1
+
+    def test_changed_frame_emits_new_board(self, synthetic_board: BGRImage) -> None:
+        changed = synthetic_board.copy()
+        changed[300:500, 400:700] = (120, 110, 100)
+        source = _FrameSequence([synthetic_board, synthetic_board, changed])
+        watcher = BoardWatcher(source, interval=0, sleep=lambda _: None)
+
+        with patch(
+            "zora.watch.read_board_from_image",
+            side_effect=[_board("A"), _board("B")],
+        ):
+            boards = list(watcher.watch(max_frames=3))
+
+        assert [b.assignments[0].name for b in boards] == ["A", "B"]
+        assert watcher.stats.reads == 2
+
+    def test_same_board_content_not_reemitted(self, synthetic_board: BGRImage) -> None:
+        """A pixel change that doesn't alter the board output emits nothing."""
+        changed = synthetic_board.copy()
+        changed[0:100, 0:100] = 0
+        source = _FrameSequence([synthetic_board, changed])
+        watcher = BoardWatcher(source, interval=0, sleep=lambda _: None)
+
+        with patch("zora.watch.read_board_from_image", return_value=_board("A")):
+            boards = list(watcher.watch(max_frames=2))
+
+        assert len(boards) == 1
+        assert watcher.stats.reads == 2
+        assert watcher.stats.emitted == 1
+
+    def test_confidence_change_not_reemitted(self, synthetic_board: BGRImage) -> None:
+        """Only the read values count as board content, not OCR confidences."""
+        changed = synthetic_board.copy()
+        changed[0:100, 0:100] = 0
+        source = _FrameSequence([synthetic_board, changed])
+        watcher = BoardWatcher(source, interval=0, sleep=lambda _: None)
+        first, second = _board("A"), _board("A")
+        first.assignments[0].confidence = {"name": 91.0}
+        second.assignments[0].confidence = {"name": 88.5}
+
+        with patch("zora.watch.read_board_from_image", side_effect=[first, second]):
+            boards = list(watcher.watch(max_frames=2))
+
+        assert boards == [first]
+
+    def test_tracks_board_across_frames(self, synthetic_board: BGRImage) -> None:
+        """The watcher's tracker locates the board in every read frame."""
+        changed = synthetic_board.copy()
+        changed[300:500, 400:700] = (120, 110, 100)
+        source = _FrameSequence([synthetic_board, changed])
+        watcher = BoardWatcher(source, interval=0, sleep=lambda _: None)
+
+        with patch("zora.pipeline.find_assignment_cards", return_value=[]):
+            list(watcher.watch(max_frames=2))
+
+        assert watcher.stats.reads == 2
+        assert watcher.tracker.stats.full_scans == 1
+        assert watcher.tracker.stats.fast_hits > 0
+
+    def test_unchanged_cards_skip_extraction(self, synthetic_board: BGRImage) -> None:
+        """A frame that changed outside the cards re-reads none of them."""
+        changed = synthetic_board.copy()
+        changed[550:600, 750:800] = 0
+        engine = FakeEngine("Survey")
+        source = _FrameSequence([synthetic_board, changed])
+        watcher = BoardWatcher(source, interval=0, engine=engine, sleep=lambda _: None)
+
+        list(watcher.watch(max_frames=1))
+        calls = len(engine.calls)
+        list(watcher.watch(max_frames=2))
+
+        assert watcher.stats.reads == 2
+        assert len(engine.calls) == calls
+        assert watcher.card_tracker.stats.last_skipped == 3
+
+    def test_capture_error_keeps_polling(self, synthetic_board: BGRImage) -> None:
+        """A capture that fails (window minimised) is skipped, not fatal."""
+        frames = iter([None, synthetic_board, synthetic_board])
+
+        def source() -> BGRImage:
+            frame = next(frames)
+            if frame is None:
+                raise RuntimeError("No window on screen with title 'Game'")
+            return frame
+
+        watcher = BoardWatcher(source, interval=0, sleep=lambda _: None)
+        with patch(
+            "zora.watch.read_board_from_image", return_value=_board("A")
+        ) as read:
+            boards = list(watcher.watch(max_frames=3))
+
+        assert len(boards) == 1
+        assert read.call_count == 1
+        assert watcher.stats.frames == 3
+        assert watcher.stats.capture_errors == 1
+        assert watcher.stats.unchanged == 1
+
+    def test_sleeps_for_remaining_interval(self, synthetic_board: BGRImage) -> None:
+        """The loop sleeps between captures but not after the last one."""
+        sleeps: list[float] = []
+        source = _FrameSequence([synthetic_board])
+        watcher = BoardWatcher(
+            source, interval=2.0, sleep=sleeps.append, clock=lambda: 0.0
+        )
+
+        with patch("zora.watch.read_board_from_image", return_value=_board("A")):
+            list(watcher.watch(max_frames=3))
+
+        assert sleeps == [2.0, 2.0]